@@ -40,7 +40,7 @@ try {
         // Insert test user
         $insertStmt = $pdo->prepare(
             "INSERT INTO users (username, email, password, first_name, last_name, role_id, created_at) 
-             VALUES (?, ?, ?, ?, ?, ?, NOW())"
+             VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)"
         );
 
         $username = 'testuser';
@@ -37,6 +37,11 @@ import traceback
 from datetime import datetime
 from collections import defaultdict
 
+# Add utils to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'utils'))
+
+from driver_pool import get_driver_pool
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
@@ -138,19 +143,7 @@ def log_step(message):
     print(f"→ {message}")
 
 
-def save_debug(driver, name_prefix):
-    """Save screenshot and HTML for debugging"""
-    ts = int(time.time())
-    try:
-        os.makedirs('tests/bdd/results', exist_ok=True)
-        screenshot = f"tests/bdd/results/{name_prefix}-{ts}.png"
-        driver.save_screenshot(screenshot)
-        with open(f"tests/bdd/results/{name_prefix}-{ts}.html", 'w', encoding='utf-8') as f:
-            f.write(driver.page_source)
-        return screenshot
-    except Exception as e:
-        print(f"   ⚠️  Could not save debug artifacts: {e}")
-        return None
+from debug_artifacts import save_debug
 
 
 def build_driver():
@@ -177,22 +170,29 @@ def build_driver():
 # NAVIGATION & LINK TESTING
 # ============================================================================
 
+# All anchors with an href as [href, text, visible], read in one round trip
+PAGE_LINKS_JS = """
+var out = [];
+var anchors = document.querySelectorAll('a[href]');
+for (var i = 0; i < anchors.length; i++) {
+  var a = anchors[i];
+  var r = a.getBoundingClientRect();
+  var style = window.getComputedStyle(a);
+  var visible = r.width > 0 && r.height > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+  out.push([a.href, visible ? (a.innerText || '').trim() : '', visible]);
+}
+return out;
+"""
+
+
 def get_all_links(driver):
-    """Extract all links from page"""
+    """Extract all links from page (single execute_script instead of per-anchor calls)"""
     try:
-        links = driver.find_elements(By.TAG_NAME, 'a')
-        link_data = []
-        for link in links:
-            href = link.get_attribute('href')
-            text = link.text.strip()
-            visible = link.is_displayed()
-            if href:  # Only links with href
-                link_data.append({
-                    'href': href,
-                    'text': text,
-                    'visible': visible
-                })
-        return link_data
+        return [
+            {'href': href, 'text': text, 'visible': visible}
+            for href, text, visible in driver.execute_script(PAGE_LINKS_JS)
+            if href  # Only links with href
+        ]
     except Exception as e:
         print(f"   ⚠️  Error extracting links: {e}")
         return []
@@ -738,7 +738,7 @@ def run_comprehensive_role_based_test():
         print(f"  HEADLESS:           {HEADLESS}")
         print(f"  TEST_TIMEOUT:       {TEST_TIMEOUT}s")
         
-        driver = build_driver()
+        driver = get_driver_pool('comprehensive', build_driver).checkout()
         
         # ====================================================================
         # PHASE 1: GUEST NAVIGATION
@@ -823,8 +823,8 @@ def run_comprehensive_role_based_test():
     
     finally:
         if driver:
-            driver.quit()
-            print("\n🔌 Browser closed")
+            get_driver_pool('comprehensive', build_driver).checkin(driver)
+            print("\n🔌 Browser returned to pool")
 
 
 # ============================================================================
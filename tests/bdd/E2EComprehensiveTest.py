@@ -51,6 +51,8 @@ except ImportError:
     NavbarLinksValidator = None
     DashboardStatsValidator = None
 
+from driver_pool import get_driver_pool
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
@@ -125,19 +127,7 @@ def log_step(message):
     print(f"→ {message}")
 
 
-def save_debug(driver, name_prefix):
-    """Save screenshot and HTML for debugging"""
-    ts = int(time.time())
-    try:
-        screenshot = f"{name_prefix}-{ts}.png"
-        driver.save_screenshot(screenshot)
-        with open(f"{name_prefix}-{ts}.html", 'w', encoding='utf-8') as f:
-            f.write(driver.page_source)
-        print(f"   📸 Debug artifacts saved: {screenshot}, {name_prefix}-{ts}.html")
-        return screenshot
-    except Exception as e:
-        print(f"   ⚠️  Could not save debug artifacts: {e}")
-        return None
+from debug_artifacts import save_debug
 
 
 def build_driver():
@@ -794,7 +784,7 @@ def run_comprehensive_e2e_test():
         print(f"  SKIP_PROMOTION:     {SKIP_PROMOTION}")
         print(f"  SKIP_DATABASE_CHECK: {SKIP_DATABASE_CHECK}")
         
-        driver = build_driver()
+        driver = get_driver_pool('e2e', build_driver).checkout()
         
         # ====================================================================
         # PHASE 1: AUTHENTICATION
@@ -891,8 +881,8 @@ def run_comprehensive_e2e_test():
     
     finally:
         if driver:
-            driver.quit()
-            print("\n🔌 Browser closed")
+            get_driver_pool('e2e', build_driver).checkin(driver)
+            print("\n🔌 Browser returned to pool")
 
 
 # ============================================================================
@@ -19,6 +19,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 import time
+import sys
 import random
 import string
 import subprocess
@@ -37,16 +38,8 @@ def random_email():
     return "testuser" + ''.join(random.choices(string.digits, k=6)) + "@example.com"
 
 
-def save_debug(driver, name_prefix):
-    ts = int(time.time())
-    try:
-        screenshot = f"{name_prefix}-{ts}.png"
-        driver.save_screenshot(screenshot)
-        with open(f"{name_prefix}-{ts}.html", 'w', encoding='utf-8') as f:
-            f.write(driver.page_source)
-        print(f"Saved debug artifacts: {screenshot}, {name_prefix}-{ts}.html")
-    except Exception as e:
-        print(f"Failed to save debug artifacts: {e}")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'utils'))
+from debug_artifacts import save_debug
 
 
 def build_driver():
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Debug Artifact Store
+Lists, exports and garbage-collects the deduplicated failure screenshots and HTML
+
+Suites store failure artifacts by content hash (utils/artifact_store.py);
+this command shows what was captured and copies a run's or test's artifacts
+out under readable names.
+
+Usage:
+  python tests/bdd/artifacts.py stats
+  python tests/bdd/artifacts.py list --test 'FAM-%'
+  python tests/bdd/artifacts.py export /tmp/fam-003 --test FAM-003
+  python tests/bdd/artifacts.py gc --budget-mb 50
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'utils'))
+
+from artifact_store import ArtifactStore
+
+
+def _mb(value):
+    return f"{value / 1024 / 1024:.1f} MB"
+
+
+def cmd_stats(store, args):
+    stats = store.stats()
+    saved = stats['logical_bytes'] - stats['stored_bytes']
+    print(f"📦 {stats['runs']} runs, {stats['entries']} artifacts in {stats['blobs']} blobs: "
+          f"{_mb(stats['stored_bytes'])} stored, {_mb(max(0, saved))} saved by dedup "
+          f"(budget {_mb(store.budget)})")
+    return 0
+
+
+def cmd_list(store, args):
+    entries = store.entries(args.run, args.test, args.limit)
+    for entry in entries:
+        print(f"{entry['timestamp']}  {entry['run']}  {entry['test']}  {entry['step']}  {entry['kind']:<10} "
+              f"{entry['blob'][:12]}  {entry['url'] or ''}")
+    if not entries:
+        print("No artifacts")
+    return 0
+
+
+def cmd_export(store, args):
+    written = store.export(args.dest, args.run, args.test)
+    print(f"✅ Exported {len(written)} files to {args.dest}")
+    return 0 if written else 2
+
+
+def cmd_gc(store, args):
+    budget = int(args.budget_mb * 1024 * 1024) if args.budget_mb is not None else None
+    result = store.gc(budget, keep_runs=args.keep_runs)
+    print(f"🧹 Dropped {result['runs_dropped']} runs, deleted {result['blobs_deleted']} blobs "
+          f"({_mb(result['bytes_freed'])}); {_mb(result['stored_bytes'])} stored")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Debug Artifact Store')
+    parser.add_argument('--root', help='Store directory (default: BDD_ARTIFACT_DIR or results/artifacts)')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    sub.add_parser('stats', help='Show sizes and dedup savings').set_defaults(func=cmd_stats)
+
+    listing = sub.add_parser('list', help='List artifacts, newest first')
+    listing.add_argument('--run', help='Only this run')
+    listing.add_argument('--test', help='Only tests matching this SQL LIKE pattern')
+    listing.add_argument('--limit', type=int, default=50)
+    listing.set_defaults(func=cmd_list)
+
+    export = sub.add_parser('export', help='Copy artifacts out under readable names')
+    export.add_argument('dest', help='Target directory')
+    export.add_argument('--run', help='Only this run')
+    export.add_argument('--test', help='Only tests matching this SQL LIKE pattern')
+    export.set_defaults(func=cmd_export)
+
+    gc = sub.add_parser('gc', help='Enforce the size budget')
+    gc.add_argument('--budget-mb', type=float, help='Budget in MB (default: BDD_ARTIFACT_BUDGET_MB or 200)')
+    gc.add_argument('--keep-runs', type=int, default=1, help='Newest runs never dropped (default: 1)')
+    gc.set_defaults(func=cmd_gc)
+
+    args = parser.parse_args()
+    store = ArtifactStore(args.root)
+    try:
+        return args.func(store, args)
+    finally:
+        store.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Admin Dashboard Scale Benchmark
+Times DashboardService's statistics queries as the database grows
+
+Grows a database step by step to each --scales user count with the synthetic
+dataset generator (utils/dataset_generator.py: users, family members,
+events, payments, sessions) and at every step times the getDashboardStats
+queries (utils/dashboard_queries.py) over N iterations. With --http (MySQL
+only) it also times GET /admin as an admin on a `php -S` server using the
+same MySQL database: DashboardService's queries use MySQL date functions
+(DATE_SUB, YEAR, MONTH) that SQLite does not have, so on SQLite only the
+Python re-implementation of the queries is timed.
+
+SQLite runs on a restored copy of the golden database. MySQL (--dialect
+mysql) runs against the database configured by DB_HOST/DB_NAME/DB_USER/DB_PASS;
+generated rows are purged again afterwards unless --keep is given.
+
+Usage:
+  python tests/bdd/benchmark_dashboard.py
+  python tests/bdd/benchmark_dashboard.py --scales 1000 10000 100000 --iterations 20
+  python tests/bdd/benchmark_dashboard.py --dialect mysql --scales 1000 10000 --http
+
+Samples are stored as dashboard_stats records (mode sqlite-<users> /
+mysql-<users>) for perf_gate.py compare.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'utils'))
+
+from benchmark_store import BenchmarkStore, summarize
+from dashboard_queries import QUERY_NAMES, run_dashboard_queries
+from dataset_generator import PYMYSQL_AVAILABLE, DatasetGenerator, connect_mysql, connect_sqlite
+from golden_db import restore
+from php_server import RUNTIME_DIR
+
+
+def time_admin_page(base_url, iterations):
+    """
+    Time GET /admin as the dev-login admin
+
+    Returns:
+        (samples, errors): [{'latency_ms': ...}], list of error strings
+    """
+    import requests
+
+    session = requests.Session()
+    samples, errors = [], []
+    try:
+        session.get(f"{base_url}/__dev_login?role=admin&user_id=1&next=/admin", timeout=30)
+        for _ in range(iterations):
+            started = time.perf_counter()
+            response = session.get(f"{base_url}/admin", timeout=120, allow_redirects=False)
+            elapsed = (time.perf_counter() - started) * 1000
+            if response.status_code != 200:
+                errors.append(f"HTTP {response.status_code}")
+            else:
+                samples.append({'latency_ms': elapsed})
+    except requests.RequestException as e:
+        errors.append(type(e).__name__)
+    finally:
+        session.close()
+    return samples, errors
+
+
+def print_step(scale, counts, generated, summary, slowest):
+    print(f"\n📈 {scale:,} users: " + ', '.join(f"{table} {count:,}" for table, count in counts.items())
+          + f" (+{generated['users']:,} users in {generated['seconds']:.1f}s)")
+    total = summary['total_ms']
+    print(f"   all queries: p50 {total['p50']:.2f} ms, p95 {total['p95']:.2f} ms, max {total['max']:.2f} ms")
+    for name in slowest:
+        stats = summary[f"{name}_ms"]
+        print(f"   {name:<18} p50 {stats['p50']:8.2f} ms  p95 {stats['p95']:8.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Admin Dashboard Scale Benchmark')
+    parser.add_argument('--scales', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help='User counts to grow the database to (default: 1000 10000 100000)')
+    parser.add_argument('--iterations', '-n', type=int, default=10, help='Timed runs per step (default: 10)')
+    parser.add_argument('--dialect', choices=('sqlite', 'mysql'), default='sqlite')
+    parser.add_argument('--db', help='SQLite file (default: results/servers/dashboard-scale.db)')
+    parser.add_argument('--http', action='store_true', help='Also time GET /admin on a php -S server (MySQL only)')
+    parser.add_argument('--batch-size', type=int, default=5000, help='Rows per executemany (default: 5000)')
+    parser.add_argument('--seed', type=int, default=42, help='Dataset RNG seed (default: 42)')
+    parser.add_argument('--keep', action='store_true', help='MySQL: keep the generated rows')
+    parser.add_argument('--no-save', action='store_true', help='Do not store samples')
+    args = parser.parse_args()
+
+    if args.dialect == 'mysql' and not PYMYSQL_AVAILABLE:
+        print("❌ pymysql is required for --dialect mysql: pip install pymysql")
+        return 2
+    if args.http and args.dialect != 'mysql':
+        print("❌ --http needs --dialect mysql (the admin dashboard's queries use MySQL date functions)")
+        return 2
+
+    server = None
+    if args.dialect == 'sqlite':
+        db_path = args.db or RUNTIME_DIR / 'dashboard-scale.db'
+        restore(db_path)
+        conn = connect_sqlite(db_path)
+        print(f"🔧 SQLite {db_path}")
+    else:
+        conn = connect_mysql()
+        print(f"🔧 MySQL {os.environ.get('DB_HOST', 'localhost')}/{os.environ.get('DB_NAME', 'u103964107_uma')}")
+
+    generator = DatasetGenerator(conn, args.dialect, seed=args.seed, batch_size=args.batch_size)
+    store = None if args.no_save else BenchmarkStore()
+    metrics = [f"{name}_ms" for name in QUERY_NAMES] + ['total_ms']
+    http_failed = False
+    try:
+        if args.dialect == 'mysql':
+            generator.purge()
+        if args.http:
+            from php_server import PhpServer
+            server = PhpServer(shard_index='dashboard', mysql=True).start(prepare_db=False)
+            print(f"🔧 {server.base_url}")
+
+        baseline_users = generator.table_counts()['users']
+        for scale in sorted(args.scales):
+            missing = scale - (generator.table_counts()['users'] - baseline_users)
+            generated = generator.generate(max(0, missing))
+            counts = generator.table_counts()
+
+            run_dashboard_queries(conn, args.dialect)  # warm the page cache
+            samples = [run_dashboard_queries(conn, args.dialect)[0] for _ in range(args.iterations)]
+            summary = summarize(samples, metrics)
+            slowest = sorted(QUERY_NAMES, key=lambda name: -summary[f"{name}_ms"]['p50'])[:3]
+            print_step(scale, counts, generated, summary, slowest)
+            if store:
+                store.record('dashboard_stats', f"{args.dialect}-{scale}", samples, kind='dashboard_stats',
+                             role='admin', scale=scale, counts=counts, summary=summary)
+
+            if server:
+                page_samples, errors = time_admin_page(server.base_url, args.iterations)
+                if page_samples:
+                    page = summarize(page_samples, ['latency_ms'])['latency_ms']
+                    print(f"   GET /admin        p50 {page['p50']:8.2f} ms  p95 {page['p95']:8.2f} ms")
+                    if store:
+                        store.record('/admin', f"scale{scale}", page_samples, kind='http_latency',
+                                     role='admin', scale=scale, errors=errors)
+                if errors:
+                    http_failed = True
+                    print(f"   ⚠️  GET /admin: {len(errors)} of {args.iterations} failed ({errors[0]})")
+    finally:
+        if server:
+            server.stop()
+        if args.dialect == 'mysql' and not args.keep:
+            deleted = generator.purge()
+            print(f"\n🧹 Purged {sum(deleted.values()):,} generated rows")
+        conn.close()
+        if store:
+            store.close()
+
+    if store:
+        print(f"\n📄 Samples saved to {store.log.log_file} (run {store.run_id}, commit {store.commit})")
+    return 1 if http_failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Page Load Benchmark
+Navigation Timing benchmark over cold and warm loads per route
+
+Replaces the single time.time() measurement around driver.get in
+test_oauth_admin/test_selenium with browser-reported timings (TTFB,
+DOMContentLoaded, load, first paint, transfer sizes) over N iterations,
+reported as p50/p95/p99. Samples are stored in
+results/benchmarks/benchmarks.jsonl (with the git commit) for trend comparison.
+
+Usage:
+  python tests/bdd/benchmark_page_load.py
+  python tests/bdd/benchmark_page_load.py --routes / /about /login --iterations 20 --modes cold
+  python tests/bdd/benchmark_page_load.py --role user --routes /user/dashboard
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common_config import BASE_URL, checkout_webdriver, checkin_webdriver, get_logged_in_user, print_header
+from page_timing import TIMING_METRICS, measure_route, summarize
+from benchmark_store import BenchmarkStore
+
+
+DEFAULT_ROUTES = ['/', '/about', '/events', '/contact', '/login']
+REPORT_METRICS = ('ttfb', 'dom_content_loaded', 'load', 'first_contentful_paint')
+
+
+def _ms(value):
+    return f"{value:8.1f}" if value is not None else f"{'-':>8}"
+
+
+def print_route_summary(route, mode, summary, previous=None):
+    """Print p50/p95/p99 per metric (and the p50 change against the previous run)"""
+    print(f"\n📄 {route} [{mode}] ({summary.get('load', {}).get('n', 0)} samples)")
+    print(f"   {'metric':<24}{'p50':>8}{'p95':>8}{'p99':>8}   Δp50 vs previous")
+    for metric in REPORT_METRICS:
+        stats = summary.get(metric)
+        if not stats:
+            continue
+        delta = ''
+        if previous and previous.get(metric) and previous[metric]['p50']:
+            change = (stats['p50'] - previous[metric]['p50']) / previous[metric]['p50'] * 100
+            delta = f"{change:+.1f}%"
+        print(f"   {metric + ' (ms)':<24}{_ms(stats['p50'])}{_ms(stats['p95'])}{_ms(stats['p99'])}   {delta}")
+    document = summary.get('transfer_size', {}).get('p50')
+    resources = summary.get('resource_transfer_size', {}).get('p50')
+    count = summary.get('resource_count', {}).get('p50')
+    if document is not None:
+        print(f"   transfer: document {document / 1024:.1f} KB, "
+              f"{count:.0f} resources {(resources or 0) / 1024:.1f} KB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Page Load Benchmark')
+    parser.add_argument('--routes', nargs='+', default=DEFAULT_ROUTES, help='Paths to benchmark')
+    parser.add_argument('--iterations', '-n', type=int, default=10, help='Measured loads per route and mode')
+    parser.add_argument('--modes', nargs='+', choices=('cold', 'warm'), default=['cold', 'warm'],
+                        help='cold: HTTP cache cleared before every load; warm: cache primed once')
+    parser.add_argument('--role', choices=('guest', 'user'), default='guest',
+                        help='Benchmark as a guest or as a logged-in user')
+    parser.add_argument('--no-save', action='store_true', help='Do not persist samples')
+    args = parser.parse_args()
+
+    print_header(f"PAGE LOAD BENCHMARK - {BASE_URL} ({args.iterations} iterations, {args.role})")
+    store = BenchmarkStore()
+    driver = checkout_webdriver(lean=False)  # page weight is part of what is measured
+    try:
+        if args.role == 'user':
+            login = get_logged_in_user(driver, role='user')
+            if not login.get('success'):
+                print(f"❌ Login failed: {login.get('error')}")
+                return 1
+
+        for route in args.routes:
+            for mode in args.modes:
+                samples = measure_route(driver, f"{BASE_URL}{route}", args.iterations, mode)
+                if not samples:
+                    print(f"\n❌ {route} [{mode}]: no load event within timeout")
+                    continue
+                summary = summarize(samples)
+                previous = store.previous_summary(route, mode, TIMING_METRICS, role=args.role)
+                print_route_summary(route, mode, summary, previous)
+                if not args.no_save:
+                    store.record(route, mode, samples, role=args.role, base_url=BASE_URL)
+    finally:
+        checkin_webdriver(driver)
+        store.close()
+
+    if not args.no_save:
+        print(f"\n📄 Samples saved to {store.log.log_file} (run {store.run_id}, commit {store.commit})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
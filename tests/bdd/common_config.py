@@ -3,10 +3,12 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 import os
+import sys
 import json
 import time
 import sqlite3
 import logging
+from pathlib import Path
 
 # Placeholder constants and objects
 SELENIUM_AVAILABLE = True
@@ -14,7 +16,7 @@ BCRYPT_AVAILABLE = False
 SQLITE_AVAILABLE = True
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 USERS_FILE = os.path.join(PROJECT_ROOT, 'test_users.json')
-BASE_URL = "http://localhost:8000"  # Update to your actual test server URL
+BASE_URL = os.environ.get('BASE_URL', 'http://localhost:8000').rstrip('/')  # Set per shard by the parallel runner
 TEST_TIMEOUT = 15
 logger = logging.getLogger("bdd")
 
@@ -29,7 +31,28 @@ try:
 except ImportError:
     webdriver = None
 
+# Shared utilities live in utils/ and are imported by bare module name
+sys.path.insert(0, os.path.join(PROJECT_ROOT, 'utils'))
 
+from driver_pool import get_driver_pool
+from wait_engine import install_shim, settle, navigate, click_and_wait, scroll_into_view
+from session_cache import SessionCache
+from results_store import ResultsEventLog, current_run_id, log_path_for
+from golden_db import restore as restore_golden_db, role_user
+from trace_spans import traced, span, instrument_driver, start_trace, finish_trace, get_tracer
+from command_profiler import PROFILE_ENABLED, get_profiler, profile_driver
+from debug_artifacts import get_artifacts, begin_test, save_debug, record_step
+from driver_binary import resolve_chromedriver
+from lean_profile import LEAN_ENABLED, apply_lean_profile
+from test_dag import TestDag, depends_on
+
+# Step spans for the shared helpers (recorded only when BDD_TRACE is set)
+navigate = traced('navigate', cat='navigation')(navigate)
+click_and_wait = traced('click_and_wait', cat='wait')(click_and_wait)
+settle = traced('settle', cat='wait')(settle)
+
+
+@traced(cat='wait')
 def wait_for_clickable(driver, by, value, timeout=15):
     """Wait for an element to be clickable and return it."""
     try:
@@ -44,8 +67,31 @@ def wait_for_clickable(driver, by, value, timeout=15):
 # SELENIUM DRIVER SETUP
 # ============================================================================
 
-def setup_webdriver():
-    """Setup Chrome WebDriver with standard configuration"""
+def _instrument(driver, profile):
+    instrument_driver(driver)
+    if PROFILE_ENABLED if profile is None else profile:
+        profile_driver(driver)
+    return driver
+
+
+def _lean(driver, lean, allow):
+    if LEAN_ENABLED if lean is None else lean:
+        apply_lean_profile(driver, allow)
+    elif getattr(driver, '_bdd_lean', False):
+        apply_lean_profile(driver, 'all')
+    return driver
+
+
+def setup_webdriver(profile=None, lean=None, allow=()):
+    """
+    Setup Chrome WebDriver with standard configuration
+
+    Args:
+        profile: Count and time every WebDriver command per call site
+            (default: WEBDRIVER_PROFILE environment variable)
+        lean: Block images, fonts, media and analytics (default: WEBDRIVER_LEAN, on)
+        allow: Lean profile groups or patterns to load anyway, e.g. ('images',)
+    """
     if not SELENIUM_AVAILABLE:
         raise ImportError("Selenium is not available")
     
@@ -59,8 +105,11 @@ def setup_webdriver():
         options.add_argument('--disable-blink-features=AutomationControlled')
         options.add_experimental_option('excludeSwitches', ['enable-automation'])
         options.add_experimental_option('useAutomationExtension', False)
-        driver = webdriver.Chrome(options=options)
-        return driver
+        service = webdriver.ChromeService(executable_path=resolve_chromedriver())
+        driver = webdriver.Chrome(service=service, options=options)
+        install_shim(driver)
+        _lean(driver, lean, allow)
+        return _instrument(driver, profile)
     except Exception as chrome_exc:
         print(f"ChromeDriver failed: {chrome_exc}. Trying Firefox/GeckoDriver...")
         from selenium.webdriver.firefox.options import Options as FirefoxOptions
@@ -69,9 +118,48 @@ def setup_webdriver():
         firefox_options.add_argument('--width=1920')
         firefox_options.add_argument('--height=1080')
         driver = webdriver.Firefox(options=firefox_options)
-        return driver
+        return _instrument(driver, profile)
+
+
+def checkout_webdriver(lean=None, allow=(), timeout=None):
+    """
+    Get a browser from the process-wide pool (started with setup_webdriver if needed)
+
+    Args:
+        lean: Block images, fonts, media and analytics (default: WEBDRIVER_LEAN, on)
+        allow: This suite's lean profile allowlist, e.g. ('images',)
+        timeout: Seconds to wait for a free browser (default: the pool's;
+            0 raises TimeoutError at once if none is free)
+    """
+    return _lean(get_driver_pool('default', setup_webdriver).checkout(timeout), lean, allow)
+
 
+def checkin_webdriver(driver):
+    """Reset a browser and return it to the pool instead of quitting it"""
+    get_driver_pool('default', setup_webdriver).checkin(driver)
 
+
+def run_test_dag(suite, workers=None):
+    """
+    Run a set-up suite's test_* steps along their @depends_on graph
+
+    Dependents of a failed step are recorded as SKIP without running;
+    independent branches run concurrently on extra pooled browsers when
+    the pool has them free.
+
+    Args:
+        suite: Suite instance after setup()
+        workers: Concurrent branches (default: DAG_WORKERS or 2)
+
+    Returns:
+        (passed, skipped, total)
+    """
+    dag = TestDag(suite, checkout_webdriver, checkin_webdriver, workers)
+    dag.run()
+    return dag.summary()
+
+
+@traced(cat='wait')
 def wait_for_element(driver, by, value, timeout=15):
     """Wait for an element to be present in the DOM and return it, or None on timeout."""
     try:
@@ -106,11 +194,11 @@ def verify_password(password, hashed):
 # ============================================================================
 
 def get_db_connection():
-    """Get SQLite database connection"""
+    """Get SQLite database connection (the server's DB_PATH when set)"""
     if not SQLITE_AVAILABLE:
         raise ImportError("SQLite is not available")
     
-    db_path = PROJECT_ROOT / 'umashaktidham.db'
+    db_path = Path(os.environ.get('DB_PATH') or os.path.join(PROJECT_ROOT, 'umashaktidham.db'))
     if not db_path.exists():
         raise FileNotFoundError(f"Database not found: {db_path}")
     
@@ -119,6 +207,26 @@ def get_db_connection():
     return conn
 
 
+def reset_database():
+    """
+    Restore the server's SQLite database (DB_PATH) from the golden snapshot
+
+    Gives a suite or test a clean database in milliseconds instead of
+    cleaning up through the browser. Cached login sessions stay valid: on a
+    restorable database only the golden database's seeded users are cached,
+    and they keep their ids.
+
+    Returns:
+        bool - False when the server is not on a SQLite DB_PATH
+    """
+    db_path = os.environ.get('DB_PATH')
+    if not db_path or os.environ.get('USE_MYSQL', 'true').lower() in ('1', 'true'):
+        return False
+    method = restore_golden_db(db_path)
+    logger.info(f"Database reset from golden snapshot ({method}): {db_path}")
+    return True
+
+
 # ============================================================================
 # TEST DATA UTILITIES
 # ============================================================================
@@ -185,13 +293,13 @@ def print_test_result(test_id, test_name, status, duration, details=""):
 # USER CREATION & LOGIN
 # ============================================================================
 
+@traced()
 def create_and_login_user(driver, email=None, password="Test@Password123", first_name="Test", last_name="User"):
     if email is None:
         email = generate_test_user_email()
     try:
         # Step 1: Register the user
-        driver.get(f"{BASE_URL}/register")
-        time.sleep(1)
+        navigate(driver, f"{BASE_URL}/register", TEST_TIMEOUT)
         wait_reg = WebDriverWait(driver, TEST_TIMEOUT)
         email_field = wait_reg.until(EC.presence_of_element_located((By.NAME, "email")))
         email_field.clear()
@@ -212,22 +320,17 @@ def create_and_login_user(driver, email=None, password="Test@Password123", first
         if not terms_checkbox.is_selected():
             driver.execute_script("arguments[0].click();", terms_checkbox)
         submit_btn = driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
-        driver.execute_script("arguments[0].scrollIntoView(true);", submit_btn)
-        time.sleep(0.5)
-        driver.execute_script("arguments[0].click();", submit_btn)
-        time.sleep(2)
+        scroll_into_view(driver, submit_btn)
+        click_and_wait(driver, submit_btn, TEST_TIMEOUT)
         # Check for registration errors
         error_elements = driver.find_elements(By.XPATH, "//*[contains(@class, 'error') or contains(@class, 'alert') or contains(@class, 'invalid')]")
         error_texts = [el.text for el in error_elements if el.text.strip()]
         if error_texts:
             logger.error(f"Registration error detected: {' | '.join(error_texts)}")
-            screenshot_path = f"/tmp/registration-error-{int(time.time())}.png"
-            driver.save_screenshot(screenshot_path)
-            logger.info(f"Screenshot of registration error: {screenshot_path}")
+            save_debug(driver, 'registration-error')
             return {'success': False, 'error': 'Registration error: ' + ' | '.join(error_texts)}
         # Step 2: Login the user
-        driver.get(f"{BASE_URL}/login")
-        time.sleep(1)
+        navigate(driver, f"{BASE_URL}/login", TEST_TIMEOUT)
         wait_login = WebDriverWait(driver, TEST_TIMEOUT)
         email_field = wait_login.until(EC.presence_of_element_located((By.NAME, "email")))
         email_field.clear()
@@ -236,26 +339,21 @@ def create_and_login_user(driver, email=None, password="Test@Password123", first
         password_field.clear()
         password_field.send_keys(password)
         submit_btn = driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
-        driver.execute_script("arguments[0].scrollIntoView(true);", submit_btn)
-        time.sleep(0.5)
-        driver.execute_script("arguments[0].click();", submit_btn)
-        time.sleep(2)
+        scroll_into_view(driver, submit_btn)
+        click_and_wait(driver, submit_btn, TEST_TIMEOUT)
         # Check for login errors
         error_elements = driver.find_elements(By.XPATH, "//*[contains(@class, 'error') or contains(@class, 'alert') or contains(@class, 'invalid')]")
         error_texts = [el.text for el in error_elements if el.text.strip()]
         if error_texts:
             logger.error(f"Login error detected: {' | '.join(error_texts)}")
-            screenshot_path = f"/tmp/login-error-{int(time.time())}.png"
-            driver.save_screenshot(screenshot_path)
-            logger.info(f"Screenshot of login error: {screenshot_path}")
+            save_debug(driver, 'login-error')
             return {'success': False, 'error': 'Login error: ' + ' | '.join(error_texts)}
         # Wait for dashboard
-        time.sleep(2)
         wait_dashboard = WebDriverWait(driver, TEST_TIMEOUT)
         try:
             wait_dashboard.until(lambda d: "/dashboard" in d.current_url or "/user/dashboard" in d.current_url)
         except TimeoutException:
-            driver.get(f"{BASE_URL}/user/dashboard")
+            navigate(driver, f"{BASE_URL}/user/dashboard", TEST_TIMEOUT)
             logger.info(f"Session cookies after dashboard navigation: {driver.get_cookies()}")
             try:
                 dashboard_header = driver.find_element(By.XPATH, "//*[contains(text(), 'Welcome to Umashakti Dham')]")
@@ -263,9 +361,8 @@ def create_and_login_user(driver, email=None, password="Test@Password123", first
             except Exception as e:
                 logger.warning(f"Dashboard header not found. User may not be logged in: {e}")
             logger.info("Navigated to dashboard after login/session.")
-            time.sleep(1)
         # After login, check for profile completion prompt
-        time.sleep(2)
+        settle(driver, TEST_TIMEOUT)
         body_text = driver.find_element(By.TAG_NAME, "body").text
         logger.info(f"Body text after login: {body_text[:200]}")
         logger.info(f"Current URL after login: {driver.current_url}")
@@ -276,12 +373,10 @@ def create_and_login_user(driver, email=None, password="Test@Password123", first
                 logger.info("Attempting to locate Edit Profile button...")
                 edit_btn = driver.find_element(By.XPATH, "//button[contains(@data-action, 'edit-profile')]")
                 logger.info("Edit Profile button found. Scrolling into view...")
-                driver.execute_script("arguments[0].scrollIntoView(true);", edit_btn)
-                time.sleep(1.5)
+                scroll_into_view(driver, edit_btn)
                 logger.info("Clicking Edit Profile button...")
-                edit_btn.click()
+                click_and_wait(driver, edit_btn, TEST_TIMEOUT, js_click=False)
                 logger.info("Clicked Edit Profile button.")
-                time.sleep(2)
             except Exception as e:
                 logger.warning(f"Edit Profile button not found or not clickable: {e}")
             logger.info("Waiting for profile form to appear...")
@@ -327,25 +422,18 @@ def create_and_login_user(driver, email=None, password="Test@Password123", first
             logger.info(f"Filled profile fields: {filled_fields}")
             try:
                 submit_btn = driver.find_element(By.CSS_SELECTOR, "form button[type='submit'], form button[type='button'][data-action*='save']")
-                driver.execute_script("arguments[0].scrollIntoView(true);", submit_btn)
-                time.sleep(0.5)
-                submit_btn.click()
-                time.sleep(2)
-                screenshot_path = f"/tmp/profile-submit-{int(time.time())}.png"
-                driver.save_screenshot(screenshot_path)
-                logger.info(f"Screenshot after profile submit: {screenshot_path}")
+                scroll_into_view(driver, submit_btn)
+                click_and_wait(driver, submit_btn, TEST_TIMEOUT, js_click=False)
+                record_step(driver, 'profile-submit', screenshot=False)
                 error_elements = driver.find_elements(By.XPATH, "//*[contains(@class, 'error') or contains(@class, 'alert') or contains(@class, 'invalid')]")
                 error_texts = [el.text for el in error_elements if el.text.strip()]
                 if error_texts:
                     logger.error(f"Profile completion error detected: {' | '.join(error_texts)}")
-                    screenshot_path = f"/tmp/profile-error-{int(time.time())}.png"
-                    driver.save_screenshot(screenshot_path)
-                    logger.info(f"Screenshot of profile error: {screenshot_path}")
+                    save_debug(driver, 'profile-error')
             except Exception as e:
                 logger.error(f"Could not submit profile completion form: {e}")
             for _ in range(5):
-                driver.get(f"{BASE_URL}/dashboard")
-                time.sleep(2)
+                navigate(driver, f"{BASE_URL}/dashboard", TEST_TIMEOUT)
                 logger.info(f"Waiting for dashboard after profile completion. Current URL: {driver.current_url}")
                 logger.info(f"Session cookies: {driver.get_cookies()}")
                 body_text = driver.find_element(By.TAG_NAME, "body").text
@@ -356,8 +444,7 @@ def create_and_login_user(driver, email=None, password="Test@Password123", first
         logger.info(f"Final URL before success check: {driver.current_url}")
         logger.info(f"Session cookies: {driver.get_cookies()}")
         for _ in range(3):
-            driver.get(f"{BASE_URL}/dashboard")
-            time.sleep(2)
+            navigate(driver, f"{BASE_URL}/dashboard", TEST_TIMEOUT)
             logger.info(f"Dashboard reload for session check. URL: {driver.current_url}")
             logger.info(f"Session cookies: {driver.get_cookies()}")
             body_text = driver.find_element(By.TAG_NAME, "body").text
@@ -370,11 +457,9 @@ def create_and_login_user(driver, email=None, password="Test@Password123", first
                     'last_name': last_name,
                     'success': True
                 }
-            time.sleep(1)
         for attempt in range(3):
             logger.info(f"Retrying login after profile completion. Attempt {attempt+1}")
-            driver.get(f"{BASE_URL}/login")
-            time.sleep(1)
+            navigate(driver, f"{BASE_URL}/login", TEST_TIMEOUT)
             wait_retry = WebDriverWait(driver, TEST_TIMEOUT)
             email_field = wait_retry.until(EC.presence_of_element_located((By.NAME, "email")))
             email_field.clear()
@@ -383,19 +468,15 @@ def create_and_login_user(driver, email=None, password="Test@Password123", first
             password_field.clear()
             password_field.send_keys(password)
             submit_btn = driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
-            driver.execute_script("arguments[0].scrollIntoView(true);", submit_btn)
-            time.sleep(0.5)
-            driver.execute_script("arguments[0].click();", submit_btn)
-            time.sleep(2)
+            scroll_into_view(driver, submit_btn)
+            click_and_wait(driver, submit_btn, TEST_TIMEOUT)
             logger.info(f"URL after retry login: {driver.current_url}")
             logger.info(f"Session cookies: {driver.get_cookies()}")
             error_elements = driver.find_elements(By.XPATH, "//*[contains(@class, 'error') or contains(@class, 'alert') or contains(@class, 'invalid')]")
             error_texts = [el.text for el in error_elements if el.text.strip()]
             if error_texts:
                 logger.error(f"Login error detected: {' | '.join(error_texts)}")
-                screenshot_path = f"/tmp/login-error-{int(time.time())}.png"
-                driver.save_screenshot(screenshot_path)
-                logger.info(f"Screenshot of login error: {screenshot_path}")
+                save_debug(driver, 'login-error')
                 return {'success': False, 'error': 'Login error: ' + ' | '.join(error_texts)}
             if "/dashboard" in driver.current_url or "/user/dashboard" in driver.current_url:
                 logger.info(f"User successfully created and logged in: {email}")
@@ -416,9 +497,177 @@ def create_and_login_user(driver, email=None, password="Test@Password123", first
         return {'success': False, 'error': str(e)}
 
 
+_session_cache = None
+
+
+def get_session_cache():
+    """Get the shared login-state cache for BASE_URL"""
+    global _session_cache
+    if _session_cache is None:
+        _session_cache = SessionCache(BASE_URL)
+    return _session_cache
+
+
+def _restorable_database():
+    """True when the server runs on a SQLite DB_PATH reset from the golden database"""
+    return bool(os.environ.get('DB_PATH')) and os.environ.get('USE_MYSQL', 'true').lower() not in ('1', 'true')
+
+
+def seeded_user(role):
+    """
+    Get the golden database's seeded user for a role, if the server has it
+
+    Returns:
+        dict with email, password, first_name, last_name; None when the server
+        is not on a golden database copy or the role was not seeded
+    """
+    if not _restorable_database():
+        return None
+    user = role_user(role)
+    try:
+        conn = get_db_connection()
+    except (ImportError, FileNotFoundError):
+        return None
+    try:
+        found = conn.execute("SELECT 1 FROM users WHERE email = ?", (user['email'],)).fetchone()
+    except sqlite3.Error:
+        found = None
+    finally:
+        conn.close()
+    return user if found else None
+
+
+def _require_role_database(role):
+    """Raise ValueError unless users can be given roles in the server's database"""
+    if not _restorable_database():
+        raise ValueError(f"Cannot give a user the '{role}' role: the server is not on a SQLite DB_PATH "
+                         "(run isolated servers, e.g. pytest --php-server)")
+
+
+def promote_user(email, role):
+    """
+    Give a registered user a role in the server's SQLite database (DB_PATH)
+
+    The role takes effect at the user's next login.
+
+    Raises:
+        ValueError: when the server is not on a SQLite DB_PATH (e.g. a shared
+            MySQL dev server) or the role does not exist
+    """
+    _require_role_database(role)
+    conn = get_db_connection()
+    try:
+        row = conn.execute("SELECT id FROM roles WHERE name = ?", (role,)).fetchone()
+        if row is None:
+            raise ValueError(f"Unknown role: {role}")
+        with conn:
+            updated = conn.execute("UPDATE users SET role_id = ? WHERE email = ?", (row['id'], email)).rowcount
+    finally:
+        conn.close()
+    if not updated:
+        raise ValueError(f"No user {email} to promote to {role}")
+
+
+@traced()
+def login_user(driver, email, password):
+    """
+    Log in with an existing account through the /login form
+
+    The browser's cookies for the page it is on (normally BASE_URL) are
+    dropped first, so an earlier session does not carry over.
+
+    Returns:
+        bool - True if the browser reached a dashboard
+    """
+    driver.delete_all_cookies()
+    navigate(driver, f"{BASE_URL}/login", TEST_TIMEOUT)
+    email_field = WebDriverWait(driver, TEST_TIMEOUT).until(EC.presence_of_element_located((By.NAME, "email")))
+    email_field.clear()
+    email_field.send_keys(email)
+    password_field = driver.find_element(By.NAME, "password")
+    password_field.clear()
+    password_field.send_keys(password)
+    submit_btn = driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
+    scroll_into_view(driver, submit_btn)
+    click_and_wait(driver, submit_btn, TEST_TIMEOUT)
+    return "dashboard" in driver.current_url or "/admin" in driver.current_url
+
+
+@traced()
+def get_logged_in_user(driver, role="user", cache=True, **profile):
+    """
+    Get a logged-in browser, reusing a cached session when one is still valid
+
+    On a golden database copy (isolated servers) a cache miss logs in as the
+    role's seeded user (golden_db.role_user), whose session then stays valid
+    across database resets. Otherwise it falls back to create_and_login_user
+    (full register/login/profile flow); other roles are produced by promoting
+    the new user (promote_user) and logging it in again. Registered users are
+    cached only on a server whose database is never reset.
+
+    Args:
+        driver: WebDriver to log in
+        role: 'user', or another role name such as 'admin'
+        cache: Reuse and record cached sessions as a seeded user; pass False
+            from suites that change the user (family members, password, ...)
+            so they get a fresh user of their own
+        **profile: Keyword arguments passed to create_and_login_user
+
+    Returns:
+        Same dict as create_and_login_user plus 'role', and 'cached': True on a cache hit
+
+    Raises:
+        ValueError: for a role other than 'user' when the server's database
+            cannot be changed (see promote_user)
+    """
+    cache = get_session_cache() if cache else None
+    key = cache.make_key(role, profile) if cache else None
+    user = cache.restore(driver, key) if cache else None
+    if user:
+        logger.info(f"Reused cached session for {user.get('email')} ({role})")
+        return user
+
+    seeded = seeded_user(role) if cache and not profile else None
+    if seeded:
+        if not login_user(driver, seeded['email'], seeded['password']):
+            return {'success': False, 'error': f"Could not log in as the seeded {role} user {seeded['email']}"}
+        result = dict(seeded, success=True)
+    else:
+        if role != "user":
+            # Fail before registering anyone when the role cannot be produced
+            _require_role_database(role)
+        result = create_and_login_user(driver, **profile)
+        if result.get('success') and role != "user":
+            promote_user(result['email'], role)
+            if not login_user(driver, result['email'], result['password']):
+                return {'success': False, 'error': f"Could not log in again as {role} after promotion"}
+    if result.get('success'):
+        result['role'] = role
+        # A registered user is gone after the next database reset; only seeded users outlive it
+        if cache and (seeded or not _restorable_database()):
+            cache.capture(driver, key, result)
+    return result
+
+
 class TestResultsManager:
+    """
+    Test results recorder backed by an append-only JSONL event log
+
+    add_suite/add_test_result append one line to <results_file>.jsonl (safe
+    for parallel suites sharing a file), tagged with the run id; save()
+    compacts this run's events into results_file. In-memory stats only
+    cover this process.
+    """
+
+    __test__ = False  # not a pytest test class despite the name
+
     def __init__(self, results_file="results.json"):
+        results_file = Path(results_file)
+        if results_file.is_dir():
+            results_file = results_file / "test_results.json"
         self.results_file = results_file
+        self.event_log = ResultsEventLog(log_path_for(results_file))
+        self.run_id = current_run_id()
         self.results = {
             "test_suites": {},
             "summary": {},
@@ -428,9 +677,13 @@ class TestResultsManager:
     def add_suite(self, suite_name, metadata):
         if suite_name not in self.results["test_suites"]:
             self.results["test_suites"][suite_name] = {
-                "metadata": metadata,
+                "metadata": dict(metadata),
                 "tests": []
             }
+            self.event_log.append({"type": "suite", "run": self.run_id, "suite": suite_name, "metadata": metadata,
+                                   "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")})
+            start_trace(suite_name)
+            get_profiler().label = suite_name
 
     def add_test_result(self, suite_name, test_id, test_name, status, duration, details=""):
         if suite_name not in self.results["test_suites"]:
@@ -445,38 +698,40 @@ class TestResultsManager:
             "details": details
         }
         self.results["test_suites"][suite_name]["tests"].append(test_result)
-        self._update_suite_stats(suite_name)
-        self._update_summary()
-        self.save()
+        self.event_log.append(dict(test_result, type="test", run=self.run_id))
+        # Buffered step snapshots are written only for failures
+        get_artifacts().end_test(test_id, status.lower() == "pass")
+        tracer = get_tracer()
+        if tracer is not None and duration:
+            # Suites time tests themselves; place the test span over the steps it covered
+            tracer.add_complete(f"{test_id}: {test_name}", time.perf_counter() - duration, duration,
+                                cat='test', status=status)
+        self._update_suite_stats(suite_name, test_result)
+        self._update_summary(test_result)
         return test_result
 
-    def _update_suite_stats(self, suite_name):
-        suite = self.results["test_suites"][suite_name]
-        tests = suite["tests"]
-        total = len(tests)
-        passed = sum(1 for t in tests if t["status"].lower() == "pass")
-        failed = total - passed
-        duration = sum(t.get("duration", 0) for t in tests)
-        pass_rate = (passed / total * 100) if total > 0 else 0
-        suite["metadata"]["total"] = total
-        suite["metadata"]["passed"] = passed
-        suite["metadata"]["failed"] = failed
-        suite["metadata"]["pass_rate"] = pass_rate
-        suite["metadata"]["duration"] = duration
-        suite["metadata"]["updated"] = time.strftime("%Y-%m-%dT%H:%M:%S")
-
-    def _update_summary(self):
-        suites = self.results["test_suites"]
-        total_tests = sum(s["metadata"].get("total", 0) for s in suites.values())
-        total_passed = sum(s["metadata"].get("passed", 0) for s in suites.values())
-        total_failed = sum(s["metadata"].get("failed", 0) for s in suites.values())
-        pass_rate = (total_passed / total_tests * 100) if total_tests > 0 else 0
-        self.results["summary"]["total_suites"] = len(suites)
-        self.results["summary"]["total_tests"] = total_tests
-        self.results["summary"]["total_passed"] = total_passed
-        self.results["summary"]["total_failed"] = total_failed
-        self.results["summary"]["pass_rate"] = pass_rate
-        self.results["metadata"]["updated"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+    # Suites record results through the shorter name
+    add_test = add_test_result
+
+    def _update_suite_stats(self, suite_name, test_result):
+        meta = self.results["test_suites"][suite_name]["metadata"]
+        passed = test_result["status"].lower() == "pass"
+        meta["total"] = meta.get("total", 0) + 1
+        meta["passed"] = meta.get("passed", 0) + (1 if passed else 0)
+        meta["failed"] = meta["total"] - meta["passed"]
+        meta["pass_rate"] = meta["passed"] / meta["total"] * 100
+        meta["duration"] = meta.get("duration", 0) + (test_result.get("duration") or 0)
+        meta["updated"] = test_result["timestamp"]
+
+    def _update_summary(self, test_result):
+        summary = self.results["summary"]
+        passed = test_result["status"].lower() == "pass"
+        summary["total_suites"] = len(self.results["test_suites"])
+        summary["total_tests"] = summary.get("total_tests", 0) + 1
+        summary["total_passed"] = summary.get("total_passed", 0) + (1 if passed else 0)
+        summary["total_failed"] = summary["total_tests"] - summary["total_passed"]
+        summary["pass_rate"] = summary["total_passed"] / summary["total_tests"] * 100
+        self.results["metadata"]["updated"] = test_result["timestamp"]
 
     def get_all_tests_flat(self):
         all_tests = []
@@ -486,11 +741,17 @@ class TestResultsManager:
         return all_tests
 
     def save(self):
+        """Flush the event log and compact this run's events into results_file"""
         try:
-            with open(self.results_file, 'w') as f:
-                json.dump(self.results, f, indent=2)
+            self.event_log.compact(self.results_file, self.run_id)
             logger.info(f"Results saved to {self.results_file}")
-        except IOError as e:
+            trace_file = finish_trace()
+            if trace_file:
+                logger.info(f"Trace saved to {trace_file}")
+            # Hot WebDriver call sites of this suite (only populated with WEBDRIVER_PROFILE)
+            get_profiler().print_report()
+            get_profiler().reset()
+        except (IOError, OSError) as e:
             logger.error(f"Failed to save results: {e}")
 
     def to_dict(self):
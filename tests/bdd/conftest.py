@@ -2,28 +2,66 @@
 Pytest configuration for BDD tests
 Provides fixtures and hooks for comprehensive test suite
 
+The *_refactored suite classes (setup/teardown plus test_* methods that
+record PASS/FAIL in a TestResultsManager) are collected as pytest items by
+the adapter below: one suite instance per class, methods in definition
+order, an item fails when its method records a failure and is skipped when
+a step it @depends_on failed (utils/test_dag.py). The unittest-based
+suites are collected by pytest itself. Session fixtures give every xdist
+worker its own pooled browser and, with --php-server, its own `php -S`
+server and SQLite database.
+
 Usage:
   pytest tests/bdd/ -v
   pytest tests/bdd/ -v --html=report.html
   pytest tests/bdd/ -k "navbar" -v
+  pytest tests/bdd/ -n auto --php-server          # pytest-xdist, one server per worker
 """
 
 import pytest
+import inspect
 import os
 import sys
+import unittest
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import xdist.scheduler
+    XDIST_AVAILABLE = True
+except ImportError:
+    XDIST_AVAILABLE = False
+
 # Add utils to path
 sys.path.insert(0, str(Path(__file__).parent / 'utils'))
 
+# Scripts that drive a browser at import time (no __main__ guard)
+collect_ignore = [
+    'test_dashboard_buttons.py',
+    'test_save_button.py',
+    'test_save_quick.py',
+    'test_simple_registration.py',
+    'test_success_banners.py',
+]
+
 
 # ============================================================================
 # PYTEST CONFIGURATION
 # ============================================================================
 
+def pytest_addoption(parser):
+    """Add BDD command line options"""
+    parser.addoption(
+        "--php-server", action="store_true", default=False,
+        help="Start an isolated php -S server with its own SQLite DB per worker instead of using BASE_URL"
+    )
+
+
 def pytest_configure(config):
     """Configure pytest"""
+    # One results run for the session; xdist workers inherit it from the controller
+    from results_store import new_run_id
+    os.environ.setdefault('RESULTS_RUN_ID', new_run_id())
     config.addinivalue_line(
         "markers", "bdd: BDD test"
     )
@@ -45,6 +83,9 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "stats: Statistics display tests"
     )
+    config.addinivalue_line(
+        "markers", "legacy_suite: Refactored suite class collected through the adapter"
+    )
 
 
 def pytest_collection_modifyitems(config, items):
@@ -76,6 +117,115 @@ def bdd_config():
     }
 
 
+def _worker_id(config):
+    """xdist worker name ('gw0', ...), or 'main' without xdist"""
+    workerinput = getattr(config, 'workerinput', None)
+    return workerinput['workerid'] if workerinput else 'main'
+
+
+@pytest.fixture(scope="session")
+def golden_db():
+    """Get the golden SQLite database, built once per input change"""
+    from golden_db import build_golden
+    return build_golden()
+
+
+@pytest.fixture(scope="session")
+def php_server(request):
+    """
+    Start this worker's `php -S` server (with --php-server)
+
+    Yields:
+        PhpServer, or None when the suites run against BASE_URL
+    """
+    if not request.config.getoption("--php-server"):
+        yield None
+        return
+    from php_server import PhpServer
+    server = PhpServer(shard_index=f"pytest-{_worker_id(request.config)}").start()
+    try:
+        yield server
+    finally:
+        server.stop()
+
+
+@pytest.fixture(scope="session")
+def base_url(php_server, bdd_config):
+    """
+    Get the server URL for this worker and point common_config at it
+
+    Returns:
+        str - URL without trailing slash
+    """
+    url = php_server.base_url if php_server else bdd_config['base_url']
+    # BASE_URL, plus USE_MYSQL/DB_PATH so reset_database() finds the worker's file
+    os.environ.update(php_server.env() if php_server else {'BASE_URL': url})
+    import common_config
+    if common_config.BASE_URL != url:
+        common_config.BASE_URL = url
+        common_config._session_cache = None  # keyed by URL
+    return url
+
+
+@pytest.fixture(scope="module")
+def server_db(php_server, base_url):
+    """
+    Reset this worker's server database to the golden copy before the module
+
+    Returns:
+        Path of the server's SQLite file, or None against BASE_URL
+    """
+    if php_server is None:
+        return None
+    from common_config import reset_database
+    reset_database()
+    return php_server.db_path
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _module_base_url(request):
+    """Point a suite module's own BASE_URL import at this worker's server"""
+    if not hasattr(request.module, 'BASE_URL'):
+        return
+    url = request.getfixturevalue('base_url')
+    request.module.BASE_URL = url
+
+
+@pytest.fixture(scope="module")
+def driver(base_url):
+    """Get a pooled browser for the module, returned to the pool afterwards"""
+    from common_config import checkout_webdriver, checkin_webdriver
+    browser = checkout_webdriver()
+    try:
+        yield browser
+    finally:
+        checkin_webdriver(browser)
+
+
+@pytest.fixture(scope="module")
+def logged_in_user(request, driver):
+    """
+    Log the module's browser in (cached session when still valid)
+
+    Role 'user' by default; parametrize indirectly for others (the role's
+    seeded user; skipped without --php-server):
+      @pytest.mark.parametrize('logged_in_user', ['admin'], indirect=True)
+
+    Returns:
+        dict from get_logged_in_user (email, password, success, ...)
+    """
+    from common_config import get_logged_in_user
+    role = getattr(request, 'param', 'user')
+    try:
+        user = get_logged_in_user(driver, role=role)
+    except ValueError as e:
+        # Roles other than 'user' need an isolated server (--php-server) with seeded users
+        pytest.skip(str(e))
+    if not user.get('success'):
+        pytest.fail(f"Could not log in as {role}: {user.get('error')}", pytrace=False)
+    return user
+
+
 @pytest.fixture(scope="session")
 def results_dir():
     """Get results directory"""
@@ -97,6 +247,92 @@ def reset_environment():
     # Cleanup code here if needed
 
 
+# ============================================================================
+# LEGACY SUITE ADAPTERS
+# ============================================================================
+
+SUITE_MARKERS = {
+    'navigation': 'navigation',
+    'admin_management': 'admin',
+    'family_management': 'family',
+    'profile_management': 'profile',
+}
+
+
+def _is_legacy_suite(module, obj):
+    """Plain suite class with setup()/teardown() and test_* methods"""
+    return (
+        inspect.isclass(obj)
+        and obj.__module__ == module.__name__
+        and not issubclass(obj, unittest.TestCase)
+        and callable(getattr(obj, 'setup', None))
+        and callable(getattr(obj, 'teardown', None))
+        and any(name.startswith('test_') for name in vars(obj))
+    )
+
+
+def _adapter_test(name):
+    def test(self, legacy_suite):
+        from test_dag import PASS, dependencies, run_step
+        failed = [need for need in dependencies(self.legacy_class)[name] if self.outcomes.get(need, PASS) != PASS]
+        if failed:
+            self.outcomes[name] = 'SKIP'
+            pytest.skip(f"depends on {', '.join(failed)}, which did not pass")
+        status, details = run_step(legacy_suite, name)
+        self.outcomes[name] = status
+        if status != PASS:
+            pytest.fail(details, pytrace=False)
+    test.__name__ = name
+    return test
+
+
+def _adapter_class(suite_cls):
+    """Pytest test class running suite_cls's test_* methods on one shared instance"""
+    namespace = {'legacy_class': suite_cls, 'outcomes': {}, '__doc__': suite_cls.__doc__}
+    for name, member in vars(suite_cls).items():
+        if name.startswith('test_') and callable(member):
+            namespace[name] = _adapter_test(name)
+            namespace[name].__doc__ = member.__doc__
+    marks = [pytest.mark.legacy_suite]
+    suite_name = getattr(suite_cls, 'SUITE_NAME', None)
+    if suite_name in SUITE_MARKERS:
+        marks.append(getattr(pytest.mark, SUITE_MARKERS[suite_name]))
+    namespace['pytestmark'] = marks
+    return type(f"Test{suite_cls.__name__}", (), namespace)
+
+
+@pytest.fixture(scope="class")
+def legacy_suite(request, base_url):
+    """Set up the adapted suite once per class, tear it down (save results) after its last item"""
+    suite = request.cls.legacy_class()
+    suite.setup()
+    try:
+        yield suite
+    finally:
+        suite.teardown()
+
+
+def pytest_pycollect_makeitem(collector, name, obj):
+    """Collect *_refactored suite classes through _adapter_class"""
+    if not isinstance(collector, pytest.Module) or not collector.module.__name__.endswith('_refactored'):
+        return None
+    module = collector.module
+    if not _is_legacy_suite(module, obj):
+        return None
+    adapter = _adapter_class(obj)
+    # Class collectors resolve their object by name on the module
+    setattr(module, adapter.__name__, adapter)
+    return pytest.Class.from_parent(collector, name=adapter.__name__)
+
+
+if XDIST_AVAILABLE:
+    def pytest_xdist_make_scheduler(config, log):
+        """Default -n to --dist loadscope: items of an adapted suite share one instance"""
+        if config.getvalue("dist") == "load":
+            return xdist.scheduler.LoadScopeScheduling(config, log)
+        return None
+
+
 # ============================================================================
 # PYTEST HOOKS
 # ============================================================================
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Site Link Crawler
+Crawls the whole site as guest, user and admin and reports broken links and redirect chains
+
+Replaces tests/tdd/LinkTester.php (sequential, hand-listed URLs): links are
+discovered from the pages themselves and fetched concurrently, see
+utils/link_crawler.py.
+
+Usage:
+  python tests/bdd/crawl_links.py
+  python tests/bdd/crawl_links.py --roles guest user --depth 2 --concurrency 32
+
+Exit code is 1 if any role has broken links or could not log in.
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'utils'))
+
+from link_crawler import AIOHTTP_AVAILABLE, REPORT_FILE, ROLES, LinkCrawler, has_broken_links, print_report, write_report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Site Link Crawler')
+    parser.add_argument('--base-url', default=os.environ.get('BASE_URL', 'http://localhost:8000'),
+                        help='Server URL (default: BASE_URL or http://localhost:8000)')
+    parser.add_argument('--roles', nargs='+', choices=ROLES, default=list(ROLES), help='Roles to crawl as')
+    parser.add_argument('--depth', type=int, default=3, help='Max link depth from the start pages (default: 3)')
+    parser.add_argument('--concurrency', type=int, default=None,
+                        help='Connection pool size (default: CRAWL_CONCURRENCY or 16)')
+    parser.add_argument('--report', default=str(REPORT_FILE), help='JSON report file')
+    args = parser.parse_args()
+
+    if not AIOHTTP_AVAILABLE:
+        print("❌ aiohttp is required: pip install aiohttp")
+        return 2
+
+    crawler = LinkCrawler(args.base_url, roles=args.roles, concurrency=args.concurrency, max_depth=args.depth)
+    report = crawler.run()
+    print_report(report)
+    print(f"\n📄 Report: {write_report(report, args.report)}")
+    return 1 if has_broken_links(report) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -10,8 +10,14 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 import json
+import os
+import sys
 import time
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'utils'))
+
+from driver_pool import get_driver_pool
+
 BASE_URL = "http://127.0.0.1:8000"
 
 def setup_driver():
@@ -161,7 +167,8 @@ def main():
     print("  ELEMENT SELECTOR DISCOVERY TOOL")
     print("=" * 80)
     
-    driver = setup_driver()
+    pool = get_driver_pool('discover_selectors', setup_driver)
+    driver = pool.checkout()
     all_selectors = {}
     
     try:
@@ -178,7 +185,7 @@ def main():
         all_selectors["access"] = find_elements_on_page(driver, f"{BASE_URL}/access")
         
     finally:
-        driver.quit()
+        pool.checkin(driver)
     
     # Save results
     output_file = "tests/bdd/results/selector_discovery.json"
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+HTTP Load Test
+Measures throughput and latency of the app's hot routes under concurrency
+
+Logs in a pool of users and replays a weighted route mix (/login,
+/dashboard, /user/dashboard, /user/family, the family AJAX endpoints) at a
+fixed concurrency or request rate, then prints HDR-style latency percentiles
+and error rates per route (see utils/load_generator.py).
+
+With --start-server the test gets its own `php -S` (PHP_CLI_SERVER_WORKERS
+workers, standing in for php-fpm) on a restored copy of the golden SQLite
+database with --users seeded users. Against an existing BASE_URL, every
+virtual user is a separate session of the test user.
+
+Usage:
+  python tests/bdd/load_test.py --start-server --users 50 --concurrency 20 --duration 30
+  python tests/bdd/load_test.py --rps 100 --duration 60 --mix read
+  BASE_URL=http://localhost:8000 python tests/bdd/load_test.py --concurrency 5
+
+Latency samples are stored with the git commit for perf_gate.py compare.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'utils'))
+
+from load_generator import AIOHTTP_AVAILABLE, ROUTE_MIXES, LoadGenerator, load_mix
+from golden_db import TEST_USER, seed_users
+from benchmark_store import BenchmarkStore
+
+
+def _ms(value):
+    return f"{value:9.2f}" if value is not None else f"{'-':>9}"
+
+
+def print_report(report):
+    print(f"\n{'='*104}")
+    print(f"LOAD TEST - {report['mode']}, {report['users']} users, {report['elapsed']:.1f}s measured, "
+          f"peak {report['in_flight_peak']} in flight")
+    print(f"{'='*104}")
+    print(f"{'route':<22}{'count':>8}{'rps':>9}{'err%':>7}{'p50':>9}{'p90':>9}{'p99':>9}{'p99.9':>9}{'max':>9}  (ms)")
+    rows = [(name, route['summary'], route['rps'], route['error_rate']) for name, route in report['routes'].items()]
+    rows.append(('TOTAL', report['total'], report['total']['rps'], report['total']['error_rate']))
+    for name, summary, rps, error_rate in rows:
+        print(f"{name:<22}{summary['count']:>8}{rps:>9.1f}{error_rate * 100:>7.1f}"
+              f"{_ms(summary['p50'])}{_ms(summary['p90'])}{_ms(summary['p99'])}{_ms(summary['p99.9'])}{_ms(summary['max'])}")
+    for name, route in report['routes'].items():
+        for error, count in sorted(route['errors'].items(), key=lambda e: -e[1]):
+            print(f"   ⚠️  {name}: {error} x{count}")
+
+
+def save_report(report):
+    """Store per-route latency samples as http_latency benchmark records"""
+    store = BenchmarkStore()
+    for name, route in report['routes'].items():
+        if route['samples']:
+            store.record(route['path'], report['mode'], [{'latency_ms': v} for v in route['samples']],
+                         kind='http_latency', role='user' if route['auth'] else 'guest', name=name,
+                         summary=route['summary'], errors=route['errors'], histogram=route['histogram'])
+    store.close()
+    return store
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HTTP Load Test')
+    parser.add_argument('--base-url', default=os.environ.get('BASE_URL', 'http://localhost:8000'))
+    load = parser.add_mutually_exclusive_group()
+    load.add_argument('--concurrency', '-c', type=int, default=10, help='Closed loop: concurrent workers (default: 10)')
+    load.add_argument('--rps', type=float, help='Open loop: target requests per second')
+    parser.add_argument('--duration', '-d', type=float, default=30, help='Measured seconds (default: 30)')
+    parser.add_argument('--warmup', type=float, default=5, help='Unmeasured seconds first (default: 5)')
+    parser.add_argument('--users', '-u', type=int, default=10, help='Virtual users (default: 10)')
+    parser.add_argument('--mix', default='default',
+                        help=f"Route mix: {', '.join(ROUTE_MIXES)} or a JSON file (default: default)")
+    parser.add_argument('--max-connections', type=int, default=100, help='Connection pool size (default: 100)')
+    parser.add_argument('--start-server', action='store_true',
+                        help='Start an isolated php -S with its own database and seeded users')
+    parser.add_argument('--php-workers', type=int, default=os.cpu_count() or 4,
+                        help='PHP_CLI_SERVER_WORKERS for --start-server (default: CPU count)')
+    parser.add_argument('--seed', type=int, help='RNG seed for the route sequence')
+    parser.add_argument('--no-save', action='store_true', help='Do not store latency samples')
+    args = parser.parse_args()
+
+    if not AIOHTTP_AVAILABLE:
+        print("❌ aiohttp is required: pip install aiohttp")
+        return 2
+
+    server = None
+    base_url = args.base_url
+    users = [(TEST_USER['email'], TEST_USER['password'])] * args.users
+    if args.start_server:
+        from php_server import PhpServer
+        server = PhpServer(shard_index='load', workers=args.php_workers)
+        server.prepare_database()
+        seeded = seed_users(server.db_path, args.users)
+        if seeded:
+            users = seeded
+        server.start(prepare_db=False)
+        base_url = server.base_url
+        print(f"🔧 {base_url} ({args.php_workers} PHP workers, {len(seeded) or 'no'} seeded users)")
+
+    try:
+        generator = LoadGenerator(base_url, load_mix(args.mix), users, concurrency=args.concurrency, rps=args.rps,
+                                  duration=args.duration, warmup=args.warmup,
+                                  max_connections=args.max_connections, seed=args.seed)
+        report = asyncio.run(generator.run())
+    finally:
+        if server:
+            server.stop()
+
+    print_report(report)
+    if not args.no_save:
+        store = save_report(report)
+        print(f"\n📄 Latency samples saved to {store.log.log_file} (run {store.run_id}, commit {store.commit})")
+    return 1 if report['total']['error_rate'] > 0.01 else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Performance Regression Gate
+Saves benchmark baselines per git commit and compares new runs against them
+
+Benchmarks (benchmark_page_load.py, load_test.py, benchmark_dashboard.py) append raw samples to
+results/benchmarks/benchmarks.jsonl tagged with the git commit. This command
+turns a commit's samples into a baseline and later checks another commit's
+samples against it (Mann-Whitney U + bootstrap CI, see utils/perf_baseline.py).
+Only statistically significant slowdowns larger than --min-effect fail.
+
+Usage:
+  # On the reference commit (e.g. main): benchmark, then store the baseline
+  python tests/bdd/benchmark_page_load.py --iterations 20
+  python tests/bdd/perf_gate.py save
+
+  # On the change under test: benchmark again, then compare
+  python tests/bdd/benchmark_page_load.py --iterations 20
+  python tests/bdd/perf_gate.py compare                 # against the latest other baseline
+  python tests/bdd/perf_gate.py compare --baseline a1b2c3d
+
+Exit code of compare is 1 if any metric regressed, 2 if there was nothing to compare.
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'utils'))
+
+from benchmark_store import BenchmarkStore, current_commit
+from perf_baseline import GATED_METRICS, BaselineStore, compare_series, series_from_records
+
+
+VERDICT_ICONS = {'regression': '❌', 'improvement': '🚀', 'unchanged': '✅', 'insufficient': '⚪'}
+
+
+def load_records(commit=None, run_id=None):
+    """Benchmark records of one run, or of every run on a commit"""
+    store = BenchmarkStore()
+    records = [
+        r for kind in GATED_METRICS for r in store.records(kind)
+        if (r.get('run_id') == run_id if run_id else r.get('commit') == commit)
+    ]
+    store.close()
+    return records
+
+
+def cmd_save(args):
+    commit = args.commit or current_commit()
+    series = series_from_records(load_records(commit, args.run))
+    if not series:
+        print(f"❌ No benchmark samples for {'run ' + args.run if args.run else 'commit ' + commit}")
+        return 2
+    if commit.endswith('+dirty'):
+        print("⚠️  Working tree has uncommitted changes; baseline is stored under " + commit)
+    BaselineStore().save(commit, series)
+    samples = sum(len(v) for s in series.values() for v in s['metrics'].values())
+    print(f"✅ Baseline for {commit}: {len(series)} series, {samples} samples")
+    return 0
+
+
+def cmd_list(args):
+    store = BaselineStore()
+    for commit in store.commits():
+        print(f"{commit}: {len(store.get(commit))} series")
+    return 0
+
+
+def _fmt(value, pattern):
+    return pattern.format(value) if value is not None else '-'
+
+
+def print_rows(rows, show_all=False):
+    for row in rows:
+        if not show_all and row['verdict'] == 'unchanged':
+            continue
+        low, high = row['ci']
+        print(f"{VERDICT_ICONS[row['verdict']]} {row['series']} {row['metric']}: "
+              f"p50 {_fmt(row['baseline_p50'], '{:.1f}')} → {_fmt(row['candidate_p50'], '{:.1f}')} "
+              f"(x{_fmt(row['ratio'], '{:.2f}')}, 95% CI {_fmt(low, '{:.2f}')}-{_fmt(high, '{:.2f}')}, "
+              f"p={_fmt(row['p_value'], '{:.4f}')}, n={row['n_baseline']}/{row['n_candidate']})")
+
+
+def cmd_compare(args):
+    candidate_commit = args.candidate or current_commit()
+    candidate = series_from_records(load_records(candidate_commit, args.run))
+    store = BaselineStore()
+    baseline_commit = args.baseline or store.latest(exclude=candidate_commit)
+    baseline = store.get(baseline_commit) if baseline_commit else None
+
+    if not baseline:
+        print(f"❌ No baseline found{' for ' + baseline_commit if baseline_commit else ''} (run: perf_gate.py save)")
+        return 2
+    if not candidate:
+        print(f"❌ No benchmark samples for {'run ' + args.run if args.run else 'commit ' + candidate_commit}")
+        return 2
+
+    rows = compare_series(baseline, candidate, alpha=args.alpha, min_effect=args.min_effect,
+                          min_samples=args.min_samples)
+    print(f"\n📊 {candidate_commit} vs baseline {baseline_commit} "
+          f"(alpha={args.alpha}, min effect={args.min_effect:.0%})")
+    print_rows(rows, show_all=args.verbose)
+
+    counts = {verdict: sum(1 for r in rows if r['verdict'] == verdict) for verdict in VERDICT_ICONS}
+    print(f"\n{counts['regression']} regressed, {counts['improvement']} improved, "
+          f"{counts['unchanged']} unchanged, {counts['insufficient']} with too few samples")
+    if not rows:
+        print("⚠️  No series in common with the baseline")
+        return 2
+    return 1 if counts['regression'] else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Performance Regression Gate')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    save = sub.add_parser('save', help='Store the samples of a commit (or run) as its baseline')
+    save.add_argument('--commit', help='Commit whose samples to store (default: current)')
+    save.add_argument('--run', help='Only use this benchmark run id')
+    save.set_defaults(func=cmd_save)
+
+    listing = sub.add_parser('list', help='List stored baselines')
+    listing.set_defaults(func=cmd_list)
+
+    compare = sub.add_parser('compare', help='Compare samples against a baseline')
+    compare.add_argument('--baseline', help='Baseline commit (default: latest saved for another commit)')
+    compare.add_argument('--candidate', help='Commit under test (default: current)')
+    compare.add_argument('--run', help='Only use this benchmark run id as the candidate')
+    compare.add_argument('--alpha', type=float, default=0.01, help='Significance level (default: 0.01)')
+    compare.add_argument('--min-effect', type=float, default=0.05,
+                         help='Smallest median slowdown that fails, as a fraction (default: 0.05)')
+    compare.add_argument('--min-samples', type=int, default=5, help='Minimum samples per side (default: 5)')
+    compare.add_argument('--verbose', '-v', action='store_true', help='Also list unchanged metrics')
+    compare.set_defaults(func=cmd_compare)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
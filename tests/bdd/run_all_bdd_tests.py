@@ -10,6 +10,7 @@ Usage:
   python tests/bdd/run_all_bdd_tests.py --no-headless      # Run with visible browser
   python tests/bdd/run_all_bdd_tests.py --test ComprehensiveRoleBasedTest
   python tests/bdd/run_all_bdd_tests.py --verbose
+  python tests/bdd/run_all_bdd_tests.py --fail-fast        # Stop at the first failing file
   
 Options:
   --pytest             - Use pytest instead of direct execution
@@ -20,6 +21,8 @@ Options:
   --url <url>          - Set base URL
   --verbose            - Verbose output
   --html               - Generate HTML report (with pytest)
+  --order <mode>       - history (riskiest/fastest-failing first, default) or fixed
+  --fail-fast [N]      - Stop after N failed files (default N: 1)
 """
 
 import os
@@ -31,6 +34,11 @@ import argparse
 from datetime import datetime
 from pathlib import Path
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'utils'))
+
+from results_store import ResultsEventLog, new_run_id
+from test_ordering import DEFAULT_RUN_LOG, plan_order, print_order
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
@@ -40,7 +48,7 @@ BASE_URL = os.environ.get('BASE_URL', 'http://localhost:8000')
 HEADLESS = os.environ.get('HEADLESS', 'true').lower() != 'false'
 TEST_TIMEOUT = os.environ.get('TEST_TIMEOUT', '15')
 
-# Main test files to run (in order)
+# Main test files to run (fixed order; --order history reorders them)
 MAIN_TESTS = [
     'ComprehensiveRoleBasedTest.py',
     'E2EComprehensiveTest.py',
@@ -195,6 +203,10 @@ def main():
     parser.add_argument('--url', type=str, help='Set base URL')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
     parser.add_argument('--html', action='store_true', help='Generate HTML report')
+    parser.add_argument('--order', choices=('history', 'fixed'), default='history',
+                        help='history: riskiest/fastest-failing files first (default); fixed: MAIN_TESTS order')
+    parser.add_argument('--fail-fast', type=int, nargs='?', const=1, default=None, metavar='N',
+                        help='Stop after N failed files (default N: 1)')
     
     args = parser.parse_args()
     
@@ -214,6 +226,8 @@ def main():
     os.environ['BASE_URL'] = BASE_URL
     os.environ['HEADLESS'] = 'true' if HEADLESS else 'false'
     os.environ['TEST_TIMEOUT'] = str(TEST_TIMEOUT)
+    # One results run for every suite started below (results.json shows only it)
+    os.environ['RESULTS_RUN_ID'] = new_run_id()
     
     # Print header
     log_header("BDD TEST SUITE RUNNER")
@@ -246,8 +260,15 @@ def main():
     else:
         # Run specific test or all tests
         test_files = [args.test] if args.test else MAIN_TESTS
+        if args.order == 'history' and len(test_files) > 1:
+            order = plan_order(test_files)
+            print("\nOrder (riskiest first):")
+            print_order(order)
+            test_files = [test_file for test_file, _ in order]
         
-        for test_file in test_files:
+        run_log = ResultsEventLog(DEFAULT_RUN_LOG)
+        failures = 0
+        for position, test_file in enumerate(test_files):
             test_start = time.time()
             passed = run_test_direct(test_file, verbose=args.verbose)
             elapsed = time.time() - test_start
@@ -256,6 +277,15 @@ def main():
                 'passed': passed,
                 'elapsed': elapsed
             }
+            run_log.append({'type': 'run', 'file': test_file, 'status': 'PASS' if passed else 'FAIL',
+                            'duration': elapsed, 'timestamp': datetime.now().isoformat()})
+            failures += not passed
+            if args.fail_fast and failures >= args.fail_fast:
+                not_run = test_files[position + 1:]
+                if not_run:
+                    log_warning(f"Fail-fast: {failures} failed, not running {', '.join(not_run)}")
+                break
+        run_log.close()
     
     total_elapsed = time.time() - total_start
     
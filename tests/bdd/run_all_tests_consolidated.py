@@ -2,12 +2,20 @@
 """
 Consolidated Test Runner - Execute all refactored test suites
 Aggregates results from all suites into a single dashboard
+
+Suites run riskiest first: historically failing, flaky and fast-failing
+suites (results/suite_runs.jsonl, see utils/test_ordering.py) start before
+the ones that always pass. With --fail-fast, the run stops once that many
+suites have failed: queued suites are not started and running ones are killed.
 """
 
+import argparse
 import subprocess
 import json
 import sys
 import os
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
 
@@ -16,6 +24,14 @@ TESTS_DIR = Path(__file__).parent
 RESULTS_DIR = TESTS_DIR / "results"
 RESULTS_DIR.mkdir(parents=True, exist_ok=True)
 RESULTS_FILE = RESULTS_DIR / "test_results.json"
+SUITE_RUNS_LOG = RESULTS_DIR / "suite_runs.jsonl"
+SUITE_TIMEOUT = 300
+
+sys.path.insert(0, str(TESTS_DIR / "utils"))
+
+from results_store import ResultsEventLog, compact_results, new_run_id
+from php_server import PhpServer, php_available
+from test_ordering import plan_order, print_order
 
 # Test suites to run
 TEST_SUITES = [
@@ -32,52 +48,232 @@ TEST_SUITES = [
 # Only run if file exists
 SUITES_TO_RUN = [s for s in TEST_SUITES if (TESTS_DIR / s).exists()]
 
+# Serializes prefixed output lines from concurrent suites
+_print_lock = threading.Lock()
+
+
+def _emit(prefix, line):
+    with _print_lock:
+        print(f"{prefix} {line}", flush=True)
+
+
+def load_suite_durations(log_file=SUITE_RUNS_LOG, window=5):
+    """
+    Get historical wall-clock duration per suite file
+
+    Args:
+        log_file: JSONL run log written by this runner
+        window: Average over the last N runs of each suite
+
+    Returns:
+        dict suite file -> seconds
+    """
+    history = {}
+    for event in ResultsEventLog(log_file).read_events():
+        if event.get("type") == "run" and event.get("status") in ("PASS", "FAIL") and event.get("duration") is not None:
+            history.setdefault(event["file"], []).append(event["duration"])
+    return {name: sum(runs[-window:]) / len(runs[-window:]) for name, runs in history.items()}
+
+
+def plan_shards(suites, workers, durations, order=None):
+    """
+    Split suites into shards
+
+    Without an order, shards are balanced longest-processing-time first.
+    With one, suites are dealt in that order to the shard that frees up
+    first, i.e. every free worker takes the riskiest suite left: the riskiest
+    suites start at once on different workers, at some cost in balance.
+    Suites without history are assumed to take the median known duration.
+
+    Args:
+        suites: Suite file names
+        workers: Number of shards
+        durations: dict suite file -> expected seconds
+        order: Optional suite files, riskiest first (plan_order())
+
+    Returns:
+        list of (expected_seconds, [suite files in run order]) per shard
+    """
+    known = sorted(durations[s] for s in suites if s in durations)
+    default = known[len(known) // 2] if known else 60.0
+    estimate = {s: durations.get(s, default) for s in suites}
+
+    if order:
+        queue = [s for s in order if s in estimate] + [s for s in suites if s not in order]
+    else:
+        queue = sorted(suites, key=lambda s: estimate[s], reverse=True)
+    shards = [[0.0, []] for _ in range(max(1, min(workers, len(suites))))]
+    for suite in queue:
+        shard = min(shards, key=lambda sh: sh[0])
+        shard[0] += estimate[suite]
+        shard[1].append(suite)
+    return [tuple(shard) for shard in shards]
+
+
+def run_test(suite_name, shard_index=0, extra_env=None, cancel=None):
+    """
+    Run a single test suite, streaming its output with a [suite] prefix
+
+    Args:
+        suite_name: Suite file name
+        shard_index: Worker running the suite (exported as TEST_SHARD_INDEX)
+        extra_env: Extra environment (e.g. the shard server's BASE_URL/DB_PATH)
+        cancel: Optional threading.Event; the suite is killed when it is set
+
+    Returns:
+        dict with file, status (PASS/FAIL/TIMEOUT/ERROR/CANCELLED), returncode, duration
+    """
+    prefix = f"[{suite_name.replace('test_', '').replace('_refactored.py', '')}]"
+    env = dict(os.environ, TEST_SHARD_INDEX=str(shard_index), PYTHONUNBUFFERED="1", **(extra_env or {}))
+    started = time.time()
+    _emit(prefix, f"▶ starting on worker {shard_index}")
 
-def run_test(suite_name):
-    """Run a single test suite"""
-    print(f"\n{'='*80}")
-    print(f"Running: {suite_name}")
-    print(f"{'='*80}")
-    
     try:
-        result = subprocess.run(
-            ["python", str(TESTS_DIR / suite_name)],
+        proc = subprocess.Popen(
+            [sys.executable, str(TESTS_DIR / suite_name)],
             cwd=str(TESTS_DIR.parent.parent),
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            timeout=300
+            bufsize=1,
+            env=env
         )
-        
-        if result.returncode == 0:
-            print(f"✅ {suite_name} - PASS")
-            return True
-        else:
-            print(f"❌ {suite_name} - FAIL")
-            if result.stdout:
-                print("STDOUT:", result.stdout[-500:])  # Last 500 chars
-            if result.stderr:
-                print("STDERR:", result.stderr[-500:])
-            return False
-    except subprocess.TimeoutExpired:
-        print(f"⏱️ {suite_name} - TIMEOUT")
-        return False
     except Exception as e:
-        print(f"❌ {suite_name} - ERROR: {e}")
-        return False
+        _emit(prefix, f"❌ ERROR: {e}")
+        return {"file": suite_name, "status": "ERROR", "returncode": None, "duration": 0}
+
+    timed_out = threading.Event()
+    cancelled = threading.Event()
 
+    def kill():
+        timed_out.set()
+        proc.kill()
 
-def aggregate_results():
-    """Aggregate all results from JSON"""
+    def watch_cancel():
+        while proc.poll() is None:
+            if cancel.wait(0.2):
+                cancelled.set()
+                proc.kill()
+                return
+
+    timer = threading.Timer(SUITE_TIMEOUT, kill)
+    timer.start()
+    if cancel is not None:
+        threading.Thread(target=watch_cancel, daemon=True).start()
     try:
-        if RESULTS_FILE.exists():
-            with open(RESULTS_FILE, 'r') as f:
-                data = json.load(f)
-            return data
-        else:
-            return {}
+        for line in proc.stdout:
+            _emit(prefix, line.rstrip("\n"))
+        returncode = proc.wait()
+    finally:
+        timer.cancel()
+
+    duration = time.time() - started
+    if cancelled.is_set():
+        status = "CANCELLED"
+        _emit(prefix, f"⏹️ CANCELLED after {duration:.1f}s (fail-fast)")
+    elif timed_out.is_set():
+        status = "TIMEOUT"
+        _emit(prefix, f"⏱️ TIMEOUT after {SUITE_TIMEOUT}s")
+    elif returncode == 0:
+        status = "PASS"
+        _emit(prefix, f"✅ PASS ({duration:.1f}s)")
+    else:
+        status = "FAIL"
+        _emit(prefix, f"❌ FAIL (exit {returncode}, {duration:.1f}s)")
+    return {"file": suite_name, "status": status, "returncode": returncode, "duration": duration}
+
+
+def start_shard_servers(count):
+    """
+    Start one isolated PHP server (own port and SQLite DB) per shard
+
+    Returns:
+        list of started PhpServer
+    """
+    servers = []
+    try:
+        for index in range(count):
+            server = PhpServer(shard_index=index).start()
+            print(f"  worker {index} server: {server.base_url} (DB_PATH={server.db_path})")
+            servers.append(server)
+    except Exception:
+        stop_shard_servers(servers)
+        raise
+    return servers
+
+
+def stop_shard_servers(servers):
+    for server in servers:
+        server.stop()
+
+
+def run_shards(shards, servers=None, max_failures=None):
+    """
+    Run each shard's suites sequentially, all shards concurrently
+
+    Args:
+        shards: plan_shards() result
+        servers: Optional PhpServer per shard; its env is exported to the suites
+        max_failures: Stop after this many failed suites (None: run everything)
+
+    Returns:
+        dict suite file -> run_test() result (suites never started are missing)
+    """
+    outcomes = {}
+    outcomes_lock = threading.Lock()
+    run_log = ResultsEventLog(SUITE_RUNS_LOG)
+    cancel = threading.Event()
+    failures = []
+
+    def worker(index, suites):
+        for position, suite in enumerate(suites):
+            if cancel.is_set():
+                return
+            if servers and position > 0:
+                # Fresh database per suite; cached logins of seeded users stay valid
+                servers[index].reset_database()
+            outcome = run_test(suite, index, servers[index].env() if servers else None,
+                               cancel if max_failures else None)
+            with outcomes_lock:
+                outcomes[suite] = outcome
+                if outcome["status"] not in ("CANCELLED", "ERROR"):
+                    # Durations use PASS/FAIL only; TIMEOUT still counts as a failure for ordering
+                    run_log.append(dict(outcome, type="run", timestamp=datetime.now().isoformat()))
+                if outcome["status"] != "PASS" and outcome["status"] != "CANCELLED":
+                    failures.append(suite)
+                    if max_failures and len(failures) >= max_failures and not cancel.is_set():
+                        _emit("[runner]", f"⛔ fail-fast: {len(failures)} suite(s) failed, stopping the run")
+                        cancel.set()
+
+    threads = [
+        threading.Thread(target=worker, args=(index, suites), name=f"shard-{index}")
+        for index, (_, suites) in enumerate(shards)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    run_log.close()
+    return outcomes
+
+
+def aggregate_results(run):
+    """
+    Aggregate results recorded by the suites
+
+    Compacts the shared event log into RESULTS_FILE, keeping only the events
+    of this run (RESULTS_RUN_ID), so stale results from earlier runs do not count.
+    """
+    try:
+        aggregated = compact_results(RESULTS_FILE, run)
+        return aggregated if aggregated["test_suites"] else {}
     except Exception as e:
         print(f"Error reading results: {e}")
-        return {}
+        try:
+            with open(RESULTS_FILE, 'r') as f:
+                return json.load(f)
+        except Exception:
+            return {}
 
 
 def print_summary(aggregated):
@@ -90,11 +286,11 @@ def print_summary(aggregated):
     total_passed = 0
     total_failed = 0
     
-    if 'suites' in aggregated:
-        for suite_name, suite_data in aggregated['suites'].items():
+    if 'test_suites' in aggregated:
+        for suite_name, suite_data in aggregated['test_suites'].items():
             if 'tests' in suite_data:
                 tests = suite_data['tests']
-                passed = sum(1 for t in tests if t.get('status') == 'PASS')
+                passed = sum(1 for t in tests if str(t.get('status', '')).upper() == 'PASS')
                 failed = len(tests) - passed
                 total_tests += len(tests)
                 total_passed += passed
@@ -116,28 +312,63 @@ def print_summary(aggregated):
 
 def main():
     """Main execution"""
+    parser = argparse.ArgumentParser(description='Consolidated Test Runner')
+    parser.add_argument('--workers', '-j', type=int,
+                        default=int(os.environ.get('TEST_WORKERS', min(os.cpu_count() or 1, len(SUITES_TO_RUN) or 1))),
+                        help='Number of suites to run concurrently (default: TEST_WORKERS or CPU count)')
+    parser.add_argument('--isolated-servers', dest='isolated', action='store_true', default=None,
+                        help='Start a PHP server with its own SQLite DB per worker (default when workers > 1)')
+    parser.add_argument('--shared-server', dest='isolated', action='store_false',
+                        help='Run every worker against BASE_URL')
+    parser.add_argument('--order', choices=('history', 'fixed'), default='history',
+                        help='history: riskiest/fastest-failing suites first (default); fixed: TEST_SUITES order')
+    parser.add_argument('--fail-fast', type=int, nargs='?', const=1, default=None, metavar='N',
+                        help='Stop after N failed suites (default N: 1)')
+    args = parser.parse_args()
+
+    order = plan_order(SUITES_TO_RUN) if args.order == 'history' else None
+    shards = plan_shards(SUITES_TO_RUN, args.workers, load_suite_durations(),
+                         [suite for suite, _ in order] if order else None)
+
     print("\n" + "="*80)
     print(f"UMASHAKTIDHAM TEST SUITE - CONSOLIDATED RUNNER")
     print(f"Timestamp: {datetime.now().isoformat()}")
-    print(f"Suites to run: {len(SUITES_TO_RUN)}")
+    print(f"Suites to run: {len(SUITES_TO_RUN)} across {len(shards)} worker(s)")
+    if order:
+        print("Order (riskiest first):")
+        print_order(order)
+    if args.fail_fast:
+        print(f"Fail-fast: stop after {args.fail_fast} failed suite(s)")
+    for index, (expected, suites) in enumerate(shards):
+        print(f"  worker {index} (~{expected:.0f}s): {', '.join(suites)}")
+    
+    isolated = args.isolated
+    if isolated is None:
+        isolated = len(shards) > 1 and php_available()
+    servers = start_shard_servers(len(shards)) if isolated else []
     print("="*80)
     
     # Run all test suites
-    results = {}
-    for suite in SUITES_TO_RUN:
-        success = run_test(suite)
-        results[suite] = "PASS" if success else "FAIL"
-    
-    # Give results time to be written
-    import time
-    time.sleep(2)
+    started = time.time()
+    # Every suite process records under this run; the summary covers only it
+    run = os.environ['RESULTS_RUN_ID'] = new_run_id()
+    try:
+        outcomes = run_shards(shards, servers, args.fail_fast)
+    finally:
+        stop_shard_servers(servers)
+    wall_time = time.time() - started
     
     # Aggregate results
-    aggregated = aggregate_results()
+    aggregated = aggregate_results(run)
     passed, total = print_summary(aggregated)
     
-    # Return exit code based on all tests passing
-    if total > 0 and passed == total:
+    failed_suites = [s for s in SUITES_TO_RUN if outcomes.get(s, {}).get("status") != "PASS"]
+    for suite in failed_suites:
+        print(f"❌ {suite}: {outcomes.get(suite, {}).get('status', 'NOT RUN')}")
+    print(f"Wall time: {wall_time:.1f}s")
+    
+    # Exit code: every suite process succeeded and every recorded test passed
+    if not failed_suites and total > 0 and passed == total:
         print("✅ ALL TESTS PASSED!")
         return 0
     else:
@@ -18,8 +18,10 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from common_config import (
-    BASE_URL, TEST_TIMEOUT, setup_webdriver,
-    TestResultsManager, create_and_login_user, logger
+    BASE_URL, TEST_TIMEOUT, checkout_webdriver, checkin_webdriver,
+    navigate, click_and_wait, settle,
+    TestResultsManager, get_logged_in_user, logger,
+    depends_on, run_test_dag
 )
 
 
@@ -37,7 +39,7 @@ class AdminManagementTests:
     
     def setup(self):
         """Initialize"""
-        self.driver = setup_webdriver()
+        self.driver = checkout_webdriver()
         results_file = Path(self.RESULTS_DIR) / "test_results.json"
         self.results = TestResultsManager(results_file)
         self.results.add_suite(self.SUITE_NAME, {})
@@ -49,7 +51,7 @@ class AdminManagementTests:
         """Cleanup"""
         try:
             if self.driver:
-                self.driver.quit()
+                checkin_webdriver(self.driver)
         except:
             pass
         if self.results:
@@ -62,7 +64,7 @@ class AdminManagementTests:
         test_name = "Register Admin User"
         start = time.time()
         try:
-            result = create_and_login_user(self.driver)
+            result = get_logged_in_user(self.driver, role="admin")
             if not result['success']:
                 raise Exception(result.get('error', 'Login failed'))
             self.admin_user = result
@@ -76,6 +78,7 @@ class AdminManagementTests:
             print(f"❌ {test_id}: {test_name} - {str(e)}")
             return False
     
+    @depends_on('test_001_register_admin_user')
     def test_002_navigate_admin_panel(self):
         """ADMIN-002: Navigate to admin panel"""
         test_id = "ADMIN-002"
@@ -85,8 +88,7 @@ class AdminManagementTests:
             if not self.admin_user or not self.admin_user.get('success'):
                 raise Exception("Admin user not logged in")
             
-            self.driver.get(f"{BASE_URL}/admin/dashboard")
-            time.sleep(2)
+            navigate(self.driver, f"{BASE_URL}/admin/dashboard", TEST_TIMEOUT)
             
             # Check if on admin page
             if "/admin" in self.driver.current_url.lower():
@@ -124,14 +126,14 @@ class AdminManagementTests:
             print(f"❌ {test_id}: {test_name} - {str(e)}")
             return False
     
+    @depends_on('test_001_register_admin_user')
     def test_004_view_users_list(self):
         """ADMIN-004: View users list"""
         test_id = "ADMIN-004"
         test_name = "View Users List"
         start = time.time()
         try:
-            self.driver.get(f"{BASE_URL}/admin/users")
-            time.sleep(2)
+            navigate(self.driver, f"{BASE_URL}/admin/users", TEST_TIMEOUT)
             
             wait = WebDriverWait(self.driver, TEST_TIMEOUT)
             # Look for users table or list
@@ -156,14 +158,14 @@ class AdminManagementTests:
             print(f"❌ {test_id}: {test_name} - {str(e)}")
             return False
     
+    @depends_on('test_001_register_admin_user', 'test_003_register_test_user')
     def test_005_add_user_via_admin(self):
         """ADMIN-005: Add user via admin panel"""
         test_id = "ADMIN-005"
         test_name = "Add User Via Admin"
         start = time.time()
         try:
-            self.driver.get(f"{BASE_URL}/admin/add-user")
-            time.sleep(1)
+            navigate(self.driver, f"{BASE_URL}/admin/add-user", TEST_TIMEOUT)
             
             wait = WebDriverWait(self.driver, TEST_TIMEOUT)
             
@@ -179,9 +181,7 @@ class AdminManagementTests:
             
             # Submit form
             submit_btn = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
-            self.driver.execute_script("arguments[0].click();", submit_btn)
-            
-            time.sleep(2)
+            click_and_wait(self.driver, submit_btn, TEST_TIMEOUT)
             duration = time.time() - start
             self.results.add_test(self.SUITE_NAME, test_id, test_name, "PASS", duration, "User added")
             print(f"✅ {test_id}: {test_name} ({duration:.2f}s)")
@@ -192,22 +192,20 @@ class AdminManagementTests:
             print(f"❌ {test_id}: {test_name} - {str(e)}")
             return False
     
+    @depends_on('test_001_register_admin_user')
     def test_006_edit_user_via_admin(self):
         """ADMIN-006: Edit user via admin panel"""
         test_id = "ADMIN-006"
         test_name = "Edit User Via Admin"
         start = time.time()
         try:
-            self.driver.get(f"{BASE_URL}/admin/users")
-            time.sleep(1)
+            navigate(self.driver, f"{BASE_URL}/admin/users", TEST_TIMEOUT)
             
             wait = WebDriverWait(self.driver, TEST_TIMEOUT)
             
             # Find and click edit button
             edit_btn = wait.until(EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), 'Edit')] | //button[contains(text(), 'Edit')]")))
-            self.driver.execute_script("arguments[0].click();", edit_btn)
-            
-            time.sleep(1)
+            click_and_wait(self.driver, edit_btn, TEST_TIMEOUT)
             # Modify field
             name_field = self.driver.find_element(By.NAME, "name")
             name_field.clear()
@@ -215,9 +213,7 @@ class AdminManagementTests:
             
             # Save
             save_btn = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
-            self.driver.execute_script("arguments[0].click();", save_btn)
-            
-            time.sleep(2)
+            click_and_wait(self.driver, save_btn, TEST_TIMEOUT)
             duration = time.time() - start
             self.results.add_test(self.SUITE_NAME, test_id, test_name, "PASS", duration, "User updated")
             print(f"✅ {test_id}: {test_name} ({duration:.2f}s)")
@@ -228,14 +224,14 @@ class AdminManagementTests:
             print(f"❌ {test_id}: {test_name} - {str(e)}")
             return False
     
+    @depends_on('test_001_register_admin_user')
     def test_007_role_verification(self):
         """ADMIN-007: Verify admin role visibility"""
         test_id = "ADMIN-007"
         test_name = "Role Verification"
         start = time.time()
         try:
-            self.driver.get(f"{BASE_URL}/user/dashboard")
-            time.sleep(1)
+            navigate(self.driver, f"{BASE_URL}/user/dashboard", TEST_TIMEOUT)
             
             wait = WebDriverWait(self.driver, TEST_TIMEOUT)
             
@@ -258,30 +254,28 @@ class AdminManagementTests:
             print(f"❌ {test_id}: {test_name} - {str(e)}")
             return False
     
+    @depends_on('test_001_register_admin_user')
     def test_008_delete_user_via_admin(self):
         """ADMIN-008: Delete user via admin panel"""
         test_id = "ADMIN-008"
         test_name = "Delete User Via Admin"
         start = time.time()
         try:
-            self.driver.get(f"{BASE_URL}/admin/users")
-            time.sleep(1)
+            navigate(self.driver, f"{BASE_URL}/admin/users", TEST_TIMEOUT)
             
             wait = WebDriverWait(self.driver, TEST_TIMEOUT)
             
             # Find and click delete button
             delete_btn = wait.until(EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), 'Delete')] | //button[contains(text(), 'Delete')]")))
-            self.driver.execute_script("arguments[0].click();", delete_btn)
-            
-            time.sleep(1)
+            click_and_wait(self.driver, delete_btn, TEST_TIMEOUT)
             # Confirm delete if modal appears
             try:
                 confirm_btn = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Confirm')] | //button[contains(text(), 'Yes')]")
-                self.driver.execute_script("arguments[0].click();", confirm_btn)
+                click_and_wait(self.driver, confirm_btn, TEST_TIMEOUT)
             except:
                 pass
             
-            time.sleep(2)
+            settle(self.driver, TEST_TIMEOUT)
             duration = time.time() - start
             self.results.add_test(self.SUITE_NAME, test_id, test_name, "PASS", duration, "User deleted")
             print(f"✅ {test_id}: {test_name} ({duration:.2f}s)")
@@ -293,23 +287,11 @@ class AdminManagementTests:
             return False
     
     def run_all_tests(self):
-        """Run all tests"""
+        """Run all tests along their dependencies (dependents of a failure are skipped)"""
         print(f"\n🚀 Starting {self.SUITE_NAME.upper()} test suite\n")
-        tests = [
-            self.test_001_register_admin_user,
-            self.test_002_navigate_admin_panel,
-            self.test_003_register_test_user,
-            self.test_004_view_users_list,
-            self.test_005_add_user_via_admin,
-            self.test_006_edit_user_via_admin,
-            self.test_007_role_verification,
-            self.test_008_delete_user_via_admin,
-        ]
-        results = [test() for test in tests]
-        passed = sum(1 for r in results if r)
-        total = len(results)
+        passed, skipped, total = run_test_dag(self)
         print(f"\n{'='*80}")
-        print(f"RESULTS: {passed}/{total} tests passed ({passed*100//total}%)")
+        print(f"RESULTS: {passed}/{total} tests passed ({passed*100//total}%), {skipped} skipped")
         print(f"{'='*80}\n")
         return passed == total
 
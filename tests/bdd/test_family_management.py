@@ -19,6 +19,8 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import time
+import sys
+import os
 import json
 import random
 from datetime import datetime
@@ -60,18 +62,8 @@ class TestResults:
         return failed == 0
 
 
-def save_debug(driver, name_prefix):
-    """Save screenshot and HTML for debugging"""
-    ts = int(time.time())
-    try:
-        screenshot = f"{name_prefix}-{ts}.png"
-        driver.save_screenshot(screenshot)
-        with open(f"{name_prefix}-{ts}.html", 'w', encoding='utf-8') as f:
-            f.write(driver.page_source)
-        return screenshot
-    except Exception as e:
-        print(f"   ⚠️  Could not save debug: {e}")
-        return None
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'utils'))
+from debug_artifacts import save_debug
 
 
 def build_driver(headless=True):
@@ -29,9 +29,17 @@ from selenium.webdriver.support import expected_conditions as EC
 from common_config import (
     BASE_URL,
     TEST_TIMEOUT,
-    setup_webdriver,
+    checkout_webdriver,
+    checkin_webdriver,
     TestResultsManager,
-    create_and_login_user,
+    get_logged_in_user,
+    navigate,
+    click_and_wait,
+    settle,
+    scroll_into_view,
+    save_debug,
+    depends_on,
+    run_test_dag,
     logger,
 )
 
@@ -50,7 +58,7 @@ class FamilyManagementTests:
     
     def setup(self):
         """Initialize test suite"""
-        self.driver = setup_webdriver()
+        self.driver = checkout_webdriver()
         results_file = Path(self.RESULTS_DIR) / "test_results.json"
         self.results = TestResultsManager(results_file)
         self.results.add_suite(self.SUITE_NAME, {})
@@ -62,7 +70,7 @@ class FamilyManagementTests:
         """Cleanup after tests"""
         try:
             if self.driver:
-                self.driver.quit()
+                checkin_webdriver(self.driver)
         except:
             pass
         
@@ -73,13 +81,7 @@ class FamilyManagementTests:
     
     def save_debug(self, name_prefix):
         """Save debug artifacts"""
-        timestamp = int(time.time())
-        try:
-            screenshot = f"/tmp/{name_prefix}-{timestamp}.png"
-            self.driver.save_screenshot(screenshot)
-            logger.info(f"Screenshot: {screenshot}")
-        except Exception as e:
-            logger.error(f"Screenshot failed: {e}")
+        return save_debug(self.driver, name_prefix)
     
     def test_001_register_and_login(self):
         """FAM-001: Register new user and login"""
@@ -88,7 +90,8 @@ class FamilyManagementTests:
         start_time = time.time()
         
         try:
-            result = create_and_login_user(self.driver)
+            # Fresh user: the suite adds and deletes family members, so no cached session
+            result = get_logged_in_user(self.driver, cache=False)
             
             if not result['success']:
                 raise Exception(result.get('error', 'Unknown error'))
@@ -121,6 +124,7 @@ class FamilyManagementTests:
             self.save_debug("FAM-001-fail")
             return False
     
+    @depends_on('test_001_register_and_login')
     def test_002_add_family_ajax(self):
         """FAM-002: Add family member via AJAX"""
         test_id = "FAM-002"
@@ -131,8 +135,7 @@ class FamilyManagementTests:
             if not self.test_user or not self.test_user.get('success'):
                 raise Exception("User not logged in")
             
-            self.driver.get(f"{BASE_URL}/user/dashboard")
-            time.sleep(1)
+            navigate(self.driver, f"{BASE_URL}/user/dashboard", TEST_TIMEOUT)
             
             member_data = {
                 'first_name': f'Member_AJAX_{random.randint(1000, 9999)}',
@@ -185,6 +188,7 @@ class FamilyManagementTests:
             self.save_debug("FAM-002-fail")
             return False
     
+    @depends_on('test_001_register_and_login')
     def test_003_add_family_form(self):
         """FAM-003: Add family members for each relationship type via form"""
         test_id = "FAM-003"
@@ -193,8 +197,7 @@ class FamilyManagementTests:
         try:
             if not self.test_user or not self.test_user.get('success'):
                 raise Exception("User not logged in")
-            self.driver.get(f"{BASE_URL}/user/dashboard")
-            time.sleep(1)
+            navigate(self.driver, f"{BASE_URL}/user/dashboard", TEST_TIMEOUT)
             # All relationship types from member-form.php
             relationships = [
                 'spouse','son','daughter','mother','father','sibling','brother','sister',
@@ -210,12 +213,11 @@ class FamilyManagementTests:
                 }
                 try:
                     add_btn = wait.until(EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Add Family Member')] | //a[contains(text(), 'Add Family Member')]")))
-                    self.driver.execute_script("arguments[0].scrollIntoView(true);", add_btn)
-                    time.sleep(0.5)
+                    scroll_into_view(self.driver, add_btn)
                     add_btn.click()
                     # Wait for modal and fields to be enabled
                     modal = wait.until(EC.visibility_of_element_located((By.ID, "memberForm")))
-                    time.sleep(0.5)
+                    settle(self.driver, TEST_TIMEOUT)
                     for field_name, value in member.items():
                         try:
                             field = wait.until(EC.presence_of_element_located((By.NAME, field_name)))
@@ -226,8 +228,7 @@ class FamilyManagementTests:
                             logger.warning(f"Could not fill field {field_name}: {e}")
                     # Submit form
                     submit_btn = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "form#memberForm button[type='submit']")))
-                    self.driver.execute_script("arguments[0].click();", submit_btn)
-                    time.sleep(1)
+                    click_and_wait(self.driver, submit_btn, TEST_TIMEOUT)
                     self.added_members.append(member)
                 except Exception as e:
                     logger.warning(f"Failed to add {member['first_name']}: {e}")
@@ -256,6 +257,7 @@ class FamilyManagementTests:
             self.save_debug("FAM-003-fail")
             return False
     
+    @depends_on('test_001_register_and_login')
     def test_004_edit_family_member(self):
         """FAM-004: Edit random family members and update different fields"""
         test_id = "FAM-004"
@@ -266,18 +268,15 @@ class FamilyManagementTests:
                 raise Exception("User not logged in")
             if not self.added_members:
                 raise Exception("No family members to edit")
-            self.driver.get(f"{BASE_URL}/user/dashboard")
-            time.sleep(1)
+            navigate(self.driver, f"{BASE_URL}/user/dashboard", TEST_TIMEOUT)
             wait = WebDriverWait(self.driver, TEST_TIMEOUT)
             # Find Edit buttons
             edit_buttons = wait.until(EC.presence_of_all_elements_located((By.XPATH, "//button[contains(@title, 'Edit')] | //a[contains(@title, 'Edit')] | //button[contains(text(), 'Edit')] | //a[contains(text(), 'Edit')]")))
             if edit_buttons:
                 for i in range(min(3, len(edit_buttons))):
                     edit_btn = edit_buttons[i]
-                    self.driver.execute_script("arguments[0].scrollIntoView(true);", edit_btn)
-                    time.sleep(0.5)
-                    edit_btn.click()
-                    time.sleep(1)
+                    scroll_into_view(self.driver, edit_btn)
+                    click_and_wait(self.driver, edit_btn, TEST_TIMEOUT, js_click=False)
                     # Update random fields
                     field_updates = {
                         "first_name": f"Edited{i}",
@@ -296,8 +295,7 @@ class FamilyManagementTests:
                             logger.warning(f"Could not update field {field_name}: {e}")
                     # Submit
                     submit_btn = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "form#memberForm button[type='submit']")))
-                    self.driver.execute_script("arguments[0].click();", submit_btn)
-                    time.sleep(1)
+                    click_and_wait(self.driver, submit_btn, TEST_TIMEOUT)
                 duration = time.time() - start_time
                 self.results.add_test(
                     self.SUITE_NAME,
@@ -325,6 +323,7 @@ class FamilyManagementTests:
             self.save_debug("FAM-004-fail")
             return False
     
+    @depends_on('test_001_register_and_login')
     def test_005_delete_family_member(self):
         """FAM-005: Delete family members using dashboard delete icon"""
         test_id = "FAM-005"
@@ -335,25 +334,22 @@ class FamilyManagementTests:
                 raise Exception("User not logged in")
             if not self.added_members:
                 raise Exception("No family members to delete")
-            self.driver.get(f"{BASE_URL}/user/dashboard")
-            time.sleep(1)
+            navigate(self.driver, f"{BASE_URL}/user/dashboard", TEST_TIMEOUT)
             wait = WebDriverWait(self.driver, TEST_TIMEOUT)
             # Find Delete icons/buttons (by title or icon)
             delete_buttons = wait.until(EC.presence_of_all_elements_located((By.XPATH, "//button[contains(@title, 'Delete')] | //a[contains(@title, 'Delete')] | //button[contains(text(), 'Delete')] | //a[contains(text(), 'Delete')]")))
             if delete_buttons:
                 for i in range(min(3, len(delete_buttons))):
                     delete_btn = delete_buttons[i]
-                    self.driver.execute_script("arguments[0].scrollIntoView(true);", delete_btn)
-                    time.sleep(0.5)
-                    delete_btn.click()
+                    scroll_into_view(self.driver, delete_btn)
                     # Handle confirmation modal if present
-                    time.sleep(1)
+                    click_and_wait(self.driver, delete_btn, TEST_TIMEOUT, js_click=False)
                     try:
                         confirm_btn = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Confirm')] | //button[contains(text(), 'Yes')] | //button[contains(@class, 'btn-danger')]")
-                        confirm_btn.click()
+                        click_and_wait(self.driver, confirm_btn, TEST_TIMEOUT, js_click=False)
                     except:
                         pass
-                    time.sleep(1)
+                    settle(self.driver, TEST_TIMEOUT)
                 duration = time.time() - start_time
                 self.results.add_test(
                     self.SUITE_NAME,
@@ -382,32 +378,12 @@ class FamilyManagementTests:
             return False
     
     def run_all_tests(self):
-        """Run all tests in sequence"""
+        """Run all tests along their dependencies (dependents of a failure are skipped)"""
         print(f"\n🚀 Starting {self.SUITE_NAME.upper()} test suite\n")
-        
-        tests = [
-            self.test_001_register_and_login,
-            self.test_002_add_family_ajax,
-            self.test_003_add_family_form,
-            self.test_004_edit_family_member,
-            self.test_005_delete_family_member,
-        ]
-        
-        results = []
-        for test in tests:
-            try:
-                results.append(test())
-            except Exception as e:
-                logger.error(f"Test {test.__name__} failed: {e}")
-                results.append(False)
-        
-        # Print summary
-        passed = sum(1 for r in results if r)
-        total = len(results)
-        print(f"\n{'=' * 80}")
-        print(f"RESULTS: {passed}/{total} tests passed ({passed * 100 // total}%)")
-        print(f"{'=' * 80}\n")
-        
+        passed, skipped, total = run_test_dag(self)
+        print(f"\n{'='*80}")
+        print(f"RESULTS: {passed}/{total} tests passed ({passed*100//total}%), {skipped} skipped")
+        print(f"{'='*80}\n")
         return passed == total
 
 
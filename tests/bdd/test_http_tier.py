@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+HTTP-Only Test Tier
+Server-rendered checks from test_selenium.UmaShaktiDhamTest without a browser
+
+Auth gating, footer, meta tags and the navbar per role need no JavaScript, so
+they run on requests + lxml (see utils/http_client.py): pages are fetched
+concurrently once per class and each test asserts on the parsed HTML.
+Selenium suites keep the interactive flows (modals, forms, JS validation).
+
+Usage:
+  BASE_URL=http://localhost:8000 python tests/bdd/test_http_tier.py
+"""
+
+import os
+import sys
+import unittest
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'utils'))
+
+from http_client import HTTP_TIER_AVAILABLE, HttpClient
+from navbar_roles import get_role_matcher
+from golden_db import TEST_USER
+
+
+BASE_URL = os.environ.get('BASE_URL', 'http://localhost:8000').rstrip('/')
+TEST_EMAIL = os.environ.get('HTTP_TIER_EMAIL', TEST_USER['email'])
+TEST_PASSWORD = os.environ.get('HTTP_TIER_PASSWORD', TEST_USER['password'])
+
+ADMIN_URLS = ["/admin", "/admin/users", "/admin/moderators", "/admin/events"]
+GUEST_PAGES = ["/", "/login", "/dashboard"] + ADMIN_URLS
+
+
+def redirected_to_login(page):
+    return "login" in page.url.lower()
+
+
+@unittest.skipUnless(HTTP_TIER_AVAILABLE, "requires 'requests' and 'lxml' (pip install requests lxml)")
+class GuestHttpTest(unittest.TestCase):
+    """Guest checks (no session cookie)"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = HttpClient(BASE_URL)
+        cls.pages = cls.client.get_many(GUEST_PAGES)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.close()
+
+    def test_01_homepage_loads(self):
+        """Test that the homepage loads correctly"""
+        page = self.pages["/"]
+        self.assertEqual(page.status, 200)
+        self.assertIn("Uma Shakti Dham", page.title)
+        self.assertIsNotNone(page.find("//*[@id='mainNav']"))
+        self.assertIsNotNone(page.find("//a[contains(text(), 'Login')]"))
+
+    def test_02_login_page_accessible(self):
+        """Test that login page has its form elements"""
+        page = self.pages["/login"]
+        self.assertIsNotNone(page.find("//*[@name='email']"))
+        self.assertIsNotNone(page.find("//*[@name='password']"))
+        self.assertIsNotNone(page.find("//button[@type='submit']"))
+
+    def test_05_dashboard_requires_authentication(self):
+        """Test that dashboard requires authentication"""
+        self.assertTrue(redirected_to_login(self.pages["/dashboard"]), self.pages["/dashboard"].url)
+
+    def test_06_admin_routes_require_authentication(self):
+        """Test that admin routes require authentication"""
+        for url in ADMIN_URLS:
+            with self.subTest(url=url):
+                self.assertTrue(redirected_to_login(self.pages[url]), self.pages[url].url)
+
+    def test_13_check_footer_presence(self):
+        """Test that footer is present on pages"""
+        self.assertIsNotNone(self.pages["/"].find("//footer"))
+
+    def test_15_check_meta_tags(self):
+        """Test that pages have proper meta tags"""
+        self.assertIsNotNone(self.pages["/"].meta('description'))
+        self.assertIsNotNone(self.pages["/"].meta('viewport'))
+
+    def test_20_guest_navbar_links(self):
+        """Test guest navbar shows login/register and hides member links"""
+        result = get_role_matcher('guest').match(self.pages["/"].navbar_links())
+        self.assertEqual(result['missing'], [], result)
+        self.assertEqual(result['visible_hidden'], [], result)
+
+
+@unittest.skipUnless(HTTP_TIER_AVAILABLE, "requires 'requests' and 'lxml' (pip install requests lxml)")
+class UserHttpTest(unittest.TestCase):
+    """Logged-in user checks (session cookie from a form login)"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = HttpClient(BASE_URL)
+        cls.login_page = cls.client.login(TEST_EMAIL, TEST_PASSWORD)
+        cls.pages = cls.client.get_many(["/user/dashboard"] + ADMIN_URLS)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.close()
+
+    def test_01_login_sets_session(self):
+        """Test that logging in lands on the dashboard"""
+        self.assertNotIn("/login", urlparse(self.login_page.url).path, self.login_page.url)
+        self.assertFalse(redirected_to_login(self.pages["/user/dashboard"]))
+
+    def test_02_admin_routes_denied_for_user(self):
+        """Test that a regular user cannot open admin routes"""
+        for url in ADMIN_URLS:
+            with self.subTest(url=url):
+                path = urlparse(self.pages[url].url).path
+                self.assertTrue(self.pages[url].status >= 400 or not path.startswith("/admin"),
+                                f"{url} served {self.pages[url].status} at {path}")
+
+    def test_03_user_navbar_links(self):
+        """Test user navbar shows member links and hides login/admin"""
+        result = get_role_matcher('user').match(self.pages["/user/dashboard"].navbar_links())
+        self.assertEqual(result['missing'], [], result)
+        self.assertEqual(result['visible_hidden'], [], result)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
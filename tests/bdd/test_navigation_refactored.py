@@ -18,8 +18,10 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from common_config import (
-    BASE_URL, TEST_TIMEOUT, setup_webdriver,
-    TestResultsManager, create_and_login_user, logger
+    BASE_URL, TEST_TIMEOUT, checkout_webdriver, checkin_webdriver,
+    navigate, click_and_wait,
+    TestResultsManager, create_and_login_user, get_logged_in_user, logger,
+    depends_on, run_test_dag
 )
 
 
@@ -35,7 +37,7 @@ class NavigationTests:
     
     def setup(self):
         """Initialize"""
-        self.driver = setup_webdriver()
+        self.driver = checkout_webdriver()
         results_file = Path(self.RESULTS_DIR) / "test_results.json"
         self.results = TestResultsManager(results_file)
         self.results.add_suite(self.SUITE_NAME, {})
@@ -47,7 +49,7 @@ class NavigationTests:
         """Cleanup"""
         try:
             if self.driver:
-                self.driver.quit()
+                checkin_webdriver(self.driver)
         except:
             pass
         if self.results:
@@ -60,8 +62,7 @@ class NavigationTests:
         test_name = "Guest Navbar Elements"
         start = time.time()
         try:
-            self.driver.get(BASE_URL)
-            time.sleep(1)
+            navigate(self.driver, BASE_URL, TEST_TIMEOUT)
             
             wait = WebDriverWait(self.driver, TEST_TIMEOUT)
             
@@ -90,14 +91,11 @@ class NavigationTests:
         test_name = "Login Link Navigation"
         start = time.time()
         try:
-            self.driver.get(BASE_URL)
-            time.sleep(1)
+            navigate(self.driver, BASE_URL, TEST_TIMEOUT)
             
             wait = WebDriverWait(self.driver, TEST_TIMEOUT)
             login_link = wait.until(EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), 'LOGIN')] | //a[contains(text(), 'Login')]")))
-            self.driver.execute_script("arguments[0].click();", login_link)
-            
-            time.sleep(1)
+            click_and_wait(self.driver, login_link, TEST_TIMEOUT)
             
             if "/login" in self.driver.current_url:
                 duration = time.time() - start
@@ -118,14 +116,11 @@ class NavigationTests:
         test_name = "Register Link Navigation"
         start = time.time()
         try:
-            self.driver.get(BASE_URL)
-            time.sleep(1)
+            navigate(self.driver, BASE_URL, TEST_TIMEOUT)
             
             wait = WebDriverWait(self.driver, TEST_TIMEOUT)
             register_link = wait.until(EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), 'REGISTER')] | //a[contains(text(), 'Register')]")))
-            self.driver.execute_script("arguments[0].click();", register_link)
-            
-            time.sleep(1)
+            click_and_wait(self.driver, register_link, TEST_TIMEOUT)
             
             if "/register" in self.driver.current_url:
                 duration = time.time() - start
@@ -146,13 +141,11 @@ class NavigationTests:
         test_name = "Authenticated Navbar Elements"
         start = time.time()
         try:
-            # Register and login
-            result = create_and_login_user(self.driver)
+            # Login (cached session when available)
+            result = get_logged_in_user(self.driver)
             if not result['success']:
                 raise Exception("Login failed")
             
-            time.sleep(1)
-            
             wait = WebDriverWait(self.driver, TEST_TIMEOUT)
             
             # Check for logout link
@@ -174,14 +167,14 @@ class NavigationTests:
             print(f"❌ {test_id}: {test_name} - {str(e)}")
             return False
     
+    @depends_on('test_004_authenticated_navbar_elements')
     def test_005_dashboard_navigation(self):
         """NAV-005: Dashboard link navigates correctly"""
         test_id = "NAV-005"
         test_name = "Dashboard Navigation"
         start = time.time()
         try:
-            self.driver.get(f"{BASE_URL}/user/dashboard")
-            time.sleep(1)
+            navigate(self.driver, f"{BASE_URL}/user/dashboard", TEST_TIMEOUT)
             
             if "/dashboard" in self.driver.current_url:
                 duration = time.time() - start
@@ -211,11 +204,9 @@ class NavigationTests:
             
             # Find and click logout
             logout_link = wait.until(EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), 'LOGOUT')] | //a[contains(text(), 'Logout')] | //form//button[contains(text(), 'Logout')]")))
-            self.driver.execute_script("arguments[0].click();", logout_link)
-            
-            time.sleep(1)
-            
             # Should be back at home or login
+            click_and_wait(self.driver, logout_link, TEST_TIMEOUT)
+            
             if "/login" in self.driver.current_url or self.driver.current_url == BASE_URL or self.driver.current_url == f"{BASE_URL}/":
                 duration = time.time() - start
                 self.results.add_test(self.SUITE_NAME, test_id, test_name, "PASS", duration, "Logout successful")
@@ -229,22 +220,20 @@ class NavigationTests:
             print(f"❌ {test_id}: {test_name} - {str(e)}")
             return False
     
+    @depends_on('test_004_authenticated_navbar_elements')
     def test_007_home_link_navigation(self):
         """NAV-007: Home link always navigates to home"""
         test_id = "NAV-007"
         test_name = "Home Link Navigation"
         start = time.time()
         try:
-            self.driver.get(f"{BASE_URL}/user/dashboard")
-            time.sleep(1)
+            navigate(self.driver, f"{BASE_URL}/user/dashboard", TEST_TIMEOUT)
             
             wait = WebDriverWait(self.driver, TEST_TIMEOUT)
             
             # Find home/logo link
             home_link = wait.until(EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), 'Home')] | //a[contains(@href, '/')] | //img[@alt='logo'] | //a[contains(@class, 'navbar-brand')]")))
-            self.driver.execute_script("arguments[0].click();", home_link)
-            
-            time.sleep(1)
+            click_and_wait(self.driver, home_link, TEST_TIMEOUT)
             
             if self.driver.current_url == BASE_URL or self.driver.current_url == f"{BASE_URL}/":
                 duration = time.time() - start
@@ -264,22 +253,11 @@ class NavigationTests:
             return False
     
     def run_all_tests(self):
-        """Run all tests"""
+        """Run all tests along their dependencies (dependents of a failure are skipped)"""
         print(f"\n🚀 Starting {self.SUITE_NAME.upper()} test suite\n")
-        tests = [
-            self.test_001_guest_navbar_elements,
-            self.test_002_login_link_navigation,
-            self.test_003_register_link_navigation,
-            self.test_004_authenticated_navbar_elements,
-            self.test_005_dashboard_navigation,
-            self.test_006_logout_functionality,
-            self.test_007_home_link_navigation,
-        ]
-        results = [test() for test in tests]
-        passed = sum(1 for r in results if r)
-        total = len(results)
+        passed, skipped, total = run_test_dag(self)
         print(f"\n{'='*80}")
-        print(f"RESULTS: {passed}/{total} tests passed ({passed*100//total}%)")
+        print(f"RESULTS: {passed}/{total} tests passed ({passed*100//total}%), {skipped} skipped")
         print(f"{'='*80}\n")
         return passed == total
 
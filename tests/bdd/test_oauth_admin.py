@@ -5,9 +5,8 @@ Tests the specific OAuth login flow and admin role assignment
 """
 
 import time
-import subprocess
 import os
-import signal
+import sys
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -15,28 +14,19 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'utils'))
 
-def start_php_server():
-    """Start PHP development server"""
-    print("🔧 Starting PHP development server on localhost:8000...")
-
-    # Change to project directory
-    os.chdir("/Users/sarthak/Sites/umashaktidham.org")
-
-    # Start PHP server
-    server_process = subprocess.Popen(
-        ["php", "-S", "localhost:8000"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        preexec_fn=os.setsid  # Create new process group
-    )
+from driver_pool import get_driver_pool
+from php_server import PhpServer
+from page_timing import collect_page_timing
+from driver_binary import resolve_chromedriver
 
-    # Wait for server to start
-    time.sleep(3)
 
-    return server_process
+def start_php_server():
+    """Start PHP development server (own SQLite database, returns once it answers HTTP)"""
+    print("🔧 Starting PHP development server on localhost:8000...")
+    return PhpServer(port=8000).start()
 
 
 def setup_driver():
@@ -50,7 +40,7 @@ def setup_driver():
     chrome_options.add_argument("--disable-web-security")
     chrome_options.add_argument("--allow-running-insecure-content")
 
-    service = Service(ChromeDriverManager().install())
+    service = Service(resolve_chromedriver())
     driver = webdriver.Chrome(service=service, options=chrome_options)
     driver.implicitly_wait(10)
 
@@ -197,24 +187,28 @@ def test_page_load_performance(driver):
 
     for url, name in pages_to_test:
         try:
-            start_time = time.time()
             driver.get(f"{base_url}{url}")
-            end_time = time.time()
+            timing = collect_page_timing(driver)
+            if not timing:
+                print(f"   ❌ {name}: load event did not fire")
+                continue
 
-            load_time = end_time - start_time
+            # Browser-reported load event end, not wall-clock around driver.get
+            load_time = timing['load'] / 1000
             results.append((name, load_time))
 
+            detail = f"TTFB {timing['ttfb']:.0f}ms, DOMContentLoaded {timing['dom_content_loaded']:.0f}ms"
             if load_time < 5:  # 5 seconds is reasonable for local development
-                print(f"   ✅ {name}: {load_time:.2f}s")
+                print(f"   ✅ {name}: {load_time:.2f}s ({detail})")
             else:
-                print(f"   ⚠️  {name}: {load_time:.2f}s (slow)")
+                print(f"   ⚠️  {name}: {load_time:.2f}s (slow, {detail})")
         except Exception as e:
             print(f"   ❌ Failed to load {name}: {e}")
 
     # Summary
     if results:
-        avg_time = sum(time for _, time in results) / len(results)
-        print(f"   📊 Average load time: {avg_time:.2f}s")
+        avg_time = sum(load_time for _, load_time in results) / len(results)
+        print(f"   📊 Average load time: {avg_time:.2f}s (run benchmark_page_load.py for p50/p95/p99)")
 
     return True
 
@@ -232,7 +226,7 @@ def main():
         server_process = start_php_server()
 
         # Setup Selenium driver
-        driver = setup_driver()
+        driver = get_driver_pool('oauth_admin', setup_driver).checkout()
 
         # Run tests
         tests_passed = 0
@@ -271,16 +265,12 @@ def main():
     finally:
         # Cleanup
         if driver:
-            print("\n🧹 Cleaning up Selenium driver...")
-            driver.quit()
+            print("\n🧹 Returning Selenium driver to pool...")
+            get_driver_pool('oauth_admin', setup_driver).checkin(driver)
 
         if server_process:
             print("🛑 Stopping PHP development server...")
-            try:
-                os.killpg(os.getpgid(server_process.pid), signal.SIGTERM)
-                server_process.wait(timeout=5)
-            except:
-                server_process.kill()
+            server_process.stop()
 
 
 if __name__ == '__main__':
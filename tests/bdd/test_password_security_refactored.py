@@ -18,8 +18,10 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from common_config import (
-    BASE_URL, TEST_TIMEOUT, setup_webdriver,
-    TestResultsManager, create_and_login_user, logger
+    BASE_URL, TEST_TIMEOUT, checkout_webdriver, checkin_webdriver,
+    navigate, click_and_wait,
+    TestResultsManager, create_and_login_user, logger,
+    depends_on, run_test_dag
 )
 
 
@@ -36,7 +38,7 @@ class PasswordSecurityTests:
     
     def setup(self):
         """Initialize"""
-        self.driver = setup_webdriver()
+        self.driver = checkout_webdriver()
         results_file = Path(self.RESULTS_DIR) / "test_results.json"
         self.results = TestResultsManager(results_file)
         self.results.add_suite(self.SUITE_NAME, {})
@@ -48,7 +50,7 @@ class PasswordSecurityTests:
         """Cleanup"""
         try:
             if self.driver:
-                self.driver.quit()
+                checkin_webdriver(self.driver)
         except:
             pass
         if self.results:
@@ -75,6 +77,7 @@ class PasswordSecurityTests:
             print(f"❌ {test_id}: {test_name} - {str(e)}")
             return False
     
+    @depends_on('test_001_register_and_login')
     def test_002_navigate_change_password(self):
         """PWD-002: Navigate to change password page"""
         test_id = "PWD-002"
@@ -93,8 +96,7 @@ class PasswordSecurityTests:
             
             success = False
             for url in urls:
-                self.driver.get(url)
-                time.sleep(1)
+                navigate(self.driver, url, TEST_TIMEOUT)
                 if "password" in self.driver.current_url.lower() or "settings" in self.driver.current_url.lower():
                     success = True
                     break
@@ -112,6 +114,7 @@ class PasswordSecurityTests:
             print(f"❌ {test_id}: {test_name} - {str(e)}")
             return False
     
+    @depends_on('test_001_register_and_login')
     def test_003_change_password_success(self):
         """PWD-003: Change password successfully"""
         test_id = "PWD-003"
@@ -135,9 +138,7 @@ class PasswordSecurityTests:
             
             # Submit
             submit_btn = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
-            self.driver.execute_script("arguments[0].click();", submit_btn)
-            
-            time.sleep(2)
+            click_and_wait(self.driver, submit_btn, TEST_TIMEOUT)
             
             # Store new password for next test
             self.test_user['password'] = "NewPass@123"
@@ -152,6 +153,7 @@ class PasswordSecurityTests:
             print(f"❌ {test_id}: {test_name} - {str(e)}")
             return False
     
+    @depends_on('test_003_change_password_success')
     def test_004_session_after_password_change(self):
         """PWD-004: Session remains valid after password change"""
         test_id = "PWD-004"
@@ -161,8 +163,7 @@ class PasswordSecurityTests:
             if not self.test_user or not self.test_user.get('success'):
                 raise Exception("User not logged in")
             
-            self.driver.get(f"{BASE_URL}/user/dashboard")
-            time.sleep(1)
+            navigate(self.driver, f"{BASE_URL}/user/dashboard", TEST_TIMEOUT)
             
             # Check still authenticated
             if "dashboard" in self.driver.current_url or "login" not in self.driver.current_url:
@@ -178,6 +179,7 @@ class PasswordSecurityTests:
             print(f"❌ {test_id}: {test_name} - {str(e)}")
             return False
     
+    @depends_on('test_001_register_and_login')
     def test_005_password_validation(self):
         """PWD-005: Password validation rules"""
         test_id = "PWD-005"
@@ -188,8 +190,7 @@ class PasswordSecurityTests:
                 raise Exception("User not logged in")
             
             # Try to set weak password
-            self.driver.get(f"{BASE_URL}/user/change-password")
-            time.sleep(1)
+            navigate(self.driver, f"{BASE_URL}/user/change-password", TEST_TIMEOUT)
             
             wait = WebDriverWait(self.driver, TEST_TIMEOUT)
             
@@ -203,9 +204,7 @@ class PasswordSecurityTests:
             confirm_pwd.send_keys("weak")
             
             submit_btn = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
-            self.driver.execute_script("arguments[0].click();", submit_btn)
-            
-            time.sleep(1)
+            click_and_wait(self.driver, submit_btn, TEST_TIMEOUT)
             
             # Check for error message
             error_present = len(self.driver.find_elements(By.XPATH, "//*[contains(text(), 'password')] | //*[contains(text(), 'error')]")) > 0
@@ -224,20 +223,11 @@ class PasswordSecurityTests:
             return False
     
     def run_all_tests(self):
-        """Run all tests"""
+        """Run all tests along their dependencies (dependents of a failure are skipped)"""
         print(f"\n🚀 Starting {self.SUITE_NAME.upper()} test suite\n")
-        tests = [
-            self.test_001_register_and_login,
-            self.test_002_navigate_change_password,
-            self.test_003_change_password_success,
-            self.test_004_session_after_password_change,
-            self.test_005_password_validation,
-        ]
-        results = [test() for test in tests]
-        passed = sum(1 for r in results if r)
-        total = len(results)
+        passed, skipped, total = run_test_dag(self)
         print(f"\n{'='*80}")
-        print(f"RESULTS: {passed}/{total} tests passed ({passed*100//total}%)")
+        print(f"RESULTS: {passed}/{total} tests passed ({passed*100//total}%), {skipped} skipped")
         print(f"{'='*80}\n")
         return passed == total
 
@@ -18,8 +18,10 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from common_config import (
-    BASE_URL, TEST_TIMEOUT, setup_webdriver,
-    TestResultsManager, create_and_login_user, logger
+    BASE_URL, TEST_TIMEOUT, checkout_webdriver, checkin_webdriver,
+    navigate, click_and_wait, settle, scroll_into_view,
+    TestResultsManager, create_and_login_user, record_step, logger,
+    depends_on, run_test_dag
 )
 
 
@@ -36,7 +38,7 @@ class ProfileManagementTests:
     
     def setup(self):
         """Initialize"""
-        self.driver = setup_webdriver()
+        self.driver = checkout_webdriver()
         results_file = Path(self.RESULTS_DIR) / "test_results.json"
         self.results = TestResultsManager(results_file)
         self.results.add_suite(self.SUITE_NAME, {})
@@ -48,7 +50,7 @@ class ProfileManagementTests:
         """Cleanup"""
         try:
             if self.driver:
-                self.driver.quit()
+                checkin_webdriver(self.driver)
         except:
             pass
         if self.results:
@@ -75,19 +77,10 @@ class ProfileManagementTests:
         from selenium.webdriver.support.ui import WebDriverWait
         from selenium.webdriver.support import expected_conditions as EC
         def save_html(stage):
-            html_path = os.path.join(os.path.dirname(__file__), "results", f"profile-register-login-{stage}-{int(time.time())}.html")
-            try:
-                page_html = self.driver.find_element(By.TAG_NAME, "html").get_attribute("outerHTML")
-                with open(html_path, "w") as f:
-                    f.write(page_html)
-            except Exception:
-                pass
+            # Buffered; written only if the test fails
+            record_step(self.driver, f"profile-register-login-{stage}", screenshot=False)
         def save_screenshot(stage):
-            screenshot_path = os.path.join(os.path.dirname(__file__), "results", f"profile-register-login-{stage}-{int(time.time())}.png")
-            try:
-                self.driver.save_screenshot(screenshot_path)
-            except Exception:
-                pass
+            record_step(self.driver, f"profile-register-login-{stage}", html=False)
 
         try:
             logger = None
@@ -96,8 +89,7 @@ class ProfileManagementTests:
             except Exception:
                 pass
             logger and logger.info(f"Navigating to registration page: {BASE_URL}/register")
-            self.driver.get(f'{BASE_URL}/register')
-            time.sleep(1)
+            navigate(self.driver, f'{BASE_URL}/register', TEST_TIMEOUT)
             logger and logger.info(f"Current URL after navigation: {self.driver.current_url}")
             save_html("register-page")
             # Try to find the registration form by ID, fallback to form with action '/register'
@@ -165,7 +157,7 @@ class ProfileManagementTests:
                 self.driver.execute_script("arguments[0].click();", terms_checkbox)
                 logger and logger.info("Terms checkbox checked.")
             # Wait for client-side validation
-            time.sleep(1.5)
+            settle(self.driver, TEST_TIMEOUT)
             # Assign submit button after all fields are filled
             submit_btn = form.find_element(By.CSS_SELECTOR, 'button[type="submit"]')
             self.driver.execute_script("arguments[0].scrollIntoView(true);", submit_btn)
@@ -174,14 +166,12 @@ class ProfileManagementTests:
             if submit_btn.get_attribute('disabled'):
                 logger and logger.error("Submit button is disabled after filling all fields.")
                 raise Exception("Submit button is disabled after filling all fields.")
-            time.sleep(0.3)
             try:
-                submit_btn.click()
+                click_and_wait(self.driver, submit_btn, TEST_TIMEOUT, js_click=False)
                 logger and logger.info("Submit button clicked.")
             except Exception:
-                self.driver.execute_script("arguments[0].click();", submit_btn)
+                click_and_wait(self.driver, submit_btn, TEST_TIMEOUT)
                 logger and logger.info("Submit button clicked via JS.")
-            time.sleep(2)
             save_html("after-register-submit")
             save_screenshot("after-register-submit")
         except Exception as e:
@@ -194,8 +184,7 @@ class ProfileManagementTests:
             return False
 
         # After registration, attempt login
-        self.driver.get(f'{BASE_URL}/login')
-        time.sleep(1)
+        navigate(self.driver, f'{BASE_URL}/login', TEST_TIMEOUT)
         save_html("login-page")
         try:
             email_field = WebDriverWait(self.driver, TEST_TIMEOUT).until(
@@ -209,13 +198,11 @@ class ProfileManagementTests:
             submit_btn = WebDriverWait(self.driver, TEST_TIMEOUT).until(
                 EC.presence_of_element_located((By.NAME, 'submit'))
             )
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", submit_btn)
-            time.sleep(0.3)
+            scroll_into_view(self.driver, submit_btn)
             try:
                 submit_btn.click()
             except Exception:
-                self.driver.execute_script("arguments[0].click();", submit_btn)
-            time.sleep(2)
+                click_and_wait(self.driver, submit_btn, TEST_TIMEOUT)
             save_html("after-login-submit")
         except Exception as e:
             save_html("login-error")
@@ -251,13 +238,11 @@ class ProfileManagementTests:
                 submit_btn = WebDriverWait(self.driver, TEST_TIMEOUT).until(
                     EC.presence_of_element_located((By.NAME, 'submit'))
                 )
-                self.driver.execute_script("arguments[0].scrollIntoView(true);", submit_btn)
-                time.sleep(0.3)
+                scroll_into_view(self.driver, submit_btn)
                 try:
                     submit_btn.click()
                 except:
-                    self.driver.execute_script("arguments[0].click();", submit_btn)
-                time.sleep(2)
+                    click_and_wait(self.driver, submit_btn, TEST_TIMEOUT)
                 save_html("after-login-submit")
             except Exception as e:
                 save_html("login-error")
@@ -285,6 +270,7 @@ class ProfileManagementTests:
                 print(f"❌ {test_id}: {test_name} - Login failed or wrong redirect: {self.driver.current_url}")
                 return False
     
+    @depends_on('test_001_register_and_login')
     def test_002_navigate_profile_edit(self):
         """PROF-002: Navigate to profile edit page"""
         test_id = "PROF-002"
@@ -305,13 +291,8 @@ class ProfileManagementTests:
             logger and logger.info(f"Current URL after dashboard navigation: {self.driver.current_url}")
             # Save dashboard HTML for diagnosis
             def save_html(stage):
-                html_path = os.path.join(os.path.dirname(__file__), "results", f"profile-dashboard-{stage}-{int(time.time())}.html")
-                try:
-                    page_html = self.driver.find_element(By.TAG_NAME, "html").get_attribute("outerHTML")
-                    with open(html_path, "w") as f:
-                        f.write(page_html)
-                except Exception:
-                    pass
+                # Buffered; written only if the test fails
+                record_step(self.driver, f"profile-dashboard-{stage}", screenshot=False)
             save_html("after-dashboard-nav")
             # Log all anchor tags for diagnosis
             anchors = self.driver.find_elements(By.TAG_NAME, 'a')
@@ -331,13 +312,8 @@ class ProfileManagementTests:
             try:
                 # Save HTML after clicking Edit Profile for diagnosis
                 def save_html(stage):
-                    html_path = os.path.join(os.path.dirname(__file__), "results", f"profile-edit-modal-{stage}-{int(time.time())}.html")
-                    try:
-                        page_html = self.driver.find_element(By.TAG_NAME, "html").get_attribute("outerHTML")
-                        with open(html_path, "w") as f:
-                            f.write(page_html)
-                    except Exception:
-                        pass
+                    # Buffered; written only if the test fails
+                    record_step(self.driver, f"profile-edit-modal-{stage}", screenshot=False)
                 save_html("after-edit-profile-click")
                 # Increase wait timeout for modal form
                 WebDriverWait(self.driver, TEST_TIMEOUT * 2).until(EC.presence_of_element_located((By.ID, "memberForm")))
@@ -374,12 +350,11 @@ class ProfileManagementTests:
             # Find and click profile/edit link
             try:
                 profile_link = wait.until(EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), 'Profile')] | //a[contains(text(), 'Edit Profile')]")))
-                self.driver.execute_script("arguments[0].click();", profile_link)
+                click_and_wait(self.driver, profile_link, TEST_TIMEOUT)
                 logger and logger.info("Clicked profile/edit link.")
             except Exception as e:
                 logger and logger.error(f"Profile/Edit link not found or not clickable: {e}")
                 raise Exception("Profile/Edit link not found or not clickable.")
-            time.sleep(1)
             logger and logger.info(f"Current URL after clicking profile/edit: {self.driver.current_url}")
             # Verify on edit page
             if "/profile" in self.driver.current_url or "/edit" in self.driver.current_url:
@@ -396,6 +371,7 @@ class ProfileManagementTests:
             print(f"❌ {test_id}: {test_name} - {str(e)}")
             return False
     
+    @depends_on('test_001_register_and_login')
     def test_003_edit_profile_details(self):
         """PROF-003: Edit profile details"""
         test_id = "PROF-003"
@@ -420,8 +396,7 @@ class ProfileManagementTests:
             village_field.send_keys("Test Village")
             # Save
             save_btn = form.find_element(By.ID, "formModalSaveBtn")
-            self.driver.execute_script("arguments[0].click();", save_btn)
-            time.sleep(2)
+            click_and_wait(self.driver, save_btn, TEST_TIMEOUT)
             duration = time.time() - start
             self.results.add_test(self.SUITE_NAME, test_id, test_name, "PASS", duration, "Profile updated via modal")
             print(f"✅ {test_id}: {test_name} ({duration:.2f}s)")
@@ -432,6 +407,7 @@ class ProfileManagementTests:
             print(f"❌ {test_id}: {test_name} - {str(e)}")
             return False
     
+    @depends_on('test_003_edit_profile_details')
     def test_004_verify_profile_persistence(self):
         """PROF-004: Verify profile data persists"""
         test_id = "PROF-004"
@@ -441,8 +417,7 @@ class ProfileManagementTests:
             if not self.test_user or not self.test_user.get('success'):
                 raise Exception("User not logged in")
             # Reload dashboard and open modal again
-            self.driver.get(f"{BASE_URL}/user/dashboard")
-            time.sleep(1)
+            navigate(self.driver, f"{BASE_URL}/user/dashboard", TEST_TIMEOUT)
             wait = WebDriverWait(self.driver, TEST_TIMEOUT * 2)
             # Click Edit Profile button again
             edit_btn = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "button[data-action='edit-profile']")))
@@ -466,6 +441,7 @@ class ProfileManagementTests:
             print(f"❌ {test_id}: {test_name} - {str(e)}")
             return False
     
+    @depends_on('test_001_register_and_login')
     def test_005_profile_completeness(self):
         """PROF-005: Check profile completeness tracking"""
         test_id = "PROF-005"
@@ -475,8 +451,7 @@ class ProfileManagementTests:
             if not self.test_user or not self.test_user.get('success'):
                 raise Exception("User not logged in")
             
-            self.driver.get(f"{BASE_URL}/user/dashboard")
-            time.sleep(1)
+            navigate(self.driver, f"{BASE_URL}/user/dashboard", TEST_TIMEOUT)
             
             wait = WebDriverWait(self.driver, TEST_TIMEOUT)
             
@@ -501,17 +476,10 @@ class ProfileManagementTests:
             return False
     
     def run_all_tests(self):
-        """Run all tests"""
+        """Run all tests along their dependencies (dependents of a failure are skipped)"""
         print(f"\n🚀 Starting {self.SUITE_NAME.upper()} test suite\n")
-        tests = [
-            self.test_001_register_and_login,
-            self.test_002_navigate_profile_edit,
-            self.test_003_edit_profile_details,
-            self.test_004_verify_profile_persistence,
-            self.test_005_profile_completeness,
-        ]
-        for test_func in tests:
-            try:
-                test_func()
-            except Exception as e:
-                print(f"Exception in {test_func.__name__}: {e}")
+        passed, skipped, total = run_test_dag(self)
+        print(f"\n{'='*80}")
+        print(f"RESULTS: {passed}/{total} tests passed ({passed*100//total}%), {skipped} skipped")
+        print(f"{'='*80}\n")
+        return passed == total
@@ -1,17 +1,24 @@
 """
 Test Results Logger & Tracker
 Centralized module to track all test results with timestamps and status
-Maintains both JSON for data and HTML for visualization
+History is stored in SQLite (test_results.db); HTML is generated for visualization
 """
 
-import json
 import os
+import sys
 from datetime import datetime
 from pathlib import Path
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'utils'))
+
+from results_db import ResultsDB
+
 
 class TestResultsLogger:
-    """Track and persist test results to JSON and HTML"""
+    """Track and persist test results to SQLite and HTML"""
+
+    # Detail rows rendered in the dashboard (aggregates always cover all history)
+    DASHBOARD_DETAIL_LIMIT = 500
     
     def __init__(self, test_suite_name, log_dir="tests/results"):
         """
@@ -26,23 +33,15 @@ class TestResultsLogger:
         self.log_dir.mkdir(parents=True, exist_ok=True)
         
         self.json_file = self.log_dir / "test_results.json"
+        self.db_file = self.log_dir / "test_results.db"
         self.html_file = self.log_dir / "test_results.html"
         
         self.session_results = []
         self.session_start = datetime.now()
         
-        # Load existing results or initialize
-        self.all_results = self._load_results()
-    
-    def _load_results(self):
-        """Load existing results from JSON file"""
-        if self.json_file.exists():
-            try:
-                with open(self.json_file, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                return []
-        return []
+        # Open history database; legacy JSON results are imported once
+        self.db = ResultsDB(self.db_file)
+        self.db.import_json(self.json_file)
     
     def record_test(self, test_id, test_name, passed, details="", duration=0):
         """
@@ -67,17 +66,15 @@ class TestResultsLogger:
         }
         
         self.session_results.append(result)
-        self.all_results.append(result)
         
-        # Auto-save after each test
-        self._save_results()
+        # Buffered; written in batches
+        self.db.add(result)
     
     def _save_results(self):
-        """Save results to JSON file"""
+        """Write buffered results to the database"""
         try:
-            with open(self.json_file, 'w') as f:
-                json.dump(self.all_results, f, indent=2)
-        except IOError as e:
+            self.db.flush()
+        except Exception as e:
             print(f"Error saving test results: {e}")
     
     def finalize_session(self):
@@ -98,35 +95,26 @@ class TestResultsLogger:
         print(f"Duration: {duration:.2f}s")
         print("="*80 + "\n")
         
+        self._save_results()
+        
         # Generate HTML dashboard
         self._generate_html_dashboard()
     
     def _generate_html_dashboard(self):
         """Generate comprehensive HTML dashboard of all test results"""
         
-        # Calculate statistics
-        total_tests = len(self.all_results)
-        passed_tests = sum(1 for r in self.all_results if r["passed"])
-        failed_tests = total_tests - passed_tests
-        pass_rate = (passed_tests / total_tests * 100) if total_tests > 0 else 0
-        
-        # Group by suite
-        suites = {}
-        for result in self.all_results:
-            suite = result["suite"]
-            if suite not in suites:
-                suites[suite] = {"passed": 0, "failed": 0, "tests": []}
-            suites[suite]["tests"].append(result)
-            if result["passed"]:
-                suites[suite]["passed"] += 1
-            else:
-                suites[suite]["failed"] += 1
+        # Calculate statistics (aggregate queries; history is never loaded)
+        totals = self.db.get_totals()
+        total_tests = totals["total"]
+        passed_tests = totals["passed"]
+        failed_tests = totals["failed"]
+        pass_rate = totals["pass_rate"]
         
         # Generate suite summary rows
         suite_rows = ""
-        for suite_name in sorted(suites.keys()):
-            suite_data = suites[suite_name]
-            suite_total = suite_data["passed"] + suite_data["failed"]
+        for suite_data in self.db.get_suite_summary():
+            suite_name = suite_data["suite"]
+            suite_total = suite_data["total"]
             suite_pass_rate = (suite_data["passed"] / suite_total * 100) if suite_total > 0 else 0
             
             status_color = "#28a745" if suite_data["failed"] == 0 else "#dc3545"
@@ -145,7 +133,7 @@ class TestResultsLogger:
         
         # Generate detailed test rows
         test_rows = ""
-        for result in sorted(self.all_results, key=lambda x: x["timestamp"], reverse=True):
+        for result in self.db.get_recent(limit=self.DASHBOARD_DETAIL_LIMIT):
             status_color = "#28a745" if result["passed"] else "#dc3545"
             status_text = "✅ PASS" if result["passed"] else "❌ FAIL"
             error_details = f"<br><small>{result['details']}</small>" if result['details'] else ""
@@ -445,7 +433,7 @@ class TestResultsLogger:
             
             <!-- Detailed Test Results -->
             <div class="section">
-                <h2 class="section-title">📋 Detailed Test Results</h2>
+                <h2 class="section-title">📋 Detailed Test Results (latest {self.DASHBOARD_DETAIL_LIMIT})</h2>
                 <div class="filters">
                     <button class="filter-btn active" onclick="filterTests('all')">All Tests</button>
                     <button class="filter-btn" onclick="filterTests('pass')">✅ Passed</button>
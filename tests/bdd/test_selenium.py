@@ -2,9 +2,15 @@
 """
 Selenium Test Suite for Uma Shakti Dham Website
 Tests OAuth login, admin functionality, and user dashboard
+
+Server-rendered checks (homepage, login form, auth gating, footer, meta
+tags) run without a browser in test_http_tier.py; only the interactive
+checks stay here.
 """
 
 import time
+import os
+import sys
 import unittest
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -13,7 +19,9 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'utils'))
+from driver_binary import resolve_chromedriver
 
 
 class UmaShaktiDhamTest(unittest.TestCase):
@@ -34,7 +42,7 @@ class UmaShaktiDhamTest(unittest.TestCase):
         chrome_options.add_argument("--allow-running-insecure-content")
 
         # Initialize the Chrome driver
-        service = Service(ChromeDriverManager().install())
+        service = Service(resolve_chromedriver())
         cls.driver = webdriver.Chrome(service=service, options=chrome_options)
 
         # Set implicit wait
@@ -57,49 +65,6 @@ class UmaShaktiDhamTest(unittest.TestCase):
         self.driver.get(self.base_url)
         self.wait = WebDriverWait(self.driver, 20)
 
-    def test_01_homepage_loads(self):
-        """Test that the homepage loads correctly"""
-        print("📋 Test 1: Homepage loads correctly")
-
-        # Check page title
-        self.assertIn("Uma Shakti Dham", self.driver.title)
-
-        # Check for main navigation elements
-        nav_menu = self.wait.until(
-            EC.presence_of_element_located((By.ID, "mainNav"))
-        )
-        self.assertIsNotNone(nav_menu)
-
-        # Check for login link
-        login_link = self.driver.find_element(By.XPATH, "//a[contains(text(), 'Login')]")
-        self.assertIsNotNone(login_link)
-
-        print("✅ Homepage loaded successfully")
-
-    def test_02_login_page_accessible(self):
-        """Test that login page is accessible"""
-        print("📋 Test 2: Login page accessible")
-
-        # Navigate to login page
-        self.driver.get(f"{self.base_url}/login")
-
-        # Check for login form elements
-        try:
-            email_field = self.wait.until(
-                EC.presence_of_element_located((By.NAME, "email"))
-            )
-            password_field = self.driver.find_element(By.NAME, "password")
-            login_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
-
-            self.assertIsNotNone(email_field)
-            self.assertIsNotNone(password_field)
-            self.assertIsNotNone(login_button)
-
-            print("✅ Login page accessible with form elements")
-
-        except TimeoutException:
-            self.fail("Login form elements not found")
-
     def test_03_oauth_google_link_present(self):
         """Test that Google OAuth login link is present"""
         print("📋 Test 3: Google OAuth link present")
@@ -146,33 +111,6 @@ class UmaShaktiDhamTest(unittest.TestCase):
             except NoSuchElementException:
                 print("⚠️  Facebook OAuth link not found (might not be configured)")
 
-    def test_05_dashboard_requires_authentication(self):
-        """Test that dashboard requires authentication"""
-        print("📋 Test 5: Dashboard requires authentication")
-
-        self.driver.get(f"{self.base_url}/dashboard")
-
-        # Should redirect to login page
-        self.wait.until(lambda driver: "login" in driver.current_url.lower())
-        self.assertIn("login", self.driver.current_url.lower())
-
-        print("✅ Dashboard correctly requires authentication")
-
-    def test_06_admin_routes_require_authentication(self):
-        """Test that admin routes require authentication"""
-        print("📋 Test 6: Admin routes require authentication")
-
-        admin_urls = ["/admin", "/admin/users", "/admin/moderators", "/admin/events"]
-
-        for url in admin_urls:
-            with self.subTest(url=url):
-                self.driver.get(f"{self.base_url}{url}")
-                # Should redirect to login
-                self.wait.until(lambda driver: "login" in driver.current_url.lower())
-                self.assertIn("login", self.driver.current_url.lower())
-
-        print("✅ Admin routes correctly require authentication")
-
     def test_07_navigation_menu_structure(self):
         """Test that navigation menu has correct structure"""
         print("📋 Test 7: Navigation menu structure")
@@ -282,17 +220,6 @@ class UmaShaktiDhamTest(unittest.TestCase):
         except NoSuchElementException:
             print("⚠️  Access gate not found or not required")
 
-    def test_13_check_footer_presence(self):
-        """Test that footer is present on pages"""
-        print("📋 Test 13: Footer presence")
-
-        try:
-            footer = self.driver.find_element(By.TAG_NAME, "footer")
-            self.assertIsNotNone(footer)
-            print("✅ Footer found on page")
-        except NoSuchElementException:
-            print("⚠️  Footer not found")
-
     def test_14_test_navigation_links(self):
         """Test that main navigation links work"""
         print("📋 Test 14: Navigation links")
@@ -323,26 +250,6 @@ class UmaShaktiDhamTest(unittest.TestCase):
                 except Exception as e:
                     print(f"⚠️  Navigation to {url} failed: {e}")
 
-    def test_15_check_meta_tags(self):
-        """Test that pages have proper meta tags"""
-        print("📋 Test 15: Meta tags")
-
-        # Check meta description
-        try:
-            meta_description = self.driver.find_element(By.XPATH, "//meta[@name='description']")
-            self.assertIsNotNone(meta_description)
-            print("✅ Meta description found")
-        except NoSuchElementException:
-            print("⚠️  Meta description not found")
-
-        # Check viewport meta tag
-        try:
-            viewport = self.driver.find_element(By.XPATH, "//meta[@name='viewport']")
-            self.assertIsNotNone(viewport)
-            print("✅ Viewport meta tag found")
-        except NoSuchElementException:
-            print("⚠️  Viewport meta tag not found")
-
 
 if __name__ == '__main__':
     # Start PHP development server in background
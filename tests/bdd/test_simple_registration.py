@@ -4,12 +4,16 @@ Simple registration test for debugging
 """
 
 import time
+import os
+import sys
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'utils'))
+from driver_binary import resolve_chromedriver
 
 BASE_URL = "http://localhost:8000"
 TEST_TIMEOUT = 15
@@ -22,7 +26,7 @@ options.add_argument("--disable-dev-shm-usage")
 options.add_argument("--window-size=1920,1080")
 
 # Initialize WebDriver
-service = Service(ChromeDriverManager().install())
+service = Service(resolve_chromedriver())
 driver = webdriver.Chrome(service=service, options=options)
 driver.implicitly_wait(10)
 
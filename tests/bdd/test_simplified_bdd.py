@@ -14,9 +14,11 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'utils'))
+from driver_binary import resolve_chromedriver
+
 BASE_URL = os.getenv('BASE_URL', 'http://localhost:8000')
 TEST_TIMEOUT = 15
 HEADLESS = os.getenv('HEADLESS', 'True').lower() == 'true'
@@ -45,7 +47,7 @@ class SimplifiedBDDTests:
             options.add_argument('--disable-dev-shm-usage')
             options.add_argument('--window-size=1920,1080')
             
-            service = Service(ChromeDriverManager().install())
+            service = Service(resolve_chromedriver())
             self.driver = webdriver.Chrome(service=service, options=options)
             print(f"   ✅ WebDriver ready\n")
             return True
@@ -12,10 +12,11 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from common_config import (
-    BASE_URL, HEADLESS, TEST_TIMEOUT,
-    setup_webdriver, TestResultsManager,
+    BASE_URL, TEST_TIMEOUT,
+    checkout_webdriver, checkin_webdriver, TestResultsManager, begin_test,
     print_header, print_section, print_test_result,
     wait_for_element, wait_for_clickable,
+    navigate, click_and_wait,
     logger
 )
 from selenium.webdriver.common.by import By
@@ -36,10 +37,9 @@ class SimplifiedBDDTests:
         """Setup test environment"""
         print_header("SIMPLIFIED BDD TEST SUITE")
         print(f"\nBase URL: {BASE_URL}")
-        print(f"Headless: {HEADLESS}")
         
         print("\n→ Setting up Chrome WebDriver...")
-        self.driver = setup_webdriver()
+        self.driver = checkout_webdriver()
         print("   ✅ WebDriver ready\n")
         
         # Ensure suite exists in results
@@ -48,12 +48,13 @@ class SimplifiedBDDTests:
     def teardown(self):
         """Cleanup"""
         if self.driver:
-            self.driver.quit()
-            print("\n🔌 Browser closed")
+            checkin_webdriver(self.driver)
+            print("\n🔌 Browser returned to pool")
     
     def test_guest_navbar(self):
         """Test: Guest - Navbar visible"""
         test_id = "GUEST-001"
+        begin_test(test_id)
         test_name = "Guest - Navbar visible"
         
         start = time.time()
@@ -80,6 +81,7 @@ class SimplifiedBDDTests:
     def test_guest_login_link(self):
         """Test: Guest - Login link present"""
         test_id = "GUEST-002"
+        begin_test(test_id)
         test_name = "Guest - Login link present"
         
         start = time.time()
@@ -106,6 +108,7 @@ class SimplifiedBDDTests:
     def test_guest_register_link(self):
         """Test: Guest - Register link present"""
         test_id = "GUEST-003"
+        begin_test(test_id)
         test_name = "Guest - Register link present"
         
         start = time.time()
@@ -132,13 +135,13 @@ class SimplifiedBDDTests:
     def test_user_login(self):
         """Test: User - Login successful"""
         test_id = "USER-001"
+        begin_test(test_id)
         test_name = "User - Login successful"
         
         start = time.time()
         try:
             # Navigate to login
-            self.driver.get(f"{BASE_URL}/login")
-            time.sleep(1)
+            navigate(self.driver, f"{BASE_URL}/login", TEST_TIMEOUT)
             
             # Fill login form
             email_input = wait_for_element(self.driver, By.NAME, "email")
@@ -151,10 +154,9 @@ class SimplifiedBDDTests:
             
             # Submit form
             submit_btn = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
-            submit_btn.click()
-            
             # Wait for redirect to dashboard
-            time.sleep(3)
+            click_and_wait(self.driver, submit_btn, TEST_TIMEOUT, js_click=False)
+            
             current_url = self.driver.current_url
             
             if "dashboard" in current_url or "user" in current_url:
@@ -181,6 +183,7 @@ class SimplifiedBDDTests:
     def test_user_navbar(self):
         """Test: User - Navbar links found"""
         test_id = "USER-002"
+        begin_test(test_id)
         test_name = "User - Navbar links found"
         
         start = time.time()
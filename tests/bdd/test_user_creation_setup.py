@@ -17,9 +17,11 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'utils'))
+from driver_binary import resolve_chromedriver
+
 # Configuration
 BASE_URL = os.getenv('BASE_URL', 'http://localhost:8000')
 TEST_TIMEOUT = 15
@@ -263,7 +265,7 @@ def setup_chrome_driver():
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--window-size=1920,1080')
         
-        service = Service(ChromeDriverManager().install())
+        service = Service(resolve_chromedriver())
         driver = webdriver.Chrome(service=service, options=options)
         print(f"   ✅ WebDriver ready")
         return driver
@@ -18,8 +18,13 @@ from selenium.webdriver.support import expected_conditions as EC
 from common_config import (
     BASE_URL,
     TEST_TIMEOUT,
-    setup_webdriver,
+    checkout_webdriver,
+    checkin_webdriver,
     TestResultsManager,
+    begin_test,
+    navigate,
+    click_and_wait,
+    settle,
     logger,
 )
 
@@ -33,7 +38,7 @@ class TestUserManagement(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Initialize WebDriver and results manager"""
-        cls.driver = setup_webdriver()
+        cls.driver = checkout_webdriver()
         cls.results = TestResultsManager(Path(cls.RESULTS_DIR))
         cls.results.add_suite(cls.SUITE_NAME, {})
         cls.test_user = None
@@ -46,7 +51,7 @@ class TestUserManagement(unittest.TestCase):
     def tearDownClass(cls):
         """Clean up and finalize"""
         try:
-            cls.driver.quit()
+            checkin_webdriver(cls.driver)
         except:
             pass
         cls.results.save()
@@ -55,6 +60,7 @@ class TestUserManagement(unittest.TestCase):
     def test_001_user_registration(self):
         """UM-001: Register test user"""
         test_id = "UM-001"
+        begin_test(test_id)
         test_name = "User Registration"
         start_time = time.time()
         
@@ -73,8 +79,7 @@ class TestUserManagement(unittest.TestCase):
             self.driver.find_element(By.NAME, "first_name").send_keys("Test")
             self.driver.find_element(By.NAME, "last_name").send_keys("User")
             
-            self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
-            time.sleep(2)
+            click_and_wait(self.driver, self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']"), TEST_TIMEOUT, js_click=False)
             
             self.__class__.test_user = {'email': email, 'password': password}
             
@@ -92,6 +97,7 @@ class TestUserManagement(unittest.TestCase):
     def test_002_user_login(self):
         """UM-002: User login"""
         test_id = "UM-002"
+        begin_test(test_id)
         test_name = "User Login"
         start_time = time.time()
         
@@ -125,6 +131,7 @@ class TestUserManagement(unittest.TestCase):
     def test_003_user_profile_edit(self):
         """UM-003: Edit user profile"""
         test_id = "UM-003"
+        begin_test(test_id)
         test_name = "Edit User Profile"
         start_time = time.time()
         
@@ -132,14 +139,12 @@ class TestUserManagement(unittest.TestCase):
             wait = WebDriverWait(self.driver, TEST_TIMEOUT)
             
             # Navigate to profile
-            self.driver.get(f"{BASE_URL}/user/profile")
-            time.sleep(1)
+            navigate(self.driver, f"{BASE_URL}/user/profile", TEST_TIMEOUT)
             
             # Try to find and click edit button/link
             try:
                 edit_btn = wait.until(EC.element_to_be_clickable((By.LINK_TEXT, "Edit")))
-                edit_btn.click()
-                time.sleep(1)
+                click_and_wait(self.driver, edit_btn, TEST_TIMEOUT, js_click=False)
             except:
                 # If no edit button, check if form is already editable
                 pass
@@ -154,13 +159,10 @@ class TestUserManagement(unittest.TestCase):
             
             # Submit form
             submit_btn = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
-            submit_btn.click()
-            
-            time.sleep(2)
+            click_and_wait(self.driver, submit_btn, TEST_TIMEOUT, js_click=False)
             
             # Verify update
-            self.driver.get(f"{BASE_URL}/user/profile")
-            time.sleep(1)
+            navigate(self.driver, f"{BASE_URL}/user/profile", TEST_TIMEOUT)
             
             updated_field = self.driver.find_element(By.NAME, "first_name")
             actual_value = updated_field.get_attribute("value")
@@ -182,6 +184,7 @@ class TestUserManagement(unittest.TestCase):
     def test_004_add_family_member(self):
         """UM-004: Add family member"""
         test_id = "UM-004"
+        begin_test(test_id)
         test_name = "Add Family Member"
         start_time = time.time()
         
@@ -189,15 +192,13 @@ class TestUserManagement(unittest.TestCase):
             wait = WebDriverWait(self.driver, TEST_TIMEOUT)
             
             # Navigate to dashboard
-            self.driver.get(f"{BASE_URL}/user/dashboard")
-            time.sleep(1)
+            navigate(self.driver, f"{BASE_URL}/user/dashboard", TEST_TIMEOUT)
             
             # Find and click "Add Family Member" button
             add_btn = wait.until(
                 EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Add Family') or contains(text(), 'Add Member')]"))
             )
-            add_btn.click()
-            time.sleep(1)
+            click_and_wait(self.driver, add_btn, TEST_TIMEOUT, js_click=False)
             
             # Fill form
             first_name = self.driver.find_element(By.NAME, "first_name")
@@ -215,13 +216,10 @@ class TestUserManagement(unittest.TestCase):
             
             # Submit
             submit_btn = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
-            submit_btn.click()
-            
-            time.sleep(2)
+            click_and_wait(self.driver, submit_btn, TEST_TIMEOUT, js_click=False)
             
             # Verify member added
-            self.driver.get(f"{BASE_URL}/user/dashboard")
-            time.sleep(1)
+            navigate(self.driver, f"{BASE_URL}/user/dashboard", TEST_TIMEOUT)
             
             # Check if member appears in list
             members = self.driver.find_elements(By.XPATH, "//div[contains(text(), 'TestSpouse')]")
@@ -243,6 +241,7 @@ class TestUserManagement(unittest.TestCase):
     def test_005_edit_family_member(self):
         """UM-005: Edit family member"""
         test_id = "UM-005"
+        begin_test(test_id)
         test_name = "Edit Family Member"
         start_time = time.time()
         
@@ -250,15 +249,13 @@ class TestUserManagement(unittest.TestCase):
             wait = WebDriverWait(self.driver, TEST_TIMEOUT)
             
             # Navigate to dashboard
-            self.driver.get(f"{BASE_URL}/user/dashboard")
-            time.sleep(1)
+            navigate(self.driver, f"{BASE_URL}/user/dashboard", TEST_TIMEOUT)
             
             # Find family member and click edit
             edit_btn = wait.until(
                 EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), 'Edit')] | //button[contains(text(), 'Edit')]"))
             )
-            edit_btn.click()
-            time.sleep(1)
+            click_and_wait(self.driver, edit_btn, TEST_TIMEOUT, js_click=False)
             
             # Update field
             first_name = self.driver.find_element(By.NAME, "first_name")
@@ -267,13 +264,10 @@ class TestUserManagement(unittest.TestCase):
             
             # Submit
             submit_btn = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
-            submit_btn.click()
-            
-            time.sleep(2)
+            click_and_wait(self.driver, submit_btn, TEST_TIMEOUT, js_click=False)
             
             # Verify update
-            self.driver.get(f"{BASE_URL}/user/dashboard")
-            time.sleep(1)
+            navigate(self.driver, f"{BASE_URL}/user/dashboard", TEST_TIMEOUT)
             
             updated_members = self.driver.find_elements(By.XPATH, "//div[contains(text(), 'EditedSpouse')]")
             
@@ -294,6 +288,7 @@ class TestUserManagement(unittest.TestCase):
     def test_006_delete_family_member(self):
         """UM-006: Delete family member"""
         test_id = "UM-006"
+        begin_test(test_id)
         test_name = "Delete Family Member"
         start_time = time.time()
         
@@ -301,28 +296,25 @@ class TestUserManagement(unittest.TestCase):
             wait = WebDriverWait(self.driver, TEST_TIMEOUT)
             
             # Navigate to dashboard
-            self.driver.get(f"{BASE_URL}/user/dashboard")
-            time.sleep(1)
+            navigate(self.driver, f"{BASE_URL}/user/dashboard", TEST_TIMEOUT)
             
             # Find delete button
             delete_btn = wait.until(
                 EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), 'Delete')] | //button[contains(text(), 'Delete')]"))
             )
-            delete_btn.click()
-            time.sleep(1)
+            click_and_wait(self.driver, delete_btn, TEST_TIMEOUT, js_click=False)
             
             # Confirm deletion
             try:
                 confirm_btn = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Confirm')] | //button[contains(text(), 'Yes')]")
-                confirm_btn.click()
+                click_and_wait(self.driver, confirm_btn, TEST_TIMEOUT, js_click=False)
             except:
                 pass
             
-            time.sleep(2)
+            settle(self.driver, TEST_TIMEOUT)
             
             # Verify deletion
-            self.driver.get(f"{BASE_URL}/user/dashboard")
-            time.sleep(1)
+            navigate(self.driver, f"{BASE_URL}/user/dashboard", TEST_TIMEOUT)
             
             duration = time.time() - start_time
             self.results.add_test(self.SUITE_NAME, test_id, test_name, "PASS", duration, "Family member deleted")
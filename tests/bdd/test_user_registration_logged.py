@@ -16,9 +16,12 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from test_results_logger import TestResultsLogger
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'utils'))
+from debug_artifacts import save_debug
+from driver_binary import resolve_chromedriver
+
 
 class TestUserRegistrationWithLogger(unittest.TestCase):
     """
@@ -47,7 +50,7 @@ class TestUserRegistrationWithLogger(unittest.TestCase):
         options.add_argument("--window-size=1920,1080")
         
         # Initialize WebDriver
-        service = Service(ChromeDriverManager().install())
+        service = Service(resolve_chromedriver())
         cls.driver = webdriver.Chrome(service=service, options=options)
         cls.driver.implicitly_wait(10)
         
@@ -64,22 +67,7 @@ class TestUserRegistrationWithLogger(unittest.TestCase):
     
     def save_debug(self, name_prefix):
         """Save debug artifacts (screenshot and HTML) on failure"""
-        timestamp = int(time.time())
-        screenshot_file = f"{name_prefix}-{timestamp}.png"
-        html_file = f"{name_prefix}-{timestamp}.html"
-        
-        try:
-            self.driver.save_screenshot(screenshot_file)
-            print(f"Screenshot saved: {screenshot_file}")
-        except:
-            pass
-        
-        try:
-            with open(html_file, 'w') as f:
-                f.write(self.driver.page_source)
-            print(f"HTML saved: {html_file}")
-        except:
-            pass
+        return save_debug(self.driver, name_prefix)
     
     # ========================================================================
     # TEST 1: User Registration
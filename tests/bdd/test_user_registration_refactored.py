@@ -18,8 +18,12 @@ from selenium.webdriver.support import expected_conditions as EC
 from common_config import (
     BASE_URL,
     TEST_TIMEOUT,
-    setup_webdriver,
+    checkout_webdriver,
+    checkin_webdriver,
     TestResultsManager,
+    begin_test,
+    click_and_wait,
+    save_debug,
     logger,
     verify_password,
 )
@@ -34,7 +38,7 @@ class TestUserRegistration(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Initialize WebDriver and results manager"""
-        cls.driver = setup_webdriver()
+        cls.driver = checkout_webdriver()
         cls.results = TestResultsManager(Path(cls.RESULTS_DIR))
         cls.results.add_suite(cls.SUITE_NAME, {})
         cls.registered_user = None
@@ -47,7 +51,7 @@ class TestUserRegistration(unittest.TestCase):
     def tearDownClass(cls):
         """Clean up and finalize"""
         try:
-            cls.driver.quit()
+            checkin_webdriver(cls.driver)
         except:
             pass
         cls.results.save()
@@ -55,17 +59,12 @@ class TestUserRegistration(unittest.TestCase):
     
     def save_debug(self, name_prefix):
         """Save debug artifacts on failure"""
-        timestamp = int(time.time())
-        try:
-            screenshot = f"/tmp/{name_prefix}-{timestamp}.png"
-            self.driver.save_screenshot(screenshot)
-            logger.info(f"Screenshot: {screenshot}")
-        except Exception as e:
-            logger.error(f"Screenshot failed: {e}")
+        return save_debug(self.driver, name_prefix)
     
     def test_001_register_new_user(self):
         """REG-001: Test new user registration"""
         test_id = "REG-001"
+        begin_test(test_id)
         test_name = "User Registration"
         start_time = time.time()
         
@@ -89,10 +88,8 @@ class TestUserRegistration(unittest.TestCase):
             self.driver.find_element(By.NAME, "last_name").send_keys(last_name)
             
             # Submit form
-            self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
-            
             # Wait for success
-            time.sleep(2)
+            click_and_wait(self.driver, self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']"), TEST_TIMEOUT, js_click=False)
             
             # Store for later tests
             self.__class__.registered_user = {
@@ -131,6 +128,7 @@ class TestUserRegistration(unittest.TestCase):
     def test_002_login_new_user(self):
         """REG-002: Test login with newly registered user"""
         test_id = "REG-002"
+        begin_test(test_id)
         test_name = "Login (New User)"
         start_time = time.time()
         
@@ -179,6 +177,7 @@ class TestUserRegistration(unittest.TestCase):
     def test_003_session_management(self):
         """REG-003: Test session management"""
         test_id = "REG-003"
+        begin_test(test_id)
         test_name = "Session Management"
         start_time = time.time()
         
@@ -220,6 +219,7 @@ class TestUserRegistration(unittest.TestCase):
     def test_004_logout(self):
         """REG-004: Test logout functionality"""
         test_id = "REG-004"
+        begin_test(test_id)
         test_name = "Logout"
         start_time = time.time()
         
@@ -230,10 +230,8 @@ class TestUserRegistration(unittest.TestCase):
             logout_btn = wait.until(
                 EC.element_to_be_clickable((By.LINK_TEXT, "Logout"))
             )
-            logout_btn.click()
-            
             # Should redirect to home or login
-            time.sleep(1)
+            click_and_wait(self.driver, logout_btn, TEST_TIMEOUT, js_click=False)
             
             duration = time.time() - start_time
             self.results.add_test(
@@ -264,6 +262,7 @@ class TestUserRegistration(unittest.TestCase):
     def test_005_login_existing_user(self):
         """REG-005: Test login with existing user"""
         test_id = "REG-005"
+        begin_test(test_id)
         test_name = "Login (Existing User)"
         start_time = time.time()
         
@@ -312,6 +311,7 @@ class TestUserRegistration(unittest.TestCase):
     def test_006_invalid_login(self):
         """REG-006: Test invalid login attempt"""
         test_id = "REG-006"
+        begin_test(test_id)
         test_name = "Invalid Login Attempt"
         start_time = time.time()
         
@@ -323,10 +323,9 @@ class TestUserRegistration(unittest.TestCase):
             email_field.send_keys("nonexistent@example.com")
             
             self.driver.find_element(By.NAME, "password").send_keys("WrongPassword123")
-            self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
-            
             # Should show error message
-            time.sleep(1)
+            click_and_wait(self.driver, self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']"), TEST_TIMEOUT, js_click=False)
+            
             current_url = self.driver.current_url
             
             # Check if still on login page (indicating failed login)
@@ -0,0 +1,174 @@
+"""
+Test DAG Executor Tests
+Ordering, branches, cycle detection, skip propagation and browser handling of utils/test_dag.py
+
+Usage:
+    pytest tests/bdd/unit/test_dag_executor.py -v
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'utils'))
+
+from test_dag import PASS, SKIP, TestDag, branches, dependencies, depends_on, step_names, topological_order
+
+
+class Results:
+    """Minimal TestResultsManager: add_test_result / get_all_tests_flat"""
+
+    def __init__(self):
+        self.tests = []
+        self._lock = threading.Lock()
+
+    def add_test_result(self, suite_name, test_id, test_name, status, duration, details=""):
+        with self._lock:
+            self.tests.append({'id': test_id, 'name': test_name, 'status': status, 'details': details})
+
+    def get_all_tests_flat(self):
+        with self._lock:
+            return list(self.tests)
+
+
+class Suite:
+    """login -> profile -> persistence, with an independent guest branch"""
+
+    SUITE_NAME = 'fake'
+    FAILING = ()
+
+    def __init__(self):
+        self.driver = 'main-browser'
+        self.results = Results()
+        self.ran = []
+
+    def _step(self, test_id):
+        self.ran.append(test_id)
+        status = 'FAIL' if test_id in self.FAILING else 'PASS'
+        self.results.add_test_result(self.SUITE_NAME, test_id, test_id, status, 0)
+
+    def test_001_guest_navbar(self):
+        """T-001: Guest navbar"""
+        self._step('T-001')
+
+    def test_002_login(self):
+        """T-002: Login"""
+        self._step('T-002')
+
+    @depends_on('test_002_login')
+    def test_003_edit_profile(self):
+        """T-003: Edit profile"""
+        self._step('T-003')
+
+    @depends_on('test_003_edit_profile')
+    def test_004_profile_persists(self):
+        """T-004: Profile persists"""
+        self._step('T-004')
+
+    def test_005_guest_footer(self):
+        """T-005: Guest footer"""
+        self._step('T-005')
+
+
+class FailingLogin(Suite):
+    FAILING = ('T-002',)
+
+
+class Pool:
+    """Pool stand-in: `free` browsers available without waiting"""
+
+    def __init__(self, free):
+        self.free = [f'browser-{n}' for n in range(free)]
+        self.out = []
+        self.lock = threading.Lock()
+
+    def checkout(self, timeout=None):
+        with self.lock:
+            if not self.free:
+                raise TimeoutError("No WebDriver available")
+            driver = self.free.pop()
+            self.out.append(driver)
+            return driver
+
+    def checkin(self, driver):
+        with self.lock:
+            self.out.remove(driver) if driver in self.out else None
+            self.free.append(driver)
+
+
+def test_topological_order_keeps_file_order_among_ready_steps():
+    graph = {'a': (), 'b': ('c',), 'c': (), 'd': ('b', 'a')}
+    assert topological_order(graph, ['a', 'b', 'c', 'd']) == ['a', 'c', 'b', 'd']
+
+
+def test_cycle_is_reported_with_its_steps():
+    graph = {'a': (), 'b': ('c',), 'c': ('b',)}
+    with pytest.raises(ValueError, match='b, c'):
+        topological_order(graph, ['a', 'b', 'c'])
+
+
+def test_unknown_dependency_is_rejected():
+    class Broken:
+        @depends_on('test_000_missing')
+        def test_001_step(self):
+            pass
+
+    with pytest.raises(ValueError, match='test_000_missing'):
+        dependencies(Broken)
+
+
+def test_branches_are_connected_components_largest_first():
+    graph = dependencies(Suite)
+    names = step_names(Suite)
+    assert branches(graph, names) == [
+        ['test_002_login', 'test_003_edit_profile', 'test_004_profile_persists'],
+        ['test_001_guest_navbar'],
+        ['test_005_guest_footer'],
+    ]
+
+
+def test_failed_step_skips_its_dependents_transitively():
+    suite = FailingLogin()
+    dag = TestDag(suite)
+    outcomes = dag.run()
+
+    assert suite.ran == ['T-001', 'T-002', 'T-005']
+    assert outcomes['test_003_edit_profile'][0] == SKIP
+    assert outcomes['test_004_profile_persists'][0] == SKIP
+    assert 'T-003' in outcomes['test_004_profile_persists'][1]
+    assert dag.summary() == (2, 2, 5)
+    recorded = {t['id']: t['status'] for t in suite.results.tests}
+    assert recorded == {'T-001': PASS, 'T-002': 'FAIL', 'T-003': SKIP, 'T-004': SKIP, 'T-005': PASS}
+
+
+def test_extra_browsers_are_only_taken_when_free_and_returned():
+    pool = Pool(free=2)
+    suite = Suite()
+    suite.driver = pool.checkout()
+    dag = TestDag(suite, pool.checkout, pool.checkin, workers=3)
+    outcomes = dag.run()
+
+    assert all(status == PASS for status, _ in outcomes.values())
+    assert sorted(suite.ran) == ['T-001', 'T-002', 'T-003', 'T-004', 'T-005']
+    # One clone got the free browser and returned it; only the suite's own browser stays out
+    assert pool.out == [suite.driver]
+
+
+def test_no_free_browser_runs_on_the_suite_browser():
+    pool = Pool(free=1)
+    suite = Suite()
+    suite.driver = pool.checkout()
+    dag = TestDag(suite, pool.checkout, pool.checkin, workers=4)
+    outcomes = dag.run()
+
+    assert suite.ran == ['T-002', 'T-003', 'T-004', 'T-001', 'T-005']
+    assert all(status == PASS for status, _ in outcomes.values())
+    assert pool.out == [suite.driver]
+
+
+def test_default_workers_are_bounded(monkeypatch):
+    monkeypatch.delenv('DAG_WORKERS', raising=False)
+    pool = Pool(free=8)
+    assert TestDag(Suite(), pool.checkout, pool.checkin).workers == 2
@@ -0,0 +1,85 @@
+"""
+Debug Artifacts Ring Buffer Tests
+Step snapshots are persisted when their test fails and dropped when it passes
+
+Usage:
+    pytest tests/bdd/unit/test_debug_artifacts_ring.py -v
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'utils'))
+
+from debug_artifacts import DebugArtifacts
+
+
+class FakeDriver:
+    """Just enough of a WebDriver for DebugArtifacts.snapshot()"""
+
+    def __init__(self):
+        self.current_url = 'http://localhost:8000/dashboard'
+        self.page_source = '<html><body>page 0</body></html>'
+        self.shots = 0
+
+    def get_screenshot_as_base64(self):
+        self.shots += 1
+        return 'iVBORw0KGgo='
+
+    def load(self, n):
+        self.page_source = f'<html><body>page {n}</body></html>'
+
+
+def _artifacts(tmp_path):
+    return DebugArtifacts(root=tmp_path / 'artifacts', steps=5, run_id='run')
+
+
+def test_failed_test_persists_its_steps(tmp_path):
+    artifacts = _artifacts(tmp_path)
+    driver = FakeDriver()
+    artifacts.begin_test('PROF-001')
+    for n in range(2):
+        driver.load(n)
+        artifacts.step(driver, f'step{n}')
+    artifacts.end_test('PROF-001', False)
+    assert artifacts.flush(5)
+
+    entries = artifacts.store.entries()
+    assert {e['test'] for e in entries} == {'PROF-001'}
+    assert sorted(e['step'] for e in entries if e['kind'] == 'html') == ['001-step0', '002-step1']
+    assert artifacts._rings == {}
+
+
+def test_passed_test_drops_its_steps(tmp_path):
+    artifacts = _artifacts(tmp_path)
+    driver = FakeDriver()
+    artifacts.begin_test('PROF-001')
+    artifacts.step(driver, 'step0')
+    artifacts.end_test('PROF-001', True)
+
+    assert artifacts._queue.unfinished_tasks == 0
+    assert artifacts._writer is None
+    assert artifacts._rings == {}
+
+
+def test_save_debug_files_under_the_running_test(tmp_path):
+    artifacts = _artifacts(tmp_path)
+    driver = FakeDriver()
+    artifacts.begin_test('PROF-001')
+    artifacts.end_test('PROF-001', True)
+    artifacts.begin_test('PROF-002')
+    artifacts.step(driver, 'step0')
+    label = artifacts.save_debug(driver, 'fail')
+    assert label == 'run/PROF-002/002-fail'
+    assert artifacts.flush(5)
+    assert {e['test'] for e in artifacts.store.entries()} == {'PROF-002'}
+
+
+def test_steps_begun_under_another_name_are_kept(tmp_path):
+    artifacts = _artifacts(tmp_path)
+    artifacts.begin_test('test_001_register_and_login')
+    artifacts.step(FakeDriver(), 'step0')
+    artifacts.end_test('FAM-001', False)
+    assert artifacts.flush(5)
+    assert {e['test'] for e in artifacts.store.entries()} == {'FAM-001'}
+    assert artifacts.current_test == 'FAM-001'
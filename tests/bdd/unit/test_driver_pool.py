@@ -0,0 +1,82 @@
+"""
+WebDriver Pool Tests
+Slow browsers do not block the pool lock; capacity stays consistent
+
+Usage:
+    pytest tests/bdd/unit/test_driver_pool.py -v
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'utils'))
+
+from driver_pool import WebDriverPool
+
+
+class FakeDriver:
+    """Browser stand-in whose commands can be made to hang"""
+
+    def __init__(self):
+        self.current_url = 'about:blank'
+        self.hang = threading.Event()
+        self.release = threading.Event()
+        self.quit_called = False
+
+    def execute_script(self, script, *args):
+        if self.hang.is_set():
+            self.release.wait(5)
+        return 1
+
+    def delete_all_cookies(self):
+        pass
+
+    def get(self, url):
+        self.current_url = url
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_hung_health_check_does_not_block_checkin():
+    pool = WebDriverPool(FakeDriver, max_size=2)
+    slow, fast = pool.checkout(), pool.checkout()
+    pool.checkin(slow)
+    slow.hang.set()
+
+    checkout = threading.Thread(target=pool.checkout)
+    checkout.start()
+    # The checkout is stuck health-checking `slow`; a checkin must still go through
+    done = threading.Thread(target=pool.checkin, args=(fast, False))
+    done.start()
+    done.join(1)
+    assert not done.is_alive()
+    slow.release.set()
+    checkout.join(5)
+    assert pool.get_summary()['live'] == 2
+
+
+def test_unknown_driver_checkin_is_ignored():
+    pool = WebDriverPool(FakeDriver, max_size=1)
+    pool.checkin(FakeDriver())
+    summary = pool.get_summary()
+    assert (summary['live'], summary['idle']) == (0, 0)
+
+    driver = pool.checkout()
+    pool.checkin(driver)
+    pool.checkin(driver)
+    summary = pool.get_summary()
+    assert (summary['live'], summary['idle']) == (1, 1)
+
+
+def test_unhealthy_idle_browser_is_replaced():
+    pool = WebDriverPool(FakeDriver, max_size=1)
+    driver = pool.checkout()
+    pool.checkin(driver)
+    driver.execute_script = None  # any command now fails
+
+    replacement = pool.checkout(timeout=1)
+    assert replacement is not driver
+    assert driver.quit_called
+    assert pool.get_summary()['live'] == 1
@@ -0,0 +1,69 @@
+"""
+Latency Histogram Tests
+Bucket layout and percentiles of utils/latency_histogram.py
+
+Usage:
+    pytest tests/bdd/unit/test_latency_histogram.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'utils'))
+
+from latency_histogram import LatencyHistogram, _bucket_index, _bucket_range
+
+
+def test_small_values_have_exact_buckets():
+    assert [_bucket_index(v) for v in (0, 1, 255)] == [0, 1, 255]
+    assert _bucket_range(255) == (255, 255)
+
+
+@pytest.mark.parametrize('value, index, bucket', [
+    (256, 256, (256, 257)),
+    (511, 383, (510, 511)),
+    (512, 384, (512, 515)),
+    (1_000_000, 1780, (999_424, 1_003_519)),
+])
+def test_bucket_boundaries(value, index, bucket):
+    assert _bucket_index(value) == index
+    assert _bucket_range(index) == bucket
+
+
+def test_buckets_are_contiguous_and_within_one_percent():
+    for index in range(256, 3000):
+        low, high = _bucket_range(index)
+        assert _bucket_range(index + 1)[0] == high + 1
+        assert _bucket_index(low) == _bucket_index(high) == index
+        assert (high - low) / low < 0.01
+
+
+def test_percentiles_never_understate_and_stay_within_one_percent():
+    histogram = LatencyHistogram()
+    for ms in range(1, 101):
+        histogram.record(ms / 1000.0)
+
+    for pct, exact in ((50, 50), (90, 90), (99, 99)):
+        assert exact <= histogram.percentile(pct) <= exact * 1.01
+    assert histogram.percentile(100) == 100.0
+    assert histogram.mean == pytest.approx(50.5)
+
+
+def test_empty_histogram():
+    histogram = LatencyHistogram()
+    assert histogram.percentile(50) is None
+    assert histogram.summary()['max'] is None
+
+
+def test_merge_and_round_trip():
+    fast, slow = LatencyHistogram(), LatencyHistogram()
+    fast.record(0.002, count=9)
+    slow.record(2.0)
+    merged = LatencyHistogram.from_dict(fast.merge(slow).to_dict())
+
+    assert (merged.count, merged.min, merged.max) == (10, 2000, 2_000_000)
+    # Highest value of the 2000 us bucket (2000..2007)
+    assert merged.percentile(90) == 2.007
+    assert merged.percentile(100) == 2000.0
@@ -0,0 +1,105 @@
+"""
+Load Generator Route Tests
+Every route of every built-in mix is registered in routes.php
+
+The stub server answers only the paths routes.php registers and sends
+everything else to /404, as core/Router.php does.
+
+Usage:
+    pytest tests/bdd/unit/test_load_generator_routes.py -v
+"""
+
+import asyncio
+import re
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlparse
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'utils'))
+
+from load_generator import AIOHTTP_AVAILABLE, ROUTE_MIXES, LoadGenerator
+
+ROUTES_FILE = Path(__file__).parents[3] / 'routes.php'
+
+
+def registered_routes():
+    """(METHOD, path) pairs of routes.php, with $router->group() prefixes applied"""
+    routes = set()
+    prefix = ''
+    for line in ROUTES_FILE.read_text().splitlines():
+        group = re.match(r"\$router->group\('([^']*)'", line)
+        route = re.match(r"(\s*)\$router->(get|post)\('([^']*)'", line)
+        if group:
+            prefix = group.group(1)
+        elif route:
+            if not route.group(1):
+                prefix = ''
+            routes.add((route.group(2).upper(), prefix + route.group(3)))
+    return routes
+
+
+class StubApp(BaseHTTPRequestHandler):
+    routes = set()
+
+    def _answer(self, method):
+        path = urlparse(self.path).path
+        if method == 'POST' and path == '/login':
+            self._reply(303, {'Location': '/user/dashboard'})
+        elif path == '/404':
+            self._reply(404)
+        elif (method, path) in self.routes:
+            self._reply(200)
+        else:
+            self._reply(302, {'Location': '/404'})
+
+    def _reply(self, status, headers=None):
+        length = int(self.headers.get('Content-Length') or 0)
+        self.rfile.read(length)
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def do_GET(self):
+        self._answer('GET')
+
+    def do_POST(self):
+        self._answer('POST')
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    StubApp.routes = registered_routes()
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubApp)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_routes_file_is_parsed():
+    routes = registered_routes()
+    assert ('GET', '/user/dashboard') in routes
+    assert ('GET', '/admin/dashboard') in routes
+    assert ('GET', '/dashboard') not in routes
+
+
+@pytest.mark.skipif(not AIOHTTP_AVAILABLE, reason="aiohttp not installed")
+@pytest.mark.parametrize('mix', sorted(ROUTE_MIXES))
+def test_no_route_of_the_mix_404s(stub_server, mix):
+    generator = LoadGenerator(stub_server, ROUTE_MIXES[mix], [('load@example.com', 'secret')],
+                              concurrency=4, duration=0.5, warmup=0, seed=1)
+    report = asyncio.run(generator.run())
+
+    errors = {name: route['errors'] for name, route in report['routes'].items() if route['errors']}
+    assert errors == {}
+    assert all(route['summary']['count'] for route in report['routes'].values())
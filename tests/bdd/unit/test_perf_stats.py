@@ -0,0 +1,95 @@
+"""
+Performance Statistics Tests
+Mann-Whitney p-values, bootstrap ratio intervals and the regression gate verdicts
+
+Usage:
+    pytest tests/bdd/unit/test_perf_stats.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'utils'))
+
+from perf_baseline import compare_series
+from perf_stats import bootstrap_ratio_ci, mann_whitney_greater
+
+
+def test_exact_p_value_without_overlap():
+    result = mann_whitney_greater([1, 2, 3, 4, 5], [6, 7, 8, 9, 10])
+    # Only 1 of the C(10, 5) = 252 arrangements is this extreme
+    assert result == {'u': 25.0, 'p_value': pytest.approx(1 / 252), 'method': 'exact'}
+
+
+def test_exact_p_value_with_overlap():
+    result = mann_whitney_greater([1, 2, 3, 5], [4, 6, 7])
+    # U = 11 of 12; U >= 11 in 2 of the C(7, 3) = 35 arrangements
+    assert result == {'u': 11.0, 'p_value': pytest.approx(2 / 35), 'method': 'exact'}
+
+
+def test_exact_p_value_is_one_when_candidate_is_faster():
+    assert mann_whitney_greater([6, 7, 8], [1, 2, 3])['p_value'] == pytest.approx(1.0)
+
+
+def test_ties_use_the_corrected_normal_approximation():
+    result = mann_whitney_greater([1, 1, 2, 2, 3], [3, 3, 4, 4, 5])
+    # Ranks 6 + 6 + 8.5 + 8.5 + 10 -> U = 24; tie groups 2, 2, 3, 2 -> variance 21.94
+    assert result['method'] == 'normal'
+    assert result['u'] == 24.0
+    assert result['p_value'] == pytest.approx(0.009433, abs=1e-5)
+
+
+def test_all_tied_samples_are_not_significant():
+    assert mann_whitney_greater([5, 5, 5], [5, 5, 5])['p_value'] == 1.0
+
+
+def test_empty_side_has_no_p_value():
+    assert mann_whitney_greater([], [1, 2])['p_value'] is None
+
+
+def test_bootstrap_ratio_ci_brackets_the_slowdown():
+    baseline = [10, 11, 12, 13, 14]
+    candidate = [2 * value for value in baseline]
+    low, high = bootstrap_ratio_ci(baseline, candidate)
+    assert low <= 2.0 <= high
+    assert (low, high) == bootstrap_ratio_ci(baseline, candidate)
+
+
+def test_bootstrap_ratio_ci_of_identical_samples_is_one():
+    assert bootstrap_ratio_ci([7, 7, 7], [7, 7, 7]) == (1.0, 1.0)
+
+
+def test_bootstrap_ratio_ci_without_a_usable_baseline():
+    assert bootstrap_ratio_ci([], [1, 2]) == (None, None)
+    assert bootstrap_ratio_ci([0, 0, 0], [1, 2, 3]) == (None, None)
+
+
+def _series(values):
+    return {'GET /': {'metrics': {'p50_ms': list(values)}}}
+
+
+BASELINE = [100 + n for n in range(20)]
+
+
+@pytest.mark.parametrize('factor, verdict', [
+    (1.5, 'regression'),
+    (0.5, 'improvement'),
+    (1.0, 'unchanged'),
+])
+def test_compare_series_verdicts(factor, verdict):
+    [row] = compare_series(_series(BASELINE), _series(value * factor for value in BASELINE))
+    assert row['verdict'] == verdict
+    assert row['ratio'] == pytest.approx(factor)
+
+
+def test_small_slowdown_below_min_effect_is_unchanged():
+    [row] = compare_series(_series(BASELINE), _series(value * 1.02 for value in BASELINE))
+    assert row['verdict'] == 'unchanged'
+
+
+def test_too_few_samples_are_insufficient():
+    [row] = compare_series(_series(BASELINE), _series([150, 160, 170]))
+    assert row['verdict'] == 'insufficient'
+    assert row['p_value'] is None
@@ -0,0 +1,49 @@
+"""
+Shard Planning Tests
+LPT balancing, risk-order dealing and the median default of run_all_tests_consolidated.plan_shards
+
+Usage:
+    pytest tests/bdd/unit/test_plan_shards.py -v
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from run_all_tests_consolidated import plan_shards
+
+
+def test_longest_suites_are_spread_first():
+    durations = {'a': 50, 'b': 40, 'c': 30, 'd': 20, 'e': 10}
+    shards = plan_shards(list(durations), 2, durations)
+    # Each suite, longest first, goes to the least loaded shard (first one on a tie)
+    assert shards == [(80.0, ['a', 'd', 'e']), (70.0, ['b', 'c'])]
+
+
+def test_suites_without_history_take_the_median_duration():
+    durations = {'a': 10, 'b': 30, 'c': 90}
+    shards = plan_shards(['a', 'b', 'c', 'new'], 2, durations)
+    # 'new' is estimated at 30 s, the median of the known suites
+    assert shards == [(90.0, ['c']), (70.0, ['b', 'new', 'a'])]
+
+
+def test_without_any_history_suites_default_to_sixty_seconds():
+    assert plan_shards(['a', 'b'], 1, {}) == [(120.0, ['a', 'b'])]
+
+
+def test_never_more_shards_than_suites():
+    assert len(plan_shards(['a', 'b'], 8, {})) == 2
+    assert len(plan_shards([], 4, {})) == 1
+
+
+def test_riskiest_suites_start_first_on_different_workers():
+    durations = {'a': 50, 'b': 40, 'c': 30, 'd': 20}
+    shards = plan_shards(list(durations), 2, durations, order=['d', 'c', 'a', 'b'])
+    # d and c start at once; each worker then takes the riskiest suite left when it frees up
+    assert shards == [(70.0, ['d', 'a']), (70.0, ['c', 'b'])]
+
+
+def test_suites_missing_from_the_order_run_last():
+    shards = plan_shards(['a', 'b', 'new'], 1, {'a': 10, 'b': 20}, order=['b', 'a'])
+    assert shards == [(50.0, ['b', 'a', 'new'])]
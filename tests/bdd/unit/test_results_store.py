@@ -0,0 +1,57 @@
+"""
+Results Store Tests
+Compacting one run's results keeps other runs' events in the shared log
+
+Usage:
+    pytest tests/bdd/unit/test_results_store.py -v
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'utils'))
+
+from results_store import ResultsEventLog
+
+
+def _test(run, test_id, status='PASS', timestamp='2099-01-01T00:00:00'):
+    return {'type': 'test', 'run': run, 'suite': 'Suite', 'id': test_id, 'name': test_id,
+            'status': status, 'duration': 1, 'timestamp': timestamp}
+
+
+def _ids(results):
+    return sorted(t['id'] for suite in results['test_suites'].values() for t in suite['tests'])
+
+
+def test_compacting_one_run_keeps_the_other_runs_events(tmp_path):
+    log = ResultsEventLog(tmp_path / 'results.jsonl')
+    log.append({'type': 'suite', 'run': 'B', 'suite': 'Suite', 'metadata': {}})
+    log.append(_test('B', 'T1'))
+    log.append({'type': 'suite', 'run': 'A', 'suite': 'Suite', 'metadata': {}})
+    log.append(_test('A', 'T2'))
+
+    assert _ids(log.compact(tmp_path / 'results.json', 'A')) == ['T2']
+    assert _ids(log.compact(tmp_path / 'results.json', 'B')) == ['T1']
+
+
+def test_each_run_is_compacted_to_its_latest_results(tmp_path):
+    log = ResultsEventLog(tmp_path / 'results.jsonl')
+    log.append(_test('A', 'T1', 'FAIL'))
+    log.append(_test('B', 'T1', 'FAIL'))
+    log.append(_test('A', 'T1', 'PASS'))
+
+    results = log.compact(tmp_path / 'results.json', 'A')
+
+    assert results['summary']['total_passed'] == 1
+    assert [(e['run'], e['status']) for e in log.read_events()] == [('A', 'PASS'), ('B', 'FAIL')]
+
+
+def test_runs_past_the_retention_window_are_dropped(tmp_path):
+    log = ResultsEventLog(tmp_path / 'results.jsonl')
+    log.append(_test('old', 'T1', timestamp='2000-01-01T00:00:00'))
+    log.append(_test('A', 'T2', timestamp='2000-01-01T00:00:00'))
+
+    log.compact(tmp_path / 'results.json', 'A', retention_hours=24)
+
+    # The compacting run itself is always kept, however old its results
+    assert [e['run'] for e in log.read_events()] == ['A']
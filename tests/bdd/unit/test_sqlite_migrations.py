@@ -0,0 +1,87 @@
+"""
+SQLite Migration Translation Tests
+MySQL -> SQLite rewriting of utils/sqlite_migrations.translate_statement
+
+Usage:
+    pytest tests/bdd/unit/test_sqlite_migrations.py -v
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'utils'))
+
+from sqlite_migrations import apply_sql, split_statements, translate_statement
+
+
+CREATE_USERS = """CREATE TABLE IF NOT EXISTS users (
+  id INT AUTO_INCREMENT PRIMARY KEY,
+  email VARCHAR(150) NOT NULL,
+  status ENUM('active', 'banned') DEFAULT 'active',
+  updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  INDEX idx_status (status),
+  KEY (email, status),
+  UNIQUE KEY uniq_email (email)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4"""
+
+
+def test_create_table_is_rewritten_for_sqlite():
+    create, *indexes = translate_statement(CREATE_USERS)
+
+    assert 'id INTEGER PRIMARY KEY AUTOINCREMENT' in create
+    assert "status TEXT DEFAULT 'active'" in create
+    assert 'ON UPDATE' not in create
+    assert 'UNIQUE (email)' in create
+    assert 'ENGINE' not in create
+    assert indexes == [
+        'CREATE INDEX IF NOT EXISTS idx_status ON users (status)',
+        'CREATE INDEX IF NOT EXISTS idx_users_email_status ON users (email, status)',
+    ]
+
+
+def test_set_statements_are_dropped():
+    assert translate_statement('SET FOREIGN_KEY_CHECKS = 0') == []
+
+
+def test_auto_increment_start_becomes_a_sequence():
+    assert translate_statement('ALTER TABLE users AUTO_INCREMENT = 100001') == [('sequence', 'users', 100001)]
+
+
+def test_multi_column_alter_is_split_and_loses_its_position():
+    statement = "ALTER TABLE users ADD COLUMN city VARCHAR(100) NULL AFTER email, ADD COLUMN kind ENUM('a','b') FIRST"
+    assert translate_statement(statement) == [
+        'ALTER TABLE users ADD COLUMN city VARCHAR(100) NULL',
+        'ALTER TABLE users ADD COLUMN kind TEXT',
+    ]
+
+
+def test_on_duplicate_key_update_becomes_an_upsert():
+    statement = "INSERT INTO roles (name, level) VALUES ('admin', 5) ON DUPLICATE KEY UPDATE level = VALUES(level)"
+    assert translate_statement(statement) == [
+        "INSERT INTO roles (name, level) VALUES ('admin', 5) ON CONFLICT DO UPDATE SET level = excluded.level"
+    ]
+
+
+def test_split_statements_ignores_semicolons_in_quotes_and_comments():
+    sql = "INSERT INTO t VALUES ('a;b'); -- trailing; comment\nSELECT 1;"
+    assert split_statements(sql) == ["INSERT INTO t VALUES ('a;b')", 'SELECT 1']
+
+
+def test_translated_script_runs_on_sqlite():
+    conn = sqlite3.connect(':memory:')
+    apply_sql(conn, f"""
+        SET NAMES utf8mb4;
+        {CREATE_USERS};
+        ALTER TABLE users AUTO_INCREMENT = 100001;
+        ALTER TABLE users ADD COLUMN city VARCHAR(100) NULL AFTER email;
+        ALTER TABLE users ADD COLUMN city VARCHAR(100) NULL;
+        ALTER TABLE missing_table ADD COLUMN x INT;
+        INSERT INTO users (email) VALUES ('a@example.com');
+        INSERT INTO users (email, status) VALUES ('a@example.com', 'banned')
+            ON DUPLICATE KEY UPDATE status = VALUES(status);
+    """)
+
+    assert conn.execute('SELECT id, email, status, city FROM users').fetchall() == [
+        (100001, 'a@example.com', 'banned', None)
+    ]
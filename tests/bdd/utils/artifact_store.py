@@ -0,0 +1,235 @@
+"""
+Artifact Store Utility
+Content-addressed storage for debug screenshots and page HTML
+
+Every artifact is stored once under blobs/<aa>/<sha256><suffix>, keyed by
+the hash of its content (for HTML: of the uncompressed page), so the same
+failure screenshot or DOM captured by many runs costs its bytes only once.
+A SQLite manifest maps run, test, step, kind, timestamp and URL to the blob.
+gc() drops the oldest runs from the manifest until the blobs still
+referenced fit the size budget, then deletes unreferenced blobs. Suite
+processes share the store: put() holds a shared flock on manifest.db.lock
+and gc() an exclusive one, so a collection never deletes a blob another
+process has just deduplicated against.
+
+Configuration (via environment variables):
+  BDD_ARTIFACT_DIR        - Store root (default: tests/bdd/results/artifacts)
+  BDD_ARTIFACT_BUDGET_MB  - Size budget enforced by gc() (default: 200)
+"""
+
+import hashlib
+import os
+import re
+import shutil
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+DEFAULT_ARTIFACT_DIR = Path(__file__).parent.parent / 'results' / 'artifacts'
+DEFAULT_BUDGET_MB = 200
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    hash TEXT PRIMARY KEY,
+    suffix TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS artifacts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run TEXT NOT NULL,
+    test TEXT NOT NULL,
+    step TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    url TEXT,
+    blob TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_artifacts_run ON artifacts (run);
+CREATE INDEX IF NOT EXISTS idx_artifacts_test ON artifacts (test);
+CREATE INDEX IF NOT EXISTS idx_artifacts_blob ON artifacts (blob);
+"""
+
+
+class ArtifactStore:
+    """Blob directory plus SQLite manifest, safe for concurrent suite processes"""
+
+    def __init__(self, root=None, budget_mb=None):
+        """
+        Initialize store (creates the manifest if missing)
+
+        Args:
+            root: Store directory (default: BDD_ARTIFACT_DIR or DEFAULT_ARTIFACT_DIR)
+            budget_mb: Size budget for gc() (default: BDD_ARTIFACT_BUDGET_MB or 200)
+        """
+        self.root = Path(root or os.environ.get('BDD_ARTIFACT_DIR', DEFAULT_ARTIFACT_DIR))
+        self.blob_dir = self.root / 'blobs'
+        self.budget = int(float(budget_mb or os.environ.get('BDD_ARTIFACT_BUDGET_MB', DEFAULT_BUDGET_MB)) * 1024 * 1024)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.root / 'manifest.db'), timeout=30, check_same_thread=False)
+        self._conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _locked(self, exclusive=False):
+        """Hold the thread lock and the cross-process manifest lock (exclusive for gc)"""
+        with self._lock, open(self.root / 'manifest.db.lock', 'w') as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            yield
+
+    def blob_path(self, digest, suffix):
+        return self.blob_dir / digest[:2] / f"{digest}{suffix}"
+
+    def put(self, data, suffix, run, test, step, kind, timestamp=None, url=None, key=None):
+        """
+        Store an artifact, writing its blob only if the content is new
+
+        Args:
+            data: Bytes to store
+            suffix: Blob file suffix ('.png', '.html.gz', ...)
+            run, test, step, kind: Manifest entry
+            timestamp: Capture time (epoch seconds, default: now)
+            url: Page URL
+            key: Bytes to hash instead of data (e.g. the uncompressed HTML)
+
+        Returns:
+            (Path of the blob, bool - True if it was already stored)
+        """
+        digest = hashlib.sha256(key if key is not None else data).hexdigest()
+        path = self.blob_path(digest, suffix)
+        stamp = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(timestamp or time.time()))
+        with self._locked():
+            known = self._conn.execute("SELECT 1 FROM blobs WHERE hash = ?", (digest,)).fetchone()
+            duplicate = bool(known) and path.exists()
+            if not duplicate:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+                tmp.write_bytes(data)
+                os.replace(tmp, path)
+            with self._conn:
+                self._conn.execute("INSERT OR IGNORE INTO blobs (hash, suffix, size, created) VALUES (?, ?, ?, ?)",
+                                   (digest, suffix, len(data), stamp))
+                self._conn.execute(
+                    "INSERT INTO artifacts (run, test, step, kind, timestamp, url, blob) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (run, test, step, kind, stamp, url, digest)
+                )
+        return path, duplicate
+
+    def entries(self, run=None, test=None, limit=200):
+        """
+        Get manifest entries, newest first
+
+        Returns:
+            list of dicts: run, test, step, kind, timestamp, url, blob, suffix, path
+        """
+        where, params = [], []
+        if run:
+            where.append("a.run = ?")
+            params.append(run)
+        if test:
+            where.append("a.test LIKE ?")
+            params.append(test)
+        sql = ("SELECT a.run, a.test, a.step, a.kind, a.timestamp, a.url, a.blob, b.suffix "
+               "FROM artifacts a JOIN blobs b ON b.hash = a.blob"
+               + (" WHERE " + " AND ".join(where) if where else "")
+               + " ORDER BY a.id DESC LIMIT ?")
+        with self._lock:
+            rows = self._conn.execute(sql, params + [limit]).fetchall()
+        return [
+            {'run': run_id, 'test': test_id, 'step': step, 'kind': kind, 'timestamp': stamp, 'url': url,
+             'blob': digest, 'suffix': suffix, 'path': self.blob_path(digest, suffix)}
+            for run_id, test_id, step, kind, stamp, url, digest, suffix in rows
+        ]
+
+    def stats(self):
+        """Get entry, blob and byte counts (logical = without dedup)"""
+        with self._lock:
+            entries, logical = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(b.size), 0) FROM artifacts a JOIN blobs b ON b.hash = a.blob"
+            ).fetchone()
+            blobs, stored = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM blobs").fetchone()
+            runs = self._conn.execute("SELECT COUNT(DISTINCT run) FROM artifacts").fetchone()[0]
+        return {'runs': runs, 'entries': entries, 'blobs': blobs, 'stored_bytes': stored, 'logical_bytes': logical}
+
+    def _delete_orphans(self):
+        """Delete blobs no manifest entry references (caller holds the exclusive lock)"""
+        orphans = self._conn.execute(
+            "SELECT hash, suffix, size FROM blobs WHERE hash NOT IN (SELECT DISTINCT blob FROM artifacts)"
+        ).fetchall()
+        for digest, suffix, _ in orphans:
+            try:
+                self.blob_path(digest, suffix).unlink()
+            except OSError:
+                pass
+        with self._conn:
+            self._conn.executemany("DELETE FROM blobs WHERE hash = ?", [(digest,) for digest, _, _ in orphans])
+        return len(orphans), sum(size for _, _, size in orphans)
+
+    def gc(self, budget=None, keep_runs=1):
+        """
+        Enforce the size budget
+
+        Drops whole runs, oldest first (never the newest keep_runs), until the
+        referenced blobs fit, then deletes unreferenced blobs and stray temp files.
+
+        Args:
+            budget: Bytes (default: the store's budget)
+            keep_runs: Newest runs that are never dropped
+
+        Returns:
+            dict: runs_dropped, blobs_deleted, bytes_freed, stored_bytes
+        """
+        budget = self.budget if budget is None else budget
+        dropped = 0
+        with self._locked(exclusive=True):
+            runs = [run for run, in self._conn.execute(
+                "SELECT run FROM artifacts GROUP BY run ORDER BY MIN(id)"
+            ).fetchall()]
+            stored = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+            for run in runs[:max(0, len(runs) - keep_runs)]:
+                if stored <= budget:
+                    break
+                with self._conn:
+                    self._conn.execute("DELETE FROM artifacts WHERE run = ?", (run,))
+                dropped += 1
+                # Only blobs no other run shares free space
+                stored = self._conn.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM blobs WHERE hash IN (SELECT DISTINCT blob FROM artifacts)"
+                ).fetchone()[0]
+            deleted, freed = self._delete_orphans()
+            stored = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+            for tmp in self.blob_dir.glob('*/*.tmp'):
+                if time.time() - tmp.stat().st_mtime > 3600:
+                    tmp.unlink()
+        return {'runs_dropped': dropped, 'blobs_deleted': deleted, 'bytes_freed': freed, 'stored_bytes': stored}
+
+    def export(self, dest, run=None, test=None):
+        """
+        Copy artifacts out under readable names (<run>/<test>/<step>-<kind><suffix>)
+
+        Returns:
+            list of written paths
+        """
+        dest = Path(dest)
+        written = []
+        for entry in reversed(self.entries(run, test, limit=10000)):
+            step = re.sub(r'[^A-Za-z0-9_.-]+', '_', entry['step'])
+            target = (dest / entry['run'] / re.sub(r'[^A-Za-z0-9_.-]+', '_', entry['test'])
+                      / f"{step}-{entry['kind']}{entry['suffix']}")
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(entry['path'], target)
+            written.append(target)
+        return written
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
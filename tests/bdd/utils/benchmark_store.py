@@ -0,0 +1,145 @@
+"""
+Benchmark Store Utility
+Persists benchmark samples per git commit and summarizes their distributions
+
+Every benchmark run appends one JSONL record per route and mode with the raw
+samples, the run id and the git commit, so later runs can be compared against
+earlier ones. Records of different benchmarks share the file and are told
+apart by their type (e.g. 'page_timing').
+
+Configuration (via environment variables):
+  BENCHMARK_LOG - JSONL file (default: tests/bdd/results/benchmarks/benchmarks.jsonl)
+"""
+
+import os
+import subprocess
+import time
+import uuid
+from pathlib import Path
+
+from results_store import ResultsEventLog
+
+
+BENCHMARK_LOG = Path(__file__).parent.parent / 'results' / 'benchmarks' / 'benchmarks.jsonl'
+
+
+def percentile(values, pct):
+    """
+    Linear-interpolated percentile
+
+    Args:
+        values: Numbers (None values are ignored)
+        pct: Percentile 0-100
+
+    Returns:
+        float, or None for no values
+    """
+    values = sorted(v for v in values if v is not None)
+    if not values:
+        return None
+    rank = (len(values) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (rank - low)
+
+
+def summarize(samples, metrics):
+    """
+    Get per-metric distribution stats
+
+    Returns:
+        dict metric -> {n, min, p50, p95, p99, max, mean}
+    """
+    summary = {}
+    for metric in metrics:
+        values = [s.get(metric) for s in samples if s.get(metric) is not None]
+        if not values:
+            continue
+        summary[metric] = {
+            'n': len(values),
+            'min': min(values),
+            'p50': percentile(values, 50),
+            'p95': percentile(values, 95),
+            'p99': percentile(values, 99),
+            'max': max(values),
+            'mean': sum(values) / len(values),
+        }
+    return summary
+
+
+def current_commit(cwd=None):
+    """
+    Get the checked-out git commit (short hash, '+dirty' if uncommitted changes)
+
+    Returns:
+        str, or 'unknown' outside a git checkout
+    """
+    cwd = cwd or Path(__file__).parent
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=cwd,
+                                capture_output=True, text=True, timeout=10).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=cwd,
+                               capture_output=True, text=True, timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return 'unknown'
+    if not commit:
+        return 'unknown'
+    return commit + ('+dirty' if dirty else '')
+
+
+class BenchmarkStore:
+    """JSONL store of benchmark samples, one record per route/mode/run"""
+
+    def __init__(self, log_file=None):
+        """
+        Initialize store
+
+        Args:
+            log_file: JSONL file (default: BENCHMARK_LOG, or BENCHMARK_LOG env var)
+        """
+        self.log = ResultsEventLog(log_file or os.environ.get('BENCHMARK_LOG', BENCHMARK_LOG))
+        self.run_id = uuid.uuid4().hex[:12]
+        self.commit = current_commit()
+
+    def record(self, route, mode, samples, kind='page_timing', **extra):
+        """
+        Persist the samples of one route/mode
+
+        Args:
+            route: Path benchmarked
+            mode: 'cold' or 'warm' (or any label)
+            samples: list of sample dicts
+            kind: Record type, lets other benchmarks share the store
+            **extra: Additional fields stored with the record (e.g. role)
+        """
+        self.log.append(dict(
+            extra, type=kind, run_id=self.run_id, commit=self.commit,
+            timestamp=time.strftime('%Y-%m-%dT%H:%M:%S'),
+            route=route, mode=mode, samples=samples
+        ))
+
+    def records(self, kind='page_timing', route=None, mode=None, **match):
+        """
+        Get stored records, oldest first
+
+        Args:
+            kind, route, mode: Filters (None matches anything)
+            **match: Extra field filters, e.g. role='user'
+
+        Returns:
+            list of record dicts
+        """
+        return [
+            r for r in self.log.read_events()
+            if r.get('type') == kind and (route is None or r.get('route') == route)
+            and (mode is None or r.get('mode') == mode)
+            and all(r.get(key) == value for key, value in match.items())
+        ]
+
+    def previous_summary(self, route, mode, metrics, kind='page_timing', **match):
+        """Summary of the latest earlier run for route/mode (None if there is none)"""
+        earlier = [r for r in self.records(kind, route, mode, **match) if r.get('run_id') != self.run_id]
+        return summarize(earlier[-1]['samples'], metrics) if earlier else None
+
+    def close(self):
+        self.log.close()
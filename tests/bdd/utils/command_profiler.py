@@ -0,0 +1,163 @@
+"""
+Command Profiler Utility
+Counts WebDriver round trips by command and call site and times them
+
+Every remote command (findElement, getElementText, getElementAttribute,
+isElementDisplayed, executeScript, ...) goes through driver.execute;
+profile_driver() wraps it and charges the call to the first stack frame
+outside Selenium and this instrumentation, i.e. the suite or helper line
+that issued it. The hot call-site table shows where batching several
+round trips into one execute_script would pay off.
+
+Configuration (via environment variables):
+  WEBDRIVER_PROFILE       - Set to true to profile drivers from setup_webdriver
+  WEBDRIVER_PROFILE_TOP   - Rows in the hot call-site table (default: 15)
+"""
+
+import atexit
+import os
+import sys
+import threading
+import time
+
+
+PROFILE_ENABLED = os.environ.get('WEBDRIVER_PROFILE', 'false').lower() in ('1', 'true', 'yes')
+DEFAULT_TOP = int(os.environ.get('WEBDRIVER_PROFILE_TOP', 15))
+
+# Frames in these files are never the call site
+_SKIP_FILES = (os.sep + 'selenium' + os.sep, os.sep + 'command_profiler.py', os.sep + 'trace_spans.py',
+               os.sep + 'contextlib.py', os.sep + 'functools.py')
+
+
+def _call_site():
+    """'file:line function' of the first frame outside Selenium and the wrappers"""
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if not any(skip in filename for skip in _SKIP_FILES):
+            return f"{os.path.basename(filename)}:{frame.f_lineno} {frame.f_code.co_name}"
+        frame = frame.f_back
+    return '?'
+
+
+class CommandProfiler:
+    """Per (command, call site) counts and latencies of WebDriver commands"""
+
+    def __init__(self, label='webdriver'):
+        """
+        Initialize profiler
+
+        Args:
+            label: Name shown in the report header (usually the suite)
+        """
+        self.label = label
+        self.stats = {}
+        self._lock = threading.Lock()
+
+    def record(self, command, site, seconds):
+        with self._lock:
+            entry = self.stats.get((command, site))
+            if entry is None:
+                self.stats[(command, site)] = [1, seconds, seconds]
+            else:
+                entry[0] += 1
+                entry[1] += seconds
+                entry[2] = max(entry[2], seconds)
+
+    @property
+    def total_calls(self):
+        return sum(entry[0] for entry in self.stats.values())
+
+    @property
+    def total_seconds(self):
+        return sum(entry[1] for entry in self.stats.values())
+
+    def by_command(self):
+        """dict command -> (calls, seconds), most time first"""
+        totals = {}
+        for (command, _), (count, seconds, _) in self.stats.items():
+            calls, total = totals.get(command, (0, 0.0))
+            totals[command] = (calls + count, total + seconds)
+        return dict(sorted(totals.items(), key=lambda item: -item[1][1]))
+
+    def hot_sites(self, top=DEFAULT_TOP):
+        """
+        Get the call sites with the most time spent in round trips
+
+        Returns:
+            list of dicts: command, site, calls, total_ms, mean_ms, max_ms
+        """
+        rows = [
+            {'command': command, 'site': site, 'calls': count, 'total_ms': seconds * 1000,
+             'mean_ms': seconds / count * 1000, 'max_ms': worst * 1000}
+            for (command, site), (count, seconds, worst) in self.stats.items()
+        ]
+        rows.sort(key=lambda row: -row['total_ms'])
+        return rows[:top]
+
+    def report(self, top=DEFAULT_TOP):
+        """Formatted per-command totals and hot call-site table"""
+        lines = [
+            f"\n{'=' * 100}",
+            f"WEBDRIVER COMMANDS - {self.label}: {self.total_calls} round trips, {self.total_seconds:.2f}s",
+            '=' * 100,
+            ', '.join(f"{command} {calls}x/{seconds:.2f}s" for command, (calls, seconds) in self.by_command().items()),
+            f"\n{'calls':>7}{'total ms':>11}{'mean ms':>9}{'max ms':>9}  {'command':<24}call site",
+        ]
+        for row in self.hot_sites(top):
+            lines.append(f"{row['calls']:>7}{row['total_ms']:>11.1f}{row['mean_ms']:>9.1f}{row['max_ms']:>9.1f}  "
+                         f"{row['command']:<24}{row['site']}")
+        return '\n'.join(lines)
+
+    def print_report(self, top=DEFAULT_TOP):
+        if self.stats:
+            print(self.report(top))
+
+    def reset(self, label=None):
+        with self._lock:
+            self.stats = {}
+        if label:
+            self.label = label
+
+
+_profiler = CommandProfiler()
+
+
+def get_profiler():
+    """Get the process-wide profiler that profiled drivers report to"""
+    return _profiler
+
+
+def profile_driver(driver, profiler=None):
+    """
+    Count and time every WebDriver command of driver
+
+    Args:
+        driver: WebDriver
+        profiler: CommandProfiler (default: the process-wide one)
+
+    Returns:
+        driver
+    """
+    if getattr(driver, '_bdd_profiled', False):
+        return driver
+    profiler = profiler or _profiler
+    execute = driver.execute
+
+    def profiled_execute(driver_command, params=None):
+        site = _call_site()
+        start = time.perf_counter()
+        try:
+            return execute(driver_command, params)
+        finally:
+            profiler.record(driver_command, site, time.perf_counter() - start)
+
+    driver.execute = profiled_execute
+    driver._bdd_profiled = True
+    return driver
+
+
+@atexit.register
+def _report_unreported():
+    # Scripts that never call TestResultsManager.save() still get their table
+    _profiler.print_report()
@@ -0,0 +1,95 @@
+"""
+Dashboard Queries Utility
+The queries of DashboardService::getDashboardStats, runnable from Python per dialect
+
+The MySQL statements are copied verbatim from src/Services/DashboardService.php
+(keep them in sync). DashboardService uses MySQL-only date functions
+(DATE_SUB/NOW/YEAR/MONTH), so the SQLite variants express the same filters
+with datetime()/strftime(); they return the same numbers and do the same
+scans, which is what a scale benchmark needs.
+"""
+
+import time
+
+
+# (name, mysql, sqlite) in the order getDashboardStats runs them
+DASHBOARD_QUERIES = (
+    ('total_users', "SELECT COUNT(*) as count FROM users", None),
+    ('active_users',
+     "SELECT COUNT(DISTINCT user_id) as count FROM sessions WHERE last_activity > DATE_SUB(NOW(), INTERVAL 30 DAY)",
+     "SELECT COUNT(DISTINCT user_id) as count FROM sessions WHERE last_activity > datetime('now', '-30 days')"),
+    ('total_events', "SELECT COUNT(*) as count FROM events", None),
+    ('upcoming_events',
+     "SELECT COUNT(*) as count FROM events WHERE start_at > NOW()",
+     "SELECT COUNT(*) as count FROM events WHERE start_at > datetime('now')"),
+    ('total_donations', "SELECT SUM(amount) as total FROM payments WHERE status = 'completed'", None),
+    ('total_payments', "SELECT SUM(amount) as total FROM payments", None),
+    ('monthly_revenue',
+     "SELECT SUM(amount) as total FROM payments WHERE status = 'completed' "
+     "AND YEAR(created_at) = YEAR(NOW()) AND MONTH(created_at) = MONTH(NOW())",
+     "SELECT SUM(amount) as total FROM payments WHERE status = 'completed' "
+     "AND strftime('%Y-%m', created_at) = strftime('%Y-%m', 'now')"),
+    ('total_members', "SELECT COUNT(*) as count FROM family_members", None),
+    ('total_families', "SELECT COUNT(DISTINCT user_id) as count FROM family_members", None),
+    ('age_groups',
+     "SELECT "
+     "SUM(CASE WHEN birth_year IS NULL THEN 0 WHEN (YEAR(NOW()) - birth_year) <= 10 THEN 1 ELSE 0 END) as kids, "
+     "SUM(CASE WHEN birth_year IS NULL THEN 0 WHEN (YEAR(NOW()) - birth_year) BETWEEN 11 AND 59 THEN 1 ELSE 0 END) as adults, "
+     "SUM(CASE WHEN birth_year IS NULL THEN 0 WHEN (YEAR(NOW()) - birth_year) >= 60 THEN 1 ELSE 0 END) as seniors "
+     "FROM family_members",
+     "SELECT "
+     "SUM(CASE WHEN birth_year IS NULL THEN 0 WHEN (CAST(strftime('%Y', 'now') AS INTEGER) - birth_year) <= 10 THEN 1 ELSE 0 END) as kids, "
+     "SUM(CASE WHEN birth_year IS NULL THEN 0 WHEN (CAST(strftime('%Y', 'now') AS INTEGER) - birth_year) BETWEEN 11 AND 59 THEN 1 ELSE 0 END) as adults, "
+     "SUM(CASE WHEN birth_year IS NULL THEN 0 WHEN (CAST(strftime('%Y', 'now') AS INTEGER) - birth_year) >= 60 THEN 1 ELSE 0 END) as seniors "
+     "FROM family_members"),
+    ('role_counts',
+     "SELECT r.name, COUNT(u.id) as count FROM roles r LEFT JOIN users u ON r.id = u.role_id GROUP BY r.id, r.name",
+     None),
+    ('active_sponsors',
+     "SELECT COUNT(DISTINCT u.id) as count FROM users u JOIN roles r ON u.role_id = r.id "
+     "JOIN sessions s ON u.id = s.user_id WHERE r.name = 'sponsor' AND s.last_activity > DATE_SUB(NOW(), INTERVAL 30 DAY)",
+     "SELECT COUNT(DISTINCT u.id) as count FROM users u JOIN roles r ON u.role_id = r.id "
+     "JOIN sessions s ON u.id = s.user_id WHERE r.name = 'sponsor' AND s.last_activity > datetime('now', '-30 days')"),
+)
+
+QUERY_NAMES = tuple(name for name, _, _ in DASHBOARD_QUERIES)
+
+
+def dashboard_queries(dialect):
+    """
+    Get (name, sql) of the dashboard queries for a dialect
+
+    Args:
+        dialect: 'mysql' or 'sqlite'
+    """
+    if dialect == 'mysql':
+        return [(name, mysql) for name, mysql, _ in DASHBOARD_QUERIES]
+    return [(name, sqlite or mysql) for name, mysql, sqlite in DASHBOARD_QUERIES]
+
+
+def run_dashboard_queries(conn, dialect):
+    """
+    Run the dashboard queries once, timing each
+
+    Args:
+        conn: DB-API connection
+        dialect: 'mysql' or 'sqlite'
+
+    Returns:
+        (sample, results): sample maps '<name>_ms' and 'total_ms' to milliseconds,
+        results maps name to the fetched rows
+    """
+    sample = {}
+    results = {}
+    cursor = conn.cursor()
+    try:
+        started = time.perf_counter()
+        for name, sql in dashboard_queries(dialect):
+            query_started = time.perf_counter()
+            cursor.execute(sql)
+            results[name] = cursor.fetchall()
+            sample[f"{name}_ms"] = (time.perf_counter() - query_started) * 1000
+        sample['total_ms'] = (time.perf_counter() - started) * 1000
+    finally:
+        cursor.close()
+    return sample, results
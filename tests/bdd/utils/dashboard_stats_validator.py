@@ -1,16 +1,87 @@
 """
 Dashboard Stats Validator Utility
 Validates dashboard statistics, links, and UI elements
+
+The dashboard is read once by an injected collector (SNAPSHOT_JS) that returns
+profile completeness, family member counts, stat cards and buttons as one JSON
+blob; every validator is plain Python over that snapshot, so a full dashboard
+check costs a single round trip instead of several waits and XPath scans.
 """
 
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 import re
 import time
 
 
+SNAPSHOT_JS = """
+var lower = function (s) { return (s || '').toLowerCase(); };
+var clean = function (s) { return (s || '').replace(/\\s+/g, ' ').trim(); };
+var isVisible = function (el) {
+  var r = el.getBoundingClientRect();
+  var style = window.getComputedStyle(el);
+  return r.width > 0 && r.height > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+};
+var ownText = function (el) {
+  var t = '';
+  for (var n = el.firstChild; n; n = n.nextSibling) { if (n.nodeType === 3) { t += n.nodeValue; } }
+  return t;
+};
+var innermost = function (list) {
+  return list.filter(function (el) {
+    return !list.some(function (other) { return other !== el && el.contains(other); });
+  });
+};
+
+var snap = {ready: document.readyState, url: window.location.href};
+if (!document.body) { return snap; }
+
+var percent = document.getElementById('profilePercentText');
+snap.profilePercentText = percent ? clean(percent.innerText || percent.textContent) : null;
+snap.profileDonut = !!document.getElementById('profileDonut');
+
+var all = document.body.querySelectorAll('*:not(script):not(style)');
+var complete = [], family = [];
+for (var i = 0; i < all.length; i++) {
+  var el = all[i];
+  var text = lower(el.textContent);
+  if (ownText(el).indexOf('%') !== -1 && text.indexOf('complete') !== -1) { complete.push(el); }
+  if (text.indexOf('family') !== -1 && text.indexOf('member') !== -1 && /\\d/.test(text)) { family.push(el); }
+}
+snap.completeTexts = complete.slice(0, 5).map(function (el) { return clean(el.innerText || el.textContent); });
+snap.familyCountTexts = innermost(family).slice(0, 5).map(function (el) { return clean(el.innerText || el.textContent); });
+
+var rows = document.querySelectorAll('#familyList tr, table tbody tr, tr.family-member-row');
+snap.familyRows = rows.length;
+
+snap.statCards = Array.prototype.map.call(
+  document.querySelectorAll('.stats-card, .stat-card, .stat-item, [data-stat]'),
+  function (card) {
+    var label = card.querySelector('.stats-card-label, .stat-label, .stat-title');
+    return {
+      label: clean(label ? label.textContent : card.getAttribute('data-stat')),
+      text: clean(card.innerText || card.textContent)
+    };
+  }
+);
+
+snap.buttons = Array.prototype.map.call(
+  document.querySelectorAll('button, a, [role="button"], input[type="submit"], input[type="button"]'),
+  function (el) {
+    return {
+      text: clean(el.innerText || el.value || el.textContent),
+      tag: el.tagName.toLowerCase(),
+      href: el.href || null,
+      visible: isVisible(el),
+      enabled: !el.disabled && el.getAttribute('aria-disabled') !== 'true'
+    };
+  }
+).filter(function (b) { return b.text; });
+
+return snap;
+"""
+
+
 class DashboardStatsValidator:
     """Validates dashboard statistics and links"""
     
@@ -19,14 +90,45 @@ class DashboardStatsValidator:
         self.driver = driver
         self.timeout = timeout
         self.base_url = base_url
+        self._snapshot = None
     
-    def validate_profile_completeness(self):
+    def get_snapshot(self, refresh=False):
+        """
+        Collect the dashboard snapshot (cached until refresh=True)
+        
+        Waits only for document.readyState == 'complete'; the dashboard is
+        server-rendered, so everything the validators need is in the DOM then.
+        
+        Returns:
+            dict - see SNAPSHOT_JS
+        """
+        if self._snapshot is not None and not refresh:
+            return self._snapshot
+        
+        def collect(driver):
+            snap = driver.execute_script(SNAPSHOT_JS)
+            return snap if snap and snap.get('ready') == 'complete' and 'buttons' in snap else None
+        
+        snap = collect(self.driver)
+        if snap is None:
+            try:
+                snap = WebDriverWait(self.driver, self.timeout, poll_frequency=0.1).until(collect)
+            except TimeoutException:
+                snap = {}
+        self._snapshot = snap
+        return snap
+    
+    def validate_profile_completeness(self, snapshot=None):
         """
         Validate that profile completeness is displayed
         
+        Args:
+            snapshot: Dashboard snapshot (default: get_snapshot())
+        
         Returns:
             dict with completeness validation results
         """
+        snap = snapshot if snapshot is not None else self.get_snapshot()
         result = {
             'found': False,
             'percentage': None,
@@ -35,73 +137,53 @@ class DashboardStatsValidator:
             'message': ''
         }
         
-        try:
-            # Try to find completeness percentage element
-            try:
-                percent_elem = WebDriverWait(self.driver, self.timeout).until(
-                    EC.presence_of_element_located((By.ID, 'profilePercentText'))
-                )
-                text = percent_elem.text.strip()
-                
-                # Extract percentage
-                match = re.search(r'(\d+)\s*%', text)
-                if match:
-                    percentage = int(match.group(1))
-                    result['found'] = True
-                    result['percentage'] = percentage
-                    result['element'] = 'profilePercentText'
-                    result['element_text'] = text
-                    result['message'] = f'Profile {percentage}% complete'
-                    result['passed'] = True
-                    return result
-            except TimeoutException:
-                pass
-            
-            # Fallback: look for donut SVG
-            try:
-                donut = self.driver.find_element(By.ID, 'profileDonut')
+        # Completeness percentage element
+        text = snap.get('profilePercentText')
+        match = re.search(r'(\d+)\s*%', text or '')
+        if match:
+            percentage = int(match.group(1))
+            result['found'] = True
+            result['percentage'] = percentage
+            result['element'] = 'profilePercentText'
+            result['element_text'] = text
+            result['message'] = f'Profile {percentage}% complete'
+            result['passed'] = True
+            return result
+        
+        # Fallback: donut SVG
+        if snap.get('profileDonut'):
+            result['found'] = True
+            result['element'] = 'profileDonut'
+            result['message'] = 'Profile completeness SVG found'
+            result['passed'] = True
+            return result
+        
+        # Last fallback: any "...% complete" text
+        for text in snap.get('completeTexts', []):
+            match = re.search(r'(\d+)\s*%', text)
+            if match:
+                percentage = int(match.group(1))
                 result['found'] = True
-                result['element'] = 'profileDonut'
-                result['message'] = 'Profile completeness SVG found'
+                result['percentage'] = percentage
+                result['element_text'] = text
+                result['message'] = f'Found: {text}'
                 result['passed'] = True
                 return result
-            except NoSuchElementException:
-                pass
-            
-            # Last fallback: search for percentage text
-            try:
-                texts = self.driver.find_elements(
-                    By.XPATH,
-                    "//*[contains(text(), '%') and (contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'complete') or contains(., 'complete'))]"
-                )
-                if texts:
-                    text = texts[0].text.strip()
-                    match = re.search(r'(\d+)\s*%', text)
-                    if match:
-                        percentage = int(match.group(1))
-                        result['found'] = True
-                        result['percentage'] = percentage
-                        result['element_text'] = text
-                        result['message'] = f'Found: {text}'
-                        result['passed'] = True
-                        return result
-            except Exception:
-                pass
-            
-            result['message'] = 'Profile completeness not found'
-            return result
-            
-        except Exception as e:
-            result['message'] = f'Error: {str(e)}'
-            return result
+        
+        result['message'] = 'Profile completeness not found'
+        return result
     
-    def validate_family_member_count(self):
+    def validate_family_member_count(self, snapshot=None):
         """
         Validate that family member count is displayed
         
+        Args:
+            snapshot: Dashboard snapshot (default: get_snapshot())
+        
         Returns:
             dict with family member validation results
         """
+        snap = snapshot if snapshot is not None else self.get_snapshot()
         result = {
             'found': False,
             'count': None,
@@ -110,60 +192,45 @@ class DashboardStatsValidator:
             'message': ''
         }
         
-        try:
-            # Look for family members table or list
-            try:
-                table = WebDriverWait(self.driver, self.timeout).until(
-                    EC.presence_of_element_located((By.XPATH, "//table//tbody or //table//tr[@class='family-member'] or .family-member-row"))
-                )
-                
-                # Count rows
-                rows = self.driver.find_elements(By.XPATH, "//table//tbody//tr or //tr[@class='family-member-row']")
-                if rows:
-                    count = len(rows)
-                    result['found'] = True
-                    result['count'] = count
-                    result['element'] = 'family-members-table'
-                    result['message'] = f'{count} family member(s) found'
-                    result['passed'] = True
-                    return result
-            except TimeoutException:
-                pass
-            
-            # Look for count display
-            try:
-                count_texts = self.driver.find_elements(
-                    By.XPATH,
-                    "//*[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'family') and contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'member')]"
-                )
-                
-                for text_elem in count_texts:
-                    text = text_elem.text.strip()
-                    match = re.search(r'(\d+)', text)
-                    if match:
-                        count = int(match.group(1))
-                        result['found'] = True
-                        result['count'] = count
-                        result['element_text'] = text
-                        result['message'] = f'Found: {text}'
-                        result['passed'] = True
-                        return result
-            except Exception:
-                pass
-            
-            result['message'] = 'Family member count not found'
-            return result
-            
-        except Exception as e:
-            result['message'] = f'Error: {str(e)}'
+        # Family members table rows
+        count = snap.get('familyRows', 0)
+        if count:
+            result['found'] = True
+            result['count'] = count
+            result['element'] = 'family-members-table'
+            result['message'] = f'{count} family member(s) found'
+            result['passed'] = True
             return result
+        
+        # Count display ("3 family members")
+        for text in snap.get('familyCountTexts', []):
+            match = re.search(r'(\d+)', text)
+            if match:
+                result['found'] = True
+                result['count'] = int(match.group(1))
+                result['element_text'] = text
+                result['message'] = f'Found: {text}'
+                result['passed'] = True
+                return result
+        
+        result['message'] = 'Family member count not found'
+        return result
     
-    def validate_dashboard_links(self, role='user'):
+    def _find_button(self, snap, text):
+        """First button/link whose text contains text (case-insensitive)"""
+        text_lower = text.lower()
+        for button in snap.get('buttons', []):
+            if text_lower in button['text'].lower():
+                return button
+        return None
+    
+    def validate_dashboard_links(self, role='user', snapshot=None):
         """
         Validate dashboard links based on role
         
         Args:
             role: 'user' or 'admin'
+            snapshot: Dashboard snapshot (default: get_snapshot())
         
         Returns:
             dict with dashboard links validation
@@ -181,6 +248,7 @@ class DashboardStatsValidator:
                 'missing_buttons': expected_buttons.get(role, [])
             }
         
+        snap = snapshot if snapshot is not None else self.get_snapshot()
         result = {
             'role': role,
             'expected_buttons': expected_buttons[role],
@@ -190,85 +258,73 @@ class DashboardStatsValidator:
             'buttons_detail': []
         }
         
-        try:
-            # Look for buttons/links
-            for expected_btn in expected_buttons[role]:
-                try:
-                    # Try to find button by text
-                    btn = self.driver.find_element(
-                        By.XPATH,
-                        f"//button[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{expected_btn.lower()}')] or //a[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{expected_btn.lower()}')]"
-                    )
-                    result['found_buttons'].append(expected_btn)
-                    result['buttons_detail'].append({
-                        'name': expected_btn,
-                        'found': True,
-                        'displayed': btn.is_displayed(),
-                        'enabled': btn.is_enabled()
-                    })
-                except NoSuchElementException:
-                    result['missing_buttons'].append(expected_btn)
-                    result['buttons_detail'].append({
-                        'name': expected_btn,
-                        'found': False
-                    })
-            
-            result['passed'] = len(result['missing_buttons']) == 0
-            result['message'] = f"Found {len(result['found_buttons'])}/{len(result['expected_buttons'])} expected buttons"
-            
-            return result
-            
-        except Exception as e:
-            result['message'] = f'Error: {str(e)}'
-            return result
+        for expected_btn in expected_buttons[role]:
+            btn = self._find_button(snap, expected_btn)
+            if btn:
+                result['found_buttons'].append(expected_btn)
+                result['buttons_detail'].append({
+                    'name': expected_btn,
+                    'found': True,
+                    'displayed': btn['visible'],
+                    'enabled': btn['enabled']
+                })
+            else:
+                result['missing_buttons'].append(expected_btn)
+                result['buttons_detail'].append({
+                    'name': expected_btn,
+                    'found': False
+                })
+        
+        result['passed'] = len(result['missing_buttons']) == 0
+        result['message'] = f"Found {len(result['found_buttons'])}/{len(result['expected_buttons'])} expected buttons"
+        
+        return result
     
-    def validate_stats_accuracy(self):
+    def validate_stats_accuracy(self, snapshot=None):
         """
         Validate that displayed stats match actual data
         This would need to compare with backend data
         
+        Args:
+            snapshot: Dashboard snapshot (default: get_snapshot())
+        
         Returns:
             dict with stats accuracy validation
         """
+        snap = snapshot if snapshot is not None else self.get_snapshot()
         result = {
-            'profile_completeness': None,
-            'family_member_count': None,
+            'profile_completeness': self.validate_profile_completeness(snap),
+            'family_member_count': self.validate_family_member_count(snap),
             'passed': False,
             'message': ''
         }
         
-        try:
-            result['profile_completeness'] = self.validate_profile_completeness()
-            result['family_member_count'] = self.validate_family_member_count()
-            
-            # Both should be found for accuracy
-            if result['profile_completeness']['found'] and result['family_member_count']['found']:
-                result['passed'] = True
-                result['message'] = 'All stats displayed accurately'
-            else:
-                missing = []
-                if not result['profile_completeness']['found']:
-                    missing.append('profile completeness')
-                if not result['family_member_count']['found']:
-                    missing.append('family member count')
-                result['message'] = f'Missing: {", ".join(missing)}'
-            
-            return result
-            
-        except Exception as e:
-            result['message'] = f'Error: {str(e)}'
-            return result
+        # Both should be found for accuracy
+        if result['profile_completeness']['found'] and result['family_member_count']['found']:
+            result['passed'] = True
+            result['message'] = 'All stats displayed accurately'
+        else:
+            missing = []
+            if not result['profile_completeness']['found']:
+                missing.append('profile completeness')
+            if not result['family_member_count']['found']:
+                missing.append('family member count')
+            result['message'] = f'Missing: {", ".join(missing)}'
+        
+        return result
     
-    def validate_working_links(self, link_configs):
+    def validate_working_links(self, link_configs, snapshot=None):
         """
         Validate that dashboard links actually work (are clickable)
         
         Args:
             link_configs: list of {'text': 'Link Text', 'expected_url_pattern': '/some/path'}
+            snapshot: Dashboard snapshot (default: get_snapshot())
         
         Returns:
             dict with link working validation
         """
+        snap = snapshot if snapshot is not None else self.get_snapshot()
         result = {
             'total_links': len(link_configs),
             'working_links': [],
@@ -276,62 +332,47 @@ class DashboardStatsValidator:
             'passed': False
         }
         
-        try:
-            for link_config in link_configs:
-                link_text = link_config.get('text')
-                expected_pattern = link_config.get('expected_url_pattern')
-                
-                try:
-                    # Find link
-                    link = self.driver.find_element(
-                        By.XPATH,
-                        f"//a[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{link_text.lower()}')] or //button[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{link_text.lower()}')]"
-                    )
-                    
-                    # Check if clickable
-                    is_displayed = link.is_displayed()
-                    is_enabled = link.is_enabled()
-                    
-                    if is_displayed and is_enabled:
-                        result['working_links'].append({
-                            'text': link_text,
-                            'working': True,
-                            'href': link.get_attribute('href')
-                        })
-                    else:
-                        result['broken_links'].append({
-                            'text': link_text,
-                            'working': False,
-                            'reason': 'Not displayed or enabled'
-                        })
-                
-                except NoSuchElementException:
-                    result['broken_links'].append({
-                        'text': link_text,
-                        'working': False,
-                        'reason': 'Element not found'
-                    })
-            
-            result['passed'] = len(result['broken_links']) == 0
-            result['message'] = f"Working: {len(result['working_links'])}/{result['total_links']}"
-            
-            return result
+        for link_config in link_configs:
+            link_text = link_config.get('text')
+            link = self._find_button(snap, link_text)
             
-        except Exception as e:
-            result['message'] = f'Error: {str(e)}'
-            return result
+            if link is None:
+                result['broken_links'].append({
+                    'text': link_text,
+                    'working': False,
+                    'reason': 'Element not found'
+                })
+            elif link['visible'] and link['enabled']:
+                result['working_links'].append({
+                    'text': link_text,
+                    'working': True,
+                    'href': link['href']
+                })
+            else:
+                result['broken_links'].append({
+                    'text': link_text,
+                    'working': False,
+                    'reason': 'Not displayed or enabled'
+                })
+        
+        result['passed'] = len(result['broken_links']) == 0
+        result['message'] = f"Working: {len(result['working_links'])}/{result['total_links']}"
+        
+        return result
     
     def get_all_dashboard_stats(self):
         """
-        Get all dashboard statistics at once
+        Get all dashboard statistics at once (one fresh snapshot)
         
         Returns:
             dict with all stats and validation results
         """
+        snap = self.get_snapshot(refresh=True)
         return {
-            'profile_completeness': self.validate_profile_completeness(),
-            'family_member_count': self.validate_family_member_count(),
-            'stats_accuracy': self.validate_stats_accuracy(),
+            'profile_completeness': self.validate_profile_completeness(snap),
+            'family_member_count': self.validate_family_member_count(snap),
+            'stats_accuracy': self.validate_stats_accuracy(snap),
+            'stat_cards': snap.get('statCards', []),
             'timestamp': time.time()
         }
     
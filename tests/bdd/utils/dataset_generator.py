@@ -0,0 +1,326 @@
+"""
+Dataset Generator Utility
+Bulk-inserts a synthetic community (users, family members, events, payments, sessions) at scale
+
+Rows are realistic enough for the queries that matter (role mix, birth years
+spread over kids/adults/seniors, sessions spread over 90 days, payments
+mostly completed and spread over two years) and deterministic for a given
+seed. Every table is filled with executemany in batches inside a single
+transaction, so 100k users take seconds rather than minutes and a failure
+leaves the database untouched.
+
+Works on SQLite (sqlite3) and MySQL (pymysql, optional). Generated rows carry
+the `prefix` marker (usernames, event slugs, session ids, transaction ids) so
+purge() can remove them again from a shared database.
+
+Configuration (via environment variables, MySQL only, as config/database.php):
+  DB_HOST, DB_NAME, DB_USER, DB_PASS - Connection (default: localhost/u103964107_uma/root/root)
+"""
+
+import os
+import random
+import sqlite3
+import time
+from datetime import datetime, timedelta
+
+try:
+    import pymysql
+    PYMYSQL_AVAILABLE = True
+except ImportError:
+    pymysql = None
+    PYMYSQL_AVAILABLE = False
+
+
+FIRST_NAMES = (
+    'Aarav', 'Aditi', 'Amit', 'Anjali', 'Arjun', 'Bhavna', 'Chirag', 'Deepa', 'Dhruv', 'Hetal',
+    'Harsh', 'Isha', 'Jay', 'Kavya', 'Kiran', 'Manish', 'Meera', 'Nikhil', 'Nisha', 'Pooja',
+    'Pranav', 'Priya', 'Rahul', 'Rina', 'Rohan', 'Sanjay', 'Shreya', 'Tejas', 'Urvi', 'Vikram',
+)
+LAST_NAMES = (
+    'Patel', 'Shah', 'Desai', 'Mehta', 'Joshi', 'Trivedi', 'Bhatt', 'Pandya', 'Parikh', 'Modi',
+    'Amin', 'Vyas', 'Dave', 'Thakkar', 'Chauhan',
+)
+VILLAGES = ('Anand', 'Nadiad', 'Vadodara', 'Surat', 'Mehsana', 'Bharuch', 'Navsari', 'Petlad', 'Borsad', 'Karamsad')
+CITIES = (('Edison', 'NJ'), ('Houston', 'TX'), ('Chicago', 'IL'), ('Atlanta', 'GA'), ('Dallas', 'TX'),
+          ('Fremont', 'CA'), ('Iselin', 'NJ'), ('Charlotte', 'NC'))
+OCCUPATIONS = ('Engineer', 'Doctor', 'Pharmacist', 'Business Owner', 'Teacher', 'Accountant', 'Student', 'Retired', None)
+
+# Share of users per role name (the rest are 'user')
+ROLE_MIX = {'sponsor': 0.05, 'committee_member': 0.02, 'moderator': 0.005, 'admin': 0.001}
+
+# Relationship of each extra family member, with weights
+RELATIONSHIPS = (('spouse', 30), ('child', 40), ('father', 8), ('mother', 8), ('sibling', 6),
+                 ('father-in-law', 3), ('mother-in-law', 3), ('other', 2))
+
+PAYMENT_STATUSES = (('completed', 80), ('pending', 15), ('failed', 5))
+
+# Rows per user for the other tables
+DEFAULT_RATIOS = {
+    'family_members': 2.5,   # average extra members per household
+    'events': 0.01,          # one event per 100 users (at least 10)
+    'payments': 1.5,
+    'sessions': 0.6,
+}
+
+BATCH_SIZE = 5000
+
+
+def connect_sqlite(db_path):
+    """Open a SQLite database for bulk loading"""
+    conn = sqlite3.connect(str(db_path), timeout=30)
+    conn.execute("PRAGMA foreign_keys = ON")
+    return conn
+
+
+def connect_mysql(host=None, database=None, user=None, password=None):
+    """Open the app's MySQL database (same environment variables as config/database.php)"""
+    if not PYMYSQL_AVAILABLE:
+        raise ImportError("MySQL support requires 'pymysql' (pip install pymysql)")
+    return pymysql.connect(
+        host=host or os.environ.get('DB_HOST', 'localhost'),
+        database=database or os.environ.get('DB_NAME', 'u103964107_uma'),
+        user=user or os.environ.get('DB_USER', 'root'),
+        password=password if password is not None else os.environ.get('DB_PASS', 'root'),
+        autocommit=False,
+    )
+
+
+def _weighted(rng, choices):
+    return rng.choices([c for c, _ in choices], weights=[w for _, w in choices])[0]
+
+
+def _timestamp(moment):
+    return moment.strftime('%Y-%m-%d %H:%M:%S')
+
+
+class DatasetGenerator:
+    """Generates and bulk-inserts a synthetic dataset into an open connection"""
+
+    def __init__(self, conn, dialect='sqlite', seed=42, prefix='scale', batch_size=BATCH_SIZE, ratios=None, now=None):
+        """
+        Initialize generator
+
+        Args:
+            conn: DB-API connection (connect_sqlite() or connect_mysql())
+            dialect: 'sqlite' or 'mysql' (placeholder style)
+            seed: RNG seed; same seed and scale give the same rows
+            prefix: Marker on generated rows, used by purge()
+            batch_size: Rows per executemany call
+            ratios: Overrides of DEFAULT_RATIOS
+            now: Reference time for dates (default: now)
+        """
+        if dialect not in ('sqlite', 'mysql'):
+            raise ValueError(f"Unknown dialect: {dialect}")
+        self.conn = conn
+        self.dialect = dialect
+        self.rng = random.Random(seed)
+        self.prefix = prefix
+        self.batch_size = batch_size
+        self.ratios = dict(DEFAULT_RATIOS, **(ratios or {}))
+        self.now = now or datetime.now().replace(microsecond=0)
+        self.password_hash = '!synthetic'  # not a bcrypt hash, so generated users cannot log in
+
+    def _sql(self, statement):
+        return statement.replace('?', '%s') if self.dialect == 'mysql' else statement
+
+    def _scalar(self, cursor, statement, params=()):
+        cursor.execute(self._sql(statement), params)
+        row = cursor.fetchone()
+        return row[0] if row else None
+
+    def _insert(self, cursor, table, columns, rows):
+        """executemany in batch_size chunks; returns the row count"""
+        statement = self._sql(f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})")
+        count = 0
+        for start in range(0, len(rows), self.batch_size):
+            batch = rows[start:start + self.batch_size]
+            cursor.executemany(statement, batch)
+            count += len(batch)
+        return count
+
+    def _moment(self, days_back, days_forward=0):
+        """Random datetime between days_back ago and days_forward ahead"""
+        offset = self.rng.uniform(-days_back * 86400, days_forward * 86400)
+        return self.now + timedelta(seconds=int(offset))
+
+    def _role_ids(self, cursor):
+        cursor.execute("SELECT name, id FROM roles")
+        return dict(cursor.fetchall())
+
+    def _user_rows(self, first_id, count, role_ids):
+        default_role = role_ids.get('user')
+        thresholds = []
+        total = 0.0
+        for name, share in ROLE_MIX.items():
+            if name in role_ids:
+                total += share
+                thresholds.append((total, role_ids[name]))
+        rows = []
+        for user_id in range(first_id, first_id + count):
+            first, last = self.rng.choice(FIRST_NAMES), self.rng.choice(LAST_NAMES)
+            city, state = self.rng.choice(CITIES)
+            draw = self.rng.random()
+            role_id = next((rid for limit, rid in thresholds if draw < limit), default_role)
+            created = self._moment(3 * 365)
+            last_login = self._moment(120) if self.rng.random() < 0.7 else None
+            username = f"{self.prefix}{user_id}"
+            rows.append((
+                user_id, username, f"{username}@example.com", self.password_hash, f"{first} {last}", first, last,
+                f"+1{self.rng.randint(2000000000, 9899999999)}", role_id, _timestamp(created),
+                _timestamp(last_login) if last_login else None, city, state, _timestamp(created),
+            ))
+        return rows
+
+    def _family_rows(self, user_rows):
+        rows = []
+        year = self.now.year
+        for user in user_rows:
+            user_id, first, last = user[0], user[5], user[6]
+            rows.append((user_id, first, last, year - self.rng.randint(25, 75), self.rng.choice(('male', 'female')),
+                         user[2], 'self', self.rng.choice(OCCUPATIONS), self.rng.choice(VILLAGES)))
+            extra = max(0, int(round(self.rng.gauss(self.ratios['family_members'], 1.2))))
+            for _ in range(extra):
+                relationship = _weighted(self.rng, RELATIONSHIPS)
+                if relationship == 'child':
+                    birth_year = year - self.rng.randint(0, 25)
+                elif relationship in ('father', 'mother', 'father-in-law', 'mother-in-law'):
+                    birth_year = year - self.rng.randint(55, 90)
+                else:
+                    birth_year = year - self.rng.randint(20, 70)
+                rows.append((user_id, self.rng.choice(FIRST_NAMES), last, birth_year,
+                             self.rng.choice(('male', 'female')), None, relationship,
+                             self.rng.choice(OCCUPATIONS), self.rng.choice(VILLAGES)))
+        return rows
+
+    def _event_rows(self, first_id, count, user_ids):
+        rows = []
+        for event_id in range(first_id, first_id + count):
+            start = self._moment(2 * 365, 180)
+            title = self.rng.choice(('Navratri Garba', 'Diwali Celebration', 'Annual Picnic', 'Youth Seminar',
+                                     'Health Camp', 'Bhajan Sandhya', 'Community Dinner', 'Sports Day'))
+            rows.append((
+                f"{title} {start.year}", f"{self.prefix}-event-{event_id}", f"{title} for the community",
+                _timestamp(start), _timestamp(start + timedelta(hours=self.rng.choice((2, 3, 4, 6)))),
+                f"{self.rng.choice(CITIES)[0]} Community Hall", self.rng.choice((50, 100, 250, 500, None)),
+                self.rng.choice((0, 0, 10, 15, 25)), int(self.rng.random() < 0.3),
+                self.rng.choice(user_ids), _timestamp(start - timedelta(days=self.rng.randint(14, 90))),
+            ))
+        return rows
+
+    def _payment_rows(self, count, user_ids, first_event_id, event_count):
+        rows = []
+        for n in range(count):
+            created = self._moment(2 * 365)
+            is_event = event_count and self.rng.random() < 0.3
+            amount = round(min(5000.0, self.rng.lognormvariate(3.9, 0.9)), 2)
+            rows.append((
+                self.rng.choice(user_ids), amount, 'USD', self.rng.choice(('card', 'paypal', 'zelle', 'cash')),
+                _weighted(self.rng, PAYMENT_STATUSES), f"{self.prefix}-txn-{first_event_id}-{n}",
+                'event' if is_event else 'donation',
+                first_event_id + self.rng.randrange(event_count) if is_event else None,
+                self.rng.choice(('stripe', 'paypal', 'manual')), _timestamp(created),
+            ))
+        return rows
+
+    def _session_rows(self, count, user_ids):
+        rows = []
+        for n in range(count):
+            last_activity = self._moment(90)
+            rows.append((
+                f"{self.prefix}-{self.rng.getrandbits(64):016x}-{n}", self.rng.choice(user_ids),
+                f"10.{self.rng.randint(0, 255)}.{self.rng.randint(0, 255)}.{self.rng.randint(1, 254)}",
+                'Mozilla/5.0 (synthetic)', '', _timestamp(last_activity),
+            ))
+        return rows
+
+    def generate(self, users):
+        """
+        Add `users` households and the proportional events, payments and sessions
+
+        Can be called repeatedly to grow a database step by step; new ids
+        continue after the current maximum.
+
+        Args:
+            users: Number of users to add
+
+        Returns:
+            dict table -> rows inserted, plus 'seconds'
+        """
+        started = time.perf_counter()
+        cursor = self.conn.cursor()
+        try:
+            role_ids = self._role_ids(cursor)
+            first_user = (self._scalar(cursor, "SELECT MAX(id) FROM users") or 0) + 1
+            first_event = (self._scalar(cursor, "SELECT MAX(id) FROM events") or 0) + 1
+
+            user_rows = self._user_rows(first_user, users, role_ids)
+            user_ids = [row[0] for row in user_rows] or [None]
+            event_count = max(10, int(users * self.ratios['events'])) if users else 0
+
+            counts = {}
+            counts['users'] = self._insert(cursor, 'users', (
+                'id', 'username', 'email', 'password', 'name', 'first_name', 'last_name', 'phone_e164', 'role_id',
+                'created_at', 'last_login_at', 'city', 'state', 'updated_at',
+            ), user_rows)
+            counts['family_members'] = self._insert(cursor, 'family_members', (
+                'user_id', 'first_name', 'last_name', 'birth_year', 'gender', 'email', 'relationship',
+                'occupation', 'village',
+            ), self._family_rows(user_rows))
+            counts['events'] = self._insert(cursor, 'events', (
+                'title', 'slug', 'description', 'start_at', 'end_at', 'location', 'capacity', 'price',
+                'sponsorable', 'created_by_user_id', 'created_at',
+            ), self._event_rows(first_event, event_count, user_ids))
+            counts['payments'] = self._insert(cursor, 'payments', (
+                'payer_user_id', 'amount', 'currency', 'method', 'status', 'transaction_id', 'reference_type',
+                'reference_id', 'gateway', 'created_at',
+            ), self._payment_rows(int(users * self.ratios['payments']), user_ids, first_event, event_count))
+            counts['sessions'] = self._insert(cursor, 'sessions', (
+                'id', 'user_id', 'ip_address', 'user_agent', 'payload', 'last_activity',
+            ), self._session_rows(int(users * self.ratios['sessions']), user_ids))
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        finally:
+            cursor.close()
+        counts['seconds'] = time.perf_counter() - started
+        return counts
+
+    def purge(self):
+        """
+        Delete every row generated with this prefix (one transaction)
+
+        Returns:
+            dict table -> rows deleted
+        """
+        pattern = f"{self.prefix}%"
+        statements = (
+            ('sessions', "DELETE FROM sessions WHERE id LIKE ?", f"{self.prefix}-%"),
+            ('payments', "DELETE FROM payments WHERE transaction_id LIKE ?", f"{self.prefix}-txn-%"),
+            ('family_members', "DELETE FROM family_members WHERE user_id IN "
+                               "(SELECT id FROM users WHERE username LIKE ? AND password = '!synthetic')", pattern),
+            ('events', "DELETE FROM events WHERE slug LIKE ?", f"{self.prefix}-event-%"),
+            ('users', "DELETE FROM users WHERE username LIKE ? AND password = '!synthetic'", pattern),
+        )
+        cursor = self.conn.cursor()
+        counts = {}
+        try:
+            for table, statement, param in statements:
+                cursor.execute(self._sql(statement), (param,))
+                counts[table] = cursor.rowcount
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        finally:
+            cursor.close()
+        return counts
+
+    def table_counts(self):
+        """Current row count of every table the generator fills"""
+        cursor = self.conn.cursor()
+        try:
+            return {table: self._scalar(cursor, f"SELECT COUNT(*) FROM {table}")
+                    for table in ('users', 'family_members', 'events', 'payments', 'sessions')}
+        finally:
+            cursor.close()
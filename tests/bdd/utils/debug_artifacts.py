@@ -0,0 +1,280 @@
+"""
+Debug Artifacts Utility
+Failure-only screenshots and page HTML, captured cheaply and written in the background
+
+The test thread only fetches the raw data (base64 screenshot and
+page_source, two WebDriver round trips); decoding, compression and disk
+writes happen on a single background writer thread. From begin_test() on,
+a test keeps a ring buffer of its last K step snapshots (step()); they are
+persisted only when the test fails (save_debug() or end_test(...,
+passed=False)) and dropped otherwise. The current test is tracked per
+thread, so concurrent DAG branches keep their own buffers. HTML is compressed with zstd when the zstandard module is
+installed, gzip otherwise.
+
+Artifacts go to the content-addressed ArtifactStore (results/artifacts,
+see utils/artifact_store.py) instead of the working directory or /tmp:
+identical screenshots and DOMs are stored once, and the store's size budget
+is enforced when the writer starts. `artifacts.py export` gives them
+readable names again.
+
+Configuration (via environment variables):
+  BDD_ARTIFACT_DIR        - Store root (default: tests/bdd/results/artifacts)
+  BDD_ARTIFACT_STEPS      - Step snapshots kept per test (default: 5)
+  BDD_ARTIFACT_BUDGET_MB  - Store size budget (default: 200)
+"""
+
+import atexit
+import base64
+import gzip
+import os
+import queue
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+from artifact_store import ArtifactStore
+
+
+DEFAULT_STEPS = 5
+
+
+def _safe(name):
+    return re.sub(r'[^A-Za-z0-9_.-]+', '_', str(name)).strip('_') or 'unnamed'
+
+
+def compress_html(html):
+    """
+    Compress page HTML
+
+    Returns:
+        (bytes, file suffix) - zstd if available, else gzip
+    """
+    data = html.encode('utf-8')
+    if ZSTD_AVAILABLE:
+        return zstandard.ZstdCompressor(level=6).compress(data), '.html.zst'
+    return gzip.compress(data, compresslevel=6), '.html.gz'
+
+
+class Snapshot:
+    """Raw capture of one step: base64 PNG, page HTML, URL"""
+
+    __slots__ = ('step', 'timestamp', 'url', 'screenshot_b64', 'html', 'error')
+
+    def __init__(self, step, url=None, screenshot_b64=None, html=None, error=None):
+        self.step = step
+        self.timestamp = time.time()
+        self.url = url
+        self.screenshot_b64 = screenshot_b64
+        self.html = html
+        self.error = error
+
+
+class DebugArtifacts:
+    """Per-test snapshot ring buffers with a background writer"""
+
+    def __init__(self, root=None, steps=None, run_id=None):
+        """
+        Initialize service (the store and writer thread start on first use)
+
+        Args:
+            root: Store root (default: BDD_ARTIFACT_DIR)
+            steps: Snapshots kept per test
+            run_id: Run name in the manifest (default: timestamp + pid)
+        """
+        self.root = root
+        self.steps = steps or int(os.environ.get('BDD_ARTIFACT_STEPS', DEFAULT_STEPS))
+        self.run_id = run_id or f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+        self.store = None
+        self._current = threading.local()
+        self._rings = {}
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._writer = None
+        self._sequence = 0
+        self.stored = 0
+        self.deduplicated = 0
+
+    # ------------------------------------------------------------------ capture
+
+    def snapshot(self, driver, step, screenshot=True, html=True):
+        """
+        Capture the raw page state on the calling (test) thread
+
+        Returns:
+            Snapshot (error set instead of raising if the browser is gone)
+        """
+        shot = Snapshot(step)
+        try:
+            shot.url = driver.current_url
+            if screenshot:
+                shot.screenshot_b64 = driver.get_screenshot_as_base64()
+            if html:
+                shot.html = driver.page_source
+        except Exception as e:
+            shot.error = f"{type(e).__name__}: {e}"
+        return shot
+
+    def _ring(self, test):
+        ring = self._rings.get(test)
+        if ring is None:
+            ring = self._rings[test] = deque(maxlen=self.steps)
+        return ring
+
+    @property
+    def current_test(self):
+        """Test the calling thread is running ('session' before the first begin_test)"""
+        return getattr(self._current, 'test', 'session')
+
+    @current_test.setter
+    def current_test(self, test):
+        self._current.test = test
+
+    def begin_test(self, test):
+        """Start buffering steps for a test on this thread (drops what an earlier run of it left)"""
+        with self._lock:
+            self.current_test = test
+            self._rings.pop(test, None)
+
+    def step(self, driver, name, screenshot=True, html=True, test=None):
+        """
+        Remember the page state after a step; kept only if the test fails
+
+        Args:
+            driver: WebDriver
+            name: Step name
+            screenshot, html: What to capture
+            test: Test id (default: the current test)
+        """
+        shot = self.snapshot(driver, name, screenshot, html)
+        with self._lock:
+            self._ring(test or self.current_test).append(shot)
+
+    def end_test(self, test, passed):
+        """
+        Finish a test: persist its buffered steps if it failed, drop them otherwise
+
+        Steps buffered under the thread's current test count too, for a runner
+        that began the test under another name (e.g. its method name). The
+        test stays current, so a save_debug() right after still files under it.
+        """
+        with self._lock:
+            began = self.current_test
+            shots = list(self._rings.pop(began, ())) if began != test else []
+            shots += self._rings.pop(test, ())
+            self.current_test = test
+        if shots and not passed:
+            self._submit(test, shots)
+
+    def save_debug(self, driver, name_prefix, test=None):
+        """
+        Capture the failure state and persist it with the test's buffered steps
+
+        Drop-in for the suites' old save_debug(driver, name_prefix).
+
+        Returns:
+            str - '<run>/<test>/<step>' label of the failure snapshot in the store
+        """
+        test = test or self.current_test
+        shot = self.snapshot(driver, name_prefix)
+        with self._lock:
+            shots = list(self._rings.pop(test, ())) + [shot]
+        labels = self._submit(test, shots)
+        print(f"   📸 Debug artifacts queued: {labels[-1]}")
+        return labels[-1]
+
+    # ------------------------------------------------------------------ writing
+
+    def _submit(self, test, shots):
+        labels = []
+        for shot in shots:
+            with self._lock:
+                self._sequence += 1
+                step = f"{self._sequence:03d}-{_safe(shot.step)}"
+            labels.append(f"{self.run_id}/{_safe(test)}/{step}")
+            self._queue.put((test, step, shot))
+        self._ensure_writer()
+        return labels
+
+    def _ensure_writer(self):
+        with self._lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name='debug-artifacts', daemon=True)
+                self._writer.start()
+
+    def _write_loop(self):
+        try:
+            self.store = ArtifactStore(self.root)
+            self.store.gc()
+        except (IOError, OSError, sqlite3.Error) as e:
+            print(f"   ⚠️  Artifact store unavailable: {e}")
+        while True:
+            test, step, shot = self._queue.get()
+            try:
+                if self.store:
+                    self._write(test, step, shot)
+            except (IOError, OSError, sqlite3.Error) as e:
+                print(f"   ⚠️  Could not store debug artifacts {test}/{step}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, test, step, shot):
+        url = shot.url if not shot.error else f"{shot.url} ({shot.error})"
+        common = dict(run=self.run_id, test=test, step=step, timestamp=shot.timestamp, url=url)
+        outputs = []
+        if shot.screenshot_b64:
+            outputs.append(self.store.put(base64.b64decode(shot.screenshot_b64), '.png', kind='screenshot', **common))
+        if shot.html is not None:
+            data, suffix = compress_html(shot.html)
+            outputs.append(self.store.put(data, suffix, kind='html', key=shot.html.encode('utf-8'), **common))
+        for _, duplicate in outputs:
+            self.stored += 1
+            self.deduplicated += duplicate
+
+    def flush(self, timeout=30):
+        """
+        Wait until queued artifacts are on disk
+
+        Returns:
+            bool - False if writes were still pending after timeout
+        """
+        deadline = time.time() + timeout
+        while self._queue.unfinished_tasks:
+            if time.time() > deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+
+_service = None
+
+
+def get_artifacts():
+    """Get the process-wide artifact service"""
+    global _service
+    if _service is None:
+        _service = DebugArtifacts()
+        atexit.register(_service.flush)
+    return _service
+
+
+def begin_test(test):
+    """Start buffering step snapshots for a test on the calling thread"""
+    get_artifacts().begin_test(test)
+
+
+def save_debug(driver, name_prefix):
+    """Persist the failure screenshot/HTML (and buffered steps) of the current test in the background"""
+    return get_artifacts().save_debug(driver, name_prefix)
+
+
+def record_step(driver, name, **kwargs):
+    """Buffer a step snapshot of the current test (persisted only if it fails)"""
+    get_artifacts().step(driver, name, **kwargs)
@@ -0,0 +1,196 @@
+"""
+Driver Binary Utility
+Offline, cached ChromeDriver resolution (replaces ChromeDriverManager().install() per run)
+
+resolve_chromedriver() returns a chromedriver path without touching the
+network once one is known:
+  1. CHROMEDRIVER_PATH, if set
+  2. the memo file shared by all processes, valid while the Chrome binary is
+     unchanged (checked with one stat, no version probe)
+  3. on a memo miss: probe the local Chrome version once, then look for a
+     chromedriver of the same major version on PATH, in DRIVER_CACHE_DIR and
+     in the webdriver_manager / Selenium Manager caches
+  4. only if none fits and WEBDRIVER_OFFLINE is not set: one
+     webdriver_manager download, which is cached and memoized like the rest;
+     if it fails (no network) the error is reported with a hint and None is
+     returned, leaving the choice to Selenium
+The result is memoized in-process as well, so later drivers cost nothing.
+
+Configuration (via environment variables):
+  CHROMEDRIVER_PATH   - Use this chromedriver, no lookup at all
+  CHROME_BIN          - Chrome/Chromium binary (default: first found on PATH)
+  DRIVER_CACHE_DIR    - Memo file and driver cache (default: ~/.cache/umashaktidham-bdd)
+  WEBDRIVER_OFFLINE   - Set to true to never download (air-gapped CI)
+"""
+
+import glob
+import json
+import os
+import re
+import shutil
+import subprocess
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+CHROME_CANDIDATES = ('google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome')
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'umashaktidham-bdd'
+
+# Where other tools leave drivers (webdriver_manager, Selenium Manager)
+THIRD_PARTY_CACHES = (
+    '~/.wdm/drivers/chromedriver/*/*/*/chromedriver',
+    '~/.wdm/drivers/chromedriver/*/*/chromedriver',
+    '~/.cache/selenium/chromedriver/*/*/chromedriver',
+)
+
+_resolved = None
+
+
+def _offline():
+    return os.environ.get('WEBDRIVER_OFFLINE', 'false').lower() in ('1', 'true', 'yes')
+
+
+def cache_dir():
+    """Get the driver cache directory"""
+    return Path(os.environ.get('DRIVER_CACHE_DIR', DEFAULT_CACHE_DIR))
+
+
+def find_chrome():
+    """Get the Chrome/Chromium binary path, or None"""
+    configured = os.environ.get('CHROME_BIN')
+    if configured and os.path.exists(configured):
+        return os.path.realpath(configured)
+    for name in CHROME_CANDIDATES:
+        path = shutil.which(name)
+        if path:
+            return os.path.realpath(path)
+    return None
+
+
+def binary_version(path):
+    """
+    Get the version a Chrome or chromedriver binary reports
+
+    Returns:
+        str like '120.0.6099.109', or None
+    """
+    try:
+        result = subprocess.run([path, '--version'], capture_output=True, text=True, timeout=15)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = re.search(r'(\d+)\.(\d+)\.(\d+)\.(\d+)', result.stdout)
+    return match.group(0) if match else None
+
+
+def _major(version):
+    return version.split('.')[0] if version else None
+
+
+def _fingerprint(chrome):
+    """Cheap identity of the installed Chrome: path, size and mtime"""
+    if not chrome:
+        return 'no-chrome'
+    stat = os.stat(chrome)
+    return f"{chrome}:{stat.st_size}:{int(stat.st_mtime)}"
+
+
+def _memo_file():
+    return cache_dir() / 'chromedriver.json'
+
+
+def _read_memo(fingerprint):
+    try:
+        memo = json.loads(_memo_file().read_text())
+    except (IOError, OSError, ValueError):
+        return None
+    path = memo.get(fingerprint)
+    return path if path and os.access(path, os.X_OK) else None
+
+
+def _write_memo(fingerprint, path):
+    memo_file = _memo_file()
+    memo_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(memo_file.with_suffix('.lock'), 'w') as lock:
+        if fcntl:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            memo = json.loads(memo_file.read_text())
+        except (IOError, OSError, ValueError):
+            memo = {}
+        memo[fingerprint] = path
+        tmp = memo_file.with_name(f"{memo_file.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(memo, indent=2))
+        os.replace(tmp, memo_file)
+
+
+def _candidates():
+    """Local chromedriver binaries: PATH first, then the caches"""
+    seen = []
+    on_path = shutil.which('chromedriver')
+    if on_path:
+        seen.append(on_path)
+    patterns = [str(cache_dir() / '*' / 'chromedriver')] + [os.path.expanduser(p) for p in THIRD_PARTY_CACHES]
+    for pattern in patterns:
+        # Newest version directories first
+        seen.extend(sorted(glob.glob(pattern), reverse=True))
+    return [path for path in seen if os.access(path, os.X_OK)]
+
+
+def _download(chrome_version):
+    """One webdriver_manager download, copied into our cache (None if it fails, e.g. no network)"""
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+    except ImportError:
+        return None
+    try:
+        downloaded = ChromeDriverManager().install()
+    except Exception as e:
+        # Network errors surface as requests/urllib/webdriver_manager exceptions alike
+        print(f"   ⚠️  chromedriver download failed ({type(e).__name__}: {e}); "
+              "set CHROMEDRIVER_PATH to a local chromedriver, or WEBDRIVER_OFFLINE=true to skip downloads")
+        return None
+    target = cache_dir() / (binary_version(downloaded) or chrome_version or 'unknown') / 'chromedriver'
+    target.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copy2(downloaded, target)
+    return str(target)
+
+
+def resolve_chromedriver():
+    """
+    Get a chromedriver path matching the local Chrome
+
+    Returns:
+        str path, or None to let Selenium choose (no local driver and offline)
+    """
+    global _resolved
+    configured = os.environ.get('CHROMEDRIVER_PATH')
+    if configured:
+        return configured
+    if _resolved:
+        return _resolved
+
+    chrome = find_chrome()
+    fingerprint = _fingerprint(chrome)
+    path = _read_memo(fingerprint)
+    if path:
+        _resolved = path
+        return path
+
+    chrome_version = binary_version(chrome) if chrome else None
+    wanted = _major(chrome_version)
+    for candidate in _candidates():
+        if wanted is None or _major(binary_version(candidate)) == wanted:
+            path = candidate
+            break
+
+    if path is None and not _offline():
+        path = _download(chrome_version)
+
+    if path:
+        _write_memo(fingerprint, path)
+        _resolved = path
+    return path
@@ -0,0 +1,290 @@
+"""
+WebDriver Pool Utility
+Process-wide pool of reusable browser sessions shared across test suites
+
+Browsers are checked out, used, reset (cookies, storage, about:blank) and
+checked back in instead of being quit, so only the first suite in a process
+pays the Chrome cold-start cost.
+
+Configuration (via environment variables):
+  WEBDRIVER_POOL_SIZE        - Hard cap on live browsers (default: CPU count)
+  WEBDRIVER_BROWSER_MEMORY   - Estimated MB per browser used for the memory cap (default: 400)
+  WEBDRIVER_POOL_DISABLED    - Set to true to quit browsers on checkin (no reuse)
+"""
+
+import atexit
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+
+DEFAULT_BROWSER_MEMORY_MB = 400
+
+
+def available_memory_mb():
+    """
+    Get currently available system memory in MB
+
+    Returns:
+        int MB available, or None when it cannot be determined
+    """
+    try:
+        with open('/proc/meminfo', 'r') as f:
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) // 1024
+    except (IOError, OSError, ValueError, IndexError):
+        pass
+
+    try:
+        pages = os.sysconf('SC_AVPHYS_PAGES')
+        page_size = os.sysconf('SC_PAGE_SIZE')
+        return (pages * page_size) // (1024 * 1024)
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+class WebDriverPool:
+    """Checkout/checkin pool of WebDriver instances with health checks and reset"""
+
+    def __init__(self, factory, max_size=None, browser_memory_mb=None, checkout_timeout=300):
+        """
+        Initialize pool
+
+        Args:
+            factory: Zero-argument callable returning a new WebDriver
+            max_size: Hard cap on live browsers (default: WEBDRIVER_POOL_SIZE or CPU count)
+            browser_memory_mb: Estimated memory per browser, used to cap by available memory
+            checkout_timeout: Seconds to wait for a free browser before giving up
+        """
+        self.factory = factory
+        self.max_size = max_size or int(os.environ.get('WEBDRIVER_POOL_SIZE', os.cpu_count() or 2))
+        self.browser_memory_mb = browser_memory_mb or int(
+            os.environ.get('WEBDRIVER_BROWSER_MEMORY', DEFAULT_BROWSER_MEMORY_MB)
+        )
+        self.checkout_timeout = checkout_timeout
+        self.reuse = os.environ.get('WEBDRIVER_POOL_DISABLED', 'false').lower() not in ('1', 'true', 'yes')
+
+        self._cond = threading.Condition()
+        self._idle = []
+        self._in_use = {}
+        self._live = 0
+        self._closed = False
+        self.stats = {'created': 0, 'reused': 0, 'discarded': 0, 'reset_failures': 0}
+
+    def _has_capacity(self):
+        """Check whether another browser may be started (caller holds lock)"""
+        if self._live >= self.max_size:
+            return False
+        if self._live == 0:
+            # Always allow at least one browser
+            return True
+        free_mb = available_memory_mb()
+        if free_mb is None:
+            return True
+        return free_mb >= self.browser_memory_mb
+
+    def checkout(self, timeout=None):
+        """
+        Get a healthy browser from the pool, starting one if capacity allows
+
+        Health checks and browser starts run outside the pool lock, so one
+        hung browser does not block other checkouts and checkins.
+
+        Args:
+            timeout: Seconds to wait for a browser (default: checkout_timeout)
+
+        Returns:
+            WebDriver instance
+        """
+        timeout = self.checkout_timeout if timeout is None else timeout
+        deadline = time.time() + timeout
+
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("WebDriver pool is closed")
+                    if self._idle:
+                        driver = self._idle.pop()
+                        break
+                    if self._has_capacity():
+                        self._live += 1
+                        driver = None
+                        break
+
+                    remaining = deadline - time.time()
+                    if remaining <= 0 or not self._cond.wait(remaining):
+                        raise TimeoutError(
+                            f"No WebDriver available after {timeout}s ({self._live} live, max {self.max_size})"
+                        )
+
+            if driver is None:
+                break
+            if self.is_healthy(driver):
+                with self._cond:
+                    if not self._closed:
+                        self._in_use[id(driver)] = driver
+                        self.stats['reused'] += 1
+                        return driver
+            self._discard(driver)
+
+        # Start the browser outside the lock; cold starts take seconds
+        try:
+            driver = self.factory()
+        except Exception:
+            with self._cond:
+                self._live -= 1
+                self._cond.notify()
+            raise
+
+        with self._cond:
+            self._in_use[id(driver)] = driver
+            self.stats['created'] += 1
+        return driver
+
+    def checkin(self, driver, reset=True):
+        """
+        Return a browser to the pool
+
+        Drivers the pool did not hand out (or already took back) are ignored,
+        so they never count against its capacity.
+
+        Args:
+            driver: WebDriver previously returned by checkout()
+            reset: Clear cookies/storage and navigate to about:blank before reuse
+        """
+        if driver is None:
+            return
+        with self._cond:
+            if id(driver) not in self._in_use:
+                return
+
+        reusable = self.reuse and not self._closed
+        if reusable:
+            reusable = self.reset(driver) if reset else self.is_healthy(driver)
+
+        with self._cond:
+            if self._in_use.pop(id(driver), None) is None:
+                # close(include_in_use=True) quit it meanwhile
+                return
+            if reusable and not self._closed:
+                self._idle.append(driver)
+                self._cond.notify()
+                return
+        self._discard(driver)
+
+    def reset(self, driver):
+        """
+        Reset browser state so the next suite starts clean
+
+        Returns:
+            bool - True if the browser is still usable
+        """
+        try:
+            current_url = driver.current_url or ''
+            if current_url.startswith('http'):
+                driver.execute_script(
+                    "try { window.localStorage.clear(); } catch (e) {}"
+                    "try { window.sessionStorage.clear(); } catch (e) {}"
+                )
+            driver.delete_all_cookies()
+            driver.get('about:blank')
+            return True
+        except Exception:
+            self.stats['reset_failures'] += 1
+            return False
+
+    def is_healthy(self, driver):
+        """Check that the browser session still responds"""
+        try:
+            driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def _discard(self, driver):
+        """Quit a browser (outside the lock; quit() can hang) and release its slot"""
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        with self._cond:
+            self._live = max(0, self._live - 1)
+            self.stats['discarded'] += 1
+            self._cond.notify()
+
+    @contextmanager
+    def driver(self, reset=True):
+        """Context manager: checkout a browser and check it back in afterwards"""
+        driver = self.checkout()
+        try:
+            yield driver
+        finally:
+            self.checkin(driver, reset=reset)
+
+    def close(self, include_in_use=False):
+        """
+        Quit idle browsers and refuse further checkouts
+
+        Args:
+            include_in_use: Also quit browsers that were never checked back in
+        """
+        with self._cond:
+            self._closed = True
+            drivers, self._idle = self._idle, []
+            if include_in_use:
+                drivers += list(self._in_use.values())
+                self._in_use.clear()
+            self._cond.notify_all()
+        for driver in drivers:
+            self._discard(driver)
+
+    def get_summary(self):
+        """Get pool statistics"""
+        with self._cond:
+            return {
+                'live': self._live,
+                'idle': len(self._idle),
+                'in_use': len(self._in_use),
+                'max_size': self.max_size,
+                **self.stats
+            }
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_driver_pool(name='default', factory=None, **kwargs):
+    """
+    Get (or create) the process-wide pool for a browser profile
+
+    Args:
+        name: Pool name; suites sharing browser options should share a name
+        factory: Callable creating a WebDriver (required the first time a name is used)
+        **kwargs: Extra WebDriverPool arguments used on creation
+
+    Returns:
+        WebDriverPool
+    """
+    with _pools_lock:
+        pool = _pools.get(name)
+        if pool is None:
+            if factory is None:
+                raise ValueError(f"No WebDriver pool named '{name}' and no factory given")
+            pool = WebDriverPool(factory, **kwargs)
+            _pools[name] = pool
+        return pool
+
+
+def close_all_pools():
+    """Quit every pooled browser (registered at interpreter exit)"""
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.close(include_in_use=True)
+
+
+atexit.register(close_all_pools)
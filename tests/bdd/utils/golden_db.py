@@ -0,0 +1,304 @@
+"""
+Golden Database Utility
+Builds a migrated + seeded SQLite "golden" database once and restores copies of it
+
+The golden file is built from database/migrations, database/seeds/*.sql and
+scripts/seed_test_user.php (testuser@example.com / password123), plus one
+user with a complete profile per role (role_user()), and rebuilt only when
+one of those inputs changes. Seeded users keep their ids across restores, so
+PHP sessions logged in as them (stored in files, not in the database) stay
+valid after a reset. restore() gives a suite or test a
+pristine copy in milliseconds:
+  1. reflink (FICLONE) copy-on-write clone, on filesystems that support it
+  2. otherwise the SQLite online backup API (safe while the app has the file open)
+
+Configuration (via environment variables):
+  GOLDEN_DB_PATH - Golden database file (default: tests/bdd/results/servers/golden.db)
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import subprocess
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+from sqlite_migrations import PROJECT_ROOT, SEEDS_DIR, build_database, migration_files
+
+
+DEFAULT_GOLDEN_PATH = Path(__file__).parent.parent / 'results' / 'servers' / 'golden.db'
+SEED_USER_SCRIPT = PROJECT_ROOT / 'scripts' / 'seed_test_user.php'
+
+# Linux ioctl to clone a file's extents (btrfs, XFS with reflink, overlayfs on those)
+FICLONE = 0x40049409
+
+TEST_USER = {
+    'username': 'testuser',
+    'email': 'testuser@example.com',
+    'password': 'password123',
+    'first_name': 'Test',
+    'last_name': 'User',
+}
+
+
+def role_user(role):
+    """
+    Credentials of the golden database's seeded user holding a role
+
+    Returns:
+        dict with email, password, first_name, last_name
+    """
+    return {
+        'email': f"bdd-{role.replace('_', '-')}@example.com",
+        'password': TEST_USER['password'],
+        'first_name': 'Seeded',
+        'last_name': role.replace('_', ' ').title(),
+    }
+
+
+def golden_path():
+    """Get the golden database path"""
+    return Path(os.environ.get('GOLDEN_DB_PATH', DEFAULT_GOLDEN_PATH))
+
+
+def _fingerprint():
+    """Hash of every input the golden database is built from"""
+    digest = hashlib.sha256()
+    inputs = migration_files() + sorted(SEEDS_DIR.glob('*.sql')) + [SEED_USER_SCRIPT, Path(__file__)]
+    for path in inputs:
+        if path.exists():
+            digest.update(path.name.encode('utf-8'))
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _hash_password(password):
+    """PHP-compatible bcrypt hash (php password_hash, else the bcrypt module)"""
+    if shutil.which('php'):
+        result = subprocess.run(
+            ['php', '-r', 'echo password_hash($argv[1], PASSWORD_BCRYPT);', password],
+            capture_output=True, text=True, timeout=30
+        )
+        if result.returncode == 0 and result.stdout.startswith('$2'):
+            return result.stdout.strip()
+    try:
+        import bcrypt
+    except ImportError:
+        return None
+    hashed = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=10)).decode('utf-8')
+    # Same algorithm; $2y$ is the prefix PHP emits
+    return '$2y$' + hashed[4:]
+
+
+def seed_test_user(db_path):
+    """
+    Seed the Selenium test user
+
+    Runs scripts/seed_test_user.php against db_path when php is available,
+    otherwise inserts the same row directly.
+
+    Returns:
+        bool - True if the test user exists afterwards
+    """
+    if shutil.which('php') and SEED_USER_SCRIPT.exists():
+        result = subprocess.run(
+            ['php', str(SEED_USER_SCRIPT)],
+            cwd=str(PROJECT_ROOT),
+            env=dict(os.environ, USE_MYSQL='false', DB_PATH=str(db_path)),
+            capture_output=True, text=True, timeout=60
+        )
+        if result.returncode == 0:
+            return True
+
+    password_hash = _hash_password(TEST_USER['password'])
+    if not password_hash:
+        return False
+
+    conn = sqlite3.connect(str(db_path))
+    try:
+        with conn:
+            role = conn.execute("SELECT id FROM roles WHERE name = 'user'").fetchone()
+            if conn.execute("SELECT 1 FROM users WHERE email = ?", (TEST_USER['email'],)).fetchone():
+                return True
+            conn.execute(
+                "INSERT INTO users (username, email, password, first_name, last_name, role_id, created_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)",
+                (TEST_USER['username'], TEST_USER['email'], password_hash,
+                 TEST_USER['first_name'], TEST_USER['last_name'], role[0] if role else 11)
+            )
+    finally:
+        conn.close()
+    return True
+
+
+def seed_users(db_path, count, prefix='loaduser', password=None):
+    """
+    Insert a pool of regular users (e.g. for load tests) in one executemany
+
+    All users share one bcrypt hash, so seeding 1000 users costs one hash.
+
+    Args:
+        db_path: SQLite database
+        count: Number of users
+        prefix: Emails are <prefix><n>@example.com
+        password: Password of every user (default: the test user's)
+
+    Returns:
+        list of (email, password); [] if no bcrypt implementation is available
+    """
+    password = password or TEST_USER['password']
+    password_hash = _hash_password(password)
+    if not password_hash:
+        return []
+
+    users = [(f"{prefix}{n}", f"{prefix}{n}@example.com") for n in range(1, count + 1)]
+    conn = sqlite3.connect(str(db_path), timeout=30)
+    try:
+        with conn:
+            role = conn.execute("SELECT id FROM roles WHERE name = 'user'").fetchone()
+            conn.executemany(
+                "INSERT OR IGNORE INTO users (username, email, password, first_name, last_name, role_id, created_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)",
+                [(username, email, password_hash, 'Load', username, role[0] if role else 11)
+                 for username, email in users]
+            )
+    finally:
+        conn.close()
+    return [(email, password) for _, email in users]
+
+
+def seed_role_users(db_path):
+    """
+    Insert one user per role with a complete profile: the self record and one
+    family member, so the dashboard shows no "Complete your profile" prompt
+
+    Returns:
+        list of seeded role names; [] if no bcrypt implementation is available
+    """
+    password_hash = _hash_password(TEST_USER['password'])
+    if not password_hash:
+        return []
+
+    conn = sqlite3.connect(str(db_path), timeout=30)
+    try:
+        with conn:
+            roles = conn.execute("SELECT id, name FROM roles ORDER BY id").fetchall()
+            for role_id, role in roles:
+                user = role_user(role)
+                cursor = conn.execute(
+                    "INSERT INTO users (username, email, password, first_name, last_name, phone_e164, role_id, created_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)",
+                    (user['email'].split('@')[0], user['email'], password_hash, user['first_name'],
+                     user['last_name'], '+11234567890', role_id)
+                )
+                conn.executemany(
+                    "INSERT INTO family_members (user_id, first_name, last_name, birth_year, gender, email,"
+                    " relationship, occupation, village, mosal, created_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, 'Tester', 'TestVillage', 'TestMosal', CURRENT_TIMESTAMP)",
+                    [(cursor.lastrowid, user['first_name'], user['last_name'], 1990, 'male', user['email'], 'self'),
+                     (cursor.lastrowid, 'Family', user['last_name'], 1992, 'female', None, 'spouse')]
+                )
+    finally:
+        conn.close()
+    return [role for _, role in roles]
+
+
+def build_golden(force=False):
+    """
+    Build the golden database if it is missing or its inputs changed
+
+    Safe to call from several processes at once (file lock + atomic replace).
+
+    Args:
+        force: Rebuild even if up to date
+
+    Returns:
+        Path to the golden database
+    """
+    path = golden_path()
+    meta_path = path.with_name(path.name + '.json')
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fingerprint = _fingerprint()
+
+    with open(path.with_name(path.name + '.lock'), 'w') as lock:
+        if fcntl:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+
+        if not force and path.exists() and meta_path.exists():
+            try:
+                if json.loads(meta_path.read_text()).get('fingerprint') == fingerprint:
+                    return path
+            except (ValueError, IOError):
+                pass
+
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        build_database(tmp_path)
+        seeded = seed_test_user(tmp_path)
+        roles = seed_role_users(tmp_path)
+
+        conn = sqlite3.connect(str(tmp_path))
+        try:
+            # Single self-contained file: no WAL sidecar to copy along
+            conn.execute("PRAGMA journal_mode=DELETE")
+            conn.execute("VACUUM")
+        finally:
+            conn.close()
+
+        os.replace(tmp_path, path)
+        meta_path.write_text(json.dumps({'fingerprint': fingerprint, 'test_user': seeded, 'role_users': roles}))
+    return path
+
+
+def _reflink(source, target):
+    """Copy-on-write clone source to target; False if unsupported"""
+    if fcntl is None:
+        return False
+    try:
+        with open(source, 'rb') as src, open(target, 'wb') as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        return True
+    except (OSError, IOError):
+        try:
+            os.unlink(target)
+        except OSError:
+            pass
+        return False
+
+
+def restore(target, source=None):
+    """
+    Reset target to a pristine copy of the golden database
+
+    Args:
+        target: SQLite file to (re)create
+        source: Golden database (default: build_golden())
+
+    Returns:
+        str - 'reflink' or 'backup', the method used
+    """
+    source = Path(source) if source else build_golden()
+    target = Path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+
+    # Between suites nothing holds a transaction open; PHP reopens the file per request
+    tmp_target = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    if _reflink(source, tmp_target):
+        os.replace(tmp_target, target)
+        return 'reflink'
+
+    # Online backup writes through SQLite locking, so it is safe even if the
+    # app server has the target open; pages are copied in one step.
+    src = sqlite3.connect(f"file:{source}?mode=ro", uri=True)
+    dst = sqlite3.connect(str(target), timeout=30)
+    try:
+        src.backup(dst)
+    finally:
+        dst.close()
+        src.close()
+    return 'backup'
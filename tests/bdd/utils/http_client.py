@@ -0,0 +1,191 @@
+"""
+HTTP Client Utility
+Browserless client for checks that need no JavaScript (requests + lxml)
+
+Server-rendered checks (auth redirects, footer, meta tags, navbar links per
+role) do not need a browser: one HTTP request and an lxml parse take a few
+milliseconds. HttpClient keeps a cookie jar per instance, so a client logged
+in through /login behaves like a logged-in browser for server-side routes.
+
+Limitations: no JavaScript and no CSS. Links hidden by stylesheets are only
+detected through the hidden attribute, inline display:none and d-none.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlparse
+
+try:
+    import requests
+    from lxml import html as lxml_html
+    HTTP_TIER_AVAILABLE = True
+except ImportError:
+    requests = None
+    lxml_html = None
+    HTTP_TIER_AVAILABLE = False
+
+
+# Same navbar candidates as NavbarLinksValidator's CSS selector, first match wins
+NAVBAR_XPATH = (
+    "(//nav | //*[@role='navigation'] | "
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' navbar ')])[1]"
+)
+
+HIDDEN_XPATH = (
+    "ancestor-or-self::*[@hidden or @aria-hidden='true' "
+    "or contains(translate(@style, ' ', ''), 'display:none') "
+    "or contains(concat(' ', normalize-space(@class), ' '), ' d-none ')]"
+)
+
+
+def _clean(text):
+    return ' '.join((text or '').split())
+
+
+class HttpPage:
+    """Parsed HTML response"""
+
+    def __init__(self, response):
+        """
+        Wrap a requests response
+
+        Args:
+            response: requests.Response (redirects already followed)
+        """
+        self.response = response
+        self.url = response.url
+        self.status = response.status_code
+        self.redirects = [r.headers.get('Location') for r in response.history]
+        content_type = response.headers.get('Content-Type', '')
+        self.tree = lxml_html.fromstring(response.content) if response.content and 'html' in content_type else None
+
+    @property
+    def title(self):
+        if self.tree is None:
+            return ''
+        titles = self.tree.xpath('//title/text()')
+        return _clean(titles[0]) if titles else ''
+
+    def find(self, xpath):
+        """First element matching xpath, or None"""
+        found = self.find_all(xpath)
+        return found[0] if found else None
+
+    def find_all(self, xpath):
+        """All elements matching xpath"""
+        return self.tree.xpath(xpath) if self.tree is not None else []
+
+    def meta(self, name):
+        """content of <meta name=...>, or None"""
+        element = self.find(f"//meta[@name='{name}']")
+        return element.get('content') if element is not None else None
+
+    def links(self, xpath='//a'):
+        """
+        Anchors as (text, absolute href, visible) tuples
+
+        Args:
+            xpath: Anchor query (relative to the document)
+        """
+        result = []
+        for anchor in self.find_all(xpath):
+            href = anchor.get('href')
+            result.append((
+                _clean(anchor.text_content()),
+                urljoin(self.url, href) if href else None,
+                not anchor.xpath(HIDDEN_XPATH)
+            ))
+        return result
+
+    def navbar_links(self):
+        """Visible navbar link texts (same navbar choice as NavbarLinksValidator)"""
+        navbar = self.find(NAVBAR_XPATH)
+        if navbar is None:
+            return []
+        return [
+            _clean(anchor.text_content())
+            for anchor in navbar.xpath('.//a')
+            if _clean(anchor.text_content()) and not anchor.xpath(HIDDEN_XPATH)
+        ]
+
+
+class HttpClient:
+    """requests.Session with a cookie jar, lxml parsing and concurrent fetches"""
+
+    def __init__(self, base_url, timeout=15, workers=8):
+        """
+        Initialize client
+
+        Args:
+            base_url: Server URL
+            timeout: Per-request timeout in seconds
+            workers: Max concurrent requests in get_many()
+        """
+        if not HTTP_TIER_AVAILABLE:
+            raise ImportError("HTTP tier requires 'requests' and 'lxml'")
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.workers = workers
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers['User-Agent'] = 'UmaShaktiDham-HttpTier/1.0'
+
+    def url(self, path):
+        return path if path.startswith('http') else f"{self.base_url}{path}"
+
+    def get(self, path, allow_redirects=True):
+        """
+        GET a page
+
+        Returns:
+            HttpPage
+        """
+        response = self.session.get(self.url(path), timeout=self.timeout, allow_redirects=allow_redirects)
+        return HttpPage(response)
+
+    def get_many(self, paths):
+        """
+        GET several pages concurrently (shares the cookie jar)
+
+        Returns:
+            dict path -> HttpPage
+        """
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(paths) or 1)) as pool:
+            return dict(zip(paths, pool.map(self.get, paths)))
+
+    def login(self, email, password, path='/login'):
+        """
+        Log in through the login form; the session cookie lands in the jar
+
+        Hidden inputs of the form (e.g. CSRF tokens) are posted along.
+
+        Returns:
+            HttpPage after redirects (on success the dashboard)
+        """
+        form_page = self.get(path)
+        data = {}
+        form = form_page.find("//form[@id='loginForm'] | //form[contains(@action, 'login')]")
+        if form is not None:
+            for field in form.xpath(".//input[@type='hidden'][@name]"):
+                data[field.get('name')] = field.get('value', '')
+            action = urljoin(form_page.url, form.get('action') or path)
+        else:
+            action = self.url(path)
+        data.update({'email': email, 'password': password, 'submit': ''})
+        response = self.session.post(action, data=data, timeout=self.timeout, allow_redirects=True)
+        return HttpPage(response)
+
+    def is_logged_in(self, probe='/user/dashboard'):
+        """True if the probe page is served without a redirect to /login"""
+        page = self.get(probe)
+        return '/login' not in urlparse(page.url).path
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,128 @@
+"""
+Latency Histogram Utility
+HDR-style log-linear histogram for request latencies
+
+Values are recorded in microseconds into buckets whose width grows with the
+value (each power of two is split into 128 linear sub-buckets), so any
+recorded latency is reproduced within 1% from 1 us up to minutes with a few
+KB of memory, regardless of how many requests were recorded. Percentiles are
+reported as the highest value equivalent to the bucket (like HdrHistogram),
+so they never understate a tail.
+"""
+
+SUB_BUCKET_BITS = 8                      # 256 first-level buckets, 128 per power of two after that
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+SUB_BUCKET_HALF = SUB_BUCKET_COUNT >> 1
+
+DEFAULT_PERCENTILES = (50, 75, 90, 95, 99, 99.9, 99.99)
+
+
+def _bucket_index(value):
+    if value < SUB_BUCKET_COUNT:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    return SUB_BUCKET_COUNT + (shift - 1) * SUB_BUCKET_HALF + ((value >> shift) - SUB_BUCKET_HALF)
+
+
+def _bucket_range(index):
+    """(lowest, highest) value that maps to a bucket"""
+    if index < SUB_BUCKET_COUNT:
+        return index, index
+    shift = (index - SUB_BUCKET_COUNT) // SUB_BUCKET_HALF + 1
+    sub = (index - SUB_BUCKET_COUNT) % SUB_BUCKET_HALF + SUB_BUCKET_HALF
+    return sub << shift, ((sub + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """Sparse log-linear histogram of latencies (microsecond resolution)"""
+
+    def __init__(self):
+        self.counts = {}
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def record(self, seconds, count=1):
+        """
+        Record a latency
+
+        Args:
+            seconds: Latency in seconds (float)
+            count: Number of occurrences
+        """
+        value = max(0, int(round(seconds * 1_000_000)))
+        index = _bucket_index(value)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.count += count
+        self.total += value * count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other):
+        """Add another histogram's counts into this one"""
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.count:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        return self
+
+    def percentile(self, pct):
+        """
+        Latency at a percentile in milliseconds
+
+        Args:
+            pct: Percentile 0-100
+
+        Returns:
+            float ms, or None if empty
+        """
+        if not self.count:
+            return None
+        target = max(1, int(round(pct / 100.0 * self.count + 0.4999999)))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(_bucket_range(index)[1], self.max) / 1000.0
+        return self.max / 1000.0
+
+    @property
+    def mean(self):
+        """Mean latency in milliseconds (exact), or None if empty"""
+        return self.total / self.count / 1000.0 if self.count else None
+
+    def summary(self, percentiles=DEFAULT_PERCENTILES):
+        """
+        Get count, min/mean/max and percentiles in milliseconds
+
+        Returns:
+            dict with count, min, mean, max and 'p<pct>' keys
+        """
+        result = {
+            'count': self.count,
+            'min': self.min / 1000.0 if self.count else None,
+            'mean': self.mean,
+            'max': self.max / 1000.0 if self.count else None,
+        }
+        for pct in percentiles:
+            result[f"p{pct:g}"] = self.percentile(pct)
+        return result
+
+    def to_dict(self):
+        """Serializable form (sparse bucket counts)"""
+        return {'counts': {str(k): v for k, v in sorted(self.counts.items())},
+                'count': self.count, 'total': self.total, 'min': self.min, 'max': self.max}
+
+    @classmethod
+    def from_dict(cls, data):
+        histogram = cls()
+        histogram.counts = {int(k): v for k, v in data.get('counts', {}).items()}
+        histogram.count = data.get('count', 0)
+        histogram.total = data.get('total', 0)
+        histogram.min = data.get('min')
+        histogram.max = data.get('max')
+        return histogram
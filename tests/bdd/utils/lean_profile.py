@@ -0,0 +1,92 @@
+"""
+Lean Profile Utility
+Blocks images, fonts, media and analytics in functional suites
+
+Assertions only look at forms and text, yet pages such as /gallery and
+/hindu-gods pull dozens of photos plus web fonts and third-party scripts.
+apply_lean_profile() hands Chrome a list of URL patterns through the
+DevTools protocol (Network.setBlockedURLs), so those requests fail
+immediately instead of being downloaded and decoded; the page, its CSS and
+its JavaScript still load normally. Blocking is per browser tab and is
+re-applied on every pool checkout, so each suite gets its own allowlist.
+
+An allowlist entry is a group name ('images', 'fonts', 'media',
+'analytics') or one of the URL patterns below; allow='all' turns the
+profile off (benchmarks that measure real page weight).
+
+Configuration (via environment variables):
+  WEBDRIVER_LEAN        - Set to false to load every resource (default: true)
+  WEBDRIVER_LEAN_ALLOW  - Comma-separated allowlist added to every suite's own
+"""
+
+import os
+
+
+LEAN_ENABLED = os.environ.get('WEBDRIVER_LEAN', 'true').lower() in ('1', 'true', 'yes')
+
+
+def _extensions(*names):
+    """Patterns for files with these extensions, with or without a query string"""
+    return [pattern for name in names for pattern in (f"*.{name}", f"*.{name}?*")]
+
+
+BLOCK_GROUPS = {
+    'images': _extensions('png', 'jpg', 'jpeg', 'gif', 'webp', 'svg', 'ico', 'bmp', 'avif'),
+    'fonts': _extensions('woff', 'woff2', 'ttf', 'otf', 'eot') + ['*fonts.googleapis.com*', '*fonts.gstatic.com*'],
+    'media': _extensions('mp4', 'webm', 'mp3', 'ogg') + ['*youtube.com/embed*'],
+    'analytics': ['*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+                  '*connect.facebook.net*', '*hotjar.com*'],
+}
+
+
+def _env_allow():
+    return [entry.strip() for entry in os.environ.get('WEBDRIVER_LEAN_ALLOW', '').split(',') if entry.strip()]
+
+
+def blocked_patterns(allow=()):
+    """
+    Get the URL patterns to block
+
+    Args:
+        allow: Group names or patterns to let through ('all' for none blocked)
+
+    Returns:
+        list of Network.setBlockedURLs patterns
+
+    Raises:
+        ValueError: for an allowlist entry that is neither a group nor a pattern
+    """
+    if isinstance(allow, str):
+        allow = [allow]
+    allow = set(allow or ()) | set(_env_allow())
+    if 'all' in allow:
+        return []
+    known = {pattern for patterns in BLOCK_GROUPS.values() for pattern in patterns}
+    unknown = allow - set(BLOCK_GROUPS) - known
+    if unknown:
+        raise ValueError(f"Unknown lean profile allowlist entries: {', '.join(sorted(unknown))}")
+    return [pattern for group, patterns in BLOCK_GROUPS.items() if group not in allow
+            for pattern in patterns if pattern not in allow]
+
+
+def apply_lean_profile(driver, allow=()):
+    """
+    Block the lean profile's resources in this browser tab (replaces any earlier list)
+
+    Args:
+        driver: WebDriver
+        allow: Allowlist, see blocked_patterns()
+
+    Returns:
+        int patterns blocked, or None if the browser has no CDP (e.g. Firefox)
+    """
+    patterns = blocked_patterns(allow)
+    if not hasattr(driver, 'execute_cdp_cmd'):
+        return None
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+    except Exception:
+        return None
+    driver._bdd_lean = bool(patterns)
+    return len(patterns)
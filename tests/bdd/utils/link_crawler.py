@@ -0,0 +1,403 @@
+"""
+Link Crawler Utility
+Concurrent asyncio crawler reporting broken links and redirect chains per role
+
+Each role (guest, user, admin) crawls the site with its own cookie jar; all
+roles share one bounded aiohttp connection pool. Pages are crawled level by
+level (breadth first, up to max_depth) and every level is fetched
+concurrently. URLs are normalized (fragment dropped) and fetched once per
+role; assets (img/script/stylesheet) are checked once for all roles.
+
+Scoping works like robots.txt: only same-origin URLs are followed and
+Allow/Disallow path rules decide (longest match wins, '*' and '$' supported).
+The defaults keep the crawler away from session-ending and destructive GET
+routes (/logout, /user/delete/...) and from OAuth redirects to providers.
+
+Configuration (via environment variables):
+  CRAWL_CONCURRENCY     - Max open connections (default: 16)
+  CRAWL_ADMIN_EMAIL     - Admin login for the admin role (default: /__dev_login, localhost only)
+  CRAWL_ADMIN_PASSWORD  - Password for CRAWL_ADMIN_EMAIL
+"""
+
+import asyncio
+import json
+import os
+import re
+import time
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import urldefrag, urljoin, urlparse
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    aiohttp = None
+    AIOHTTP_AVAILABLE = False
+
+from golden_db import TEST_USER
+
+
+REPORT_FILE = Path(__file__).parent.parent / 'results' / 'link_report.json'
+MAX_REDIRECTS = 10
+
+DEFAULT_RULES = [
+    ('disallow', '/logout'),
+    ('disallow', '/__dev_'),
+    ('disallow', '/auth/'),
+    ('disallow', '/user/delete/'),
+    ('disallow', '/*delete'),
+]
+
+ROLES = ('guest', 'user', 'admin')
+
+# Where each role starts; pages only linked from role dashboards are reached too
+START_PATHS = {
+    'guest': ('/',),
+    'user': ('/', '/user/dashboard'),
+    'admin': ('/', '/admin'),
+}
+
+
+class CrawlScope:
+    """robots.txt-style Allow/Disallow rules for one origin"""
+
+    def __init__(self, base_url, rules=None):
+        """
+        Compile rules
+
+        Args:
+            base_url: Origin to stay on
+            rules: list of ('allow'|'disallow', path pattern); default DEFAULT_RULES
+        """
+        parsed = urlparse(base_url)
+        self.origin = (parsed.scheme, parsed.netloc)
+        self.rules = [
+            (kind == 'allow', len(pattern), self._compile(pattern))
+            for kind, pattern in (DEFAULT_RULES if rules is None else rules)
+        ]
+
+    @staticmethod
+    def _compile(pattern):
+        anchored = pattern.endswith('$')
+        body = re.escape(pattern.rstrip('$')).replace(r'\*', '.*')
+        return re.compile(body + ('$' if anchored else ''))
+
+    @staticmethod
+    def parse_robots(text, agent='*'):
+        """
+        Get (kind, pattern) rules from robots.txt for a user agent
+
+        Returns:
+            list of ('allow'|'disallow', pattern)
+        """
+        rules, applies = [], False
+        for line in text.splitlines():
+            line = line.split('#', 1)[0].strip()
+            if ':' not in line:
+                continue
+            field, value = (part.strip() for part in line.split(':', 1))
+            field = field.lower()
+            if field == 'user-agent':
+                applies = value == agent or value == '*'
+            elif applies and field in ('allow', 'disallow') and value:
+                rules.append((field, value))
+        return rules
+
+    def same_origin(self, url):
+        parsed = urlparse(url)
+        return (parsed.scheme, parsed.netloc) == self.origin
+
+    def allowed(self, url):
+        """True if url is on the origin and not disallowed"""
+        if not self.same_origin(url):
+            return False
+        parsed = urlparse(url)
+        path = parsed.path or '/'
+        if parsed.query:
+            path += '?' + parsed.query
+        best = None
+        for allow, length, regex in self.rules:
+            if regex.match(path) and (best is None or length > best[1] or (length == best[1] and allow)):
+                best = (allow, length)
+        return best is None or best[0]
+
+
+class _LinkParser(HTMLParser):
+    """Collects page links, asset references and hidden form inputs"""
+
+    ASSET_ATTRS = {'img': 'src', 'script': 'src', 'link': 'href', 'source': 'src'}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.links = []
+        self.assets = []
+        self.hidden_inputs = {}
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'a' and attrs.get('href'):
+            self.links.append(attrs['href'])
+        elif tag in self.ASSET_ATTRS and attrs.get(self.ASSET_ATTRS[tag]):
+            if tag != 'link' or 'stylesheet' in (attrs.get('rel') or '') or 'icon' in (attrs.get('rel') or ''):
+                self.assets.append(attrs[self.ASSET_ATTRS[tag]])
+        elif tag == 'input' and attrs.get('type') == 'hidden' and attrs.get('name'):
+            self.hidden_inputs[attrs['name']] = attrs.get('value') or ''
+
+
+def parse_html(text):
+    parser = _LinkParser()
+    try:
+        parser.feed(text)
+    except Exception:
+        pass
+    return parser
+
+
+def normalize(url):
+    """Drop the fragment so /page and /page#top are one URL"""
+    return urldefrag(url)[0]
+
+
+class LinkCrawler:
+    """Crawls the site once per role and builds a broken-link / redirect report"""
+
+    def __init__(self, base_url, roles=ROLES, concurrency=None, max_depth=3, max_pages=1000,
+                 timeout=10, scope=None, credentials=None, start_paths=None):
+        """
+        Initialize crawler
+
+        Args:
+            base_url: Server URL
+            roles: Roles to crawl ('guest', 'user', 'admin')
+            concurrency: Connection pool size shared by all roles
+            max_depth: Link depth from the start pages
+            max_pages: Safety cap on pages per role
+            timeout: Per-request timeout in seconds
+            scope: CrawlScope (default: DEFAULT_RULES plus the site's robots.txt)
+            credentials: dict role -> (email, password) for form login
+            start_paths: dict role -> paths to start from (default: START_PATHS)
+        """
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError("Link crawler requires 'aiohttp' (pip install aiohttp)")
+        self.base_url = base_url.rstrip('/')
+        self.roles = list(roles)
+        self.concurrency = concurrency or int(os.environ.get('CRAWL_CONCURRENCY', '16'))
+        self.max_depth = max_depth
+        self.max_pages = max_pages
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.scope = scope
+        self.credentials = {'user': (TEST_USER['email'], TEST_USER['password'])}
+        if os.environ.get('CRAWL_ADMIN_EMAIL'):
+            self.credentials['admin'] = (os.environ['CRAWL_ADMIN_EMAIL'], os.environ.get('CRAWL_ADMIN_PASSWORD', ''))
+        self.credentials.update(credentials or {})
+        self.start_paths = dict(START_PATHS, **(start_paths or {}))
+        self._assets = {}
+
+    async def _fetch(self, session, url):
+        """
+        GET url following redirects by hand, so every hop is recorded
+
+        Returns:
+            dict url, status, final_url, chain [(status, url)], content_type, text, error
+        """
+        chain, seen, current = [], {url}, url
+        try:
+            for _ in range(MAX_REDIRECTS + 1):
+                async with session.get(current, allow_redirects=False) as response:
+                    location = response.headers.get('Location')
+                    if response.status in (301, 302, 303, 307, 308) and location:
+                        chain.append((response.status, current))
+                        target = normalize(urljoin(current, location))
+                        if target in seen:
+                            return self._result(url, 'LOOP', current, chain, error=f"redirect loop at {target}")
+                        seen.add(target)
+                        current = target
+                        if not self.scope.same_origin(current):
+                            # Leaving the site (OAuth provider, CDN): record, do not follow
+                            return self._result(url, response.status, current, chain)
+                        continue
+                    content_type = response.headers.get('Content-Type', '')
+                    text = await response.text(errors='replace') if 'html' in content_type else ''
+                    return self._result(url, response.status, current, chain, content_type, text)
+            return self._result(url, 'TOO_MANY_REDIRECTS', current, chain, error=f"more than {MAX_REDIRECTS} redirects")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            return self._result(url, 'ERROR', current, chain, error=str(e) or type(e).__name__)
+
+    @staticmethod
+    def _result(url, status, final_url, chain, content_type='', text='', error=None):
+        return {
+            'url': url, 'status': status, 'final_url': final_url, 'chain': chain,
+            'content_type': content_type, 'text': text, 'error': error,
+        }
+
+    @staticmethod
+    def _broken(result):
+        return not isinstance(result['status'], int) or result['status'] >= 400
+
+    async def _login(self, session, role):
+        """Log a role's session in; False if it could not be logged in"""
+        if role == 'guest':
+            return True
+        if role in self.credentials:
+            email, password = self.credentials[role]
+            form = await self._fetch(session, f"{self.base_url}/login")
+            data = dict(parse_html(form['text']).hidden_inputs, email=email, password=password)
+            async with session.post(f"{self.base_url}/login", data=data, allow_redirects=True) as response:
+                return '/login' not in urlparse(str(response.url)).path
+        if role == 'admin':
+            # Local-dev helper route (localhost only), see routes.php
+            result = await self._fetch(session, f"{self.base_url}/__dev_login?role=admin&user_id=1&next=/admin")
+            return result['status'] == 200 and '/login' not in urlparse(result['final_url']).path
+        return False
+
+    async def _check_asset(self, session, url):
+        if url not in self._assets:
+            self._assets[url] = asyncio.ensure_future(self._fetch(session, url))
+        result = await self._assets[url]
+        return dict(result, text='')
+
+    async def crawl_role(self, connector, role):
+        """
+        Crawl the site as one role
+
+        Returns:
+            dict with pages, broken, redirects, skipped and error for the role
+        """
+        jar = aiohttp.CookieJar(unsafe=True)  # unsafe: keep cookies for IP hosts like 127.0.0.1
+        async with aiohttp.ClientSession(connector=connector, connector_owner=False, cookie_jar=jar,
+                                         timeout=self.timeout,
+                                         headers={'User-Agent': 'UmaShaktiDham-LinkCrawler/1.0'}) as session:
+            if not await self._login(session, role):
+                return {'role': role, 'error': 'login failed', 'pages': 0, 'broken': [], 'redirects': [], 'skipped': 0}
+
+            referrers = {}
+            visited = set()
+            results = {}
+            skipped = set()
+            frontier = [normalize(urljoin(self.base_url + '/', path.lstrip('/'))) for path in self.start_paths.get(role, ('/',))]
+            for url in frontier:
+                referrers.setdefault(url, set())
+
+            for depth in range(self.max_depth + 1):
+                frontier = [url for url in dict.fromkeys(frontier) if url not in visited][:self.max_pages - len(visited)]
+                if not frontier:
+                    break
+                visited.update(frontier)
+                pages = await asyncio.gather(*(self._fetch(session, url) for url in frontier))
+
+                next_frontier, asset_urls = [], set()
+                for page in pages:
+                    results[page['url']] = page
+                    if not page['text'] or not self.scope.same_origin(page['final_url']):
+                        continue
+                    parsed = parse_html(page['text'])
+                    for href in parsed.links:
+                        target = normalize(urljoin(page['final_url'], href.strip()))
+                        if not target.startswith(('http://', 'https://')):
+                            continue  # mailto:, tel:, javascript:
+                        if not self.scope.allowed(target):
+                            skipped.add(target)
+                            continue
+                        referrers.setdefault(target, set()).add(page['final_url'])
+                        if depth < self.max_depth:
+                            next_frontier.append(target)
+                    for src in parsed.assets:
+                        target = normalize(urljoin(page['final_url'], src.strip()))
+                        if self.scope.allowed(target):
+                            referrers.setdefault(target, set()).add(page['final_url'])
+                            asset_urls.add(target)
+
+                assets = await asyncio.gather(*(self._check_asset(session, url) for url in asset_urls - set(results)))
+                for asset in assets:
+                    results[asset['url']] = asset
+                frontier = next_frontier
+
+        broken = [
+            {'url': r['url'], 'status': r['status'], 'error': r['error'],
+             'referrers': sorted(referrers.get(r['url'], ()))[:5]}
+            for r in results.values() if self._broken(r)
+        ]
+        redirects = [
+            {'url': r['url'], 'hops': len(r['chain']), 'chain': [f"{status} {url}" for status, url in r['chain']],
+             'final_url': r['final_url'], 'final_status': r['status']}
+            for r in results.values() if r['chain']
+        ]
+        return {
+            'role': role,
+            'error': None,
+            'pages': sum(1 for r in results.values() if 'html' in r['content_type']),
+            'checked': len(results),
+            'broken': sorted(broken, key=lambda b: b['url']),
+            'redirects': sorted(redirects, key=lambda r: (-r['hops'], r['url'])),
+            'skipped': len(skipped),
+        }
+
+    async def _load_robots(self, connector):
+        """Rules from the site's robots.txt ([] if it has none)"""
+        async with aiohttp.ClientSession(connector=connector, connector_owner=False, timeout=self.timeout) as session:
+            try:
+                async with session.get(f"{self.base_url}/robots.txt") as response:
+                    if response.status != 200 or 'text/plain' not in response.headers.get('Content-Type', ''):
+                        return []
+                    return CrawlScope.parse_robots(await response.text(errors='replace'))
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                return []
+
+    async def crawl(self):
+        """
+        Crawl every role concurrently over one bounded connection pool
+
+        Returns:
+            dict report: base_url, duration, roles (per-role results)
+        """
+        started = time.time()
+        connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.concurrency)
+        try:
+            if self.scope is None:
+                self.scope = CrawlScope(self.base_url, DEFAULT_RULES + await self._load_robots(connector))
+            roles = await asyncio.gather(*(self.crawl_role(connector, role) for role in self.roles))
+        finally:
+            await connector.close()
+        return {
+            'base_url': self.base_url,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'duration': round(time.time() - started, 3),
+            'roles': {result['role']: result for result in roles},
+        }
+
+    def run(self):
+        """Synchronous wrapper around crawl()"""
+        return asyncio.run(self.crawl())
+
+
+def print_report(report):
+    """Print a readable broken-link and redirect-chain summary"""
+    print(f"\n{'='*80}")
+    print(f"LINK CRAWL REPORT - {report['base_url']} ({report['duration']:.2f}s)")
+    print(f"{'='*80}")
+    for role, result in report['roles'].items():
+        if result['error']:
+            print(f"\n❌ {role.upper()}: {result['error']}")
+            continue
+        print(f"\n👤 {role.upper()}: {result['pages']} pages, {result['checked']} URLs checked, "
+              f"{len(result['broken'])} broken, {len(result['redirects'])} redirected, {result['skipped']} out of scope")
+        for broken in result['broken']:
+            detail = broken['error'] or f"HTTP {broken['status']}"
+            print(f"   ❌ {broken['url']} - {detail}")
+            for referrer in broken['referrers']:
+                print(f"      ↳ linked from {referrer}")
+        for redirect in result['redirects']:
+            if redirect['hops'] > 1:
+                print(f"   ↪️  {redirect['hops']} hops: {' → '.join(redirect['chain'])} → {redirect['final_status']} {redirect['final_url']}")
+
+
+def write_report(report, report_file=REPORT_FILE):
+    report_file = Path(report_file)
+    report_file.parent.mkdir(parents=True, exist_ok=True)
+    report_file.write_text(json.dumps(report, indent=2, default=str))
+    return report_file
+
+
+def has_broken_links(report):
+    return any(result['error'] or result['broken'] for result in report['roles'].values())
@@ -0,0 +1,282 @@
+"""
+Load Generator Utility
+asyncio HTTP load generator replaying weighted route mixes as logged-in users
+
+A pool of virtual users logs in through /login, each with its own cookie jar;
+guest routes use a cookie-less session. Requests are drawn from a weighted
+route mix and sent either
+  - closed loop: N concurrent workers, each sending its next request as soon
+    as the previous one finished (--concurrency), or
+  - open loop: requests start on a fixed schedule at a target rate (--rps).
+    Latency is measured from the scheduled start, so a stalled server shows
+    up in the tail instead of silently lowering the request rate
+    (coordinated omission).
+All sessions share one bounded connection pool. Latencies go into
+LatencyHistogram (HDR-style) per route; the first `warmup` seconds are not
+recorded.
+"""
+
+import asyncio
+import json
+import random
+import time
+from urllib.parse import urlparse
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    aiohttp = None
+    AIOHTTP_AVAILABLE = False
+
+from latency_histogram import LatencyHistogram
+
+
+# method: GET, POST_JSON (json body) or LOGIN (form login of the virtual user)
+ROUTE_MIXES = {
+    'default': [
+        {'name': 'login page', 'method': 'GET', 'path': '/login', 'weight': 5, 'auth': False},
+        {'name': 'login', 'method': 'LOGIN', 'path': '/login', 'weight': 2},
+        {'name': 'user dashboard', 'method': 'GET', 'path': '/user/dashboard', 'weight': 30},
+        {'name': 'family page', 'method': 'GET', 'path': '/user/family', 'weight': 10},
+        {'name': 'family form', 'method': 'GET', 'path': '/get-member-form?type=family', 'weight': 15},
+        {'name': 'add family member', 'method': 'POST_JSON', 'path': '/add-family-member', 'weight': 3,
+         'json': {'first_name': 'Load', 'last_name': 'Test', 'relationship': 'child', 'gender': 'male'}},
+    ],
+    'read': [
+        {'name': 'login page', 'method': 'GET', 'path': '/login', 'weight': 5, 'auth': False},
+        {'name': 'user dashboard', 'method': 'GET', 'path': '/user/dashboard', 'weight': 30},
+        {'name': 'family page', 'method': 'GET', 'path': '/user/family', 'weight': 10},
+        {'name': 'family form', 'method': 'GET', 'path': '/get-member-form?type=family', 'weight': 15},
+    ],
+}
+
+RESERVOIR_SIZE = 1000
+
+
+def load_mix(name_or_path):
+    """
+    Get a route mix by name (ROUTE_MIXES) or from a JSON file (list of route dicts)
+
+    Returns:
+        list of route dicts
+    """
+    if name_or_path in ROUTE_MIXES:
+        return ROUTE_MIXES[name_or_path]
+    with open(name_or_path) as f:
+        return json.load(f)
+
+
+class RouteStats:
+    """Histogram, errors and a uniform sample of latencies for one route"""
+
+    def __init__(self, rng):
+        self.histogram = LatencyHistogram()
+        self.errors = {}
+        self.samples = []
+        self._rng = rng
+
+    def add(self, latency, error=None):
+        self.histogram.record(latency)
+        if error:
+            self.errors[error] = self.errors.get(error, 0) + 1
+        # Reservoir sampling: a fixed-size uniform sample for the baseline store
+        if len(self.samples) < RESERVOIR_SIZE:
+            self.samples.append(latency * 1000)
+        else:
+            slot = self._rng.randrange(self.histogram.count)
+            if slot < RESERVOIR_SIZE:
+                self.samples[slot] = latency * 1000
+
+    @property
+    def error_count(self):
+        return sum(self.errors.values())
+
+
+class LoadGenerator:
+    """Replays a weighted route mix against the app at a target concurrency or rate"""
+
+    def __init__(self, base_url, mix, users, concurrency=None, rps=None, duration=30, warmup=5,
+                 timeout=30, max_connections=100, seed=None):
+        """
+        Initialize generator
+
+        Args:
+            base_url: Server URL
+            mix: list of route dicts (name, method, path, weight[, auth, json])
+            users: list of (email, password) for the virtual users
+            concurrency: Closed loop with this many workers
+            rps: Open loop at this many requests per second (takes precedence)
+            duration: Measured seconds (after warmup)
+            warmup: Seconds sent but not recorded
+            timeout: Per-request timeout in seconds
+            max_connections: Connection pool size shared by all sessions
+            seed: RNG seed for reproducible route choices
+        """
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError("Load generator requires 'aiohttp' (pip install aiohttp)")
+        if not users and any(route.get('auth', True) for route in mix):
+            raise ValueError("Route mix has authenticated routes but no users were given")
+        self.base_url = base_url.rstrip('/')
+        self.mix = mix
+        self.users = users
+        self.concurrency = concurrency or 10
+        self.rps = rps
+        self.duration = duration
+        self.warmup = warmup
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.max_connections = max_connections
+        self.rng = random.Random(seed)
+        self._weights = [route.get('weight', 1) for route in mix]
+        self.stats = {route['name']: RouteStats(self.rng) for route in mix}
+        self.in_flight_peak = 0
+        self._in_flight = 0
+
+    async def _login(self, session, email, password):
+        """Form login; True if the session ends up authenticated"""
+        async with session.post(f"{self.base_url}/login", data={'email': email, 'password': password}) as response:
+            await response.read()
+            return response.status < 400 and '/login' not in urlparse(str(response.url)).path
+
+    async def _send(self, session, route, user):
+        """
+        Send one request
+
+        Returns:
+            error label, or None on success
+        """
+        url = f"{self.base_url}{route['path']}"
+        method = route['method']
+        if method == 'LOGIN':
+            return None if await self._login(session, *user) else 'login failed'
+        if method == 'POST_JSON':
+            request = session.post(url, json=route.get('json', {}))
+        elif method == 'POST':
+            request = session.post(url, data=route.get('data', {}))
+        else:
+            request = session.get(url)
+        async with request as response:
+            await response.read()
+            if response.status >= 400:
+                return f"HTTP {response.status}"
+            if route.get('auth', True) and '/login' in urlparse(str(response.url)).path:
+                return 'logged out'
+        return None
+
+    async def _timed(self, route, session, user, scheduled, measure_from):
+        """Send a request and record its latency from `scheduled` if it started after warmup"""
+        self._in_flight += 1
+        self.in_flight_peak = max(self.in_flight_peak, self._in_flight)
+        try:
+            error = await self._send(session, route, user)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            error = type(e).__name__
+        finally:
+            self._in_flight -= 1
+        if scheduled >= measure_from:
+            self.stats[route['name']].add(time.perf_counter() - scheduled, error)
+
+    def _pick(self):
+        return self.rng.choices(self.mix, weights=self._weights)[0]
+
+    async def _closed_loop(self, sessions, guest, measure_from, end):
+        async def worker(index):
+            session, user = sessions[index % len(sessions)] if sessions else (guest, None)
+            while time.perf_counter() < end:
+                route = self._pick()
+                target = session if route.get('auth', True) else guest
+                await self._timed(route, target, user, time.perf_counter(), measure_from)
+
+        await asyncio.gather(*(worker(index) for index in range(self.concurrency)))
+
+    async def _open_loop(self, sessions, guest, measure_from, end):
+        interval = 1.0 / self.rps
+        start = time.perf_counter()
+        tasks = set()
+        sent = 0
+        while True:
+            scheduled = start + sent * interval
+            if scheduled >= end:
+                break
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            route = self._pick()
+            session, user = sessions[sent % len(sessions)] if sessions else (guest, None)
+            target = session if route.get('auth', True) else guest
+            task = asyncio.ensure_future(self._timed(route, target, user, scheduled, measure_from))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            sent += 1
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    async def run(self):
+        """
+        Log the users in, then generate load for warmup + duration seconds
+
+        Returns:
+            dict report (see report())
+        """
+        connector = aiohttp.TCPConnector(limit=self.max_connections)
+        common = dict(connector=connector, connector_owner=False, timeout=self.timeout,
+                      headers={'User-Agent': 'UmaShaktiDham-LoadTest/1.0'})
+        sessions = []
+        guest = aiohttp.ClientSession(cookie_jar=aiohttp.DummyCookieJar(), **common)
+        try:
+            for user in self.users:
+                session = aiohttp.ClientSession(cookie_jar=aiohttp.CookieJar(unsafe=True), **common)
+                sessions.append((session, user))
+            logins = await asyncio.gather(*(self._login(session, *user) for session, user in sessions))
+            failed = [user[0] for (_, user), ok in zip(sessions, logins) if not ok]
+            if failed:
+                raise RuntimeError(f"{len(failed)} of {len(sessions)} users could not log in (e.g. {failed[0]})")
+
+            started = time.perf_counter()
+            measure_from = started + self.warmup
+            end = measure_from + self.duration
+            if self.rps:
+                await self._open_loop(sessions, guest, measure_from, end)
+            else:
+                await self._closed_loop(sessions, guest, measure_from, end)
+            # Rates are per measured second; the tail of in-flight requests is not part of the window
+            elapsed = min(time.perf_counter(), end) - measure_from
+        finally:
+            for session, _ in sessions:
+                await session.close()
+            await guest.close()
+            await connector.close()
+        return self.report(elapsed)
+
+    def report(self, elapsed):
+        """
+        Build the report
+
+        Returns:
+            dict with mode, elapsed, total (summary), routes: name -> summary, errors, samples
+        """
+        total = LatencyHistogram()
+        routes = {}
+        for route in self.mix:
+            stats = self.stats[route['name']]
+            total.merge(stats.histogram)
+            routes[route['name']] = {
+                'path': route['path'],
+                'auth': route.get('auth', True),
+                'summary': stats.histogram.summary(),
+                'rps': stats.histogram.count / elapsed if elapsed > 0 else 0,
+                'errors': dict(stats.errors),
+                'error_rate': stats.error_count / stats.histogram.count if stats.histogram.count else 0,
+                'histogram': stats.histogram.to_dict(),
+                'samples': stats.samples,
+            }
+        errors = sum(sum(r['errors'].values()) for r in routes.values())
+        return {
+            'mode': f"rps{self.rps:g}" if self.rps else f"c{self.concurrency}",
+            'elapsed': elapsed,
+            'users': len(self.users),
+            'in_flight_peak': self.in_flight_peak,
+            'total': dict(total.summary(), rps=total.count / elapsed if elapsed > 0 else 0,
+                          error_rate=errors / total.count if total.count else 0),
+            'routes': routes,
+        }
@@ -1,36 +1,49 @@
 """
 Navbar Links Validator Utility
 Validates navbar links based on user roles and authentication status
+
+All navbar anchors are read with a single execute_script call as compact
+(text, href, visible, rect) tuples, and each role's expectations are
+compiled once into a matcher, so a navbar check costs one round trip
+regardless of how many links the navbar has.
 """
 
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-import time
+from selenium.common.exceptions import TimeoutException
+
+from wait_engine import click_and_wait
+from navbar_roles import EXPECTED_NAVBAR_LINKS, get_role_matcher
+
+
+NAVBAR_SELECTOR = "nav, [role='navigation'], .navbar"
+
+# Returns null until the navbar exists, else [[text, href, visible, [x, y, w, h]], ...]
+# (plus the element itself when arguments[1] is true)
+NAVBAR_LINKS_JS = """
+var nav = document.querySelector(arguments[0]);
+if (!nav) { return null; }
+var withElements = arguments[1];
+var out = [];
+var anchors = nav.getElementsByTagName('a');
+for (var i = 0; i < anchors.length; i++) {
+  var a = anchors[i];
+  var r = a.getBoundingClientRect();
+  var style = window.getComputedStyle(a);
+  var visible = r.width > 0 && r.height > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+  var text = visible ? (a.innerText || '').replace(/\\s+/g, ' ').trim() : '';
+  var row = [text, a.href || null, visible, [Math.round(r.x), Math.round(r.y), Math.round(r.width), Math.round(r.height)]];
+  if (withElements) { row.push(a); }
+  out.push(row);
+}
+return out;
+"""
 
 
 class NavbarLinksValidator:
     """Validates navbar links for different user roles"""
     
     # Expected links by role
-    EXPECTED_LINKS = {
-        'guest': {
-            'visible': ['Home', 'About', 'Contact', 'Login', 'Register'],
-            'hidden': ['Dashboard', 'Profile', 'Logout', 'Admin'],
-            'description': 'Non-authenticated user'
-        },
-        'user': {
-            'visible': ['Home', 'About', 'Contact', 'Dashboard', 'Profile', 'Family', 'Logout'],
-            'hidden': ['Login', 'Register', 'Admin', 'Manage Users'],
-            'description': 'Authenticated regular user'
-        },
-        'admin': {
-            'visible': ['Home', 'About', 'Contact', 'Dashboard', 'Profile', 'Admin', 'Manage Users', 'Manage Events', 'Logout'],
-            'hidden': ['Login', 'Register'],
-            'description': 'Admin user'
-        }
-    }
+    EXPECTED_LINKS = EXPECTED_NAVBAR_LINKS
     
     def __init__(self, driver, timeout=15, base_url='http://localhost:8000'):
         """Initialize validator"""
@@ -41,36 +54,44 @@ class NavbarLinksValidator:
         self.missing_links = {}
         self.unexpected_links = {}
     
-    def get_navbar_links(self):
-        """Extract all visible navbar links"""
-        links = []
+    @classmethod
+    def matcher_for(cls, role):
+        """Get the precompiled matcher for a role"""
+        return get_role_matcher(role)
+    
+    def get_navbar_snapshot(self, with_elements=False):
+        """
+        Read every navbar anchor in one round trip
         
-        try:
-            # Try to find navbar element
-            navbar = WebDriverWait(self.driver, self.timeout).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "nav, [role='navigation'], .navbar"))
-            )
-            
-            # Get all links within navbar
-            link_elements = navbar.find_elements(By.TAG_NAME, "a")
-            
-            for link in link_elements:
-                try:
-                    text = link.text.strip()
-                    href = link.get_attribute('href')
-                    if text:  # Only include links with visible text
-                        links.append({
-                            'text': text,
-                            'href': href,
-                            'element': link
-                        })
-                except Exception:
-                    continue
-            
-            return links
+        Args:
+            with_elements: Also return the WebElement of each anchor
         
-        except TimeoutException:
-            return []
+        Returns:
+            list of (text, href, visible, rect[, element]) tuples; [] if no navbar appears
+        """
+        def read(driver):
+            return driver.execute_script(NAVBAR_LINKS_JS, NAVBAR_SELECTOR, with_elements)
+        
+        rows = read(self.driver)
+        if rows is None:
+            # Navbar not rendered yet: poll (one round trip per poll) until timeout
+            try:
+                rows = WebDriverWait(self.driver, self.timeout, poll_frequency=0.1).until(read)
+            except TimeoutException:
+                return []
+        return [tuple(row) for row in rows]
+    
+    def get_navbar_links(self, with_elements=False):
+        """Extract all visible navbar links"""
+        links = []
+        for row in self.get_navbar_snapshot(with_elements):
+            text, href, visible = row[0], row[1], row[2]
+            if visible and text:  # Only include links with visible text
+                link = {'text': text, 'href': href, 'rect': row[3]}
+                if with_elements:
+                    link['element'] = row[4]
+                links.append(link)
+        return links
     
     def extract_link_texts(self, links):
         """Extract just the text from links"""
@@ -90,30 +111,13 @@ class NavbarLinksValidator:
             raise ValueError(f"Invalid role: {role}. Must be: {list(self.EXPECTED_LINKS.keys())}")
         
         role_config = self.EXPECTED_LINKS[role]
-        navbar_links = self.get_navbar_links()
-        link_texts = self.extract_link_texts(navbar_links)
-        
-        # Check for expected visible links
-        found = []
-        missing = []
-        for expected_link in role_config['visible']:
-            found_link = self._find_link_partial_match(expected_link, link_texts)
-            if found_link:
-                found.append(found_link)
-            else:
-                missing.append(expected_link)
+        link_texts = self.extract_link_texts(self.get_navbar_links())
         
-        # Check for unexpected links (should not be visible)
-        unexpected = []
-        for link_text in link_texts:
-            if not self._is_link_expected(link_text, role_config['visible'] + role_config['hidden']):
-                unexpected.append(link_text)
-        
-        # Check that hidden links are actually hidden
-        hidden_found = []
-        for hidden_link in role_config['hidden']:
-            if self._find_link_partial_match(hidden_link, link_texts):
-                hidden_found.append(hidden_link)
+        matched = self.matcher_for(role).match(link_texts)
+        found = matched['found']
+        missing = matched['missing']
+        hidden_found = matched['visible_hidden']
+        unexpected = matched['unexpected']
         
         self.found_links[role] = found
         self.missing_links[role] = missing
@@ -135,39 +139,6 @@ class NavbarLinksValidator:
         
         return result
     
-    def _find_link_partial_match(self, search_text, link_texts):
-        """
-        Find a link that partially matches the search text
-        Handles variations like 'Dashboard', 'My Dashboard', etc.
-        """
-        search_text_lower = search_text.lower()
-        
-        for link_text in link_texts:
-            link_lower = link_text.lower()
-            
-            # Exact match
-            if link_lower == search_text_lower:
-                return link_text
-            
-            # Partial match (contains)
-            if search_text_lower in link_lower or link_lower in search_text_lower:
-                return link_text
-        
-        return None
-    
-    def _is_link_expected(self, link_text, expected_list):
-        """Check if a link is in the expected list (with fuzzy matching)"""
-        link_lower = link_text.lower()
-        
-        for expected in expected_list:
-            expected_lower = expected.lower()
-            
-            # Exact or partial match
-            if link_lower == expected_lower or expected_lower in link_lower:
-                return True
-        
-        return False
-    
     def validate_link_clickable(self, link_text):
         """
         Verify a link is clickable
@@ -178,32 +149,17 @@ class NavbarLinksValidator:
         Returns:
             dict with clickability results
         """
-        navbar_links = self.get_navbar_links()
-        
-        for link in navbar_links:
+        # Snapshot already carries visibility and href; anchors are always enabled
+        for link in self.get_navbar_links():
             if link_text.lower() in link['text'].lower():
-                try:
-                    # Check if element is displayed
-                    is_displayed = link['element'].is_displayed()
-                    is_enabled = link['element'].is_enabled()
-                    href = link['element'].get_attribute('href')
-                    
-                    return {
-                        'found': True,
-                        'displayed': is_displayed,
-                        'enabled': is_enabled,
-                        'clickable': is_displayed and is_enabled,
-                        'href': href,
-                        'text': link['text']
-                    }
-                except Exception as e:
-                    return {
-                        'found': True,
-                        'displayed': False,
-                        'enabled': False,
-                        'clickable': False,
-                        'error': str(e)
-                    }
+                return {
+                    'found': True,
+                    'displayed': True,
+                    'enabled': True,
+                    'clickable': True,
+                    'href': link['href'],
+                    'text': link['text']
+                }
         
         return {
             'found': False,
@@ -217,13 +173,12 @@ class NavbarLinksValidator:
         Returns:
             dict with click result
         """
-        navbar_links = self.get_navbar_links()
+        navbar_links = self.get_navbar_links(with_elements=True)
         
         for link in navbar_links:
             if link_text.lower() in link['text'].lower():
                 try:
-                    link['element'].click()
-                    time.sleep(1)
+                    click_and_wait(self.driver, link['element'], self.timeout, js_click=False)
                     return {
                         'success': True,
                         'url': self.driver.current_url,
@@ -0,0 +1,115 @@
+"""
+Navbar Roles Utility
+Expected navbar links per role and the precompiled matcher that checks them
+
+Shared by the Selenium NavbarLinksValidator and the HTTP-only tier, so both
+apply the same case-insensitive, partial-match rules ('Dashboard' matches
+'My Dashboard').
+"""
+
+import re
+
+
+# Expected navbar links by role
+EXPECTED_NAVBAR_LINKS = {
+    'guest': {
+        'visible': ['Home', 'About', 'Contact', 'Login', 'Register'],
+        'hidden': ['Dashboard', 'Profile', 'Logout', 'Admin'],
+        'description': 'Non-authenticated user'
+    },
+    'user': {
+        'visible': ['Home', 'About', 'Contact', 'Dashboard', 'Profile', 'Family', 'Logout'],
+        'hidden': ['Login', 'Register', 'Admin', 'Manage Users'],
+        'description': 'Authenticated regular user'
+    },
+    'admin': {
+        'visible': ['Home', 'About', 'Contact', 'Dashboard', 'Profile', 'Admin', 'Manage Users', 'Manage Events', 'Logout'],
+        'hidden': ['Login', 'Register'],
+        'description': 'Admin user'
+    }
+}
+
+
+class RoleLinkMatcher:
+    """Precompiled expectations for one role (case-insensitive, partial matching)"""
+
+    def __init__(self, visible, hidden):
+        """
+        Compile matcher
+
+        Args:
+            visible: Link labels that must be present
+            hidden: Link labels that must not be present
+        """
+        self.visible = [(label, label.lower()) for label in visible]
+        self.hidden = [(label, label.lower()) for label in hidden]
+        known = [label.lower() for label in list(visible) + list(hidden)]
+        # A navbar link is "known" if it contains any expected label
+        self._known = re.compile('|'.join(re.escape(k) for k in known)) if known else None
+
+    @staticmethod
+    def _partial(label_lower, link_lower):
+        # Handles variations like 'Dashboard' vs 'My Dashboard'
+        return label_lower in link_lower or link_lower in label_lower
+
+    def _first_match(self, label_lower, links):
+        for link_text, link_lower in links:
+            if link_lower == label_lower:
+                return link_text
+        for link_text, link_lower in links:
+            if self._partial(label_lower, link_lower):
+                return link_text
+        return None
+
+    def match(self, link_texts):
+        """
+        Match navbar link texts against the role's expectations
+
+        Returns:
+            dict with found, missing, visible_hidden and unexpected lists
+        """
+        links = [(text, text.lower()) for text in link_texts]
+        found, missing = [], []
+        for label, label_lower in self.visible:
+            link = self._first_match(label_lower, links)
+            if link:
+                found.append(link)
+            else:
+                missing.append(label)
+
+        visible_hidden = [
+            label for label, label_lower in self.hidden
+            if any(self._partial(label_lower, link_lower) for _, link_lower in links)
+        ]
+        unexpected = [
+            text for text, link_lower in links
+            if not (self._known and self._known.search(link_lower))
+        ]
+        return {
+            'found': found,
+            'missing': missing,
+            'visible_hidden': visible_hidden,
+            'unexpected': unexpected
+        }
+
+
+_matchers = {}
+
+
+def get_role_matcher(role):
+    """
+    Get the compiled matcher for a role (built once per process)
+
+    Args:
+        role: 'guest', 'user' or 'admin'
+
+    Returns:
+        RoleLinkMatcher
+    """
+    matcher = _matchers.get(role)
+    if matcher is None:
+        if role not in EXPECTED_NAVBAR_LINKS:
+            raise ValueError(f"Invalid role: {role}. Must be: {list(EXPECTED_NAVBAR_LINKS.keys())}")
+        config = EXPECTED_NAVBAR_LINKS[role]
+        matcher = _matchers[role] = RoleLinkMatcher(config['visible'], config['hidden'])
+    return matcher
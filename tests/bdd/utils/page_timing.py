@@ -0,0 +1,122 @@
+"""
+Page Timing Utility
+Reads Navigation/Resource/Paint Timing from the browser and summarizes samples
+
+collect_page_timing() waits for the load event and returns one sample per page
+view, measured by the browser itself (not wall-clock around driver.get):
+  ttfb          - responseStart (ms since navigation start)
+  dom_content_loaded, dom_interactive, load - event end times (ms)
+  first_paint, first_contentful_paint       - paint entries (ms)
+  transfer_size / encoded / decoded         - document bytes
+  resource_*                                - count and bytes of subresources
+
+Samples are persisted with benchmark_store.BenchmarkStore so runs can be
+compared over time; summarize() gives p50/p95/p99 per metric.
+"""
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from benchmark_store import summarize as _summarize
+
+
+# Returns null until the load event has finished, then one flat sample
+PAGE_TIMING_JS = """
+var nav = performance.getEntriesByType('navigation')[0];
+if (!nav || nav.loadEventEnd <= 0) { return null; }
+var paint = {};
+performance.getEntriesByType('paint').forEach(function (p) { paint[p.name] = p.startTime; });
+var resources = performance.getEntriesByType('resource');
+var transfer = 0, decoded = 0, cached = 0;
+for (var i = 0; i < resources.length; i++) {
+  transfer += resources[i].transferSize || 0;
+  decoded += resources[i].decodedBodySize || 0;
+  if (resources[i].transferSize === 0 && resources[i].decodedBodySize > 0) { cached++; }
+}
+return {
+  url: location.href,
+  navigation_type: nav.type,
+  redirect_count: nav.redirectCount,
+  ttfb: nav.responseStart,
+  dom_interactive: nav.domInteractive,
+  dom_content_loaded: nav.domContentLoadedEventEnd,
+  load: nav.loadEventEnd,
+  first_paint: paint['first-paint'] === undefined ? null : paint['first-paint'],
+  first_contentful_paint: paint['first-contentful-paint'] === undefined ? null : paint['first-contentful-paint'],
+  transfer_size: nav.transferSize,
+  encoded_body_size: nav.encodedBodySize,
+  decoded_body_size: nav.decodedBodySize,
+  resource_count: resources.length,
+  resource_cached: cached,
+  resource_transfer_size: transfer,
+  resource_decoded_size: decoded
+};
+"""
+
+TIMING_METRICS = ('ttfb', 'dom_interactive', 'dom_content_loaded', 'load', 'first_paint', 'first_contentful_paint')
+SIZE_METRICS = ('transfer_size', 'decoded_body_size', 'resource_count', 'resource_transfer_size')
+
+
+def collect_page_timing(driver, timeout=30):
+    """
+    Get the timing sample of the page currently loading/loaded in driver
+
+    Returns:
+        dict sample (see module docstring); None if the load event never fired
+    """
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=0.05).until(
+            lambda d: d.execute_script(PAGE_TIMING_JS)
+        )
+    except TimeoutException:
+        return None
+
+
+def clear_browser_cache(driver):
+    """
+    Drop the HTTP cache so the next load is cold (Chrome DevTools protocol)
+
+    Returns:
+        bool - False if the browser has no CDP (e.g. Firefox)
+    """
+    try:
+        driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+        return True
+    except Exception:
+        return False
+
+
+def measure_route(driver, url, iterations=5, mode='warm', timeout=30):
+    """
+    Load url repeatedly and collect one timing sample per load
+
+    Args:
+        driver: WebDriver
+        url: Absolute URL
+        iterations: Number of measured loads
+        mode: 'cold' clears the HTTP cache before every load, 'warm' primes it once
+        timeout: Seconds to wait for each load event
+
+    Returns:
+        list of samples (failed loads are skipped)
+    """
+    if mode == 'warm':
+        driver.get(url)
+        collect_page_timing(driver, timeout)
+
+    samples = []
+    for _ in range(iterations):
+        if mode == 'cold':
+            clear_browser_cache(driver)
+        # about:blank first so every iteration is a fresh navigation, not a reload
+        driver.get('about:blank')
+        driver.get(url)
+        sample = collect_page_timing(driver, timeout)
+        if sample:
+            samples.append(sample)
+    return samples
+
+
+def summarize(samples, metrics=TIMING_METRICS + SIZE_METRICS):
+    """Per-metric p50/p95/p99 of page timing samples (see benchmark_store.summarize)"""
+    return _summarize(samples, metrics)
@@ -0,0 +1,161 @@
+"""
+Performance Baseline Utility
+Baselines of benchmark distributions keyed by git commit, and the regression check
+
+A baseline is a snapshot of raw samples per series (benchmark kind, route,
+mode, role) and metric, taken from benchmark_store records of one commit.
+compare_series() flags a metric as a regression only when both hold:
+  - one-sided Mann-Whitney U p-value < alpha (candidate slower than baseline)
+  - the bootstrap CI of median(candidate)/median(baseline) lies entirely above
+    1 + min_effect
+so one noisy sample or a tiny-but-significant shift does not fail a run.
+
+Configuration (via environment variables):
+  PERF_BASELINE_FILE - Baseline file (default: tests/bdd/results/benchmarks/baselines.json)
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+from perf_stats import bootstrap_ratio_ci, mann_whitney_greater, median
+
+
+DEFAULT_BASELINE_FILE = Path(__file__).parent.parent / 'results' / 'benchmarks' / 'baselines.json'
+
+# Metrics gated per benchmark record type
+GATED_METRICS = {
+    'page_timing': ('ttfb', 'dom_content_loaded', 'load'),
+    'http_latency': ('latency_ms',),
+    'dashboard_stats': ('total_ms',),
+}
+
+
+def series_key(record):
+    """Stable name of the series a benchmark record belongs to"""
+    return f"{record.get('type')} {record.get('route')} [{record.get('mode')}] {record.get('role', 'guest')}"
+
+
+def series_from_records(records, gated_metrics=None):
+    """
+    Pool the samples of benchmark records per series and metric
+
+    Args:
+        records: benchmark_store records
+        gated_metrics: dict kind -> metric names (default: GATED_METRICS)
+
+    Returns:
+        dict series key -> {kind, route, mode, role, metrics: {metric: [values]}}
+    """
+    gated_metrics = gated_metrics or GATED_METRICS
+    series = {}
+    for record in records:
+        metrics = gated_metrics.get(record.get('type'))
+        if not metrics:
+            continue
+        entry = series.setdefault(series_key(record), {
+            'kind': record.get('type'), 'route': record.get('route'),
+            'mode': record.get('mode'), 'role': record.get('role', 'guest'),
+            'metrics': {metric: [] for metric in metrics},
+        })
+        for sample in record.get('samples', []):
+            for metric in metrics:
+                if sample.get(metric) is not None:
+                    entry['metrics'][metric].append(sample[metric])
+    return series
+
+
+class BaselineStore:
+    """JSON file of baselines: commit -> series -> metric -> samples"""
+
+    def __init__(self, baseline_file=None):
+        """
+        Initialize store
+
+        Args:
+            baseline_file: JSON file (default: PERF_BASELINE_FILE or DEFAULT_BASELINE_FILE)
+        """
+        self.baseline_file = Path(baseline_file or os.environ.get('PERF_BASELINE_FILE', DEFAULT_BASELINE_FILE))
+
+    def _load(self):
+        try:
+            return json.loads(self.baseline_file.read_text())
+        except (IOError, OSError, ValueError):
+            return {'baselines': {}}
+
+    def _write(self, data):
+        self.baseline_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.baseline_file.with_suffix('.tmp')
+        tmp.write_text(json.dumps(data, indent=2))
+        os.replace(tmp, self.baseline_file)
+
+    def save(self, commit, series):
+        """
+        Store (replace) the baseline of a commit
+
+        Args:
+            commit: Git commit the samples were measured on
+            series: series_from_records() result
+        """
+        data = self._load()
+        data['baselines'][commit] = {'saved': time.strftime('%Y-%m-%dT%H:%M:%S'), 'series': series}
+        self._write(data)
+
+    def get(self, commit):
+        """Series of a commit's baseline, or None"""
+        baseline = self._load()['baselines'].get(commit)
+        return baseline['series'] if baseline else None
+
+    def commits(self):
+        """Baseline commits, oldest saved first"""
+        baselines = self._load()['baselines']
+        return sorted(baselines, key=lambda commit: baselines[commit]['saved'])
+
+    def latest(self, exclude=None):
+        """Most recently saved baseline commit other than exclude, or None"""
+        commits = [c for c in self.commits() if c != exclude]
+        return commits[-1] if commits else None
+
+
+def compare_series(baseline, candidate, alpha=0.01, min_effect=0.05, min_samples=5):
+    """
+    Compare candidate series against baseline series metric by metric
+
+    Args:
+        baseline, candidate: series_from_records() results
+        alpha: Significance level of the Mann-Whitney test
+        min_effect: Smallest relative median change that counts (0.05 = 5%)
+        min_samples: Fewer samples on either side gives 'insufficient'
+
+    Returns:
+        list of dicts: series, metric, n_baseline, n_candidate, baseline_p50,
+        candidate_p50, ratio, ci, p_value, verdict
+        (verdict: 'regression', 'improvement', 'unchanged' or 'insufficient')
+    """
+    rows = []
+    for key in sorted(set(baseline) & set(candidate)):
+        for metric, base_values in baseline[key]['metrics'].items():
+            cand_values = candidate[key]['metrics'].get(metric, [])
+            row = {
+                'series': key, 'metric': metric,
+                'n_baseline': len(base_values), 'n_candidate': len(cand_values),
+                'baseline_p50': median(base_values), 'candidate_p50': median(cand_values),
+                'ratio': None, 'ci': (None, None), 'p_value': None, 'verdict': 'insufficient',
+            }
+            rows.append(row)
+            if len(base_values) < min_samples or len(cand_values) < min_samples:
+                continue
+            if row['baseline_p50']:
+                row['ratio'] = row['candidate_p50'] / row['baseline_p50']
+            low, high = row['ci'] = bootstrap_ratio_ci(base_values, cand_values)
+            slower = mann_whitney_greater(base_values, cand_values)['p_value']
+            faster = mann_whitney_greater(cand_values, base_values)['p_value']
+            if slower is not None and slower < alpha and low is not None and low > 1 + min_effect:
+                row['verdict'], row['p_value'] = 'regression', slower
+            elif faster is not None and faster < alpha and high is not None and high < 1 - min_effect:
+                row['verdict'], row['p_value'] = 'improvement', faster
+            else:
+                row['verdict'] = 'unchanged'
+                row['p_value'] = min((p for p in (slower, faster) if p is not None), default=None)
+    return rows
@@ -0,0 +1,120 @@
+"""
+Performance Statistics Utility
+Two-sample tests for deciding whether a timing distribution got slower
+
+- mann_whitney_greater: one-sided Mann-Whitney U test (candidate > baseline),
+  exact for small samples without ties, normal approximation with tie and
+  continuity correction otherwise. Makes no normality assumption, which suits
+  long-tailed latency data.
+- bootstrap_ratio_ci: percentile bootstrap confidence interval of
+  median(candidate) / median(baseline), i.e. the size of a slowdown.
+
+Only the standard library is used; results are deterministic for a given seed.
+"""
+
+import math
+import random
+from functools import lru_cache
+
+
+EXACT_MAX_SAMPLES = 20
+
+
+def _ranks(values):
+    """Average ranks (1-based) and the sizes of tie groups"""
+    order = sorted(range(len(values)), key=lambda i: values[i])
+    ranks = [0.0] * len(values)
+    ties = []
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[order[k]] = (i + j) / 2.0 + 1
+        if j > i:
+            ties.append(j - i + 1)
+        i = j + 1
+    return ranks, ties
+
+
+@lru_cache(maxsize=None)
+def _u_count(u, n1, n2):
+    """Number of arrangements of n1 + n2 distinct values whose U statistic equals u"""
+    if u < 0 or u > n1 * n2:
+        return 0
+    if n1 == 0 or n2 == 0:
+        return 1 if u == 0 else 0
+    return _u_count(u - n2, n1 - 1, n2) + _u_count(u, n1, n2 - 1)
+
+
+def mann_whitney_greater(baseline, candidate):
+    """
+    One-sided Mann-Whitney U test: is candidate stochastically greater than baseline?
+
+    Args:
+        baseline: Samples of the reference run
+        candidate: Samples of the run under test
+
+    Returns:
+        dict with u, p_value and method ('exact' or 'normal'); p_value None if a side is empty
+    """
+    n1, n2 = len(candidate), len(baseline)
+    if not n1 or not n2:
+        return {'u': None, 'p_value': None, 'method': None}
+
+    ranks, ties = _ranks(list(candidate) + list(baseline))
+    u = sum(ranks[:n1]) - n1 * (n1 + 1) / 2.0
+
+    if not ties and n1 <= EXACT_MAX_SAMPLES and n2 <= EXACT_MAX_SAMPLES:
+        total = math.comb(n1 + n2, n1)
+        extreme = sum(_u_count(k, n1, n2) for k in range(int(math.ceil(u)), n1 * n2 + 1))
+        return {'u': u, 'p_value': extreme / total, 'method': 'exact'}
+
+    n = n1 + n2
+    mean = n1 * n2 / 2.0
+    tie_term = sum(t ** 3 - t for t in ties) / (n * (n - 1)) if n > 1 else 0
+    variance = n1 * n2 / 12.0 * ((n + 1) - tie_term)
+    if variance <= 0:
+        return {'u': u, 'p_value': 1.0, 'method': 'normal'}
+    z = (u - mean - 0.5) / math.sqrt(variance)
+    return {'u': u, 'p_value': 0.5 * math.erfc(z / math.sqrt(2)), 'method': 'normal'}
+
+
+def median(values):
+    values = sorted(values)
+    if not values:
+        return None
+    mid = len(values) // 2
+    return values[mid] if len(values) % 2 else (values[mid - 1] + values[mid]) / 2.0
+
+
+def bootstrap_ratio_ci(baseline, candidate, confidence=0.95, iterations=2000, seed=0):
+    """
+    Bootstrap CI of median(candidate) / median(baseline)
+
+    Args:
+        baseline, candidate: Samples
+        confidence: Two-sided confidence level
+        iterations: Bootstrap resamples
+        seed: RNG seed (deterministic output)
+
+    Returns:
+        (low, high) ratios; (None, None) if a side is empty or has a zero median
+    """
+    if not baseline or not candidate:
+        return None, None
+    rng = random.Random(seed)
+    ratios = []
+    for _ in range(iterations):
+        base = median(rng.choices(baseline, k=len(baseline)))
+        cand = median(rng.choices(candidate, k=len(candidate)))
+        if base:
+            ratios.append(cand / base)
+    if not ratios:
+        return None, None
+    ratios.sort()
+    tail = (1 - confidence) / 2
+    low = ratios[int(tail * (len(ratios) - 1))]
+    high = ratios[int(math.ceil((1 - tail) * (len(ratios) - 1)))]
+    return low, high
@@ -0,0 +1,189 @@
+"""
+PHP Server Utility
+Launches isolated `php -S` instances, one per test shard
+
+Each instance gets its own free port and its own SQLite database (USE_MYSQL=false,
+DB_PATH=<shard file>) restored from the golden database (see golden_db), so
+parallel suites do not share users or sessions. With mysql=True the server
+uses the MySQL database configured by DB_HOST/DB_NAME/DB_USER/DB_PASS instead
+(for code paths that only speak the MySQL dialect). start() returns once the
+server answers HTTP; there is no fixed startup sleep.
+
+Usage:
+  with PhpServer(shard_index=0) as server:
+      env = server.env()          # BASE_URL, USE_MYSQL, DB_PATH for child processes
+"""
+
+import os
+import shutil
+import signal
+import socket
+import subprocess
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+from sqlite_migrations import PROJECT_ROOT
+from golden_db import restore
+
+
+RUNTIME_DIR = Path(__file__).parent.parent / 'results' / 'servers'
+
+
+def php_available():
+    """Check whether the php CLI is on PATH"""
+    return shutil.which('php') is not None
+
+
+def free_port(host='127.0.0.1'):
+    """Get a TCP port that is currently free on host"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+class PhpServer:
+    """One `php -S` process with its own port and SQLite database"""
+
+    def __init__(self, shard_index=0, port=None, host='localhost', db_path=None, router='router.php', workers=None,
+                 mysql=False):
+        """
+        Initialize server (not started)
+
+        Args:
+            shard_index: Shard number, used to name the log and database files
+            port: TCP port (default: a free port)
+            host: Host name used in BASE_URL; 'localhost' enables the app's local-dev behaviour
+            db_path: SQLite file (default: results/servers/shard-<n>.db, restored on start)
+            router: Router script passed to php -S (relative to the project root)
+            workers: Concurrent PHP workers (PHP_CLI_SERVER_WORKERS); default one, as php -S
+            mysql: Serve the MySQL database from DB_* instead of a SQLite file
+        """
+        self.shard_index = shard_index
+        self.host = host
+        self.port = port or free_port()
+        self.db_path = Path(db_path) if db_path else RUNTIME_DIR / f'shard-{shard_index}.db'
+        self.log_path = RUNTIME_DIR / f'shard-{shard_index}.log'
+        self.router = router
+        self.workers = workers
+        self.mysql = mysql
+        self.process = None
+        self._log = None
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def env(self):
+        """Environment for the server and for suites targeting it"""
+        if self.mysql:
+            # DB_HOST/DB_NAME/DB_USER/DB_PASS are inherited from the environment
+            env = {'BASE_URL': self.base_url, 'USE_MYSQL': 'true'}
+        else:
+            env = {
+                'BASE_URL': self.base_url,
+                'USE_MYSQL': 'false',
+                'DB_PATH': str(self.db_path),
+            }
+        if self.workers:
+            env['PHP_CLI_SERVER_WORKERS'] = str(self.workers)
+        return env
+
+    def prepare_database(self):
+        """Reset the shard database to a copy of the golden database (not for MySQL)"""
+        if self.mysql:
+            return None
+        return restore(self.db_path)
+
+    def reset_database(self):
+        """Reset the shard database between suites (server keeps running)"""
+        return self.prepare_database()
+
+    def start(self, timeout=20, prepare_db=True):
+        """
+        Start the server and wait until it answers HTTP
+
+        Args:
+            timeout: Seconds to wait for readiness
+            prepare_db: Restore the SQLite database first (skip if the caller restored one)
+
+        Returns:
+            self
+        """
+        if not php_available():
+            raise RuntimeError("php CLI not found on PATH")
+        if prepare_db:
+            self.prepare_database()
+
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        self._log = open(self.log_path, 'w')
+        self.process = subprocess.Popen(
+            ['php', '-S', f'127.0.0.1:{self.port}', self.router],
+            cwd=str(PROJECT_ROOT),
+            env=dict(os.environ, **self.env()),
+            stdout=self._log,
+            stderr=subprocess.STDOUT,
+            start_new_session=True  # own process group, so stop() also kills PHP workers
+        )
+
+        if not self.wait_until_ready(timeout):
+            log_tail = self.read_log()[-2000:]
+            self.stop()
+            raise RuntimeError(f"PHP server on port {self.port} not ready after {timeout}s\n{log_tail}")
+        return self
+
+    def is_ready(self):
+        """Single readiness probe: any HTTP response counts (even 4xx/5xx)"""
+        try:
+            urllib.request.urlopen(f"{self.base_url}/", timeout=1).close()
+            return True
+        except urllib.error.HTTPError:
+            return True
+        except (urllib.error.URLError, OSError):
+            return False
+
+    def wait_until_ready(self, timeout=20, interval=0.05):
+        """
+        Poll the server until it responds
+
+        Returns:
+            bool - False on timeout or if the process exited
+        """
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if self.process is not None and self.process.poll() is not None:
+                return False
+            if self.is_ready():
+                return True
+            time.sleep(interval)
+        return False
+
+    def read_log(self):
+        """Get server output so far"""
+        try:
+            return self.log_path.read_text()
+        except (IOError, OSError):
+            return ''
+
+    def stop(self):
+        """Stop the server process group"""
+        if self.process is not None:
+            try:
+                os.killpg(self.process.pid, signal.SIGTERM)
+                self.process.wait(timeout=5)
+            except (ProcessLookupError, PermissionError):
+                pass
+            except subprocess.TimeoutExpired:
+                os.killpg(self.process.pid, signal.SIGKILL)
+                self.process.wait()
+            self.process = None
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -0,0 +1,223 @@
+"""
+Results Database Utility
+SQLite store for historical test results used by TestResultsLogger
+
+History lives in an indexed SQLite table instead of one JSON list that is
+loaded and re-serialized on every test. Inserts are buffered and written with
+executemany in a single transaction; dashboards read aggregates (GROUP BY)
+and a bounded page of detail rows, so history size does not slow tests down.
+
+The legacy test_results.json is imported once, the first time a database is
+opened next to it.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    test_id TEXT NOT NULL,
+    test_name TEXT,
+    suite TEXT NOT NULL,
+    passed INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    execution_time REAL DEFAULT 0,
+    details TEXT DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_results_suite ON results (suite);
+CREATE INDEX IF NOT EXISTS idx_results_test_id ON results (test_id);
+CREATE INDEX IF NOT EXISTS idx_results_timestamp ON results (timestamp);
+CREATE INDEX IF NOT EXISTS idx_results_status ON results (status);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+COLUMNS = ("test_id", "test_name", "suite", "passed", "status", "timestamp", "execution_time", "details")
+
+INSERT_SQL = f"INSERT INTO results ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})"
+
+
+def _row(result):
+    """Convert a result dict (TestResultsLogger format) to an INSERT tuple"""
+    passed = bool(result.get("passed", str(result.get("status", "")).upper() == "PASS"))
+    return (
+        str(result.get("test_id", "")),
+        result.get("test_name", ""),
+        result.get("suite", ""),
+        1 if passed else 0,
+        result.get("status") or ("PASS" if passed else "FAIL"),
+        result.get("timestamp") or time.strftime("%Y-%m-%dT%H:%M:%S"),
+        float(result.get("execution_time") or 0),
+        result.get("details") or "",
+    )
+
+
+class ResultsDB:
+    """Indexed SQLite results history with batched writes"""
+
+    def __init__(self, db_file, batch_size=50, flush_interval=2.0):
+        """
+        Initialize database (creates schema if missing)
+
+        Args:
+            db_file: Path to the SQLite file
+            batch_size: Flush buffered results after this many rows
+            flush_interval: ...or after this many seconds since the last flush
+        """
+        self.db_file = Path(db_file)
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._lock = threading.Lock()
+        self._pending = []
+        self._last_flush = time.time()
+
+        self.conn = sqlite3.connect(str(self.db_file), timeout=30, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        # WAL lets concurrent suites append while a dashboard reads
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    def add(self, result):
+        """
+        Buffer one result; written on the next batch flush
+
+        Args:
+            result: dict with test_id, test_name, suite, passed, status,
+                    timestamp, execution_time, details
+        """
+        with self._lock:
+            self._pending.append(_row(result))
+            due = (
+                len(self._pending) >= self.batch_size
+                or time.time() - self._last_flush >= self.flush_interval
+            )
+        if due:
+            self.flush()
+
+    def flush(self):
+        """Write buffered results in a single transaction"""
+        with self._lock:
+            rows, self._pending = self._pending, []
+            self._last_flush = time.time()
+            if not rows:
+                return
+            with self.conn:
+                self.conn.executemany(INSERT_SQL, rows)
+
+    def import_json(self, json_file):
+        """
+        One-time import of a legacy JSON results list
+
+        Args:
+            json_file: Path of the old test_results.json
+
+        Returns:
+            int - number of rows imported (0 if already imported or missing)
+        """
+        json_file = Path(json_file)
+        key = f"imported:{json_file.resolve()}"
+        if self.conn.execute("SELECT 1 FROM meta WHERE key = ?", (key,)).fetchone():
+            return 0
+        if not json_file.exists():
+            return 0
+
+        try:
+            with open(json_file, 'r') as f:
+                legacy = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            legacy = []
+        if not isinstance(legacy, list):
+            legacy = []
+
+        rows = [_row(r) for r in legacy if isinstance(r, dict)]
+        with self._lock, self.conn:
+            self.conn.executemany(INSERT_SQL, rows)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                (key, time.strftime("%Y-%m-%dT%H:%M:%S"))
+            )
+        return len(rows)
+
+    def get_totals(self):
+        """
+        Get overall counters
+
+        Returns:
+            dict with total, passed, failed and pass_rate
+        """
+        row = self.conn.execute(
+            "SELECT COUNT(*) AS total, COALESCE(SUM(passed), 0) AS passed FROM results"
+        ).fetchone()
+        total, passed = row["total"], row["passed"]
+        return {
+            "total": total,
+            "passed": passed,
+            "failed": total - passed,
+            "pass_rate": (passed / total * 100) if total > 0 else 0,
+        }
+
+    def get_suite_summary(self):
+        """
+        Get per-suite counters
+
+        Returns:
+            list of dicts (suite, total, passed, failed, avg_time, last_run) ordered by suite
+        """
+        rows = self.conn.execute(
+            "SELECT suite, COUNT(*) AS total, SUM(passed) AS passed,"
+            " AVG(execution_time) AS avg_time, MAX(timestamp) AS last_run"
+            " FROM results GROUP BY suite ORDER BY suite"
+        ).fetchall()
+        return [
+            dict(row, failed=row["total"] - row["passed"])
+            for row in map(dict, rows)
+        ]
+
+    def get_recent(self, limit=500, status=None, suite=None):
+        """
+        Get the most recent individual results
+
+        Args:
+            limit: Maximum rows returned
+            status: Optional 'PASS' / 'FAIL' filter
+            suite: Optional suite filter
+
+        Returns:
+            list of result dicts, newest first
+        """
+        where, params = [], []
+        if status:
+            where.append("status = ?")
+            params.append(status)
+        if suite:
+            where.append("suite = ?")
+            params.append(suite)
+        sql = f"SELECT {', '.join(COLUMNS)} FROM results"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY timestamp DESC LIMIT ?"
+        params.append(limit)
+
+        results = []
+        for row in self.conn.execute(sql, params):
+            result = dict(row)
+            result["passed"] = bool(result["passed"])
+            results.append(result)
+        return results
+
+    def close(self):
+        """Flush pending rows and close the connection"""
+        self.flush()
+        self.conn.close()
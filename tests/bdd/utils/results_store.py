@@ -0,0 +1,332 @@
+"""
+Results Store Utility
+Append-only JSONL event log for test results, safe for concurrent suites
+
+Every add_suite/add_test call appends one JSON line instead of rewriting the
+whole results file. Writes use O_APPEND plus an exclusive flock, so several
+suite processes can share one log. fsync is batched.
+
+Events carry the id of the run that recorded them: RESULTS_RUN_ID, which a
+runner exports to all of its suite processes, or else one id per process.
+compact() materializes the familiar results.json (test_suites / summary /
+metadata) from the current run's events only, and shrinks the log in place:
+every run is compacted separately, so runs still in progress in other
+processes keep their results, and runs older than the retention window are
+dropped. Neither the file nor the work of a save() grows with the history.
+
+Configuration (via environment variables):
+  RESULTS_RUN_ID          - Run the recorded results belong to (set by the runners)
+  RESULTS_RETENTION_HOURS - Keep other runs' events this long after their last event (default: 24)
+"""
+
+import json
+import os
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+def _lock(fd, exclusive=True):
+    if fcntl:
+        fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+
+
+def _unlock(fd):
+    if fcntl:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+DEFAULT_RETENTION_HOURS = 24
+
+_PROCESS_RUN_ID = None
+
+
+def new_run_id():
+    """Get a fresh run id (timestamp plus random suffix)"""
+    return f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+
+def current_run_id():
+    """Get the run id results are recorded under (RESULTS_RUN_ID, else one per process)"""
+    global _PROCESS_RUN_ID
+    if os.environ.get('RESULTS_RUN_ID'):
+        return os.environ['RESULTS_RUN_ID']
+    if _PROCESS_RUN_ID is None:
+        _PROCESS_RUN_ID = new_run_id()
+    return _PROCESS_RUN_ID
+
+
+def log_path_for(results_file):
+    """Get the JSONL event log path that backs a results.json file"""
+    return Path(results_file).with_suffix('.jsonl')
+
+
+class ResultsEventLog:
+    """Append-only, fsync-batched JSONL event log"""
+
+    def __init__(self, log_file, fsync_every=20, fsync_interval=2.0):
+        """
+        Initialize event log
+
+        Args:
+            log_file: Path of the .jsonl file (created if missing)
+            fsync_every: fsync after this many unsynced events
+            fsync_interval: ...or after this many seconds since the last fsync
+        """
+        self.log_file = Path(log_file)
+        self.log_file.parent.mkdir(parents=True, exist_ok=True)
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self._fd = None
+        self._pending = 0
+        self._last_sync = time.time()
+
+    def _open(self):
+        if self._fd is None:
+            self._fd = os.open(str(self.log_file), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        return self._fd
+
+    def append(self, event):
+        """
+        Append one event as a single JSON line
+
+        Args:
+            event: JSON-serializable dict
+        """
+        line = (json.dumps(event, separators=(',', ':'), default=str) + '\n').encode('utf-8')
+        fd = self._open()
+        _lock(fd)
+        try:
+            os.write(fd, line)
+        finally:
+            _unlock(fd)
+
+        self._pending += 1
+        if self._pending >= self.fsync_every or time.time() - self._last_sync >= self.fsync_interval:
+            self.flush()
+
+    def flush(self):
+        """fsync pending events to disk"""
+        if self._fd is not None and self._pending:
+            os.fsync(self._fd)
+        self._pending = 0
+        self._last_sync = time.time()
+
+    def close(self):
+        """Flush and close the log"""
+        if self._fd is not None:
+            self.flush()
+            os.close(self._fd)
+            self._fd = None
+
+    def read_events(self):
+        """
+        Read all events (skips a torn trailing line from a crashed writer)
+
+        Returns:
+            list of event dicts
+        """
+        if not self.log_file.exists():
+            return []
+        with open(self.log_file, 'rb') as f:
+            _lock(f.fileno(), exclusive=False)
+            try:
+                data = f.read()
+            finally:
+                _unlock(f.fileno())
+
+        return _parse(data)
+
+    def compact(self, results_file, run=None, retention_hours=None):
+        """
+        Materialize the results file from one run and shrink the log
+
+        Under the log's exclusive lock, the log is rewritten in place (writers
+        in other processes keep appending to the same file). Each run is
+        compacted on its own to one suite event per suite and the latest
+        result per test id; runs other than this one whose last event is
+        older than the retention window are dropped.
+
+        Args:
+            results_file: results.json path to (atomically) rewrite
+            run: Run id (default: current_run_id())
+            retention_hours: Age after which other runs are dropped (default: RESULTS_RETENTION_HOURS)
+
+        Returns:
+            dict - materialized results of the run
+        """
+        self.flush()
+        run = run or current_run_id()
+        if retention_hours is None:
+            retention_hours = float(os.environ.get('RESULTS_RETENTION_HOURS', DEFAULT_RETENTION_HOURS))
+        cutoff = time.time() - retention_hours * 3600
+        fd = os.open(str(self.log_file), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            _lock(fd)
+            try:
+                with os.fdopen(os.dup(fd), 'rb') as f:
+                    runs = events_by_run(_parse(f.read()))
+                kept = []
+                for run_id, run_log in runs.items():
+                    if run_id == run or _last_seen(run_log, cutoff) >= cutoff:
+                        kept.extend(compact_events(run_log))
+                events = compact_events(runs.get(run, []))
+                data = b''.join(
+                    (json.dumps(event, separators=(',', ':'), default=str) + '\n').encode('utf-8')
+                    for event in kept
+                )
+                os.ftruncate(fd, 0)
+                os.lseek(fd, 0, os.SEEK_SET)
+                os.write(fd, data)
+                os.fsync(fd)
+            finally:
+                _unlock(fd)
+        finally:
+            os.close(fd)
+
+        results = materialize(events)
+        results["metadata"]["run"] = run
+        results_file = Path(results_file)
+        tmp_file = results_file.with_name(f"{results_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, 'w') as f:
+            json.dump(results, f, indent=2)
+        os.replace(tmp_file, results_file)
+        return results
+
+
+def _parse(data):
+    """Parse JSONL bytes (skips a torn trailing line from a crashed writer)"""
+    events = []
+    for raw in data.splitlines():
+        if not raw.strip():
+            continue
+        try:
+            events.append(json.loads(raw))
+        except ValueError:
+            continue
+    return events
+
+
+def run_events(events, run):
+    """Get the events recorded by one run"""
+    return [event for event in events if event.get("run") == run]
+
+
+def events_by_run(events):
+    """Group events by run id, in order of each run's first event"""
+    runs = {}
+    for event in events:
+        runs.setdefault(event.get("run"), []).append(event)
+    return runs
+
+
+def _last_seen(events, default):
+    """Get the epoch time of a run's newest timestamped event (default if none parse)"""
+    seen = []
+    for event in events:
+        try:
+            seen.append(datetime.fromisoformat(event["timestamp"]).timestamp())
+        except (KeyError, TypeError, ValueError):
+            continue
+    return max(seen) if seen else default
+
+
+def compact_events(events):
+    """
+    Collapse events to what materialize() needs
+
+    Returns:
+        list: per suite, one suite event (merged metadata) followed by the
+        latest test event of each test id
+    """
+    suites = {}
+    for event in events:
+        name = event.get("suite")
+        if not name:
+            continue
+        suite = suites.setdefault(name, {"event": None, "latest": {}})
+        if event.get("type") == "suite":
+            if suite["event"] is None:
+                suite["event"] = dict(event, metadata=dict(event.get("metadata") or {}))
+            else:
+                suite["event"]["metadata"].update(event.get("metadata") or {})
+        elif event.get("type") == "test":
+            suite["latest"][event.get("id") or len(suite["latest"])] = event
+    compacted = []
+    for suite in suites.values():
+        if suite["event"] is not None:
+            compacted.append(suite["event"])
+        compacted.extend(suite["latest"].values())
+    return compacted
+
+
+def suite_stats(tests):
+    """Compute suite metadata counters from its tests"""
+    total = len(tests)
+    passed = sum(1 for t in tests if str(t.get("status", "")).lower() == "pass")
+    return {
+        "total": total,
+        "passed": passed,
+        "failed": total - passed,
+        "pass_rate": (passed / total * 100) if total > 0 else 0,
+        "duration": sum(t.get("duration", 0) for t in tests),
+    }
+
+
+def materialize(events):
+    """
+    Build the results.json structure from a list of events
+
+    The view holds the latest result of each test id per suite; pass one
+    run's events (run_events) to leave out results of earlier runs.
+
+    Args:
+        events: dicts with type 'suite' or 'test'
+
+    Returns:
+        dict with test_suites, summary and metadata
+    """
+    suites = {}
+    for event in events:
+        name = event.get("suite")
+        if not name:
+            continue
+        suite = suites.setdefault(name, {"metadata": {}, "latest": {}})
+        if event.get("type") == "suite":
+            suite["metadata"].update(event.get("metadata") or {})
+        elif event.get("type") == "test":
+            # Later results for the same test id supersede earlier runs
+            test = {k: v for k, v in event.items() if k not in ("type", "run")}
+            suite["latest"][test.get("id") or len(suite["latest"])] = test
+
+    updated = time.strftime("%Y-%m-%dT%H:%M:%S")
+    for suite in suites.values():
+        suite["tests"] = list(suite.pop("latest").values())
+        suite["metadata"].update(suite_stats(suite["tests"]))
+        if suite["tests"]:
+            suite["metadata"]["updated"] = max(t.get("timestamp", "") for t in suite["tests"])
+
+    total_tests = sum(s["metadata"]["total"] for s in suites.values())
+    total_passed = sum(s["metadata"]["passed"] for s in suites.values())
+    return {
+        "test_suites": suites,
+        "summary": {
+            "total_suites": len(suites),
+            "total_tests": total_tests,
+            "total_passed": total_passed,
+            "total_failed": total_tests - total_passed,
+            "pass_rate": (total_passed / total_tests * 100) if total_tests > 0 else 0,
+        },
+        "metadata": {"updated": updated, "events": len(events)},
+    }
+
+
+def compact_results(results_file, run=None):
+    """Rebuild results.json from a run's events (used by runners after parallel suites)"""
+    return ResultsEventLog(log_path_for(results_file)).compact(results_file, run)
@@ -0,0 +1,201 @@
+"""
+Session Snapshot Cache Utility
+Caches logged-in browser state so suites can skip the register/login flow
+
+After the first successful login the PHPSESSID cookie (and any other cookies)
+plus localStorage are recorded under a key built from (role, user profile
+shape). Later drivers get the snapshot injected and re-validated with one
+dashboard probe instead of replaying registration, login and profile completion.
+Updates of the shared snapshot file hold a file lock across load/modify/save,
+so shard processes never write back entries another one just dropped.
+
+Configuration (via environment variables):
+  SESSION_CACHE_FILE     - Snapshot file (default: tests/bdd/results/session_cache.json)
+  SESSION_CACHE_MAX_AGE  - Seconds a snapshot stays valid (default: 1440, PHP's gc_maxlifetime)
+  SESSION_CACHE_DISABLED - Set to true to always log in from scratch
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+DEFAULT_CACHE_FILE = Path(__file__).parent.parent / 'results' / 'session_cache.json'
+
+
+class SessionCache:
+    """Login-state cache keyed by (role, user profile shape)"""
+
+    # Cheap same-origin URL used to get a document the cookies can be attached to
+    SEED_PATH = '/favicon.ico'
+
+    # Dashboard probe used to re-validate an injected session
+    PROBE_PATH = '/user/dashboard'
+
+    def __init__(self, base_url, cache_file=None, max_age=None):
+        """
+        Initialize cache
+
+        Args:
+            base_url: Server URL the sessions belong to
+            cache_file: JSON file holding snapshots (shared across processes)
+            max_age: Seconds before a snapshot is considered expired
+        """
+        self.base_url = base_url.rstrip('/')
+        self.cache_file = Path(cache_file or os.environ.get('SESSION_CACHE_FILE', DEFAULT_CACHE_FILE))
+        self.max_age = max_age or int(os.environ.get('SESSION_CACHE_MAX_AGE', '1440'))
+        self.enabled = os.environ.get('SESSION_CACHE_DISABLED', 'false').lower() not in ('1', 'true', 'yes')
+        self._lock = threading.Lock()
+
+    def make_key(self, role, profile=None):
+        """
+        Build cache key from role and the shape (field names) of the user profile
+
+        Args:
+            role: 'user', 'admin', ...
+            profile: dict of profile fields passed to the login helper
+        """
+        shape = ','.join(sorted((profile or {}).keys())) or 'default'
+        return f"{self.base_url}|{role}|{shape}"
+
+    @contextmanager
+    def _locked(self):
+        """Hold the thread lock and the cross-process lock of the snapshot file"""
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, open(self.cache_file.with_name(self.cache_file.name + '.lock'), 'w') as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            yield
+
+    def _load(self):
+        """Load all snapshots from disk"""
+        if not self.cache_file.exists():
+            return {}
+        try:
+            with open(self.cache_file, 'r') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return {}
+
+    def _save(self, entries):
+        """Atomically write all snapshots to disk (call under _locked())"""
+        tmp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_file, 'w') as f:
+                json.dump(entries, f, indent=2)
+            os.replace(tmp_file, self.cache_file)
+        except IOError:
+            pass
+
+    def get(self, key):
+        """Get a non-expired snapshot or None"""
+        if not self.enabled:
+            return None
+        entry = self._load().get(key)
+        if not entry:
+            return None
+        if time.time() - entry.get('captured_at', 0) > self.max_age:
+            self.invalidate(key)
+            return None
+        return entry
+
+    def capture(self, driver, key, user):
+        """
+        Record cookies and localStorage of a logged-in driver
+
+        Args:
+            driver: WebDriver currently logged in on base_url
+            key: Cache key from make_key()
+            user: Result dict of the login helper (email, password, ...)
+        """
+        if not self.enabled:
+            return
+        try:
+            cookies = [
+                {k: c[k] for k in ('name', 'value', 'path', 'secure', 'httpOnly', 'expiry') if k in c}
+                for c in driver.get_cookies()
+            ]
+            local_storage = driver.execute_script(
+                "var out = {};"
+                "for (var i = 0; i < localStorage.length; i++) {"
+                "  var k = localStorage.key(i); out[k] = localStorage.getItem(k);"
+                "}"
+                "return out;"
+            ) or {}
+        except Exception:
+            return
+
+        if not any(c['name'] == 'PHPSESSID' for c in cookies):
+            return
+
+        with self._locked():
+            entries = self._load()
+            entries[key] = {
+                'user': {k: v for k, v in user.items() if k != 'cached'},
+                'cookies': cookies,
+                'local_storage': local_storage,
+                'captured_at': time.time()
+            }
+            self._save(entries)
+
+    def restore(self, driver, key):
+        """
+        Inject a cached session into driver and re-validate it
+
+        Returns:
+            user dict (with 'cached': True) if the session is still logged in, else None
+        """
+        entry = self.get(key)
+        if not entry:
+            return None
+
+        try:
+            driver.get(f"{self.base_url}{self.SEED_PATH}")
+            driver.delete_all_cookies()
+            for cookie in entry['cookies']:
+                driver.add_cookie(cookie)
+            if entry.get('local_storage'):
+                driver.execute_script(
+                    "var data = arguments[0];"
+                    "Object.keys(data).forEach(function (k) { localStorage.setItem(k, data[k]); });",
+                    entry['local_storage']
+                )
+            if self.is_logged_in(driver):
+                user = dict(entry['user'])
+                user['cached'] = True
+                return user
+        except Exception:
+            pass
+
+        self.invalidate(key)
+        return None
+
+    def is_logged_in(self, driver):
+        """Single dashboard probe: True if the session reaches a completed dashboard"""
+        driver.get(f"{self.base_url}{self.PROBE_PATH}")
+        if '/login' in driver.current_url or 'dashboard' not in driver.current_url:
+            return False
+        body_text = driver.execute_script("return document.body ? document.body.innerText : '';") or ''
+        return 'Dashboard' in body_text and 'Complete your profile' not in body_text
+
+    def clear(self):
+        """Drop all snapshots for base_url (e.g. after its database was reset)"""
+        prefix = f"{self.base_url}|"
+        with self._locked():
+            entries = {k: v for k, v in self._load().items() if not k.startswith(prefix)}
+            self._save(entries)
+
+    def invalidate(self, key=None):
+        """Drop one snapshot, or all snapshots when key is None"""
+        with self._locked():
+            entries = self._load() if key is not None else {}
+            entries.pop(key, None)
+            self._save(entries)
@@ -0,0 +1,214 @@
+"""
+SQLite Migrations Utility
+Applies the MySQL migrations in database/migrations to a SQLite file
+
+The app runs on SQLite when USE_MYSQL=false and DB_PATH is set (see
+config/database.php). The migrations are written for MySQL, so each
+statement is translated on the fly:
+- AUTO_INCREMENT primary keys   -> INTEGER PRIMARY KEY AUTOINCREMENT
+- ENUM(...)                     -> TEXT
+- inline INDEX / UNIQUE KEY     -> CREATE INDEX / UNIQUE (...)
+- ON UPDATE CURRENT_TIMESTAMP, ENGINE/CHARSET options, SET ... -> dropped
+- ALTER TABLE t AUTO_INCREMENT = n        -> sqlite_sequence row
+- ALTER TABLE t ADD COLUMN a ..., ADD COLUMN b ... AFTER x -> one ALTER per column
+- ON DUPLICATE KEY UPDATE c = VALUES(c)   -> ON CONFLICT DO UPDATE SET c = excluded.c
+"""
+
+import re
+import sqlite3
+from pathlib import Path
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+MIGRATIONS_DIR = PROJECT_ROOT / 'database' / 'migrations'
+SEEDS_DIR = PROJECT_ROOT / 'database' / 'seeds'
+
+
+def _strip_comments(sql):
+    return re.sub(r'--[^\n]*', '', sql)
+
+
+def split_statements(sql):
+    """Split a SQL script into statements (ignores ';' inside quotes)"""
+    statements, current, quote = [], [], None
+    for ch in _strip_comments(sql):
+        if quote:
+            if ch == quote:
+                quote = None
+        elif ch in ("'", '"'):
+            quote = ch
+        elif ch == ';':
+            statement = ''.join(current).strip()
+            if statement:
+                statements.append(statement)
+            current = []
+            continue
+        current.append(ch)
+    statement = ''.join(current).strip()
+    if statement:
+        statements.append(statement)
+    return statements
+
+
+def _split_top_level(body):
+    """Split a column list on commas that are not inside parentheses"""
+    parts, depth, current = [], 0, []
+    for ch in body:
+        if ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+        elif ch == ',' and depth == 0:
+            parts.append(''.join(current).strip())
+            current = []
+            continue
+        current.append(ch)
+    if ''.join(current).strip():
+        parts.append(''.join(current).strip())
+    return parts
+
+
+def _translate_column(definition):
+    definition = re.sub(r'\b(?:BIG)?INT\s+AUTO_INCREMENT\s+PRIMARY\s+KEY\b',
+                        'INTEGER PRIMARY KEY AUTOINCREMENT', definition, flags=re.I)
+    definition = re.sub(r'\bENUM\s*\([^)]*\)', 'TEXT', definition, flags=re.I)
+    definition = re.sub(r'\s+ON\s+UPDATE\s+CURRENT_TIMESTAMP\b', '', definition, flags=re.I)
+    return definition
+
+
+def _translate_create_table(statement):
+    match = re.match(r'CREATE\s+TABLE\s+(IF\s+NOT\s+EXISTS\s+)?(\w+)\s*\((.*)\)[^)]*$', statement, re.I | re.S)
+    if not match:
+        return [statement]
+    table = match.group(2)
+    columns, indexes = [], []
+    for part in _split_top_level(match.group(3)):
+        index = re.match(r'(?:INDEX|KEY)\s*(\w+)?\s*\(([^)]*)\)$', part, re.I)
+        unique = re.match(r'UNIQUE\s+(?:KEY|INDEX)\s*(\w+)?\s*(\([^)]*\))$', part, re.I)
+        if index:
+            cols = index.group(2)
+            name = index.group(1) or 'idx_{}_{}'.format(table, '_'.join(re.findall(r'\w+', cols)))
+            indexes.append(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({cols})")
+        elif unique:
+            columns.append(f"UNIQUE {unique.group(2)}")
+        else:
+            columns.append(_translate_column(part))
+    create = f"CREATE TABLE IF NOT EXISTS {table} (\n  " + ',\n  '.join(columns) + "\n)"
+    return [create] + indexes
+
+
+def _translate_alter(statement):
+    auto = re.match(r'ALTER\s+TABLE\s+(\w+)\s+AUTO_INCREMENT\s*=\s*(\d+)$', statement, re.I)
+    if auto:
+        # Applied by _set_sequence once we know the table exists
+        return [('sequence', auto.group(1), int(auto.group(2)))]
+
+    match = re.match(r'ALTER\s+TABLE\s+(\w+)\s+(.*)$', statement, re.I | re.S)
+    if not match:
+        return [statement]
+    table, actions = match.group(1), match.group(2)
+    translated = []
+    for action in _split_top_level(actions):
+        action = re.sub(r'\s+(AFTER\s+\w+|FIRST)$', '', action.strip(), flags=re.I)
+        translated.append(f"ALTER TABLE {table} {_translate_column(action)}")
+    return translated
+
+
+def _translate_insert(statement):
+    match = re.search(r'\s+ON\s+DUPLICATE\s+KEY\s+UPDATE\s+(.*)$', statement, re.I | re.S)
+    if not match:
+        return [statement]
+    updates = re.sub(r'VALUES\s*\(\s*(\w+)\s*\)', r'excluded.\1', match.group(1), flags=re.I)
+    return [f"{statement[:match.start()]} ON CONFLICT DO UPDATE SET {updates}"]
+
+
+def translate_statement(statement):
+    """
+    Translate one MySQL statement
+
+    Returns:
+        list of SQLite statements (str) or ('sequence', table, start) tuples
+    """
+    head = statement.lstrip().upper()
+    if head.startswith('SET '):
+        return []
+    if head.startswith('CREATE TABLE'):
+        return _translate_create_table(statement)
+    if head.startswith('ALTER TABLE'):
+        return _translate_alter(statement)
+    if head.startswith('INSERT'):
+        return _translate_insert(statement)
+    return [statement]
+
+
+def _table_exists(conn, table):
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone() is not None
+
+
+def _column_exists(conn, table, column):
+    return any(row[1] == column for row in conn.execute(f"PRAGMA table_info({table})"))
+
+
+def _set_sequence(conn, table, start):
+    """Make the next AUTOINCREMENT id of table equal start"""
+    if not _table_exists(conn, table):
+        return
+    conn.execute("DELETE FROM sqlite_sequence WHERE name = ?", (table,))
+    conn.execute("INSERT INTO sqlite_sequence (name, seq) VALUES (?, ?)", (table, start - 1))
+
+
+def apply_sql(conn, sql):
+    """
+    Translate and execute a MySQL script on a SQLite connection
+
+    Statements referring to tables that do not exist (the MySQL schema
+    references a few) are skipped, like MySQL would error on them.
+    """
+    for statement in split_statements(sql):
+        for translated in translate_statement(statement):
+            if isinstance(translated, tuple):
+                _set_sequence(conn, translated[1], translated[2])
+                continue
+            add_column = re.match(r'ALTER\s+TABLE\s+(\w+)\s+ADD\s+(?:COLUMN\s+)?(\w+)', translated, re.I)
+            if add_column and _column_exists(conn, add_column.group(1), add_column.group(2)):
+                continue
+            try:
+                conn.execute(translated)
+            except sqlite3.OperationalError as e:
+                if 'no such table' not in str(e):
+                    raise
+
+
+def migration_files():
+    """Migration .sql files in apply order"""
+    return sorted(MIGRATIONS_DIR.glob('*.sql'))
+
+
+def build_database(db_path, seeds=True):
+    """
+    Create a SQLite database with all migrations (and seed SQL) applied
+
+    Args:
+        db_path: SQLite file to create (replaced if it exists)
+        seeds: Also apply database/seeds/*.sql
+
+    Returns:
+        Path to the database
+    """
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    if db_path.exists():
+        db_path.unlink()
+
+    files = migration_files() + (sorted(SEEDS_DIR.glob('*.sql')) if seeds else [])
+    conn = sqlite3.connect(str(db_path))
+    try:
+        conn.execute("PRAGMA foreign_keys = OFF")
+        for sql_file in files:
+            apply_sql(conn, sql_file.read_text())
+        conn.commit()
+    finally:
+        conn.close()
+    return db_path
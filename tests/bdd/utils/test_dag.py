@@ -0,0 +1,317 @@
+"""
+Test DAG Utility
+Dependency-aware executor for suites whose numbered test methods feed each other
+
+A suite declares which steps need which with @depends_on:
+
+    @depends_on('test_001_register_and_login')
+    def test_002_add_family_ajax(self): ...
+
+TestDag runs the steps in dependency order (file order among independent
+steps). When a step fails, every step depending on it, directly or
+transitively, is recorded as SKIP at once instead of running into its
+timeouts. Steps that share no dependency edge form separate branches
+(connected components); branches run concurrently, each on its own pooled
+browser and a shallow copy of the suite instance, and the browser is reset
+between branches so a branch never sees another's login. Extra browsers are
+only taken if the pool has one free right away; otherwise the branches
+share the browsers there are.
+
+A step's outcome is read from what it records in the suite's
+TestResultsManager (any non-PASS entry fails it), falling back to its
+return value (False fails it).
+
+Configuration (via environment variables):
+  DAG_WORKERS - Branches run concurrently (default: 2; 1 = sequential)
+"""
+
+import heapq
+import os
+import queue
+import threading
+import time
+
+from debug_artifacts import begin_test
+
+
+PASS, FAIL, SKIP = 'PASS', 'FAIL', 'SKIP'
+
+# Each consolidated-runner worker already has a browser; keep the extra ones per suite small
+DEFAULT_WORKERS = 2
+
+
+def depends_on(*steps):
+    """Declare the test methods a step needs (by method name)"""
+    def decorate(func):
+        func._bdd_depends_on = tuple(steps)
+        return func
+    return decorate
+
+
+def step_names(suite_cls):
+    """Get the test_* method names of a suite class (base classes first) in definition order"""
+    names = []
+    for cls in reversed(suite_cls.__mro__):
+        for name, member in vars(cls).items():
+            if name.startswith('test_') and callable(member) and name not in names:
+                names.append(name)
+    return names
+
+
+def dependencies(suite_cls):
+    """
+    Get the declared dependency graph of a suite class
+
+    Returns:
+        dict: step name -> tuple of step names it depends on
+
+    Raises:
+        ValueError: for a dependency that is not a step of the class
+    """
+    names = step_names(suite_cls)
+    graph = {name: getattr(getattr(suite_cls, name), '_bdd_depends_on', ()) for name in names}
+    for name, needs in graph.items():
+        unknown = [need for need in needs if need not in graph]
+        if unknown:
+            raise ValueError(f"{suite_cls.__name__}.{name} depends on unknown step(s): {', '.join(unknown)}")
+    return graph
+
+
+def topological_order(graph, names):
+    """
+    Order steps so dependencies come first, file order among ready steps
+
+    Raises:
+        ValueError: on a dependency cycle
+    """
+    index = {name: i for i, name in enumerate(names)}
+    remaining = {name: len(graph[name]) for name in names}
+    dependents = {name: [] for name in names}
+    for name in names:
+        for need in graph[name]:
+            dependents[need].append(name)
+    ready = [index[name] for name in names if remaining[name] == 0]
+    heapq.heapify(ready)
+    order = []
+    while ready:
+        name = names[heapq.heappop(ready)]
+        order.append(name)
+        for dependent in dependents[name]:
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                heapq.heappush(ready, index[dependent])
+    if len(order) != len(names):
+        cycle = sorted(set(names) - set(order), key=index.get)
+        raise ValueError(f"Dependency cycle between: {', '.join(cycle)}")
+    return order
+
+
+def branches(graph, names):
+    """
+    Split steps into independent branches (connected components)
+
+    Returns:
+        list of step-name lists in execution order, largest branch first
+    """
+    parent = {name: name for name in names}
+
+    def root(name):
+        while parent[name] != name:
+            parent[name] = parent[parent[name]]
+            name = parent[name]
+        return name
+
+    for name in names:
+        for need in graph[name]:
+            parent[root(name)] = root(need)
+    groups = {}
+    for name in topological_order(graph, names):
+        groups.setdefault(root(name), []).append(name)
+    return sorted(groups.values(), key=len, reverse=True)
+
+
+def describe_step(suite, name):
+    """
+    Get a step's test id and title from its 'ID: Title' docstring
+
+    Returns:
+        (test_id, test_name)
+    """
+    doc = (getattr(type(suite), name).__doc__ or '').strip().splitlines()
+    first = doc[0] if doc else ''
+    if ':' in first:
+        test_id, title = first.split(':', 1)
+        return test_id.strip(), title.strip()
+    return name, first or name
+
+
+def results_manager(suite):
+    """Get the TestResultsManager a suite records into, or None"""
+    for value in vars(suite).values():
+        if hasattr(value, 'add_test_result') and hasattr(value, 'get_all_tests_flat'):
+            return value
+    return None
+
+
+def suite_name(suite):
+    return getattr(suite, 'SUITE_NAME', None) or getattr(suite, 'suite_name', type(suite).__name__)
+
+
+def run_step(suite, name, test_id=None):
+    """
+    Run one step and classify it from what it recorded
+
+    Args:
+        suite: Suite instance
+        name: Step method name
+        test_id: Only look at records with this id (branches running
+            concurrently record into the same manager)
+
+    Returns:
+        (status, details) - status PASS or FAIL
+    """
+    # Step snapshots taken from here on belong to this test (kept if it fails)
+    begin_test(test_id or describe_step(suite, name)[0])
+    manager = results_manager(suite)
+    recorded = len(manager.get_all_tests_flat()) if manager else 0
+    try:
+        outcome = getattr(suite, name)()
+    except Exception as e:
+        return FAIL, f"{type(e).__name__}: {e}"
+    new = manager.get_all_tests_flat()[recorded:] if manager else []
+    if test_id is not None:
+        new = [t for t in new if t.get('id') == test_id]
+    failed = [t for t in new if str(t.get('status', '')).upper() != PASS]
+    if failed:
+        return FAIL, "; ".join(f"{t['id']}: {t.get('details') or t['status']}" for t in failed)
+    if outcome is False:
+        return FAIL, f"{name} returned False"
+    return PASS, ''
+
+
+class TestDag:
+    """Runs a set-up suite instance's steps along its dependency graph"""
+
+    __test__ = False
+
+    def __init__(self, suite, checkout=None, checkin=None, workers=None):
+        """
+        Initialize executor
+
+        Args:
+            suite: Suite instance after setup() (its driver runs the first branch)
+            checkout: Callable returning a browser for another branch; takes
+                timeout=0 for the extra browsers (TimeoutError if none is free)
+            checkin: Callable returning such a browser (and resetting it)
+            workers: Concurrent branches (default: DAG_WORKERS or 2;
+                forced to 1 without checkout/checkin)
+        """
+        self.suite = suite
+        self.checkout = checkout
+        self.checkin = checkin
+        self.graph = dependencies(type(suite))
+        self.names = step_names(type(suite))
+        self.branches = branches(self.graph, self.names)
+        workers = workers or int(os.environ.get('DAG_WORKERS', DEFAULT_WORKERS))
+        if checkout is None or checkin is None:
+            workers = 1
+        self.workers = max(1, min(workers, len(self.branches)))
+        self.outcomes = {}
+        self._lock = threading.Lock()
+
+    def _blocked_by(self, name):
+        with self._lock:
+            return [need for need in self.graph[name] if self.outcomes.get(need, (PASS,))[0] != PASS]
+
+    def _skip(self, suite, name, blocked_by):
+        test_id, test_name = describe_step(suite, name)
+        upstream = ', '.join(describe_step(suite, need)[0] for need in blocked_by)
+        details = f"Skipped: depends on {upstream}, which did not pass"
+        manager = results_manager(suite)
+        if manager:
+            manager.add_test_result(suite_name(suite), test_id, test_name, SKIP, 0, details)
+        print(f"⏭️  {test_id}: {test_name} - {details}")
+        return SKIP, details
+
+    def _run_branch(self, suite, branch, concurrent=False):
+        for name in branch:
+            blocked_by = self._blocked_by(name)
+            if blocked_by:
+                result = self._skip(suite, name, blocked_by)
+            else:
+                result = run_step(suite, name, describe_step(suite, name)[0] if concurrent else None)
+            with self._lock:
+                self.outcomes[name] = result
+
+    def _worker(self, suite, pending, concurrent):
+        first = True
+        while True:
+            try:
+                branch = pending.get_nowait()
+            except queue.Empty:
+                return
+            if not first:
+                # Fresh (reset) browser: no cookies or page left over from the previous branch
+                driver, suite.driver = suite.driver, None
+                self.checkin(driver)
+                suite.driver = self.checkout()
+            first = False
+            self._run_branch(suite, branch, concurrent)
+
+    def _clones(self):
+        """Suite copies on extra browsers, as many as the pool has free now (at most workers - 1)"""
+        clones = []
+        for _ in range(1, self.workers):
+            try:
+                driver = self.checkout(timeout=0)
+            except TimeoutError:
+                break
+            clone = type(self.suite).__new__(type(self.suite))
+            clone.__dict__.update(vars(self.suite))
+            clone.driver = driver
+            clones.append(clone)
+        return clones
+
+    def run(self):
+        """
+        Run every step once, skipping dependents of failed steps
+
+        Returns:
+            dict: step name -> (status, details)
+        """
+        if self.checkout is None or self.checkin is None:
+            # One browser that is never reset: keep the file order the suite was written for
+            self._run_branch(self.suite, topological_order(self.graph, self.names))
+            return self.outcomes
+
+        pending = queue.Queue()
+        for branch in self.branches:
+            pending.put(branch)
+        clones = []
+        try:
+            clones = self._clones() if self.workers > 1 else []
+            if not clones:
+                self._worker(self.suite, pending, False)
+                return self.outcomes
+
+            suites = [self.suite] + clones
+            threads = [
+                threading.Thread(target=self._worker, args=(suite, pending, True), name=f'dag-{index}')
+                for index, suite in enumerate(suites)
+            ]
+            started = time.time()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            print(f"   {len(self.branches)} branches on {len(suites)} browsers in {time.time() - started:.1f}s")
+            return self.outcomes
+        finally:
+            for clone in clones:
+                if clone.driver is not None:
+                    self.checkin(clone.driver)
+
+    def summary(self):
+        """Get (passed, skipped, total) of the last run"""
+        statuses = [status for status, _ in self.outcomes.values()]
+        return statuses.count(PASS), statuses.count(SKIP), len(self.names)
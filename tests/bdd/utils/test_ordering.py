@@ -0,0 +1,112 @@
+"""
+Test Ordering Utility
+Orders suites so the ones most likely to fail, and quickest to do so, run first
+
+Reads the per-suite run history the runners append to
+results/suite_runs.jsonl (file, status, duration) and scores every suite:
+
+  risk     = max(failure rate, flip rate)   over the last `window` runs
+  seconds  = mean duration of its failing runs (all runs if it never failed)
+  score    = risk / seconds                 (expected failures found per second)
+
+The failure rate is Laplace-smoothed, so a suite without history scores 0.5
+and runs early; a suite that flips between PASS and FAIL is treated as
+risky even if it mostly passes. Combined with a runner's --fail-fast budget
+a broken build is reported after the first few suites instead of the full run.
+
+Configuration (via environment variables):
+  TEST_ORDER_WINDOW - Runs per suite considered (default: 20)
+"""
+
+import os
+from pathlib import Path
+
+from results_store import ResultsEventLog
+
+
+DEFAULT_RUN_LOG = Path(__file__).parent.parent / 'results' / 'suite_runs.jsonl'
+DEFAULT_WINDOW = int(os.environ.get('TEST_ORDER_WINDOW', 20))
+DEFAULT_SECONDS = 60.0
+
+# Outcomes that say something about the suite (CANCELLED/ERROR runs do not)
+COUNTED_STATUSES = ('PASS', 'FAIL', 'TIMEOUT')
+
+
+def load_history(log_file=DEFAULT_RUN_LOG, window=DEFAULT_WINDOW):
+    """
+    Get the recent runs of every suite, oldest first
+
+    Returns:
+        dict suite file -> list of (status, duration)
+    """
+    history = {}
+    for event in ResultsEventLog(log_file).read_events():
+        if event.get('type') == 'run' and event.get('status') in COUNTED_STATUSES:
+            history.setdefault(event['file'], []).append((event['status'], event.get('duration') or 0.0))
+    return {name: runs[-window:] for name, runs in history.items()}
+
+
+def suite_stats(runs, default_seconds=DEFAULT_SECONDS):
+    """
+    Score one suite from its runs
+
+    Args:
+        runs: list of (status, duration), oldest first
+        default_seconds: Expected duration without history
+
+    Returns:
+        dict: runs, failures, fail_rate, flip_rate, risk, seconds, score
+    """
+    failed = [status != 'PASS' for status, _ in runs]
+    failures = sum(failed)
+    fail_rate = (failures + 1) / (len(runs) + 2)
+    flips = sum(1 for previous, current in zip(failed, failed[1:]) if previous != current)
+    flip_rate = flips / (len(runs) - 1) if len(runs) > 1 else 0.0
+    failing = [duration for (_, duration), is_failure in zip(runs, failed) if is_failure]
+    durations = failing or [duration for _, duration in runs]
+    seconds = sum(durations) / len(durations) if durations else default_seconds
+    risk = max(fail_rate, flip_rate)
+    return {
+        'runs': len(runs),
+        'failures': failures,
+        'fail_rate': fail_rate,
+        'flip_rate': flip_rate,
+        'risk': risk,
+        'seconds': seconds,
+        'score': risk / max(seconds, 1.0),
+    }
+
+
+def plan_order(suites, history=None, log_file=DEFAULT_RUN_LOG, window=DEFAULT_WINDOW):
+    """
+    Order suites riskiest and fastest-failing first
+
+    Suites without history are assumed to take the median known duration.
+    Ties keep the given order.
+
+    Args:
+        suites: Suite file names in their fixed order
+        history: load_history() result (default: read from log_file)
+
+    Returns:
+        list of (suite file, stats dict), highest score first
+    """
+    history = load_history(log_file, window) if history is None else history
+    known = sorted(
+        sum(duration for _, duration in runs) / len(runs)
+        for name, runs in history.items() if name in suites and runs
+    )
+    default_seconds = known[len(known) // 2] if known else DEFAULT_SECONDS
+    stats = {suite: suite_stats(history.get(suite, []), default_seconds) for suite in suites}
+    position = {suite: index for index, suite in enumerate(suites)}
+    ordered = sorted(suites, key=lambda suite: (-stats[suite]['score'], position[suite]))
+    return [(suite, stats[suite]) for suite in ordered]
+
+
+def print_order(plan):
+    """Print the planned order with the history behind it"""
+    print(f"  {'suite':<45} {'runs':>4} {'fail':>6} {'flaky':>6} {'~secs':>7}")
+    for suite, stats in plan:
+        history = f"{stats['runs']:>4} {stats['fail_rate'] * 100:5.0f}% {stats['flip_rate'] * 100:5.0f}%" \
+            if stats['runs'] else f"{'-':>4} {'new':>6} {'':>6}"
+        print(f"  {suite:<45} {history} {stats['seconds']:7.1f}")
@@ -0,0 +1,246 @@
+"""
+Trace Spans Utility
+Nested timing spans for BDD suites, written as Chrome-trace / Perfetto JSON
+
+span() and @traced mark steps (helpers, waits, logins); instrument_driver()
+adds one span per WebDriver command, and trace_sleeps() one per time.sleep
+while a trace is open (finish_trace() puts the original back), so a suite's
+wall clock breaks down into page loads, waits, sleeps and round trips.
+Spans on the same thread nest by time. Open the written <suite>.trace.json
+in https://ui.perfetto.dev or chrome://tracing.
+
+Tracing is off unless BDD_TRACE is set; otherwise span() is a no-op and
+instrumented drivers pay one flag check per command.
+
+Configuration (via environment variables):
+  BDD_TRACE      - Set to true to record traces
+  BDD_TRACE_DIR  - Output directory (default: tests/bdd/results/traces)
+"""
+
+import functools
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+
+
+DEFAULT_TRACE_DIR = Path(__file__).parent.parent / 'results' / 'traces'
+TRACE_ENABLED = os.environ.get('BDD_TRACE', 'false').lower() in ('1', 'true', 'yes')
+
+# WebDriver command parameters worth showing in the trace (values are truncated)
+TRACED_PARAMS = ('using', 'value', 'url', 'name', 'script')
+MAX_ARG_LENGTH = 120
+
+_sleep = time.sleep
+_tracer = None
+_lock = threading.Lock()
+
+
+class Tracer:
+    """Collects complete ('X') trace events for one suite"""
+
+    def __init__(self, name):
+        """
+        Initialize tracer
+
+        Args:
+            name: Suite name, used as process name and file name
+        """
+        self.name = name
+        self.pid = os.getpid()
+        self.events = []
+        self._origin = time.perf_counter()
+        self._threads = {}
+
+    def _ts(self, moment):
+        return round((moment - self._origin) * 1_000_000, 3)
+
+    def _tid(self):
+        thread = threading.current_thread()
+        self._threads.setdefault(thread.ident, thread.name)
+        return thread.ident
+
+    def add_complete(self, name, start, duration, cat='step', **args):
+        """
+        Record a finished span
+
+        Args:
+            name: Span name
+            start: time.perf_counter() at the start
+            duration: Seconds
+            cat: Category (step, webdriver, wait, sleep, test, ...)
+            args: Extra key/values shown in the trace viewer
+        """
+        self.events.append({
+            'name': name, 'cat': cat, 'ph': 'X', 'pid': self.pid, 'tid': self._tid(),
+            'ts': self._ts(start), 'dur': round(duration * 1_000_000, 3), 'args': args,
+        })
+
+    @contextmanager
+    def span(self, name, cat='step', **args):
+        """Context manager recording the enclosed block as a span"""
+        start = time.perf_counter()
+        try:
+            yield args
+        except BaseException as e:
+            args['error'] = type(e).__name__
+            raise
+        finally:
+            self.add_complete(name, start, time.perf_counter() - start, cat, **args)
+
+    def instant(self, name, cat='mark', **args):
+        """Record a point-in-time marker"""
+        self.events.append({'name': name, 'cat': cat, 'ph': 'i', 's': 't', 'pid': self.pid,
+                            'tid': self._tid(), 'ts': self._ts(time.perf_counter()), 'args': args})
+
+    def to_dict(self):
+        metadata = [{'name': 'process_name', 'ph': 'M', 'pid': self.pid, 'args': {'name': self.name}}]
+        metadata += [{'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': tid, 'args': {'name': name}}
+                     for tid, name in self._threads.items()]
+        return {'traceEvents': metadata + sorted(self.events, key=lambda e: e['ts']), 'displayTimeUnit': 'ms'}
+
+    def write(self, path=None):
+        """
+        Write the trace file
+
+        Args:
+            path: Output file (default: BDD_TRACE_DIR/<name>.trace.json)
+
+        Returns:
+            Path written
+        """
+        if path is None:
+            safe_name = re.sub(r'[^A-Za-z0-9_.-]+', '_', self.name)
+            path = Path(os.environ.get('BDD_TRACE_DIR', DEFAULT_TRACE_DIR)) / f"{safe_name}.trace.json"
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict()))
+        return path
+
+
+def get_tracer():
+    """Get the active tracer, or None when not tracing"""
+    return _tracer
+
+
+def start_trace(name):
+    """
+    Start tracing a suite (no-op unless BDD_TRACE is set)
+
+    A trace still open for another suite is written first.
+
+    Returns:
+        Tracer or None
+    """
+    global _tracer
+    if not TRACE_ENABLED:
+        return None
+    with _lock:
+        if _tracer is not None and _tracer.name == name:
+            return _tracer
+        previous, _tracer = _tracer, Tracer(name)
+    if previous is not None:
+        previous.write()
+    trace_sleeps()
+    return _tracer
+
+
+def finish_trace(path=None):
+    """
+    Write and close the active trace
+
+    Returns:
+        Path written, or None when not tracing
+    """
+    global _tracer
+    with _lock:
+        tracer, _tracer = _tracer, None
+    untrace_sleeps()
+    return tracer.write(path) if tracer is not None else None
+
+
+def span(name, cat='step', **args):
+    """Span on the active tracer; a no-op context when not tracing"""
+    tracer = _tracer
+    return tracer.span(name, cat, **args) if tracer is not None else nullcontext(args)
+
+
+def traced(name=None, cat='step'):
+    """
+    Decorator recording every call of a function as a span
+
+    Usage:
+        @traced()
+        def fill_form(driver): ...
+
+        navigate = traced('navigate', cat='wait')(navigate)
+    """
+    def decorator(func):
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return func(*args, **kwargs)
+            with _tracer.span(span_name, cat):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _command_args(command, params):
+    args = {'command': command}
+    for key in TRACED_PARAMS:
+        value = (params or {}).get(key)
+        if isinstance(value, str):
+            args[key] = value if len(value) <= MAX_ARG_LENGTH else value[:MAX_ARG_LENGTH] + '…'
+    return args
+
+
+def instrument_driver(driver):
+    """
+    Record every WebDriver command of driver as a 'webdriver' span
+
+    Element calls (find_element, .text, get_attribute, is_displayed, click)
+    go through driver.execute as well, so they are covered too. Safe to call
+    more than once.
+
+    Returns:
+        driver
+    """
+    if getattr(driver, '_bdd_traced', False):
+        return driver
+    execute = driver.execute
+
+    def traced_execute(driver_command, params=None):
+        tracer = _tracer
+        if tracer is None:
+            return execute(driver_command, params)
+        with tracer.span(driver_command, 'webdriver', **_command_args(driver_command, params)):
+            return execute(driver_command, params)
+
+    driver.execute = traced_execute
+    driver._bdd_traced = True
+    return driver
+
+
+def _traced_sleep(seconds):
+    tracer = _tracer
+    if tracer is None:
+        return _sleep(seconds)
+    with tracer.span('sleep', 'sleep', seconds=seconds):
+        return _sleep(seconds)
+
+
+def trace_sleeps():
+    """Record time.sleep calls (including polling inside waits) as 'sleep' spans"""
+    time.sleep = _traced_sleep
+
+
+def untrace_sleeps():
+    """Put the original time.sleep back (unless someone else has patched it since)"""
+    if time.sleep is _traced_sleep:
+        time.sleep = _sleep
@@ -0,0 +1,199 @@
+"""
+Wait Engine Utility
+Event-driven waits that replace fixed time.sleep() calls
+
+Waits on real page signals instead of worst-case sleeps:
+- document.readyState
+- in-flight fetch/XHR count (tracked by an injected shim)
+- DOM mutation quiescence (MutationObserver)
+- URL change / new document after a navigation
+
+Drop-in helpers:
+  settle(driver)                   - instead of time.sleep() after driver.get()/AJAX
+  navigate(driver, url)            - driver.get() + settle
+  click_and_wait(driver, element)  - click, then wait for the resulting navigation or DOM update
+  scroll_into_view(driver, element)- instant scroll (no sleep needed afterwards)
+"""
+
+import time
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+DEFAULT_TIMEOUT = 15
+POLL_INTERVAL = 0.05
+QUIET_MS = 150
+
+# Installs window.__bddWait: in-flight request counter, last DOM mutation time
+# and an unload flag. Idempotent; safe to run on every document.
+SHIM_JS = """
+(function () {
+  if (window.__bddWait) { return; }
+  var state = window.__bddWait = {inflight: 0, lastMutation: Date.now(), unloading: false};
+
+  if (window.fetch) {
+    var origFetch = window.fetch;
+    window.fetch = function () {
+      state.inflight++;
+      return origFetch.apply(this, arguments).finally(function () {
+        state.inflight = Math.max(0, state.inflight - 1);
+      });
+    };
+  }
+
+  var origSend = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function () {
+    var xhr = this;
+    state.inflight++;
+    xhr.addEventListener('loadend', function () {
+      state.inflight = Math.max(0, state.inflight - 1);
+    });
+    return origSend.apply(this, arguments);
+  };
+
+  var touch = function () { state.lastMutation = Date.now(); };
+  new MutationObserver(touch).observe(document, {
+    subtree: true, childList: true, attributes: true, characterData: true
+  });
+  window.addEventListener('beforeunload', function () { state.unloading = true; });
+  window.addEventListener('pagehide', function () { state.unloading = true; });
+})();
+"""
+
+# Returns a snapshot of all wait signals in one round trip
+STATE_JS = SHIM_JS + """
+var s = window.__bddWait;
+return {
+  ready: document.readyState,
+  url: window.location.href,
+  inflight: s.inflight,
+  quietMs: Date.now() - s.lastMutation,
+  unloading: s.unloading,
+  marker: window.__bddMarker || null
+};
+"""
+
+
+def install_shim(driver):
+    """
+    Install the request/mutation shim
+
+    On Chrome the shim is registered for every new document via CDP so requests
+    issued during page load are counted; it is also injected into the current page.
+    """
+    if hasattr(driver, 'execute_cdp_cmd') and not getattr(driver, '_bdd_wait_shim', False):
+        try:
+            driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': SHIM_JS})
+            driver._bdd_wait_shim = True
+        except Exception:
+            pass
+    try:
+        driver.execute_script(SHIM_JS)
+    except Exception:
+        pass
+
+
+def get_page_state(driver):
+    """Get readyState, in-flight requests and DOM quiet time (None while navigating)"""
+    try:
+        return driver.execute_script(STATE_JS)
+    except Exception:
+        return None
+
+
+def _wait(driver, condition, timeout):
+    """Poll condition(state) until true; returns bool instead of raising"""
+    def check(d):
+        state = get_page_state(d)
+        return state is not None and condition(state)
+
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(check)
+        return True
+    except Exception:
+        return False
+
+
+def _settled(state, quiet_ms):
+    return (
+        state['ready'] == 'complete'
+        and state['inflight'] == 0
+        and state['quietMs'] >= quiet_ms
+        and not state['unloading']
+    )
+
+
+def wait_for_ready_state(driver, timeout=DEFAULT_TIMEOUT):
+    """Wait for document.readyState == 'complete'"""
+    return _wait(driver, lambda s: s['ready'] == 'complete', timeout)
+
+
+def wait_for_network_idle(driver, timeout=DEFAULT_TIMEOUT):
+    """Wait until no fetch/XHR requests are in flight"""
+    return _wait(driver, lambda s: s['inflight'] == 0, timeout)
+
+
+def wait_for_dom_quiet(driver, quiet_ms=QUIET_MS, timeout=DEFAULT_TIMEOUT):
+    """Wait until the DOM has not changed for quiet_ms milliseconds"""
+    return _wait(driver, lambda s: s['quietMs'] >= quiet_ms, timeout)
+
+
+def wait_for_url_change(driver, old_url, timeout=DEFAULT_TIMEOUT):
+    """Wait until the URL differs from old_url and the new page is loaded"""
+    return _wait(driver, lambda s: s['url'] != old_url and s['ready'] == 'complete', timeout)
+
+
+def settle(driver, timeout=DEFAULT_TIMEOUT, quiet_ms=QUIET_MS):
+    """
+    Wait until the page is loaded, the network is idle and the DOM is quiet
+
+    Drop-in replacement for time.sleep() after navigation or AJAX actions.
+
+    Returns:
+        bool - False if the page did not settle within timeout
+    """
+    return _wait(driver, lambda s: _settled(s, quiet_ms), timeout)
+
+
+def navigate(driver, url, timeout=DEFAULT_TIMEOUT):
+    """driver.get() followed by settle()"""
+    driver.get(url)
+    return settle(driver, timeout)
+
+
+def scroll_into_view(driver, element):
+    """Scroll element into view instantly (no smooth-scroll, so no sleep needed)"""
+    driver.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'instant'});", element)
+
+
+def click_and_wait(driver, element, timeout=DEFAULT_TIMEOUT, quiet_ms=QUIET_MS, js_click=True):
+    """
+    Click an element and wait for whatever it triggers to finish
+
+    Handles both outcomes without a fixed sleep: a full navigation (form
+    submit, redirect) waits for the new document to settle; an in-page
+    update (AJAX, modal, validation message) waits for network idle and
+    DOM quiescence on the current document.
+
+    Returns:
+        bool - False if nothing settled within timeout
+    """
+    install_shim(driver)
+    marker = str(time.time())
+    driver.execute_script("window.__bddMarker = arguments[0];", marker)
+
+    if js_click:
+        driver.execute_script("arguments[0].click();", element)
+    else:
+        element.click()
+    clicked_at = time.time()
+
+    def done(state):
+        if state['marker'] != marker:
+            # New document: wait for it to settle
+            return _settled(state, quiet_ms)
+        # Same document: settled and no navigation started since the click
+        elapsed_ms = (time.time() - clicked_at) * 1000
+        return elapsed_ms >= quiet_ms and _settled(state, quiet_ms)
+
+    return _wait(driver, done, timeout)